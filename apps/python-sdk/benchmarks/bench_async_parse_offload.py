@@ -0,0 +1,78 @@
+"""
+Event-loop stall benchmark for AsyncFirecrawlClient response parsing.
+
+Serves a large synthetic crawl status page (about 20 MB by default) from a fake
+transport and measures the longest gap seen by a 1 ms ticker coroutine while
+get_crawl_status decodes and normalizes it, with and without parse offloading.
+
+Usage:
+    python benchmarks/bench_async_parse_offload.py [--docs 2000] [--markdown-kb 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient  # noqa: E402
+from bench_document_parsing import make_document  # noqa: E402
+
+
+async def measure(client: AsyncFirecrawlClient, body: bytes) -> float:
+    async def fake_get(endpoint, headers=None, timeout=None):
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    client.async_http_client.get = fake_get  # type: ignore[assignment]
+
+    max_gap = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal max_gap
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await client.get_crawl_status("job")
+    done = True
+    await task
+    return max_gap
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=2000, help="documents in the page")
+    parser.add_argument("--markdown-kb", type=int, default=10, help="markdown size per document in KB")
+    args = parser.parse_args()
+
+    docs = []
+    for i in range(args.docs):
+        doc = make_document(i)
+        doc["markdown"] = "x" * (args.markdown_kb * 1024)
+        docs.append(doc)
+    body = json.dumps({"success": True, "status": "completed", "completed": len(docs), "total": len(docs), "data": docs}).encode()
+    print(f"status page: {len(docs)} documents, {len(body) / 1e6:.1f} MB\n")
+
+    inline = await measure(AsyncFirecrawlClient(api_key="bench", api_url="http://localhost"), body)
+    print(f"{'parsing on the event loop':<32} longest loop stall {inline * 1000:8.1f} ms")
+
+    client = AsyncFirecrawlClient(api_key="bench", api_url="http://localhost", parse_offload_threshold=1_000_000)
+    offloaded = await measure(client, body)
+    metrics = client.parse_metrics
+    print(f"{'parse_offload_threshold=1MB':<32} longest loop stall {offloaded * 1000:8.1f} ms")
+    print(f"\navoided block time reported by parse_metrics: {metrics.avoided_block_seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for document parsing in the v2 SDK.
+
+Builds synthetic crawl/batch status pages (1k documents each by default) shaped
+like real API payloads and times how long each result mode takes to turn them
+into SDK results, compared with validating each document separately.
+
+Usage:
+    python benchmarks/bench_document_parsing.py [--docs 1000] [--pages 5] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from firecrawl.v2.types import Document  # noqa: E402
+from firecrawl.v2.utils.normalize import normalize_document_input, parse_documents  # noqa: E402
+
+
+def make_document(i: int) -> Dict[str, Any]:
+    url = f"https://example.com/docs/page-{i}"
+    return {
+        "markdown": f"# Page {i}\n\n" + ("Lorem ipsum dolor sit amet. " * 80),
+        "links": [f"https://example.com/docs/page-{j}" for j in range(i, i + 25)],
+        "metadata": {
+            "title": f"Page {i}",
+            "description": "A synthetic page used for benchmarking.",
+            "language": "en",
+            "keywords": ["docs", "benchmark"],
+            "ogTitle": f"Page {i}",
+            "ogDescription": "A synthetic page used for benchmarking.",
+            "ogUrl": url,
+            "ogImage": "https://example.com/og.png",
+            "ogLocaleAlternate": ["en_GB", "de_DE"],
+            "ogSiteName": "Example",
+            "favicon": "https://example.com/favicon.ico",
+            "modifiedTime": "2025-01-01T00:00:00Z",
+            "publishedTime": "2024-01-01T00:00:00Z",
+            "sourceURL": url,
+            "url": url,
+            "statusCode": 200,
+            "scrapeId": f"00000000-0000-0000-0000-{i:012d}",
+            "contentType": "text/html; charset=utf-8",
+            "proxyUsed": "basic",
+            "cacheState": "miss",
+            "creditsUsed": 1,
+            "twitter:card": "summary_large_image",
+            "theme-color": "#ffffff",
+        },
+    }
+
+
+def make_pages(docs: int, pages: int) -> List[List[Dict[str, Any]]]:
+    return [[make_document(p * docs + i) for i in range(docs)] for p in range(pages)]
+
+
+def bench(name: str, fn: Callable[[], Any], repeat: int, total_docs: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    per_doc_us = best / total_docs * 1e6
+    print(f"{name:<34} {best * 1000:10.1f} ms   {per_doc_us:8.1f} us/doc")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1000, help="documents per page")
+    parser.add_argument("--pages", type=int, default=5, help="number of pages")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions (best time is reported)")
+    args = parser.parse_args()
+
+    pages = make_pages(args.docs, args.pages)
+    total = args.docs * args.pages
+    print(f"{args.pages} pages x {args.docs} docs ({total} documents), best of {args.repeat}\n")
+
+    per_doc = bench(
+        "per-document Document(**...)",
+        lambda: [[Document(**normalize_document_input(d)) for d in p] for p in pages],
+        args.repeat,
+        total,
+    )
+    typed = bench("typed Documents, one call per page", lambda: [parse_documents(p, lazy=False) for p in pages], args.repeat, total)
+    bench(
+        "typed + model_dump() (ETL path)",
+        lambda: [[d.model_dump() for d in parse_documents(p, lazy=False)] for p in pages],
+        args.repeat,
+        total,
+    )
+    lazy = bench("lazy Documents (markdown only)", lambda: [[d.markdown for d in parse_documents(p, lazy=True)] for p in pages], args.repeat, total)
+    bench(
+        "lazy Documents + metadata access",
+        lambda: [[d.metadata.title for d in parse_documents(p, lazy=True)] for p in pages],
+        args.repeat,
+        total,
+    )
+    snake = bench("raw=True (snake_case dicts)", lambda: [parse_documents(p, raw=True) for p in pages], args.repeat, total)
+    api = bench('raw="api" (untouched payload)', lambda: [parse_documents(p, raw="api") for p in pages], args.repeat, total)
+
+    print(f"\npage validation is {per_doc / typed:.1f}x faster than validating each document separately")
+    print(f"lazy Documents are {typed / lazy:.1f}x faster than eager typed models when metadata is not read")
+    print(f"raw=True is {typed / snake:.1f}x faster than typed models; raw=\"api\" is {typed / api:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+DocumentStore benchmark: ingest two crawls of the same site (mostly unchanged
+pages) and measure on-disk size, deduplication and random lookup latency.
+
+Usage:
+    python benchmarks/bench_document_store.py [--docs 5000] [--changed 0.1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from firecrawl.v2.store import DocumentStore  # noqa: E402
+from bench_document_parsing import make_document  # noqa: E402
+
+
+def crawl(n: int, run: int, changed: float):
+    rng = random.Random(run)
+    docs = []
+    for i in range(n):
+        doc = make_document(i)
+        doc["metadata"]["scrapeId"] = f"run{run}-{i}"
+        if run and rng.random() < changed:
+            doc["markdown"] += f"\n\nUpdated in run {run}"
+        docs.append(doc)
+    return {"status": "completed", "data": docs}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=5000, help="pages per crawl")
+    parser.add_argument("--changed", type=float, default=0.1, help="fraction of pages changed in the second crawl")
+    parser.add_argument("--lookups", type=int, default=2000, help="random lookups to time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path, DocumentStore(path) as store:
+        for run in range(2):
+            job = crawl(args.docs, run, args.changed)
+            start = time.perf_counter()
+            result = store.add_job(job, job_id=f"crawl-{run}")
+            elapsed = time.perf_counter() - start
+            print(
+                f"crawl {run}: {result.documents} docs in {elapsed * 1000:8.1f} ms "
+                f"({elapsed / result.documents * 1e6:6.1f} us/doc), {result.deduplicated} deduplicated"
+            )
+
+        stats = store.stats
+        print(
+            f"\n{stats.documents} documents, {stats.records} unique records, "
+            f"{stats.raw_bytes / 1e6:.1f} MB json -> {stats.compressed_bytes / 1e6:.1f} MB on disk "
+            f"({stats.raw_bytes / max(stats.compressed_bytes, 1):.1f}x)"
+        )
+
+        urls = [f"https://example.com/docs/page-{i}" for i in range(args.docs)]
+        rng = random.Random(0)
+        sample = [rng.choice(urls) for _ in range(args.lookups)]
+        for raw in (True, False):
+            start = time.perf_counter()
+            for url in sample:
+                store.get(url, raw=raw)
+            elapsed = time.perf_counter() - start
+            label = "random get(url, raw=True)" if raw else "random get(url) -> Document"
+            print(f"{label:<32} {elapsed / len(sample) * 1e6:8.1f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
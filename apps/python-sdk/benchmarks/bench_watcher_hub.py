@@ -0,0 +1,131 @@
+"""
+Thread and CPU cost of watching many jobs: one Watcher thread per job versus a
+single WatcherHub.
+
+A local websocket server plays every job: it sends a few document messages
+spaced out over time, then a done message. Both modes watch the same number of
+jobs and report peak thread count, process CPU time and wall time. The server
+runs in the same process, so CPU time includes its share for both modes.
+
+Usage:
+    python benchmarks/bench_watcher_hub.py [--jobs 500] [--docs 5] [--interval 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+import websockets
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from firecrawl.v2.watcher import Watcher  # noqa: E402
+from firecrawl.v2.watcher_hub import WatcherHub  # noqa: E402
+
+
+class BenchHttpClient:
+    def __init__(self, api_url: str):
+        self.api_url = api_url
+        self.api_key = "fc-bench"
+
+
+class BenchClient:
+    def __init__(self, api_url: str):
+        self.http_client = BenchHttpClient(api_url)
+
+
+def start_server(docs: int, interval: float):
+    ready = threading.Event()
+    state = {}
+
+    async def handler(connection):
+        request = getattr(connection, "request", None)
+        path = request.path if request is not None else connection.path
+        job_id = path.rsplit("/", 1)[-1]
+        for i in range(docs):
+            await asyncio.sleep(interval)
+            await connection.send(json.dumps({
+                "type": "document",
+                "data": {"markdown": f"# {job_id} {i}", "metadata": {"sourceURL": f"https://example.com/{job_id}/{i}"}},
+            }))
+        await connection.send(json.dumps({"type": "done", "data": {"status": "completed", "completed": docs, "total": docs}}))
+        await asyncio.sleep(1)
+
+    async def serve():
+        async with websockets.serve(handler, "127.0.0.1", 0, max_queue=None) as server:
+            state["port"] = next(iter(server.sockets)).getsockname()[1]
+            ready.set()
+            await asyncio.Future()
+
+    thread = threading.Thread(target=lambda: asyncio.run(serve()), daemon=True)
+    thread.start()
+    ready.wait()
+    return f"http://127.0.0.1:{state['port']}"
+
+
+def sample_threads(stop: threading.Event, peak: list) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], threading.active_count())
+        time.sleep(0.01)
+
+
+def run(mode: str, api_url: str, jobs: int, docs: int) -> None:
+    client = BenchClient(api_url)
+    received = [0]
+    lock = threading.Lock()
+
+    def on_document(detail):
+        with lock:
+            received[0] += 1
+
+    peak = [0]
+    stop = threading.Event()
+    sampler = threading.Thread(target=sample_threads, args=(stop, peak), daemon=True)
+    sampler.start()
+    baseline = threading.active_count()
+
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    if mode == "threads":
+        watchers = []
+        for i in range(jobs):
+            watcher = Watcher(client, f"job-{i}", poll_interval=30)
+            watcher.add_event_listener("document", on_document)
+            watcher.start()
+            watchers.append(watcher)
+        for watcher in watchers:
+            watcher._thread.join()
+    else:
+        with WatcherHub(client) as hub:
+            for i in range(jobs):
+                hub.watch(f"job-{i}", poll_interval=30, on_document=on_document)
+            hub.join()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    stop.set()
+    sampler.join()
+
+    print(
+        f"{mode:<8} {jobs} jobs: peak threads {peak[0] - baseline:4d} above baseline, "
+        f"cpu {cpu:6.2f} s, wall {wall:6.2f} s, {received[0]} documents"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=500, help="concurrently watched jobs")
+    parser.add_argument("--docs", type=int, default=5, help="documents per job")
+    parser.add_argument("--interval", type=float, default=0.2, help="seconds between documents")
+    args = parser.parse_args()
+
+    api_url = start_server(args.docs, args.interval)
+    for mode in ("threads", "hub"):
+        run(mode, api_url, args.jobs, args.docs)
+
+
+if __name__ == "__main__":
+    main()
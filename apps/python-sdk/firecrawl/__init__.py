@@ -9,6 +9,16 @@ import os
 from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
 from .v2.watcher import Watcher
 from .v2.watcher_async import AsyncWatcher
+from .v2.watcher_hub import WatcherHub
+from .v2.webhooks import WebhookReceiver
+from .v2.frame import DocumentFrame
+from .v2.store import DocumentStore
+from .v2.utils.assets import AssetStore
+from .v2.utils.url_dedupe import UrlDeduplicator
+from .v2.utils.response_cache import ResponseCache, MemoryCacheBackend, SQLiteCacheBackend
+from .v2.utils.negative_cache import NegativeCache, KnownFailureError
+from .v2.utils.idempotency import UnknownOutcomeError
+from .v2.utils.domain_profiles import DomainProfiles
 from .v1 import (
     V1FirecrawlApp,
     AsyncV1FirecrawlApp,
@@ -79,6 +89,19 @@ __all__ = [
     'AsyncFirecrawlApp',
     'Watcher',
     'AsyncWatcher',
+    'WatcherHub',
+    'WebhookReceiver',
+    'DocumentFrame',
+    'DocumentStore',
+    'AssetStore',
+    'UrlDeduplicator',
+    'ResponseCache',
+    'MemoryCacheBackend',
+    'SQLiteCacheBackend',
+    'NegativeCache',
+    'KnownFailureError',
+    'UnknownOutcomeError',
+    'DomainProfiles',
     'V1FirecrawlApp',
     'AsyncV1FirecrawlApp',
     'V1JsonConfig',
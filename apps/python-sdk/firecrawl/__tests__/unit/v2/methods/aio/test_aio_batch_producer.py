@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.batch_producer import AsyncBatchProducer
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+
+    def json(self):
+        return self._body
+
+
+class FakeAsyncGrowingBatchApi:
+    def __init__(self):
+        self.posts = []
+        self.urls = []
+        self.done = 0
+
+    async def post(self, path, payload, **kwargs):
+        await asyncio.sleep(0)
+        self.posts.append((payload.get("appendToId"), list(payload["urls"])))
+        self.urls.extend(payload["urls"])
+        return FakeResponse({"success": True, "id": "job-1", "url": "https://api/job-1", "invalidURLs": []})
+
+    async def get(self, url, timeout=None):
+        await asyncio.sleep(0)
+        skip = int(url.partition("?skip=")[2] or 0)
+        self.done = min(len(self.urls), self.done + 2)
+        return FakeResponse({
+            "success": True,
+            "status": "completed" if self.done == len(self.urls) else "scraping",
+            "completed": self.done,
+            "total": len(self.urls),
+            "next": None,
+            "data": [{"markdown": u, "metadata": {"sourceURL": u}} for u in self.urls[skip:self.done]],
+        })
+
+
+@pytest.mark.asyncio
+async def test_async_producer_streams_results_of_growing_job():
+    api = FakeAsyncGrowingBatchApi()
+    producer = AsyncBatchProducer(api, max_batch_size=4, flush_interval=0.005, poll_interval=0.005)
+
+    async def feed():
+        async with producer:
+            for i in range(10):
+                await producer.add(f"https://example.com/{i}")
+                if i % 3 == 0:
+                    await asyncio.sleep(0.01)
+
+    feeder = asyncio.create_task(feed())
+    markdown = [doc.markdown async for doc in producer.results()]
+    await feeder
+
+    assert markdown == [f"https://example.com/{i}" for i in range(10)]
+    assert api.posts[0][0] is None
+    assert all(append_to == "job-1" for append_to, _ in api.posts[1:])
+    assert sum(len(urls) for _, urls in api.posts) == 10
+    assert producer.stats.submitted == 10
+
+
+@pytest.mark.asyncio
+async def test_async_flush_sends_buffer_immediately():
+    api = FakeAsyncGrowingBatchApi()
+    producer = AsyncBatchProducer(api, max_batch_size=100, flush_interval=60)
+    await producer.add_many(["https://example.com/a", "https://example.com/b"])
+    await producer.flush()
+    assert api.posts == [(None, ["https://example.com/a", "https://example.com/b"])]
+    await producer.close()
+    assert len(api.posts) == 1
@@ -0,0 +1,43 @@
+import httpx
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import BatchRetryPolicy, ScrapeOptions
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+@pytest.mark.asyncio
+async def test_async_batch_scrape_resubmits_with_escalated_options(monkeypatch):
+    posts = []
+    docs, errors = [], []
+
+    async def fake_post(self, endpoint, data, headers=None, timeout=None):
+        posts.append(data)
+        for url in data["urls"]:
+            if url.endswith("/flaky") and data.get("proxy") != "stealth":
+                errors.append({"id": f"e{len(errors)}", "url": url, "code": "SCRAPE_TIMEOUT", "error": "timed out"})
+            else:
+                docs.append({"markdown": url, "metadata": {"sourceURL": url}})
+        return httpx.Response(200, json={"success": True, "id": "job-1", "url": "https://api/job-1"})
+
+    async def fake_get(self, endpoint, headers=None, timeout=None):
+        if endpoint.endswith("/errors"):
+            return httpx.Response(200, json={"success": True, "errors": list(errors), "robotsBlocked": []})
+        return httpx.Response(200, json={
+            "success": True, "status": "completed", "completed": len(docs) + len(errors),
+            "total": len(docs) + len(errors), "data": list(docs),
+        })
+
+    monkeypatch.setattr(AsyncHttpClient, "post", fake_post)
+    monkeypatch.setattr(AsyncHttpClient, "get", fake_get)
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost")
+    job = await client.batch_scrape(
+        ["https://example.com/a", "https://example.com/flaky"],
+        options=ScrapeOptions(formats=["markdown"]),
+        poll_interval=0,
+        retry=BatchRetryPolicy(escalate=ScrapeOptions(proxy="stealth")),
+    )
+
+    assert sorted(d.markdown for d in job.data) == ["https://example.com/a", "https://example.com/flaky"]
+    assert len(posts) == 2
+    assert posts[1]["urls"] == ["https://example.com/flaky"] and posts[1]["appendToId"] == "job-1"
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.methods.aio.batch import iter_large_batch, process_large_batch
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+
+    def json(self):
+        return self._body
+
+
+class FakeAsyncBatchApi:
+    """Async batch endpoints; every job needs ``polls`` status requests to finish."""
+
+    def __init__(self, polls=2, max_concurrency=4):
+        self.polls = polls
+        self.max_concurrency = max_concurrency
+        self.jobs = {}
+        self.running = 0
+        self.max_running = 0
+
+    async def post(self, path, payload, **kwargs):
+        await asyncio.sleep(0)
+        job_id = f"job-{len(self.jobs)}"
+        self.jobs[job_id] = {"urls": payload["urls"], "polls": 0, "finished": False}
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        return FakeResponse({"success": True, "id": job_id, "url": f"https://api/{job_id}"})
+
+    async def get(self, url, timeout=None):
+        await asyncio.sleep(0)
+        if url == "/v2/concurrency-check":
+            return FakeResponse({"success": True, "data": {"concurrency": 0, "maxConcurrency": self.max_concurrency}})
+        path, _, query = url.partition("?skip=")
+        job = self.jobs[path.rsplit("/", 1)[-1]]
+        job["polls"] += 1
+        done = len(job["urls"]) if job["polls"] >= self.polls else 0
+        if done and not job["finished"]:
+            job["finished"] = True
+            self.running -= 1
+        page = job["urls"][int(query or 0):done]
+        return FakeResponse({
+            "success": True,
+            "status": "completed" if done else "scraping",
+            "completed": done,
+            "total": len(job["urls"]),
+            "next": None,
+            "data": [{"markdown": u, "metadata": {"sourceURL": u}} for u in page],
+        })
+
+
+URLS = [f"https://example.com/{i}" for i in range(12)]
+
+
+@pytest.mark.asyncio
+async def test_async_engine_streams_with_bounded_chunks_in_flight():
+    api = FakeAsyncBatchApi(polls=3, max_concurrency=4)
+    progress = []
+    docs = [d async for d in iter_large_batch(api, URLS, chunk_size=2, poll_interval=0.001, on_progress=progress.append)]
+
+    assert sorted(d.markdown for d in docs) == sorted(URLS)
+    # ceil(4 / 2) + 1 chunk jobs at a time
+    assert api.max_running == 3
+    assert {p.index for p in progress if p.status == "completed"} == set(range(6))
+
+
+@pytest.mark.asyncio
+async def test_async_process_large_batch_keeps_order_and_propagates_timeout():
+    api = FakeAsyncBatchApi(polls=2)
+    docs = await process_large_batch(api, URLS, chunk_size=5, poll_interval=0.001, max_chunks_in_flight=2)
+    assert [d.markdown for d in docs] == URLS
+
+    slow = FakeAsyncBatchApi(polls=1000)
+    with pytest.raises(TimeoutError):
+        await process_large_batch(slow, URLS, chunk_size=5, poll_interval=0.01, timeout=0.05)
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.methods.aio.scrape import scrape_many
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+
+    def json(self):
+        return self._body
+
+
+class FakeAsyncScrapeApi:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.requested = []
+
+    async def post(self, path, payload, **kwargs):
+        url = payload["url"]
+        self.requested.append(url)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(int(url.rsplit("/", 1)[-1]) / 1000 if url[-1].isdigit() else 0.005)
+        finally:
+            self.running -= 1
+        if url.endswith("/fail"):
+            return FakeResponse({"success": False, "error": "Internal error"}, 500)
+        return FakeResponse({"success": True, "data": {"markdown": url, "metadata": {"sourceURL": url}}})
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_is_bounded_and_reports_errors():
+    api = FakeAsyncScrapeApi()
+    urls = ["https://example.com/30", "https://example.com/fail", "https://example.com/5", "https://example.com/1"]
+    progress = []
+    results = [r async for r in scrape_many(api, urls, concurrency=2, on_progress=progress.append)]
+
+    assert {url for url, _ in results} == set(urls)
+    assert isinstance(dict(results)["https://example.com/fail"], Exception)
+    assert api.max_running == 2
+    assert progress[-1].completed == 4 and progress[-1].failed == 1
+
+    ordered = [url async for url, _ in scrape_many(api, urls, concurrency=4, ordered=True)]
+    assert ordered == urls
+
+
+@pytest.mark.asyncio
+async def test_async_early_exit_cancels_outstanding_scrapes():
+    api = FakeAsyncScrapeApi()
+    urls = [f"https://example.com/{20 + i}" for i in range(20)]
+    stream = scrape_many(api, urls, concurrency=3)
+    async for _ in stream:
+        break
+    await stream.aclose()
+    await asyncio.sleep(0.05)
+    assert len(api.requested) <= 4
+    assert api.running == 0
+
+
+@pytest.mark.asyncio
+async def test_async_arguments_are_checked_and_urls_read_at_call_time():
+    api = FakeAsyncScrapeApi()
+    with pytest.raises(ValueError):
+        scrape_many(api, ["https://example.com/1"], concurrency=0)
+    urls = iter(["https://example.com/1", "https://example.com/2"])
+    stream = scrape_many(api, urls)
+    assert list(urls) == []
+    assert len([item async for item in stream]) == 2
@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _doc(url):
+    return {"markdown": url, "metadata": {"sourceURL": url}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("in_use, strategy", [(0, "scrape_many"), (29, "batch")])
+async def test_async_scrape_urls_plans_from_concurrency_and_streams_results(monkeypatch, in_use, strategy):
+    jobs = {}
+
+    async def fake_post(self, endpoint, data, headers=None, timeout=None):
+        if endpoint == "/v2/scrape":
+            if data["url"].endswith("/fail"):
+                return httpx.Response(500, json={"success": False, "error": "Internal error"})
+            return httpx.Response(200, json={"success": True, "data": _doc(data["url"])})
+        jobs["job-1"] = data["urls"]
+        return httpx.Response(200, json={"success": True, "id": "job-1", "url": "https://api/job-1"})
+
+    async def fake_get(self, endpoint, headers=None, timeout=None):
+        if endpoint == "/v2/concurrency-check":
+            return httpx.Response(200, json={"success": True, "data": {"concurrency": in_use, "maxConcurrency": 30}})
+        if endpoint.endswith("/errors"):
+            failed = [u for u in jobs["job-1"] if u.endswith("/fail")]
+            return httpx.Response(200, json={"success": True, "errors": [{"id": "e", "url": u, "error": "blocked"} for u in failed]})
+        ok = [u for u in jobs["job-1"] if not u.endswith("/fail")]
+        return httpx.Response(200, json={
+            "success": True, "status": "completed", "completed": 3, "total": 3, "data": [_doc(u) for u in ok],
+        })
+
+    monkeypatch.setattr(AsyncHttpClient, "post", fake_post)
+    monkeypatch.setattr(AsyncHttpClient, "get", fake_get)
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost")
+    urls = [f"https://example.com/{i}" for i in range(30)] + ["https://example.com/fail"]
+
+    stream = await client.scrape_urls(urls, poll_interval=0)
+    assert stream.plan.strategy == strategy
+    results = {url: result async for url, result in stream}
+    assert set(results) == set(urls)
+    assert isinstance(results["https://example.com/fail"], Exception)
+    assert results["https://example.com/3"].markdown == "https://example.com/3"
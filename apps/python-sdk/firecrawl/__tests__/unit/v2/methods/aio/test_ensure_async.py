@@ -63,7 +63,7 @@ async def test_wait_batch_scrape_polling_interval(monkeypatch):
 
     states = ["scraping", "completed"]
 
-    async def fake_status(client, job_id):
+    async def fake_status(client, job_id, **kwargs):
         state = states.pop(0)
         return S(state)
 
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from firecrawl.v2.batch_producer import BatchProducer
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+class FakeGrowingBatchApi:
+    """One batch job that grows with appendToId; every status request scrapes one more URL."""
+
+    def __init__(self, fail_append=False):
+        self.fail_append = fail_append
+        self.lock = threading.Lock()
+        self.posts = []
+        self.urls = []
+        self.done = 0
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def post(self, path, data, headers=None):
+        with self.lock:
+            self.posts.append((time.monotonic(), data.get("appendToId"), list(data["urls"]), data.get("webhook")))
+            if data.get("appendToId") and self.fail_append:
+                return FakeResponse({"success": False, "error": "Job not found"}, 404)
+            self.urls.extend(data["urls"])
+            return FakeResponse({"success": True, "id": "job-1", "url": "https://api/job-1"})
+
+    def get(self, url, timeout=None):
+        with self.lock:
+            skip = int(url.partition("?skip=")[2] or 0)
+            self.done = min(len(self.urls), self.done + 1)
+            page = self.urls[skip:self.done]
+            status = "completed" if self.done == len(self.urls) else "scraping"
+            return FakeResponse({
+                "success": True,
+                "status": status,
+                "completed": self.done,
+                "total": len(self.urls),
+                "next": None,
+                "data": [{"markdown": u, "metadata": {"sourceURL": u}} for u in page],
+            })
+
+
+def test_flushes_by_size_and_appends_to_one_job():
+    api = FakeGrowingBatchApi()
+    producer = BatchProducer(api, max_batch_size=3, flush_interval=10, poll_interval=0, webhook="https://hook")
+    producer.add_many([f"https://example.com/{i}" for i in range(7)])
+    producer.close()
+
+    assert [len(urls) for _, _, urls, _ in api.posts] == [3, 3, 1]
+    assert [append_to for _, append_to, _, _ in api.posts] == [None, "job-1", "job-1"]
+    # The webhook belongs to the job and is only sent when it is opened
+    assert [hook for _, _, _, hook in api.posts] == ["https://hook", None, None]
+    assert producer.job_id == "job-1"
+    stats = producer.stats
+    assert (stats.added, stats.submitted, stats.flushes, stats.buffered) == (7, 7, 3, 0)
+
+    docs = list(producer.results())
+    assert [d.markdown for d in docs] == [f"https://example.com/{i}" for i in range(7)]
+
+
+def test_time_trigger_sends_partial_batch_quickly():
+    api = FakeGrowingBatchApi()
+    producer = BatchProducer(api, max_batch_size=100, flush_interval=0.02)
+    added_at = time.monotonic()
+    producer.add("https://example.com/a")
+    deadline = time.monotonic() + 2
+    while not api.posts and time.monotonic() < deadline:
+        time.sleep(0.002)
+    assert api.posts and api.posts[0][0] - added_at < 0.5
+    producer.close()
+    assert producer.stats.max_buffer_seconds >= 0.02
+
+
+def test_results_stream_while_urls_are_added():
+    api = FakeGrowingBatchApi()
+    producer = BatchProducer(api, max_batch_size=2, flush_interval=0.005, poll_interval=0.005)
+    seen = []
+    reader = threading.Thread(target=lambda: seen.extend(d.markdown for d in producer.results()))
+    reader.start()
+    for i in range(6):
+        producer.add(f"https://example.com/{i}")
+        time.sleep(0.01)
+    producer.close()
+    reader.join(timeout=5)
+
+    assert not reader.is_alive()
+    assert seen == [f"https://example.com/{i}" for i in range(6)]
+
+
+def test_background_errors_surface_and_closed_producer_rejects_urls():
+    api = FakeGrowingBatchApi(fail_append=True)
+    producer = BatchProducer(api, max_batch_size=1, flush_interval=0)
+    producer.add_many(["https://example.com/a", "https://example.com/b"])
+    with pytest.raises(Exception):
+        producer.close()
+
+    ok = BatchProducer(FakeGrowingBatchApi())
+    ok.close()
+    assert list(ok.results()) == []
+    with pytest.raises(RuntimeError):
+        ok.add("https://example.com/c")
+    with pytest.raises(ValueError):
+        BatchProducer(FakeGrowingBatchApi(), max_batch_size=10, max_pending=5)
+
+
+def test_dedupe_collapses_repeats_across_flushes():
+    api = FakeGrowingBatchApi()
+    producer = BatchProducer(api, max_batch_size=2, flush_interval=10, poll_interval=0, dedupe=True)
+    producer.add_many(["https://example.com/a", "https://example.com/b"])
+    producer.add_many(["https://example.com/a/", "https://example.com/c#x", "https://example.com/b?utm_source=n"])
+    producer.close()
+
+    assert [u for _, _, urls, _ in api.posts for u in urls] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c#x",
+    ]
+    stats = producer.stats
+    assert (stats.added, stats.collapsed, stats.submitted) == (5, 2, 3)
@@ -0,0 +1,152 @@
+from firecrawl.v2.methods.batch import batch_scrape, iter_large_batch
+from firecrawl.v2.types import BatchRetryPolicy, CrawlError, ScrapeOptions
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+ERRORS = {
+    "timeout": ("SCRAPE_TIMEOUT", "Scrape timed out"),
+    "proxy": (None, "Proxy error: tunnel failed"),
+    "dns": ("SCRAPE_DNS_RESOLUTION_ERROR", "DNS resolution failed"),
+}
+
+
+class FakeBatchApi:
+    """
+    Batch endpoints where every submitted URL finishes on the next status read.
+
+    ``outcomes`` maps a URL to the result of each attempt ("ok" or a key of
+    ERRORS); URLs not listed succeed. Like the API, a job reports "completed"
+    (after ``scraping_reads`` status reads) even while appended URLs run;
+    their results show up ``append_lag`` status reads after the append.
+    """
+
+    def __init__(self, outcomes, append_lag=0, scraping_reads=0):
+        self.outcomes = {url: list(results) for url, results in outcomes.items()}
+        self.append_lag = append_lag
+        self.scraping_reads = scraping_reads
+        self.jobs = {}
+        self.posts = []
+        # Status reads of the job at each errors request
+        self.error_reads = []
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def post(self, path, data, headers=None):
+        self.posts.append(data)
+        job_id = data.get("appendToId") or f"job-{len(self.jobs)}"
+        job = self.jobs.setdefault(job_id, {"docs": [], "errors": [], "total": 0, "reads": 0, "queued": []})
+        ready_at = job["reads"] + (self.append_lag if data.get("appendToId") else 0)
+        for url in data["urls"]:
+            job["total"] += 1
+            job["queued"].append((ready_at, url, job["total"]))
+        self._settle(job)
+        return FakeResponse({"success": True, "id": job_id, "url": f"https://api/{job_id}"})
+
+    def _settle(self, job):
+        for entry in [e for e in job["queued"] if e[0] <= job["reads"]]:
+            job["queued"].remove(entry)
+            _, url, n = entry
+            pending = self.outcomes.get(url)
+            outcome = pending.pop(0) if pending else "ok"
+            if outcome == "ok":
+                job["docs"].append({"markdown": url, "metadata": {"sourceURL": url}})
+            else:
+                code, message = ERRORS[outcome]
+                job["errors"].append({"id": f"err-{n}", "url": url, "code": code, "error": message})
+
+    def get(self, url, timeout=None):
+        path, _, query = url.partition("?skip=")
+        if path.endswith("/errors"):
+            job = self.jobs[path.split("/")[-2]]
+            self.error_reads.append(job["reads"])
+            return FakeResponse({"success": True, "errors": list(job["errors"]), "robotsBlocked": []})
+        job = self.jobs[path.rsplit("/", 1)[-1]]
+        job["reads"] += 1
+        self._settle(job)
+        finished = len(job["docs"]) + len(job["errors"])
+        return FakeResponse({
+            "success": True,
+            "status": "scraping" if job["reads"] <= self.scraping_reads else "completed",
+            "completed": finished,
+            "total": job["total"],
+            "data": job["docs"][int(query or 0):],
+        })
+
+
+def test_policy_classifies_transient_errors_and_escalates_options():
+    policy = BatchRetryPolicy(escalate=ScrapeOptions(proxy="stealth"))
+    for kind, retryable in (("timeout", True), ("proxy", True), ("dns", False)):
+        code, message = ERRORS[kind]
+        assert policy.is_retryable(CrawlError(id="e", url="u", code=code, error=message)) is retryable
+    assert policy.is_retryable(CrawlError(id="e", url="u", error="Upstream returned 503")) is True
+    assert policy.is_retryable(CrawlError(id="e", url="u", error="Request failed with status 404")) is False
+
+    options = policy.retry_options(ScrapeOptions(formats=["markdown"], proxy="basic"))
+    assert options.proxy == "stealth" and options.formats is not None
+    assert BatchRetryPolicy().retry_options(None) is None
+
+
+def test_batch_scrape_appends_transient_failures_until_attempts_run_out():
+    api = FakeBatchApi({
+        "https://example.com/flaky": ["timeout", "ok"],
+        "https://example.com/dead": ["dns"],
+        "https://example.com/stuck": ["proxy", "proxy", "proxy", "ok"],
+    })
+    urls = ["https://example.com/ok", "https://example.com/flaky", "https://example.com/dead", "https://example.com/stuck"]
+    policy = BatchRetryPolicy(max_attempts=3, escalate=ScrapeOptions(proxy="stealth"))
+    job = batch_scrape(api, urls, options=ScrapeOptions(formats=["markdown"]), poll_interval=0, retry=policy)
+
+    assert job.status == "completed"
+    assert sorted(d.markdown for d in job.data) == ["https://example.com/flaky", "https://example.com/ok"]
+    appends = [p for p in api.posts if p.get("appendToId")]
+    assert [p["urls"] for p in appends] == [
+        ["https://example.com/flaky", "https://example.com/stuck"],
+        ["https://example.com/stuck"],
+    ]
+    assert all(p["appendToId"] == "job-0" and p["proxy"] == "stealth" and p["formats"] for p in appends)
+    assert "proxy" not in api.posts[0]
+
+
+def test_large_batch_resubmits_into_each_chunk_job():
+    api = FakeBatchApi({"https://example.com/1": ["timeout", "ok"], "https://example.com/4": ["timeout", "ok"]})
+    urls = [f"https://example.com/{i}" for i in range(6)]
+    progress = []
+    docs = list(iter_large_batch(
+        api, urls, chunk_size=3, poll_interval=0, max_chunks_in_flight=2,
+        on_progress=progress.append, retry=BatchRetryPolicy(),
+    ))
+
+    assert sorted(d.markdown for d in docs) == sorted(urls)
+    assert {p["appendToId"] for p in api.posts if p.get("appendToId")} == {"job-0", "job-1"}
+    final = {p.index: p for p in progress}
+    assert all(p.status == "completed" and p.resubmitted == 1 and p.documents == 3 for p in final.values())
+
+
+def test_wait_polls_for_appended_urls_while_the_job_stays_completed():
+    api = FakeBatchApi({"https://example.com/flaky": ["timeout", "ok"]}, append_lag=3, scraping_reads=2)
+    urls = ["https://example.com/a", "https://example.com/flaky"]
+    job = batch_scrape(api, urls, poll_interval=0, retry=BatchRetryPolicy())
+
+    assert job.status == "completed"
+    assert sorted(d.markdown for d in job.data) == urls
+    # Errors are only read once the job reports "completed", not while it scrapes
+    assert api.error_reads and min(api.error_reads) > 2
+
+
+def test_wait_gives_up_on_appended_urls_after_settle_timeout():
+    api = FakeBatchApi({"https://example.com/flaky": ["timeout", "ok"]}, append_lag=10**6)
+    policy = BatchRetryPolicy(settle_timeout=0.05)
+    job = batch_scrape(api, ["https://example.com/a", "https://example.com/flaky"], poll_interval=0, retry=policy)
+
+    assert [d.markdown for d in job.data] == ["https://example.com/a"]
+    assert len([p for p in api.posts if p.get("appendToId")]) == 1
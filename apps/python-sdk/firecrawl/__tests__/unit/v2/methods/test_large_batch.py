@@ -0,0 +1,122 @@
+import pytest
+
+from firecrawl.v2.methods.batch import chunks_in_flight, iter_large_batch, process_large_batch, start_batch_scrape
+from firecrawl.v2.utils.url_dedupe import UrlDeduplicator
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+class FakeBatchApi:
+    """Batch endpoints where each status request lets a job finish ``step`` more URLs."""
+
+    def __init__(self, step=1, page_size=2, max_concurrency=None):
+        self.step = step
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.jobs = {}
+        self.running = 0
+        self.max_running = 0
+        self.requested = []
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def post(self, path, data, headers=None):
+        job_id = f"job-{len(self.jobs)}"
+        self.jobs[job_id] = {"urls": data["urls"], "done": 0, "finished": False}
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        return FakeResponse({"success": True, "id": job_id, "url": f"https://api/{job_id}"})
+
+    def get(self, url, timeout=None):
+        if url == "/v2/concurrency-check":
+            if self.max_concurrency is None:
+                return FakeResponse({"success": False, "error": "unavailable"}, 500)
+            return FakeResponse({"success": True, "data": {"concurrency": 0, "maxConcurrency": self.max_concurrency}})
+        self.requested.append(url)
+        path, _, query = url.partition("?skip=")
+        job_id = path.rsplit("/", 1)[-1]
+        skip = int(query or 0)
+        job = self.jobs[job_id]
+        job["done"] = min(len(job["urls"]), job["done"] + self.step)
+        available = job["urls"][skip:job["done"]]
+        page = available[: self.page_size]
+        status = "completed" if job["done"] == len(job["urls"]) else "scraping"
+        if status == "completed" and not job["finished"]:
+            job["finished"] = True
+            self.running -= 1
+        next_url = f"{path}?skip={skip + len(page)}" if len(available) > len(page) else None
+        return FakeResponse({
+            "success": True,
+            "status": status,
+            "completed": job["done"],
+            "total": len(job["urls"]),
+            "creditsUsed": job["done"],
+            "next": next_url,
+            "data": [{"markdown": u, "metadata": {"sourceURL": u}} for u in page],
+        })
+
+
+URLS = [f"https://example.com/{i}" for i in range(10)]
+
+
+def test_keeps_chunks_in_flight_and_streams_each_document_once():
+    api = FakeBatchApi(step=1)
+    progress = []
+    docs = list(iter_large_batch(api, URLS, chunk_size=2, poll_interval=0, max_chunks_in_flight=3, on_progress=progress.append))
+
+    assert sorted(d.markdown for d in docs) == sorted(URLS)
+    assert len(docs) == len(URLS)
+    assert api.max_running == 3
+    final = {p.index: p for p in progress}
+    assert sorted(final) == [0, 1, 2, 3, 4]
+    assert all(p.status == "completed" and p.documents == 2 and p.finished_at for p in final.values())
+    # Results are read from a cursor, never from the start again
+    assert all("skip=" in url for url in api.requested)
+
+
+def test_process_large_batch_keeps_chunk_order():
+    api = FakeBatchApi(step=2, page_size=1)
+    docs = process_large_batch(api, URLS, chunk_size=3, poll_interval=0, max_chunks_in_flight=4)
+    assert [d.markdown for d in docs] == URLS
+
+
+def test_limit_derived_from_team_concurrency():
+    assert chunks_in_flight(None, 100, 50) == 2
+    assert chunks_in_flight(50, 100, 50) == 2
+    assert chunks_in_flight(250, 100, 50) == 4
+    assert chunks_in_flight(10_000, 100, 50) == 16
+    assert chunks_in_flight(250, 100, 2) == 2
+
+    api = FakeBatchApi(max_concurrency=5)
+    list(iter_large_batch(api, URLS, chunk_size=2, poll_interval=0))
+    assert api.max_running == 4
+
+
+def test_chunk_timeout_and_invalid_limit():
+    api = FakeBatchApi(step=0)
+    with pytest.raises(TimeoutError):
+        list(iter_large_batch(api, URLS[:2], chunk_size=2, poll_interval=0.01, timeout=0.05))
+    with pytest.raises(ValueError):
+        list(iter_large_batch(api, URLS, max_chunks_in_flight=0))
+
+
+def test_dedupe_before_chunking_and_on_start():
+    api = FakeBatchApi(step=5)
+    deduper = UrlDeduplicator()
+    docs = process_large_batch(api, URLS + [u + "/" for u in URLS], chunk_size=5, poll_interval=0, max_chunks_in_flight=2, dedupe=deduper)
+    assert [d.markdown for d in docs] == URLS
+    assert len(api.jobs) == 2
+    assert deduper.report.collapsed == 10
+
+    response = start_batch_scrape(api, ["https://example.com/x", "https://EXAMPLE.com/x#a"], dedupe=True)
+    assert api.jobs[response.id]["urls"] == ["https://example.com/x"]
+    assert response.collapsed_urls == 1
@@ -0,0 +1,166 @@
+"""
+Unit tests for raw (dict) result mode across scrape, crawl, batch, search and map.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.types import Document, CrawlJob, SearchRequest
+from firecrawl.v2.methods import scrape as scrape_module
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods import batch as batch_module
+from firecrawl.v2.methods import search as search_module
+from firecrawl.v2.methods import map as map_module
+from firecrawl.v2.utils.normalize import normalize_document_dict, parse_documents
+
+
+API_DOC = {
+    "markdown": "# Hello",
+    "rawHtml": "<html></html>",
+    "changeTracking": {"changeStatus": "same"},
+    "branding": {"colorScheme": "dark"},
+    "metadata": {"title": "Hello", "sourceURL": "https://example.com", "statusCode": "200", "x-extra": "ok"},
+}
+
+
+def _response(body):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = body
+    return response
+
+
+class TestNormalizeDocumentDict:
+    def test_converts_keys_without_models(self):
+        out = normalize_document_dict(API_DOC)
+        assert out["raw_html"] == "<html></html>"
+        assert out["change_tracking"] == {"changeStatus": "same"}
+        assert out["branding"] == {"color_scheme": "dark"}
+        assert out["metadata"]["source_url"] == "https://example.com"
+        assert out["metadata"]["status_code"] == 200
+        assert out["metadata"]["x-extra"] == "ok"
+        assert isinstance(out["metadata"], dict)
+
+    def test_does_not_mutate_input(self):
+        normalize_document_dict(API_DOC)
+        assert "rawHtml" in API_DOC
+        assert API_DOC["branding"] == {"colorScheme": "dark"}
+        assert "sourceURL" in API_DOC["metadata"]
+
+    def test_parse_documents_modes(self):
+        data = [API_DOC, "not-a-dict"]
+        typed = parse_documents(data)
+        assert len(typed) == 1 and isinstance(typed[0], Document)
+        assert parse_documents(data, raw="api") == [API_DOC]
+        snake = parse_documents(data, raw=True)
+        assert snake[0]["metadata"]["source_url"] == "https://example.com"
+
+
+class TestScrapeAndMapRaw:
+    def test_scrape_raw_modes(self):
+        client = Mock()
+        client.post.return_value = _response({"success": True, "data": API_DOC})
+
+        assert isinstance(scrape_module.scrape(client, "https://example.com"), Document)
+        assert scrape_module.scrape(client, "https://example.com", raw="api") is API_DOC
+        snake = scrape_module.scrape(client, "https://example.com", raw=True)
+        assert snake["raw_html"] == "<html></html>"
+
+    def test_map_raw_modes(self):
+        body = {"success": True, "links": ["https://a.com", {"url": "https://b.com", "title": "B"}]}
+        client = Mock()
+        client.post.return_value = _response(body)
+
+        assert map_module.map(client, "https://example.com", raw="api") is body
+        out = map_module.map(client, "https://example.com", raw=True)
+        assert out == {
+            "links": [
+                {"url": "https://a.com", "title": None, "description": None},
+                {"url": "https://b.com", "title": "B", "description": None},
+            ]
+        }
+
+
+class TestSearchRaw:
+    def test_search_raw_snake_case(self):
+        body = {
+            "success": True,
+            "data": {
+                "web": [{"url": "https://a.com", "title": "A"}, {"url": "https://b.com", "markdown": "# B", "metadata": {"statusCode": 200}}],
+                "images": [{"imageUrl": "https://img", "imageWidth": 10, "url": "https://c.com"}],
+            },
+        }
+        client = Mock()
+        client.post.return_value = _response(body)
+
+        out = search_module.search(client, SearchRequest(query="q"), raw=True)
+        assert out["web"][0] == {"url": "https://a.com", "title": "A"}
+        assert out["web"][1]["metadata"] == {"status_code": 200}
+        assert out["images"][0]["image_url"] == "https://img"
+        assert "news" not in out
+
+        assert search_module.search(client, SearchRequest(query="q"), raw="api") is body["data"]
+
+
+class TestCrawlAndBatchRaw:
+    def _status_body(self, next_url=None):
+        return {
+            "success": True,
+            "status": "completed",
+            "completed": 1,
+            "total": 1,
+            "creditsUsed": 1,
+            "expiresAt": "2025-01-01T00:00:00Z",
+            "next": next_url,
+            "data": [API_DOC],
+        }
+
+    def test_crawl_status_raw_snake_case_paginates(self):
+        client = Mock()
+        client.get.side_effect = [
+            _response(self._status_body("https://api/next")),
+            _response(self._status_body()),
+        ]
+        job = crawl_module.get_crawl_status(client, "job", raw=True)
+        assert job["status"] == "completed"
+        assert job["credits_used"] == 1
+        assert job["next"] is None
+        assert len(job["data"]) == 2
+        assert job["data"][0]["raw_html"] == "<html></html>"
+
+    def test_crawl_status_raw_api_keeps_payload(self):
+        client = Mock()
+        client.get.return_value = _response(self._status_body())
+        job = crawl_module.get_crawl_status(client, "job", raw="api")
+        assert job["creditsUsed"] == 1
+        assert job["data"] == [API_DOC]
+
+    def test_batch_status_raw(self):
+        client = Mock()
+        client.get.return_value = _response(self._status_body())
+        job = batch_module.get_batch_scrape_status(client, "job", raw=True)
+        assert job["status"] == "completed"
+        assert job["data"][0]["metadata"]["status_code"] == 200
+
+    def test_wait_for_batch_completion_raw(self):
+        client = Mock()
+        client.get.return_value = _response(self._status_body())
+        job = batch_module.wait_for_batch_completion(client, "job", poll_interval=0, raw=True)
+        assert isinstance(job, dict)
+
+
+class TestClientDefault:
+    def test_client_wide_raw_with_per_call_override(self):
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", raw=True)
+        client.http_client = Mock()
+        client.http_client.post.return_value = _response({"success": True, "data": API_DOC})
+        client.http_client.get.return_value = _response({
+            "success": True, "status": "completed", "completed": 0, "total": 0, "data": []
+        })
+
+        assert isinstance(client.scrape("https://example.com"), dict)
+        assert isinstance(client.scrape("https://example.com", raw=False), Document)
+        assert isinstance(client.get_crawl_status("job"), dict)
+        assert isinstance(client.get_crawl_status("job", raw=False), CrawlJob)
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from firecrawl.v2.methods.scrape import scrape_many
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+class FakeScrapeApi:
+    """Scrape endpoint whose latency is taken from the URL (``.../<ms>``); ``/fail`` URLs return 500."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.requested = []
+
+    def post(self, path, data, headers=None):
+        url = data["url"]
+        with self.lock:
+            self.requested.append(url)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(int(url.rsplit("/", 1)[-1]) / 1000 if url[-1].isdigit() else 0.005)
+            if url.endswith("/fail"):
+                return FakeResponse({"success": False, "error": "Internal error"}, 500)
+            return FakeResponse({"success": True, "data": {"markdown": url, "metadata": {"sourceURL": url}}})
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def test_results_arrive_by_completion_with_bounded_concurrency():
+    api = FakeScrapeApi()
+    urls = ["https://example.com/60", "https://example.com/5", "https://example.com/fail", "https://example.com/10"]
+    progress = []
+    results = list(scrape_many(api, urls, concurrency=2, on_progress=progress.append))
+
+    assert {url for url, _ in results} == set(urls)
+    assert results[-1][0] == "https://example.com/60"
+    errors = {url: result for url, result in results if isinstance(result, Exception)}
+    assert list(errors) == ["https://example.com/fail"]
+    assert api.max_running == 2
+    assert [p.completed for p in progress] == [1, 2, 3, 4]
+    assert (progress[-1].succeeded, progress[-1].failed, progress[-1].in_flight) == (3, 1, 0)
+
+
+def test_ordered_mode_yields_input_order():
+    api = FakeScrapeApi()
+    urls = ["https://example.com/40", "https://example.com/1", "https://example.com/20", "https://example.com/2"]
+    results = list(scrape_many(api, urls, concurrency=4, ordered=True, raw=True))
+    assert [url for url, _ in results] == urls
+    assert [doc["markdown"] for _, doc in results] == urls
+
+
+def test_breaking_out_cancels_urls_not_started():
+    api = FakeScrapeApi()
+    urls = [f"https://example.com/{20 + i}" for i in range(20)]
+    for _ in scrape_many(api, urls, concurrency=2):
+        break
+    time.sleep(0.1)
+    assert len(api.requested) <= 4
+
+
+def test_arguments_are_checked_and_urls_read_at_call_time():
+    api = FakeScrapeApi()
+    with pytest.raises(ValueError):
+        scrape_many(api, ["https://example.com/1"], concurrency=0)
+    urls = iter(["https://example.com/1", "https://example.com/2"])
+    stream = scrape_many(api, urls)
+    assert list(urls) == []
+    assert len(list(stream)) == 2
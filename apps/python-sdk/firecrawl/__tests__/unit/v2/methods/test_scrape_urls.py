@@ -0,0 +1,117 @@
+import pytest
+
+from firecrawl.v2.scrape_planner import ScrapePlanner, scrape_urls
+from firecrawl.v2.utils.error_handler import FirecrawlError
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+def _doc(url):
+    return {"markdown": url, "metadata": {"sourceURL": url}}
+
+
+class FakeApi:
+    """Scrape and batch endpoints; URLs ending in ``/fail`` fail on both paths."""
+
+    def __init__(self, max_concurrency=50, concurrency=0):
+        self.max_concurrency = max_concurrency
+        self.concurrency = concurrency
+        self.scraped = []
+        self.jobs = {}
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def post(self, path, data, headers=None):
+        if path == "/v2/scrape":
+            self.scraped.append(data["url"])
+            if data["url"].endswith("/fail"):
+                return FakeResponse({"success": False, "error": "Internal error"}, 500)
+            return FakeResponse({"success": True, "data": _doc(data["url"])})
+        job_id = f"job-{len(self.jobs)}"
+        self.jobs[job_id] = data["urls"]
+        return FakeResponse({"success": True, "id": job_id, "url": f"https://api/{job_id}"})
+
+    def get(self, url, timeout=None):
+        if url == "/v2/concurrency-check":
+            return FakeResponse(
+                {"success": True, "data": {"concurrency": self.concurrency, "maxConcurrency": self.max_concurrency}}
+            )
+        path = url.partition("?")[0]
+        if path.endswith("/errors"):
+            urls = self.jobs[path.split("/")[-2]]
+            return FakeResponse({
+                "success": True,
+                "errors": [{"id": "e", "url": u, "error": "blocked"} for u in urls if u.endswith("/fail")],
+                "robotsBlocked": [],
+            })
+        urls = self.jobs[path.rsplit("/", 1)[-1]]
+        ok = [u for u in urls if not u.endswith("/fail")]
+        return FakeResponse({
+            "success": True,
+            "status": "completed",
+            "completed": len(urls),
+            "total": len(urls),
+            "data": [_doc(u) for u in ok],
+        })
+
+
+def test_planner_weighs_list_size_headroom_and_latencies():
+    planner = ScrapePlanner(max_fan_out=50, large_batch_threshold=200, chunk_size=20)
+
+    small = planner.plan(5, max_concurrency=50, concurrency=0)
+    assert small.strategy == "scrape_many" and small.concurrency == 5
+
+    # Little concurrency left: fanning out would queue, a batch job runs server-side
+    crowded = planner.plan(40, max_concurrency=50, concurrency=48)
+    assert crowded.strategy == "batch" and crowded.headroom == 2
+    assert crowded.estimated_batch_seconds < crowded.estimated_fan_out_seconds
+
+    assert planner.plan(120, max_concurrency=50).strategy == "batch"
+    large = planner.plan(500, max_concurrency=50)
+    assert large.strategy == "large_batch" and large.chunk_size == 20
+
+    # Slow scrapes observed: the same 40 URLs go to a batch job even with full headroom
+    assert planner.plan(40, max_concurrency=50).strategy == "scrape_many"
+    for _ in range(10):
+        planner.observe_scrape_latency(30.0)
+        planner.observe_batch_first_result(1.0)
+    assert planner.plan(40, max_concurrency=50).strategy == "batch"
+
+    forced = planner.plan(3, strategy="large_batch")
+    assert forced.strategy == "large_batch" and forced.reason == "requested by caller"
+    with pytest.raises(ValueError):
+        planner.plan(3, strategy="crawl")
+
+
+@pytest.mark.parametrize("strategy", [None, "batch", "large_batch"])
+def test_every_strategy_streams_documents_and_failures_by_url(strategy):
+    api = FakeApi()
+    urls = ["https://example.com/a", "https://example.com/fail", "https://example.com/b"]
+    planner = ScrapePlanner(chunk_size=2)
+    stream = scrape_urls(api, planner, urls, strategy=strategy, poll_interval=0)
+    assert stream.plan.strategy == (strategy or "scrape_many")
+
+    results = dict(stream)
+    assert set(results) == set(urls)
+    assert results["https://example.com/a"].markdown == "https://example.com/a"
+    assert isinstance(results["https://example.com/fail"], FirecrawlError)
+    assert bool(api.scraped) == (strategy is None)
+    assert len(api.jobs) == {None: 0, "batch": 1, "large_batch": 2}[strategy]
+
+
+def test_finished_runs_update_the_estimates():
+    api = FakeApi()
+    planner = ScrapePlanner(scrape_latency=100.0, batch_first_result=100.0, smoothing=1.0)
+    list(scrape_urls(api, planner, ["https://example.com/a"]))
+    assert planner.scrape_latency < 1.0
+    list(scrape_urls(api, planner, ["https://example.com/a"], strategy="batch", poll_interval=0))
+    assert planner.batch_first_result < 1.0
@@ -0,0 +1,140 @@
+import base64
+import os
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.methods.scrape import scrape
+from firecrawl.v2.types import Document, LazyDocument
+from firecrawl.v2.utils.assets import ASSET_REF_PREFIX, AssetStore, externalize_raw_documents
+from firecrawl.v2.utils.normalize import parse_documents
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 20
+PDF = b"%PDF-1.7\n" + b"0123456789" * 300
+PNG_B64 = base64.b64encode(PNG).decode()
+PNG_DATA_URL = "data:image/png;base64," + PNG_B64
+
+
+def _api_doc(screenshot=PNG_DATA_URL):
+    return {
+        "markdown": "# Hi",
+        "screenshot": screenshot,
+        "actions": {
+            "screenshots": [PNG_DATA_URL, "https://cdn.example.com/shot.png"],
+            "pdfs": [base64.b64encode(PDF).decode()],
+            "scrapes": [{"url": "https://example.com", "html": "<p/>"}],
+        },
+        "metadata": {"sourceURL": "https://example.com", "statusCode": 200},
+    }
+
+
+class TestInMemoryStore:
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_parse_documents_leaves_references(self, lazy):
+        doc = parse_documents([_api_doc()], lazy=lazy, assets=AssetStore())[0]
+        assert doc.screenshot.startswith(ASSET_REF_PREFIX)
+        assert len(doc.screenshot) < 100
+        assert doc.screenshot_bytes() == PNG
+        shots = doc.actions["screenshots"]
+        assert shots[0] == doc.screenshot
+        assert shots[1] == "https://cdn.example.com/shot.png"
+        assert doc.asset_bytes(shots[1]) is None
+        assert doc.asset_bytes(doc.actions["pdfs"][0]) == PDF
+        assert doc.actions["scrapes"][0]["html"] == "<p/>"
+        assert doc.metadata.status_code == 200
+        assert doc.model_dump()["screenshot"] == doc.screenshot
+
+    def test_input_dict_is_not_mutated(self):
+        api_doc = _api_doc()
+        parse_documents([api_doc], assets=AssetStore())
+        assert api_doc == _api_doc()
+
+    def test_assets_survive_pickling(self):
+        doc = parse_documents([_api_doc()], lazy=True, assets=AssetStore())[0]
+        restored = pickle.loads(pickle.dumps(doc))
+        assert isinstance(restored, LazyDocument)
+        assert restored.screenshot_bytes() == PNG
+
+    def test_small_and_hosted_values_stay_inline(self):
+        small = "data:image/png;base64," + base64.b64encode(b"tiny").decode()
+        doc = parse_documents([{"screenshot": small}], assets=AssetStore())[0]
+        assert doc.screenshot == small
+        assert doc.screenshot_bytes() == b"tiny"
+
+        doc = parse_documents([{"screenshot": "https://cdn.example.com/a.png"}], assets=AssetStore())[0]
+        assert doc.screenshot == "https://cdn.example.com/a.png"
+        assert doc.screenshot_bytes() is None
+
+    def test_invalid_base64_is_left_untouched(self):
+        bogus = "data:image/png;base64," + "!" * 2000
+        doc = parse_documents([{"screenshot": bogus}], assets=AssetStore())[0]
+        assert doc.screenshot == bogus
+
+    def test_raw_modes(self):
+        snake = parse_documents([_api_doc()], raw=True, assets=AssetStore())[0]
+        assert snake["screenshot"] == PNG
+        assert snake["actions"]["pdfs"] == [PDF]
+        api = parse_documents([_api_doc()], raw="api", assets=AssetStore())[0]
+        assert api["screenshot"] == PNG_DATA_URL
+
+    def test_unknown_reference_raises(self):
+        doc = Document(screenshot=ASSET_REF_PREFIX + "0" * 64)
+        with pytest.raises(KeyError):
+            doc.screenshot_bytes()
+
+    def test_without_store_decodes_on_demand(self):
+        doc = parse_documents([_api_doc()])[0]
+        assert doc.screenshot == PNG_DATA_URL
+        assert doc.screenshot_bytes() == PNG
+        assert Document(screenshot=PNG_B64).screenshot_bytes() == PNG
+        assert Document().screenshot_bytes() is None
+
+
+class TestDirectoryStore:
+    def test_streams_to_content_addressed_files(self, tmp_path, monkeypatch):
+        # Small chunks exercise the streaming decoder across several writes
+        monkeypatch.setattr("firecrawl.v2.utils.assets._STREAM_CHUNK", 64)
+        store = AssetStore(tmp_path / "assets")
+        docs = parse_documents([_api_doc(), _api_doc()], assets=store)
+        first, second = docs
+        assert first.screenshot.startswith("file://")
+        assert first.screenshot.endswith(".png")
+        assert first.screenshot == second.screenshot
+        assert first.screenshot_bytes() == PNG
+        assert first.asset_bytes(first.actions["pdfs"][0]) == PDF
+
+        files = sorted(p for p in (tmp_path / "assets").rglob("*") if p.is_file())
+        assert len(files) == 2  # screenshot (deduplicated) + pdf
+        assert not any(p.name.startswith(".tmp-") for p in files)
+        assert first.__pydantic_private__["_assets"] is None
+
+    def test_raw_mode_gets_file_references(self, tmp_path):
+        snake = parse_documents([_api_doc()], raw=True, assets=AssetStore(tmp_path))[0]
+        assert snake["screenshot"].startswith("file://")
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            AssetStore(min_size=-1)
+
+
+class TestClientIntegration:
+    def test_scrape_uses_client_store(self):
+        client = Mock()
+        client.asset_store = AssetStore()
+        response = Mock(ok=True)
+        response.json.return_value = {"success": True, "data": _api_doc()}
+        client.post.return_value = response
+
+        doc = scrape(client, "https://example.com")
+        assert doc.screenshot.startswith(ASSET_REF_PREFIX)
+        assert doc.screenshot_bytes() == PNG
+
+    def test_watcher_raw_data_holds_bytes(self):
+        docs = externalize_raw_documents([_api_doc()], AssetStore())
+        assert docs[0]["screenshot"] == PNG
+        # Re-parsing watcher data into typed snapshots reuses the decoded bytes
+        doc = parse_documents(docs, assets=AssetStore())[0]
+        assert doc.screenshot_bytes() == PNG
+        assert externalize_raw_documents([_api_doc()], None)[0]["screenshot"] == PNG_DATA_URL
@@ -0,0 +1,95 @@
+import io
+import sys
+
+import pytest
+
+from firecrawl.v2.types import BatchScrapeJob, CrawlJob
+from firecrawl.v2.utils.normalize import parse_documents
+from firecrawl.v2.frame import COLUMN_NAMES, DocumentFrame, _document_row
+
+
+def _api_docs(start, count):
+    return [
+        {
+            "markdown": f"# Page {i}",
+            "links": [f"https://example.com/{i + 1}"],
+            "metadata": {
+                "title": [f"Page {i}"],
+                "sourceURL": f"https://example.com/{i}",
+                "statusCode": "200",
+                "contentType": "text/html",
+            },
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class TestDocumentRow:
+    def test_typed_and_raw_documents_give_same_row(self):
+        docs = _api_docs(0, 1)
+        lazy = parse_documents(docs, lazy=True)[0]
+        typed = _document_row(lazy)
+        # Deferred metadata is read from the payload without being validated
+        assert "metadata" not in lazy.__dict__
+        assert _document_row(parse_documents(docs, lazy=False)[0]) == typed
+        assert _document_row(docs[0]) == typed
+        assert _document_row(parse_documents(docs, raw=True)[0]) == typed
+        assert typed["title"] == "Page 0"
+        assert typed["status_code"] == 200
+        assert typed["url"] == "https://example.com/0"
+
+    def test_missing_pyarrow_raises_helpful_error(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(ImportError, match=r"firecrawl-py\[arrow\]"):
+            DocumentFrame()
+
+
+class TestDocumentFrame:
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_builds_incrementally_one_batch_per_page(self):
+        frame = DocumentFrame()
+        assert frame.append(parse_documents(_api_docs(0, 3))) == 3
+        assert frame.append_job({"status": "completed", "data": _api_docs(3, 2)}) == 2
+        assert frame.append([]) == 0
+
+        assert len(frame) == 5
+        assert frame.num_batches == 2
+        table = frame.to_arrow()
+        assert table.num_rows == 5
+        assert tuple(table.column_names) == COLUMN_NAMES
+        assert str(table.column("markdown").type) == "large_string"
+        assert table.column("source_url").to_pylist() == [f"https://example.com/{i}" for i in range(5)]
+
+    def test_lookup_by_source_url(self):
+        frame = DocumentFrame.from_job(CrawlJob(status="completed", data=parse_documents(_api_docs(0, 4))))
+        assert "https://example.com/2" in frame
+        row = frame.get("https://example.com/2")
+        assert row["markdown"] == "# Page 2"
+        assert row["links"] == ["https://example.com/3"]
+        assert frame.get("https://missing") is None
+
+        # Newer rows win for repeated URLs
+        frame.append([{"markdown": "updated", "metadata": {"sourceURL": "https://example.com/2"}}])
+        assert frame.get("https://example.com/2")["markdown"] == "updated"
+
+    def test_from_batch_job(self):
+        job = BatchScrapeJob(status="completed", completed=2, total=2, data=parse_documents(_api_docs(0, 2)))
+        assert len(DocumentFrame.from_job(job)) == 2
+
+    def test_parquet_roundtrip(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        frame = DocumentFrame(_api_docs(0, 3))
+        buffer = io.BytesIO()
+        frame.to_parquet(buffer)
+        buffer.seek(0)
+        assert pq.read_table(buffer).equals(frame.to_arrow())
+
+    def test_pandas_and_polars_export(self):
+        frame = DocumentFrame(_api_docs(0, 3))
+        pytest.importorskip("pandas")
+        assert list(frame.to_pandas()["title"]) == ["Page 0", "Page 1", "Page 2"]
+        pytest.importorskip("polars")
+        assert frame.to_polars().shape == (3, len(COLUMN_NAMES))
@@ -0,0 +1,112 @@
+import builtins
+
+import pytest
+
+from firecrawl.v2.types import CrawlJob, Document
+from firecrawl.v2.utils.normalize import parse_documents
+
+
+@pytest.fixture
+def store_cls():
+    pytest.importorskip("zstandard")
+    from firecrawl.v2.store import DocumentStore
+
+    return DocumentStore
+
+
+def _api_doc(i, scrape_id, markdown=None):
+    return {
+        "markdown": markdown or f"# Page {i}\n\n" + "lorem ipsum " * 200,
+        "links": [f"https://example.com/{i + 1}"],
+        "metadata": {
+            "sourceURL": f"https://example.com/{i}",
+            "title": [f"Page {i}", "dup"],
+            "statusCode": 200,
+            "scrapeId": scrape_id,
+            "cacheState": "miss",
+            "creditsUsed": 1,
+        },
+    }
+
+
+def _job(docs, raw=False):
+    if raw == "api":
+        return {"status": "completed", "completed": len(docs), "total": len(docs), "data": docs}
+    return CrawlJob(status="completed", completed=len(docs), total=len(docs), data=parse_documents(docs))
+
+
+class TestDocumentStore:
+    def test_round_trip_by_url_and_scrape_id(self, store_cls, tmp_path):
+        with store_cls(tmp_path) as store:
+            result = store.add_job(_job([_api_doc(i, f"s{i}") for i in range(5)]), job_id="job-1")
+            assert result.documents == 5
+            assert result.deduplicated == 0
+
+            doc = store.get("https://example.com/3")
+            assert isinstance(doc, Document)
+            assert doc.metadata.title == "Page 3, dup"
+            assert doc.metadata.scrape_id == "s3"
+            assert doc.links == ["https://example.com/4"]
+            assert store.get_by_scrape_id("s1").metadata.source_url == "https://example.com/1"
+            assert store.get("https://example.com/3", raw=True)["metadata"]["cache_state"] == "miss"
+            assert store.get("https://missing.example.com") is None
+            assert "https://example.com/0" in store
+            assert len(store) == 5
+            assert sorted(store.urls()) == [f"https://example.com/{i}" for i in range(5)]
+
+    def test_identical_pages_across_crawls_stored_once(self, store_cls, tmp_path):
+        with store_cls(tmp_path) as store:
+            store.add_job(_job([_api_doc(i, f"a{i}") for i in range(4)]), job_id="crawl-a")
+            before = store.stats
+            # Same content, new scrape ids; one page changed; raw API payload this time
+            docs = [_api_doc(i, f"b{i}") for i in range(3)] + [_api_doc(3, "b3", markdown="# changed")]
+            result = store.add_job(_job(docs, raw="api"), job_id="crawl-b")
+            assert result.deduplicated == 3
+            stats = store.stats
+            assert stats.documents == 8
+            assert stats.records == before.records + 1
+            assert stats.compressed_bytes < stats.raw_bytes
+
+            assert store.get("https://example.com/0").metadata.scrape_id == "b0"
+            assert store.get_by_scrape_id("a0").metadata.scrape_id == "a0"
+            assert store.get("https://example.com/3").markdown == "# changed"
+            versions = store.versions("https://example.com/3")
+            assert [v["job_id"] for v in versions] == ["crawl-a", "crawl-b"]
+            assert versions[0]["content_hash"] != versions[1]["content_hash"]
+
+    def test_segments_rotate_and_reopen(self, store_cls, tmp_path):
+        with store_cls(tmp_path, segment_size=200) as store:
+            store.add([Document.model_validate({"markdown": f"{i}" * 500, "metadata": {"source_url": f"u{i}"}}) for i in range(6)])
+            # Reads of the active segment after further appends re-map it
+            assert store.get("u5").markdown == "5" * 500
+            store.add([{"markdown": "late", "metadata": {"sourceURL": "u-late"}}])
+            assert store.get("u-late").markdown == "late"
+            assert store.stats.segments > 1
+
+        with store_cls(tmp_path, segment_size=200) as reopened:
+            assert reopened.get("u0").markdown == "0" * 500
+            assert len(reopened) == 7
+            reopened.add([{"markdown": "after reopen", "metadata": {"sourceURL": "u-new"}}])
+            assert reopened.get("u-new").markdown == "after reopen"
+
+    def test_failed_add_leaves_index_unchanged(self, store_cls, tmp_path):
+        with store_cls(tmp_path) as store:
+            with pytest.raises(TypeError):
+                store.add([_api_doc(0, "s0"), object()])
+            assert len(store) == 0
+            assert store.stats.records == 0
+
+
+def test_missing_zstandard_raises_helpful_error(monkeypatch, tmp_path):
+    from firecrawl.v2 import store as store_module
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "zstandard":
+            raise ImportError("no zstandard")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    with pytest.raises(ImportError, match=r"firecrawl-py\[store\]"):
+        store_module.DocumentStore(tmp_path)
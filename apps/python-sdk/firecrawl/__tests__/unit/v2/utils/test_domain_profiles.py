@@ -0,0 +1,115 @@
+import json
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils.domain_profiles import DomainProfiles, option_key
+from firecrawl.v2.utils.error_handler import RateLimitError, RequestTimeoutError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.response_cache import SQLiteCacheBackend
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = json.dumps(body).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+
+    def json(self):
+        return self._body
+
+
+def _doc(markdown="content", status=200, proxy_used="basic"):
+    return {"markdown": markdown, "metadata": {"sourceURL": "u", "statusCode": status, "proxyUsed": proxy_used}}
+
+
+def test_cheapest_option_set_that_works_is_suggested():
+    profiles = DomainProfiles(min_failures=2)
+    url = "https://shop.test/item"
+    assert profiles.suggest(url) is None
+
+    # Empty pages and blocked statuses fail; one failure is not enough to move on
+    profiles.record(url, None, _doc(markdown=""), 1.0)
+    assert profiles.suggest(url) is None
+    profiles.record(url, None, _doc(status=403), 1.0)
+    assert profiles.suggest(url).wait_for == 3000
+
+    profiles.record(url, ScrapeOptions(wait_for=3000), _doc(markdown=""), 4.0)
+    profiles.record(url, ScrapeOptions(wait_for=3000), _doc(markdown=""), 4.0)
+    assert profiles.suggest(url).mobile is True
+
+    profiles.record(url, ScrapeOptions(mobile=True), _doc(), 2.0)
+    assert profiles.suggest("https://shop.test/other").mobile is True
+    # Errors that say nothing about the site are ignored
+    profiles.record(url, ScrapeOptions(mobile=True), RateLimitError("slow down", 429), 0.1)
+    profiles.record(url, ScrapeOptions(mobile=True), _doc(status=404), 0.1)
+    stats = profiles.profile(url).options[option_key({"mobile": True})]
+    assert (stats.attempts, stats.successes) == (1, 1)
+
+
+def test_auto_proxy_escalation_counts_against_the_basic_proxy():
+    profiles = DomainProfiles(min_failures=2)
+    url = "https://guarded.test/"
+    for _ in range(2):
+        profiles.record(url, ScrapeOptions(proxy="auto"), _doc(proxy_used="stealth"), 5.0)
+    # Basic-proxy sets are passed over; stealth is known to work
+    assert profiles.suggest(url).proxy == "stealth"
+
+
+def test_timeout_follows_p95_latency_and_timeouts_raise_it(tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "profiles.sqlite")
+    profiles = DomainProfiles(backend, min_samples=5, min_timeout=1000, timeout_margin=1.5)
+    url = "https://slow.test/"
+    for latency in (2.0, 2.0, 3.0, 4.0):
+        profiles.record(url, None, _doc(), latency)
+    assert profiles.suggest(url) is None
+    profiles.record(url, None, _doc(), 10.0)
+    assert profiles.suggest(url).timeout == 15000
+
+    profiles.record(url, ScrapeOptions(timeout=30000), RequestTimeoutError("timed out", 408), 1.0)
+    # Profiles live in the backend, shared by another instance
+    assert DomainProfiles(SQLiteCacheBackend(tmp_path / "profiles.sqlite")).suggest(url).timeout == 45000
+
+
+def test_scrape_applies_the_profile_to_unset_options(monkeypatch):
+    sent = []
+
+    def fake_post(self, endpoint, data, headers=None, timeout=None, retries=3, backoff_factor=0.5):
+        sent.append(data)
+        stealth = data.get("proxy") == "stealth"
+        return FakeResponse({"success": True, "data": _doc(markdown="ok" if stealth else "")})
+
+    monkeypatch.setattr(HttpClient, "post", fake_post)
+    profiles = DomainProfiles(min_failures=1, ladder=[{}, {"proxy": "stealth"}])
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", domain_profiles=profiles)
+
+    assert client.scrape("https://guarded.test/a").markdown == ""
+    assert client.scrape("https://guarded.test/b", formats=["markdown"]).markdown == "ok"
+    assert sent[1]["proxy"] == "stealth" and sent[1]["formats"] == ["markdown"]
+    # Options set by the caller win
+    client.scrape("https://guarded.test/c", proxy="basic")
+    assert sent[2]["proxy"] == "basic"
+
+    profiles.apply = False
+    client.scrape("https://guarded.test/d")
+    assert "proxy" not in sent[3]
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_records_outcomes(monkeypatch):
+    async def fake_post(self, endpoint, data, headers=None, timeout=None):
+        return httpx.Response(200, json={"success": True, "data": _doc()})
+
+    monkeypatch.setattr(AsyncHttpClient, "post", fake_post)
+    profiles = DomainProfiles()
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", domain_profiles=profiles)
+    async for _ in client.scrape_many(["https://a.test/1", "https://a.test/2"]):
+        pass
+    profile = profiles.profile("a.test")
+    assert profile.options[option_key({})].successes == 2 and len(profile.latencies) == 2
@@ -0,0 +1,190 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils import http_client as http_client_module
+from firecrawl.v2.utils.error_handler import ConflictError
+from firecrawl.v2.utils.idempotency import IdempotencyKeys, UnknownOutcomeError, derive_key, with_idempotency_key
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+def test_keys_are_uuids_derived_from_payload_and_nonce():
+    payload = {"url": "https://example.com", "limit": 10}
+    key = derive_key("/v2/crawl", payload, "nightly-42")
+    assert uuid.UUID(key)
+    assert key == derive_key("/v2/crawl", {"limit": 10, "url": "https://example.com", "origin": "x"}, "nightly-42")
+    assert key != derive_key("/v2/crawl", payload, "nightly-43")
+    assert key != derive_key("/v2/crawl", {**payload, "limit": 11}, "nightly-42")
+
+    keys = IdempotencyKeys()
+    assert keys.key_for("/v2/crawl", payload) != keys.key_for("/v2/crawl", payload)
+    assert with_idempotency_key(keys, "/v2/scrape", payload, {}) == {}
+    explicit = str(uuid.uuid4())
+    assert with_idempotency_key(None, "/v2/crawl", payload, {"x-idempotency-key": explicit})["x-idempotency-key"] == explicit
+    # Caller keys are sent unchanged, UUID or not
+    assert with_idempotency_key(keys, "/v2/crawl", payload, {"x-idempotency-key": "nightly-42"})["x-idempotency-key"] == "nightly-42"
+
+
+def test_keyed_start_is_retried_with_one_key_through_timeouts_and_5xx(monkeypatch):
+    sent = []
+    outcomes = [requests.Timeout("read timed out"), FakeResponse({"success": False, "error": "busy"}, 503)]
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        sent.append((url, headers.get("x-idempotency-key")))
+        if outcomes:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return FakeResponse({"success": True, "id": "crawl-1", "url": "https://api/crawl-1"})
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    monkeypatch.setattr(http_client_module.time, "sleep", lambda seconds: None)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", idempotency_keys=True)
+
+    assert client.start_crawl("https://example.com").id == "crawl-1"
+    assert len(sent) == 3 and len({key for _, key in sent}) == 1
+    assert uuid.UUID(sent[0][1])
+
+    # Each call gets its own key
+    sent.clear()
+    client.start_crawl("https://example.com")
+    client.start_crawl("https://example.com")
+    assert sent[0][1] != sent[1][1]
+
+
+def test_unkeyed_clients_keep_retrying_only_502(monkeypatch):
+    calls = []
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        calls.append(headers)
+        return FakeResponse({"success": False, "error": "unavailable"}, 503)
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost")
+    with pytest.raises(Exception):
+        client.start_crawl("https://example.com")
+    assert len(calls) == 1 and "x-idempotency-key" not in calls[0]
+
+
+def test_reused_key_surfaces_as_conflict(monkeypatch):
+    sent = []
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        sent.append(headers.get("x-idempotency-key"))
+        return FakeResponse({"success": False, "error": "Idempotency key already used"}, 409)
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost")
+    key = str(uuid.uuid4())
+    with pytest.raises(ConflictError) as info:
+        client.start_crawl("https://example.com", idempotency_key=key)
+    assert not isinstance(info.value, UnknownOutcomeError)
+    assert sent == [key]
+
+
+def test_keyed_crawl_start_is_not_retried_on_500(monkeypatch):
+    calls = []
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        calls.append(headers.get("x-idempotency-key"))
+        return FakeResponse({"success": False, "error": "internal"}, 500)
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", idempotency_keys=True)
+    # The API records the key before the crawl fails, so a retry would only be refused
+    with pytest.raises(Exception):
+        client.start_crawl("https://example.com")
+    assert len(calls) == 1 and calls[0]
+
+
+def test_keys_do_not_widen_retries_on_endpoints_that_ignore_them(monkeypatch):
+    calls = []
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        calls.append((url, headers.get("x-idempotency-key")))
+        return FakeResponse({"success": False, "error": "internal"}, 500)
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    monkeypatch.setattr(http_client_module.time, "sleep", lambda seconds: None)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", idempotency_keys=True)
+    with pytest.raises(Exception):
+        client.start_batch_scrape(["https://example.com"])
+    # The key is sent, but batch scrape does not enforce it: a retry could start a second job
+    assert len(calls) == 1 and calls[0][0].endswith("/v2/batch/scrape") and calls[0][1]
+
+
+def test_conflict_on_a_resent_crawl_start_reports_an_unknown_outcome(monkeypatch):
+    outcomes = [
+        requests.Timeout("read timed out"),
+        FakeResponse({"success": False, "error": "Idempotency key already used"}, 409),
+    ]
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    monkeypatch.setattr(http_client_module.time, "sleep", lambda seconds: None)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", idempotency_keys=True)
+    with pytest.raises(UnknownOutcomeError) as info:
+        client.start_crawl("https://example.com")
+    assert "Timeout" in str(info.value) and info.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_async_client_keys_job_starts_by_default_on_cloud_and_retries_crawl_starts(monkeypatch):
+    sent = []
+
+    async def fake_post(self, url, json=None, headers=None, timeout=None):
+        sent.append((url, headers.get("x-idempotency-key")))
+        if url == "/v2/crawl":
+            if len(sent) in (1, 3):
+                raise httpx.ReadTimeout("read timed out")
+            if len(sent) == 2:
+                return httpx.Response(200, json={"success": True, "id": "crawl-1", "url": "https://api/crawl-1"})
+            return httpx.Response(409, json={"success": False, "error": "Idempotency key already used"})
+        if url == "/v2/scrape":
+            return httpx.Response(200, json={"success": True, "data": {"markdown": "m"}})
+        raise httpx.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+    client = AsyncFirecrawlClient(api_key="k")
+    job = await client.start_crawl("https://example.com")
+    assert job.id == "crawl-1"
+    assert [url for url, _ in sent] == ["/v2/crawl", "/v2/crawl"]
+    assert sent[0][1] == sent[1][1] and uuid.UUID(sent[0][1])
+
+    # A resent start refused with 409 may or may not have started the crawl
+    with pytest.raises(UnknownOutcomeError):
+        await client.start_crawl("https://example.com")
+    assert sent[2][1] == sent[3][1] != sent[0][1]
+
+    # Batch scrape ignores the key, so a timed out start is not resent
+    with pytest.raises(httpx.ReadTimeout):
+        await client.start_batch_scrape(["https://example.com"])
+    assert sent[-1][0] == "/v2/batch/scrape" and sent[-1][1] and len(sent) == 5
+
+    await client.scrape("https://example.com")
+    assert sent[-1] == ("/v2/scrape", None)
+
+
+async def _no_sleep(seconds):
+    return None
@@ -0,0 +1,111 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from firecrawl.v2.types import BatchScrapeJob, BrandingProfile, CrawlJob, Document, DocumentMetadata, LazyDocument
+from firecrawl.v2.utils.normalize import parse_documents
+from firecrawl.v2.methods.crawl import _parse_crawl_documents
+from firecrawl.v2.methods.batch import _parse_batch_scrape_documents
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.http_client import HttpClient
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self._body
+
+
+API_DOC = {
+    "markdown": "# Hello",
+    "rawHtml": "<html></html>",
+    "changeTracking": {"changeStatus": "same"},
+    "branding": {"colorScheme": "dark"},
+    "metadata": {"title": "Hello", "sourceURL": "https://example.com", "statusCode": "200", "x-extra": "ok"},
+}
+
+
+def _lazy():
+    return parse_documents([API_DOC], lazy=True)[0]
+
+
+def _eager():
+    return parse_documents([API_DOC], lazy=False)[0]
+
+
+class TestLazyDocument:
+    def test_crawl_and_batch_parse_lazily_only_when_asked(self):
+        for parse in (_parse_crawl_documents, _parse_batch_scrape_documents):
+            doc = parse([API_DOC], lazy=True)[0]
+            assert isinstance(doc, LazyDocument)
+            assert isinstance(doc, Document)
+            assert type(parse([API_DOC])[0]) is Document
+
+    def test_client_flag_turns_lazy_parsing_on(self, monkeypatch):
+        body = {"success": True, "status": "completed", "completed": 1, "total": 1, "data": [API_DOC]}
+        monkeypatch.setattr(HttpClient, "get", lambda self, endpoint, headers=None, timeout=None: FakeResponse(body))
+        eager = FirecrawlClient(api_key="k", api_url="http://localhost")
+        lazy = FirecrawlClient(api_key="k", api_url="http://localhost", lazy_documents=True)
+        assert type(eager.get_crawl_status("job-1").data[0]) is Document
+        assert isinstance(lazy.get_crawl_status("job-1").data[0], LazyDocument)
+        assert isinstance(lazy.get_batch_scrape_status("job-1").data[0], LazyDocument)
+
+    def test_deferred_fields_parsed_on_first_access(self):
+        doc = _lazy()
+        assert doc.raw_html == "<html></html>"
+        assert "metadata" not in doc.__dict__
+
+        assert isinstance(doc.metadata, DocumentMetadata)
+        assert doc.metadata.source_url == "https://example.com"
+        assert doc.metadata.status_code == 200
+        assert doc.metadata_dict["x-extra"] == "ok"
+        assert isinstance(doc.branding, BrandingProfile)
+        assert doc.branding.color_scheme == "dark"
+        assert doc.change_tracking == {"changeStatus": "same"}
+
+    def test_missing_deferred_fields_default_to_none(self):
+        doc = parse_documents([{"markdown": "x"}], lazy=True)[0]
+        assert doc.metadata is None
+        assert doc.branding is None
+        assert doc.model_fields_set == {"markdown"}
+
+    def test_behaves_like_eager_document(self):
+        eager = _eager()
+        assert _lazy().model_dump() == eager.model_dump()
+        assert _lazy().model_dump_json() == eager.model_dump_json()
+        assert _lazy() == eager
+        assert eager == _lazy()
+        assert _lazy().model_fields_set == eager.model_fields_set
+        assert repr(_lazy()) == repr(eager).replace("Document(", "LazyDocument(", 1)
+        assert dict(_lazy())["metadata"] == eager.metadata
+
+    def test_nested_serialization_includes_deferred_fields(self):
+        for job_cls in (CrawlJob, BatchScrapeJob):
+            job = job_cls(status="completed", completed=1, total=1, data=parse_documents([API_DOC], lazy=True))
+            dumped = job.model_dump()["data"][0]
+            assert dumped["metadata"]["source_url"] == "https://example.com"
+            assert dumped["branding"]["color_scheme"] == "dark"
+
+    def test_copy_and_pickle(self):
+        eager = _eager()
+        assert copy.copy(_lazy()) == eager
+        assert copy.deepcopy(_lazy()) == eager
+        assert _lazy().model_copy() == eager
+        assert pickle.loads(pickle.dumps(_lazy())) == eager
+
+    def test_input_not_mutated(self):
+        _lazy().model_dump()
+        assert API_DOC["branding"] == {"colorScheme": "dark"}
+        assert "sourceURL" in API_DOC["metadata"]
+
+    def test_validation_errors_surface_on_access(self):
+        doc = parse_documents([{"markdown": "x", "metadata": {"statusCode": "not-a-number"}}], lazy=True)[0]
+        assert doc.markdown == "x"
+        with pytest.raises(ValidationError):
+            doc.metadata
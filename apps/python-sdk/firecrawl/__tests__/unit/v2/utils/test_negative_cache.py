@@ -0,0 +1,166 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.methods.batch import batch_scrape
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.negative_cache import KnownFailureError, NegativeCache
+from firecrawl.v2.utils.response_cache import ResponseCache, SQLiteCacheBackend
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = json.dumps(body).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+
+    def json(self):
+        return self._body
+
+
+def _scrape_body(url, status=200):
+    return {"success": True, "data": {"markdown": url, "metadata": {"sourceURL": url, "statusCode": status}}}
+
+
+def test_ttl_doubles_per_failure_and_success_clears():
+    cache = NegativeCache(ttls={"not_found": 10})
+    assert [cache.ttl("not_found", n) for n in (1, 2, 3)] == [10, 20, 40]
+    assert cache.ttl("not_found", 30) == cache.max_ttl
+
+    first = cache.record_failure("https://example.com/gone", "not_found")
+    second = cache.record_failure("https://example.com/gone", "not_found")
+    assert second.count == 2 and second.until - first.until == pytest.approx(10, abs=1)
+    # not_found concerns the page only
+    assert cache.lookup("https://example.com/other") is None
+    with pytest.raises(KnownFailureError) as info:
+        cache.check("https://example.com/gone")
+    assert info.value.entries["https://example.com/gone"].failure == "not_found"
+
+    cache.record_status("https://example.com/gone", 200)
+    assert cache.lookup("https://example.com/gone") is None
+    assert cache.stats.model_dump() == {"skipped": 1, "failures": 2, "cleared": 1}
+
+
+def test_host_is_blocked_after_repeated_timeouts_or_one_unsupported_answer():
+    cache = NegativeCache(host_threshold=2)
+    cache.record_failure("https://slow.test/a", "timeout")
+    assert cache.lookup("https://slow.test/b") is None
+    cache.record_failure("https://slow.test/c", "timeout")
+    assert cache.lookup("https://slow.test/b").scope == "host"
+
+    cache.record_failure("https://blocked.test/x", "unsupported")
+    assert cache.lookup("https://blocked.test/y").target == "blocked.test"
+
+    # Records outlive their block so that the next failure continues the series
+    cache = NegativeCache(ttls={"timeout": 0.01})
+    cache.record_failure("https://example.com", "timeout")
+    time.sleep(0.02)
+    assert cache.lookup("https://example.com") is None
+    assert cache.record_failure("https://example.com", "timeout").count == 2
+
+
+def test_records_share_a_sqlite_backend_with_the_response_cache(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    backend = SQLiteCacheBackend(path)
+    responses = ResponseCache(backend)
+    NegativeCache(backend).record_failure("https://example.com/gone", "not_found")
+
+    other = NegativeCache(SQLiteCacheBackend(path))
+    assert other.lookup("https://example.com/gone").failure == "not_found"
+    assert responses.entry("https://api", "/v2/scrape", {"url": "https://example.com/gone"}).body is None
+
+
+def test_scrape_fails_fast_on_known_failures_until_forced(monkeypatch):
+    posts = []
+
+    def fake_post(self, endpoint, data, headers=None, timeout=None, retries=3, backoff_factor=0.5):
+        posts.append(data["url"])
+        if "slow" in data["url"]:
+            return FakeResponse({"success": False, "error": "Scrape timed out"}, 408)
+        return FakeResponse(_scrape_body(data["url"], 404 if "gone" in data["url"] else 200))
+
+    monkeypatch.setattr(HttpClient, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", negative_cache=NegativeCache())
+
+    assert client.scrape("https://example.com/gone").metadata.status_code == 404
+    with pytest.raises(KnownFailureError):
+        client.scrape("https://example.com/gone")
+    assert client.scrape("https://example.com/gone", force_retry=True).markdown == "https://example.com/gone"
+
+    with pytest.raises(Exception):
+        client.scrape("https://example.com/slow")
+    results = dict(client.scrape_many(["https://example.com/slow", "https://example.com/ok"]))
+    assert isinstance(results["https://example.com/slow"], KnownFailureError)
+    assert results["https://example.com/ok"].markdown == "https://example.com/ok"
+    assert posts == [
+        "https://example.com/gone",
+        "https://example.com/gone",
+        "https://example.com/slow",
+        "https://example.com/ok",
+    ]
+    assert client.negative_cache_stats.skipped == 2
+
+
+class FakeBatchClient:
+    def __init__(self, negative_cache):
+        self.negative_cache = negative_cache
+        self.submitted = []
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def post(self, path, data, headers=None):
+        self.submitted.append(list(data["urls"]))
+        return FakeResponse({"success": True, "id": "job-1", "url": "https://api/job-1"})
+
+    def get(self, url, timeout=None):
+        if url.endswith("/errors"):
+            error = {"id": "e1", "url": "https://dead.test/a", "code": "SCRAPE_DNS_RESOLUTION_ERROR", "error": "DNS resolution failed"}
+            return FakeResponse({"success": True, "errors": [error], "robotsBlocked": []})
+        docs = [_scrape_body("https://example.com/missing", 404)["data"], _scrape_body("https://example.com/ok")["data"]]
+        return FakeResponse({"success": True, "status": "completed", "completed": 3, "total": 3, "data": docs})
+
+
+def test_batch_skips_known_failures_and_records_the_finished_job():
+    cache = NegativeCache()
+    cache.record_failure("https://example.com/stale", "not_found")
+    client = FakeBatchClient(cache)
+    urls = ["https://dead.test/a", "https://example.com/missing", "https://example.com/ok", "https://example.com/stale"]
+
+    batch_scrape(client, urls, poll_interval=0)
+    assert client.submitted == [urls[:3]]
+    assert cache.lookup("https://dead.test/other").scope == "host"
+    assert cache.lookup("https://example.com/missing").failure == "not_found"
+    assert cache.lookup("https://example.com/ok") is None
+
+    with pytest.raises(KnownFailureError) as info:
+        batch_scrape(client, ["https://dead.test/b", "https://example.com/missing"], poll_interval=0)
+    assert len(info.value.entries) == 2
+    batch_scrape(client, ["https://dead.test/b"], poll_interval=0, force_retry=True)
+    assert client.submitted[-1] == ["https://dead.test/b"]
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_records_unsupported_sites_per_host(monkeypatch):
+    calls = []
+
+    async def fake_post(self, endpoint, data, headers=None, timeout=None):
+        calls.append(data["url"])
+        return httpx.Response(403, json={"success": False, "error": "This website is no longer supported"})
+
+    monkeypatch.setattr(AsyncHttpClient, "post", fake_post)
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", negative_cache=NegativeCache())
+    with pytest.raises(Exception):
+        await client.scrape("https://blocked.test/a")
+    with pytest.raises(KnownFailureError):
+        await client.scrape("https://blocked.test/b")
+    results = [result async for _, result in client.scrape_many(["https://blocked.test/c"], force_retry=True)]
+    assert not isinstance(results[0], KnownFailureError)
+    assert calls == ["https://blocked.test/a", "https://blocked.test/c"]
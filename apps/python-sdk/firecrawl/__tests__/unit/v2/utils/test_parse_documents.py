@@ -0,0 +1,66 @@
+import pytest
+from pydantic import ValidationError
+
+from firecrawl.v2.types import Document, DocumentMetadata, SearchResultWeb
+from firecrawl.v2.utils.normalize import normalize_document_input, parse_documents
+from firecrawl.v2.methods.search import _transform_array
+from firecrawl.v2.methods.aio.search import _transform_array as _aio_transform_array
+
+
+def _api_doc(i):
+    return {
+        "markdown": f"# Page {i}",
+        "rawHtml": "<html></html>",
+        "metadata": {
+            "title": [f"Page {i}"],
+            "sourceURL": f"https://example.com/{i}",
+            "statusCode": "200",
+            "ogLocaleAlternate": ["en_GB"],
+            "robots": ["index", "follow"],
+            "twitter:card": "summary",
+        },
+    }
+
+
+class TestParseDocumentsPage:
+    def test_page_matches_per_document_validation(self):
+        page = [_api_doc(i) for i in range(5)]
+        expected = [Document(**normalize_document_input(d)) for d in page]
+
+        for lazy in (False, True):
+            docs = parse_documents(page, lazy=lazy)
+            assert docs == expected
+            assert [d.model_dump() for d in docs] == [d.model_dump() for d in expected]
+
+    def test_metadata_coercions(self):
+        doc = parse_documents([_api_doc(1)], lazy=False)[0]
+        assert isinstance(doc.metadata, DocumentMetadata)
+        assert doc.metadata.title == "Page 1"
+        assert doc.metadata.robots == "index, follow"
+        assert doc.metadata.status_code == 200
+        assert doc.metadata.og_locale_alternate == ["en_GB"]
+        assert doc.metadata.extras["twitter:card"] == "summary"
+
+    def test_skips_non_dict_items_and_empty_input(self):
+        assert parse_documents(None) == []
+        assert len(parse_documents([_api_doc(1), None, "x"], lazy=False)) == 1
+
+    def test_invalid_document_raises(self):
+        with pytest.raises(ValidationError):
+            parse_documents([{"markdown": 123}], lazy=False)
+
+
+class TestSearchTransformArray:
+    @pytest.mark.parametrize("transform", [_transform_array, _aio_transform_array])
+    def test_documents_validated_together_keep_positions(self, transform):
+        items = [
+            {"url": "https://a.com", "title": "A"},
+            {"url": "https://b.com", "markdown": "# B", "metadata": {"statusCode": 200}},
+            "https://c.com",
+            {"url": "https://d.com", "summary": "D"},
+        ]
+        out = transform(items, SearchResultWeb)
+        assert isinstance(out[0], SearchResultWeb) and out[0].title == "A"
+        assert isinstance(out[1], Document) and out[1].metadata.status_code == 200
+        assert isinstance(out[2], SearchResultWeb) and out[2].url == "https://c.com"
+        assert isinstance(out[3], Document) and out[3].summary == "D"
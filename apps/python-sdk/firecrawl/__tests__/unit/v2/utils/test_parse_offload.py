@@ -0,0 +1,182 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import httpx
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.methods.aio.crawl import _parse_crawl_status_body
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient, parse_json_response
+from firecrawl.v2.utils.offload import ParseOffloader, _loads_incremental
+
+
+STATUS_BODY = {
+    "success": True,
+    "status": "completed",
+    "completed": 1,
+    "total": 1,
+    "data": [{"markdown": "# Hi", "metadata": {"sourceURL": "https://example.com", "statusCode": 200}}],
+}
+
+
+def _response(body=STATUS_BODY):
+    return httpx.Response(200, json=body)
+
+
+class _Client:
+    def __init__(self, offloader):
+        self.parse_offloader = offloader
+
+
+class TestParseOffloader:
+    @pytest.mark.asyncio
+    async def test_small_bodies_parse_inline(self):
+        offloader = ParseOffloader(threshold_bytes=10_000_000)
+        threads = []
+        body = await offloader.parse(_response(), lambda b: threads.append(threading.current_thread()) or b)
+        assert body["status"] == "completed"
+        assert threads == [threading.current_thread()]
+        assert offloader.metrics.inline_count == 1
+        assert offloader.metrics.offloaded_count == 0
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_parse_in_executor(self):
+        offloader = ParseOffloader(threshold_bytes=1)
+        threads = []
+        body = await offloader.parse(_response(), lambda b: threads.append(threading.current_thread()) or b)
+        assert body["completed"] == 1
+        assert threads[0] is not threading.current_thread()
+        metrics = offloader.metrics
+        assert metrics.offloaded_count == 1
+        assert metrics.offloaded_bytes == len(_response().content)
+        assert metrics.avoided_block_seconds > 0
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_offloaded_parse(self):
+        offloader = ParseOffloader(threshold_bytes=0)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        def slow_parse(body):
+            time.sleep(0.2)
+            return body
+
+        await asyncio.gather(ticker(), offloader.parse(_response(), slow_parse))
+        assert ticks == 5
+        assert offloader.metrics.max_avoided_block_seconds >= 0.2
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_pending_parses_are_bounded(self):
+        offloader = ParseOffloader(threshold_bytes=0, max_workers=4, max_pending=1)
+
+        def slow_parse(body):
+            time.sleep(0.05)
+            return body
+
+        await asyncio.gather(*(offloader.parse(_response(), slow_parse) for _ in range(3)))
+        assert offloader.metrics.offloaded_count == 3
+        assert offloader.metrics.max_pending == 1
+        assert offloader.metrics.queue_wait_seconds >= 0.05
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_parse_errors_propagate(self):
+        offloader = ParseOffloader(threshold_bytes=0)
+        with pytest.raises(Exception, match="boom"):
+            await offloader.parse(_response({"success": False, "error": "boom"}), partial(_parse_crawl_status_body))
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_pool_executor(self):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            offloader = ParseOffloader(threshold_bytes=0, executor=pool)
+            _, payload = await offloader.parse(_response(), partial(_parse_crawl_status_body, raw=False))
+        assert payload["data"][0].metadata.source_url == "https://example.com"
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            ParseOffloader(threshold_bytes=-1)
+        with pytest.raises(ValueError):
+            ParseOffloader(max_pending=0)
+
+
+class TestIncrementalDecode:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "{}",
+            ' { "a" : [ ] , "b": [1, {"x": [2]}, "s"], "c": {"d": [1]} } ',
+            json.dumps(STATUS_BODY),
+            "[1, 2]",
+            '"x"',
+            '{"a": 1, "a": 2}',
+        ],
+    )
+    def test_matches_json_loads(self, text):
+        assert _loads_incremental(text.encode()) == json.loads(text)
+
+    @pytest.mark.parametrize("text", ['{"a": [1, 2,]}', '{"a": 1} x', '{"a": [1, 2', "{1: 2}"])
+    def test_invalid_json_raises(self, text):
+        with pytest.raises(json.JSONDecodeError):
+            _loads_incremental(text.encode())
+
+
+class TestParseJsonResponse:
+    @pytest.mark.asyncio
+    async def test_without_offloader_decodes_inline(self):
+        assert await parse_json_response(_Client(None), _response()) == STATUS_BODY
+        assert await parse_json_response(object(), _response(), lambda b: b["status"]) == "completed"
+
+
+class TestAsyncClientOffload:
+    @pytest.mark.asyncio
+    async def test_crawl_status_parsed_off_loop(self, monkeypatch):
+        async def fake_get(self, endpoint, headers=None, timeout=None):
+            return _response()
+
+        monkeypatch.setattr(AsyncHttpClient, "get", fake_get)
+
+        client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", parse_offload_threshold=0)
+        job = await client.get_crawl_status("job-1")
+        assert isinstance(job, CrawlJob)
+        assert job.data[0].metadata.status_code == 200
+        assert client.parse_metrics.offloaded_count == 1
+
+        assert AsyncFirecrawlClient(api_key="k", api_url="http://localhost").parse_metrics is None
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_the_private_pool(self, monkeypatch):
+        async def fake_get(self, endpoint, headers=None, timeout=None):
+            return _response()
+
+        monkeypatch.setattr(AsyncHttpClient, "get", fake_get)
+
+        async with AsyncFirecrawlClient(api_key="k", api_url="http://localhost", parse_offload_threshold=0) as client:
+            await client.get_crawl_status("job-1")
+            pool = client.async_http_client.parse_offloader._executor
+            assert pool._threads
+        assert pool._shutdown
+        for thread in pool._threads:
+            thread.join(timeout=1)
+        assert not any(thread.is_alive() for thread in pool._threads)
+
+        # A caller-supplied executor belongs to the caller and keeps running
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            client = AsyncFirecrawlClient(
+                api_key="k", api_url="http://localhost", parse_offload_threshold=0, parse_executor=executor
+            )
+            await client.close()
+            assert executor.submit(lambda: 1).result() == 1
@@ -0,0 +1,162 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.response_cache import CacheBackend, MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = json.dumps(body).encode("utf-8")
+
+    def json(self):
+        return self._body
+
+
+def _scrape_body(url):
+    return {"success": True, "data": {"markdown": url, "metadata": {"sourceURL": url}}}
+
+
+def test_memory_backend_evicts_least_recently_used_within_byte_budget():
+    backend = MemoryCacheBackend(max_bytes=10)
+    backend.set("a", b"aaaa", 60)
+    backend.set("b", b"bbbb", 60)
+    assert backend.get("a") == b"aaaa"
+    backend.set("c", b"cccc", 60)
+    assert backend.get("b") is None
+    assert backend.get("a") == b"aaaa" and backend.get("c") == b"cccc"
+    assert backend.usage() == (2, 8) and backend.evictions == 1
+
+    backend.set("big", b"x" * 11, 60)
+    assert backend.get("big") is None
+    backend.set("short", b"s", 0.01)
+    time.sleep(0.02)
+    assert backend.get("short") is None
+
+
+def test_backends_must_implement_every_operation():
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_sqlite_backend_is_shared_between_instances_and_bounded(tmp_path):
+    path = tmp_path / "cache" / "responses.sqlite"
+    writer = SQLiteCacheBackend(path, max_bytes=10)
+    reader = SQLiteCacheBackend(path)
+    writer.set("a", b"aaaa", 60)
+    assert reader.get("a") == b"aaaa"
+    writer.set("b", b"bbbb", 60)
+    writer.set("c", b"cccc", 60)
+    assert writer.get("a") is None and writer.evictions == 1
+    assert reader.usage() == (2, 8)
+    writer.set("gone", b"g", -1)
+    assert reader.get("gone") is None
+    writer.close()
+    reader.close()
+
+
+def test_ttl_follows_max_age_and_zero_bypasses():
+    cache = ResponseCache(ttl=120)
+    assert cache.ttl_for({"url": "u"}) == 120
+    assert cache.ttl_for({"url": "u", "maxAge": 5000}) == 5
+    assert cache.ttl_for({"query": "q", "scrapeOptions": {"maxAge": 2000}}) == 2
+    assert cache.entry("https://api", "/v2/scrape", {"url": "u", "maxAge": 0}) is None
+    # Key order of the payload does not matter
+    assert ResponseCache.key_for("a", "/v2/map", {"x": 1, "y": 2}) == ResponseCache.key_for("a", "/v2/map", {"y": 2, "x": 1})
+
+
+def test_scrape_and_map_hits_skip_the_network(monkeypatch):
+    posts = []
+
+    def fake_post(self, endpoint, data, headers=None, timeout=None, retries=3, backoff_factor=0.5):
+        posts.append(endpoint)
+        if endpoint == "/v2/map":
+            return FakeResponse({"success": True, "links": [{"url": data["url"] + "/a"}]})
+        return FakeResponse(_scrape_body(data["url"]))
+
+    monkeypatch.setattr(HttpClient, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", response_cache=ResponseCache())
+
+    first = client.scrape("https://example.com", formats=["markdown"])
+    second = client.scrape("https://example.com", formats=["markdown"])
+    client.scrape("https://example.com", formats=["html"])
+    assert first.markdown == second.markdown == "https://example.com"
+    assert client.scrape("https://example.com", formats=["markdown"], raw=True)["markdown"] == "https://example.com"
+    client.map("https://example.com")
+    assert client.map("https://example.com").links[0].url == "https://example.com/a"
+
+    assert posts == ["/v2/scrape", "/v2/scrape", "/v2/map"]
+    stats = client.response_cache_stats
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (3, 3, 3, 3)
+
+
+def test_failed_responses_are_not_cached(monkeypatch):
+    calls = []
+
+    def fake_post(self, endpoint, data, headers=None, timeout=None, retries=3, backoff_factor=0.5):
+        calls.append(endpoint)
+        return FakeResponse({"success": False, "error": "blocked"})
+
+    monkeypatch.setattr(HttpClient, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", response_cache=ResponseCache())
+    for _ in range(2):
+        with pytest.raises(Exception):
+            client.scrape("https://example.com")
+    assert len(calls) == 2 and client.response_cache_stats.stores == 0
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_hits_sqlite_cache_written_by_another_client(monkeypatch, tmp_path):
+    calls = []
+
+    async def fake_post(self, endpoint, data, headers=None, timeout=None):
+        calls.append(endpoint)
+        return httpx.Response(200, json=_scrape_body(data["url"]))
+
+    monkeypatch.setattr(AsyncHttpClient, "post", fake_post)
+    path = tmp_path / "responses.sqlite"
+    options = ScrapeOptions(formats=["markdown"], max_age=60_000)
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", response_cache=ResponseCache(SQLiteCacheBackend(path)))
+    await client.scrape("https://example.com", **options.model_dump(exclude_none=True))
+
+    # Another process would open the same file
+    other = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", response_cache=ResponseCache(SQLiteCacheBackend(path)))
+    doc = await other.scrape("https://example.com", **options.model_dump(exclude_none=True))
+    assert doc.markdown == "https://example.com"
+    assert calls == ["/v2/scrape"]
+    assert other.response_cache_stats.hits == 1
+
+
+def test_completed_extract_is_cached_by_request(monkeypatch):
+    requests_made = []
+
+    def fake_post(self, endpoint, data, headers=None, timeout=None, retries=3, backoff_factor=0.5):
+        requests_made.append(endpoint)
+        return FakeResponse({"success": True, "id": "ex-1"})
+
+    def fake_get(self, endpoint, headers=None, timeout=None, retries=3, backoff_factor=0.5):
+        requests_made.append(endpoint)
+        return FakeResponse({"success": True, "id": "ex-1", "status": "completed", "data": {"price": 3}})
+
+    monkeypatch.setattr(HttpClient, "post", fake_post)
+    monkeypatch.setattr(HttpClient, "get", fake_get)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", response_cache=ResponseCache())
+    first = client.extract(["https://example.com"], prompt="price")
+    second = client.extract(["https://example.com"], prompt="price")
+    assert first.data == second.data == {"price": 3}
+    assert second.status == "completed"
+    assert requests_made == ["/v2/extract", "/v2/extract/ex-1"]
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils import http_client as http_client_module
+from firecrawl.v2.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _scrape_body(url):
+    return {"success": True, "data": {"markdown": url, "metadata": {"sourceURL": url}}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_async_scrapes_share_one_request(monkeypatch):
+    sent = []
+
+    async def fake_post(self, url, json=None, headers=None, timeout=None):
+        sent.append(json["url"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=_scrape_body(json["url"]))
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", coalesce_requests=True)
+
+    docs = await asyncio.gather(
+        *[client.scrape("https://example.com", formats=["markdown"]) for _ in range(5)],
+        client.scrape("https://example.com", formats=["html"]),
+    )
+    assert sent == ["https://example.com", "https://example.com"]
+    assert {d.markdown for d in docs} == {"https://example.com"}
+    stats = client.coalescing_stats
+    assert (stats.executed, stats.collapsed, stats.in_flight) == (2, 4, 0)
+
+    # Once the first request finished, a new call goes to the network again
+    await client.scrape("https://example.com", formats=["markdown"])
+    assert len(sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_errors_are_shared_and_leader_cancellation_is_isolated(monkeypatch):
+    async def failing_post(self, url, json=None, headers=None, timeout=None):
+        await asyncio.sleep(0.02)
+        return httpx.Response(500, json={"success": False, "error": "boom"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", failing_post)
+    client = AsyncFirecrawlClient(api_key="k", api_url="http://localhost", coalesce_requests=True)
+    results = await asyncio.gather(*[client.scrape("https://example.com") for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(r, Exception) for r in results)
+    assert client.coalescing_stats.executed == 1
+
+    flight = AsyncSingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("k", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "done"
+
+
+def test_threads_share_one_sync_request(monkeypatch):
+    sent = []
+    release = threading.Event()
+
+    class FakeResponse:
+        status_code = 200
+        ok = True
+
+        def __init__(self, body):
+            self._body = body
+
+        def json(self):
+            return self._body
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        sent.append(url)
+        release.wait(2)
+        return FakeResponse(_scrape_body(json["url"]))
+
+    monkeypatch.setattr(http_client_module.requests, "post", fake_post)
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", coalesce_requests=True)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.scrape("https://example.com"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 2
+    while client.coalescing_stats.collapsed < 3 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(sent) == 1
+    assert [d.markdown for d in results] == ["https://example.com"] * 4
+    assert client.coalescing_stats.collapsed == 3
+
+
+def test_sync_exception_reaches_every_waiter():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    def call():
+        try:
+            flight.do("k", fail)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(1)
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join(1)
+    follower.join(1)
+    assert len(errors) == 2 and flight.stats.collapsed == 1
@@ -0,0 +1,67 @@
+import pytest
+
+from firecrawl.v2.utils.url_dedupe import (
+    BloomFilter,
+    UrlDeduplicator,
+    canonicalize_url,
+    dedupe_urls,
+)
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("HTTPS://Example.COM/a/", "https://example.com/a"),
+        ("https://example.com:443/a#section", "https://example.com/a"),
+        ("http://example.com:8080/", "http://example.com:8080/"),
+        ("https://example.com", "https://example.com/"),
+        ("https://example.com/a?utm_source=x&id=3&gclid=y", "https://example.com/a?id=3"),
+        ("https://example.com/a?b=2&a=1", "https://example.com/a?b=2&a=1"),
+        ("https://[::1]:443/x", "https://[::1]/x"),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_tracking_params_kept_when_disabled():
+    url = "https://example.com/a?utm_source=x"
+    assert canonicalize_url(url, strip_tracking=False) == url
+
+
+def test_dedupe_urls_keeps_first_spelling_and_counts_collapsed():
+    urls = [
+        "https://Example.com/a/",
+        "https://example.com/a",
+        "https://example.com/a#top",
+        "https://example.com/b?utm_campaign=z",
+        "https://example.com/b",
+    ]
+    kept, collapsed = dedupe_urls(urls)
+    assert kept == ["https://Example.com/a/", "https://example.com/b?utm_campaign=z"]
+    assert collapsed == 3
+    assert dedupe_urls(urls, False) == (urls, 0)
+
+
+def test_deduplicator_switches_to_bloom_and_remembers_exact_keys():
+    deduper = UrlDeduplicator(exact_limit=10, capacity=10_000, false_positive_rate=0.001)
+    first = [f"https://example.com/{i}" for i in range(10)]
+    assert deduper.filter(first) == first
+    assert not deduper.report.probabilistic
+
+    more = [f"https://example.com/{i}" for i in range(10, 2000)]
+    assert deduper.filter(more) == more
+    report = deduper.report
+    assert report.probabilistic and report.memory_bytes > 0
+    # Keys held in the exact set before the switch are still known
+    assert deduper.filter(first) == []
+    assert report.unique == 2000
+
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(10_000, 0.01)
+    for i in range(10_000):
+        bloom.add(f"https://example.com/{i}")
+    assert all(f"https://example.com/{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"https://other.org/{i}" in bloom for i in range(20_000))
+    assert false_positives / 20_000 < 0.03
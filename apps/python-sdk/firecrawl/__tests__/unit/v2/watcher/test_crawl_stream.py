@@ -0,0 +1,176 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from firecrawl.v2.crawl_stream import AsyncCrawlStream, CrawlStream
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class DroppingWebSocket:
+    """Replays messages, then fails like a dropped connection (or ends if ``drop`` is False)."""
+
+    def __init__(self, messages, drop=True):
+        self._messages = list(messages)
+        self._drop = drop
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            if self._drop:
+                raise ConnectionClosedError(None, None)
+            raise asyncio.CancelledError()
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _doc(i):
+    return {"markdown": f"# {i}", "metadata": {"sourceURL": f"https://example.com/{i}", "scrapeId": f"s{i}"}}
+
+
+def _catchup(n, total=4):
+    return {"type": "catchup", "data": {"status": "scraping", "completed": n, "total": total, "data": [_doc(i) for i in range(n)]}}
+
+
+DONE = {"type": "done", "data": {"status": "completed", "completed": 4, "total": 4, "data": []}}
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    import websockets
+
+    def install(*sockets):
+        queue = list(sockets)
+
+        def fake_connect(uri, *args, **kwargs):
+            ws = queue.pop(0) if queue else None
+            if ws is None:
+                raise OSError("connection refused")
+            return FakeConnect(ws)
+
+        monkeypatch.setattr(websockets, "connect", fake_connect)
+
+    return install
+
+
+def _pages(client, pages):
+    """Serve status pages keyed by skip offset; each page links to the next."""
+
+    def fetch(url, raw=None):
+        skip = int(url.rsplit("skip=", 1)[1])
+        return pages[skip]
+
+    client.get_crawl_status_page = Mock(side_effect=fetch)
+
+
+def test_stream_yields_each_document_once_across_reconnects(connections):
+    connections(
+        DroppingWebSocket([_catchup(2), {"type": "document", "data": _doc(2)}]),
+        DroppingWebSocket([_catchup(4), DONE], drop=False),
+    )
+    stream = CrawlStream(DummyClient(), "jid", reconnect_backoff=0.01)
+
+    assert [doc.markdown for doc in stream] == ["# 0", "# 1", "# 2", "# 3"]
+    assert stream.status == "completed"
+    assert stream.summary.documents == 4
+
+
+def test_http_fallback_resumes_from_cursor_without_duplicates(connections):
+    connections(DroppingWebSocket([{"type": "document", "data": _doc(0)}, {"type": "document", "data": _doc(1)}]))
+    client = DummyClient()
+    _pages(client, {
+        0: {"status": "scraping", "completed": 3, "total": 4, "data": [_doc(0), _doc(1)], "next": "/v2/crawl/jid?skip=2"},
+        2: {"status": "scraping", "completed": 3, "total": 4, "data": [_doc(2)], "next": None},
+        3: {"status": "completed", "completed": 4, "total": 4, "data": [_doc(3)], "next": None},
+    })
+    stream = CrawlStream(client, "jid", poll_interval=0.01, max_reconnects=1, reconnect_backoff=0.01)
+
+    assert [doc.markdown for doc in stream] == ["# 0", "# 1", "# 2", "# 3"]
+    assert stream.status == "completed"
+    requested = [call.args[0] for call in client.get_crawl_status_page.call_args_list]
+    assert requested == ["/v2/crawl/jid?skip=0", "/v2/crawl/jid?skip=2", "/v2/crawl/jid?skip=3"]
+
+
+def test_failed_job_ends_stream_and_timeout_raises(connections):
+    connections(
+        DroppingWebSocket([{"type": "document", "data": _doc(0)}, {"type": "error", "error": "boom", "data": {"status": "failed"}}], drop=False),
+    )
+    stream = CrawlStream(DummyClient(), "jid", max_reconnects=0)
+    assert [doc.markdown for doc in stream] == ["# 0"]
+    assert stream.error == "boom"
+
+    connections()
+    client = DummyClient()
+    client.get_crawl_status_page = Mock(return_value={"status": "scraping", "data": [], "next": None})
+    stream = CrawlStream(client, "jid", poll_interval=0.01, timeout=0.2, max_reconnects=0)
+    with pytest.raises(TimeoutError):
+        list(stream)
+
+
+@pytest.mark.asyncio
+async def test_async_stream_yields_once(connections):
+    connections(
+        DroppingWebSocket([_catchup(2)]),
+        DroppingWebSocket([_catchup(3), {"type": "document", "data": _doc(3)}, DONE], drop=False),
+    )
+    client = DummyClient()
+    client.get_crawl_status_page = Mock(return_value={"status": "scraping", "data": [_doc(0)], "next": None})
+
+    stream = AsyncCrawlStream(client, "jid", reconnect_backoff=0.01)
+    markdown = [doc.markdown async for doc in stream]
+
+    assert markdown == ["# 0", "# 1", "# 2", "# 3"]
+    assert stream.job_id == "jid"
+    assert stream.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_async_fallback_polls_until_terminal_and_surfaces_fetch_errors(connections):
+    connections()
+    client = DummyClient()
+    scraping = {"status": "scraping", "data": [], "next": None}
+    _pages(client, {0: scraping})
+    client.get_crawl_status_page.side_effect = [scraping] * 5 + [{"status": "completed", "data": [_doc(0)], "next": None}]
+    stream = AsyncCrawlStream(client, "jid", poll_interval=0.01, max_reconnects=0)
+    assert [doc.markdown async for doc in stream] == ["# 0"]
+    assert client.get_crawl_status_page.call_count == 6
+
+    # A failing status fetch ends the stream with the error, not silently
+    client.get_crawl_status_page = Mock(side_effect=[scraping, ConnectionError("status unavailable")])
+    stream = AsyncCrawlStream(client, "jid", poll_interval=0.01, max_reconnects=0)
+    with pytest.raises(ConnectionError):
+        [doc async for doc in stream]
+
+
+def test_stream_that_stops_before_the_job_finishes_raises(connections):
+    connections()
+    client = DummyClient()
+    client.get_crawl_status_page = Mock(return_value={"status": "scraping", "data": [], "next": None})
+    stream = CrawlStream(client, "jid", poll_interval=0.01, max_reconnects=0)
+    iterator = iter(stream)
+    stream._watcher.start()
+    stream._watcher.stop()
+    with pytest.raises(RuntimeError):
+        next(iterator)
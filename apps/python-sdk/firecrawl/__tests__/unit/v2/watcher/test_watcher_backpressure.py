@@ -0,0 +1,171 @@
+import asyncio
+import json
+
+import pytest
+
+from firecrawl.v2.watcher_async import AsyncWatcher, _SpillFile
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class FakeWebSocket:
+    """Replays messages; a float entry pauses the sender for that many seconds."""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.received = 0
+
+    async def recv(self):
+        while self._messages and isinstance(self._messages[0], float):
+            await asyncio.sleep(self._messages.pop(0))
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            raise asyncio.CancelledError()
+        self.received += 1
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws: FakeWebSocket):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _doc(i):
+    return {"markdown": f"# {i}", "metadata": {"sourceURL": f"https://example.com/{i}", "scrapeId": f"s{i}"}}
+
+
+def _messages(n, pause=None):
+    out = []
+    for i in range(n):
+        if pause is not None:
+            out.append(pause)
+        out.append({"type": "document", "data": _doc(i)})
+    out.append({"type": "done", "data": {"status": "completed", "completed": n, "total": n, "data": []}})
+    return out
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    import websockets
+
+    def install(messages):
+        ws = FakeWebSocket(messages)
+        monkeypatch.setattr(websockets, "connect", lambda uri, *a, **kw: FakeConnect(ws))
+        return ws
+
+    return install
+
+
+async def _consume_slowly(watcher, delay=0.005):
+    markdown = []
+    snapshots = 0
+    async for snapshot in watcher:
+        snapshots += 1
+        markdown.extend(d.markdown for d in snapshot.data)
+        await asyncio.sleep(delay)
+    return markdown, snapshots
+
+
+@pytest.mark.asyncio
+async def test_block_policy_bounds_queue(fake_ws):
+    ws = fake_ws(_messages(10))
+    watcher = AsyncWatcher(DummyClient(), job_id="jid", stream=True, max_queue=2, max_reconnects=0)
+
+    received_when_first_consumed = None
+    markdown = []
+    async for snapshot in watcher:
+        if received_when_first_consumed is None:
+            await asyncio.sleep(0.05)
+            received_when_first_consumed = ws.received
+        markdown.extend(d.markdown for d in snapshot.data)
+
+    assert markdown == [f"# {i}" for i in range(10)]
+    stats = watcher.queue_stats
+    assert stats.max_depth <= 2
+    assert stats.blocked_seconds > 0
+    # The receiver stopped reading while the consumer was busy
+    assert received_when_first_consumed < 10
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_without_losing_documents(fake_ws):
+    fake_ws(_messages(20))
+    watcher = AsyncWatcher(DummyClient(), job_id="jid", stream=True, max_queue=1, overflow="coalesce", max_reconnects=0)
+
+    markdown, snapshots = await _consume_slowly(watcher)
+
+    assert markdown == [f"# {i}" for i in range(20)]
+    assert watcher.queue_stats.coalesced > 0
+    assert snapshots < 21
+    assert watcher.summary.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_spill_policy_preserves_order(fake_ws):
+    fake_ws(_messages(15))
+    watcher = AsyncWatcher(DummyClient(), job_id="jid", stream=True, max_queue=2, overflow="spill", max_reconnects=0)
+
+    markdown, snapshots = await _consume_slowly(watcher)
+
+    assert markdown == [f"# {i}" for i in range(15)]
+    assert snapshots == 16
+    assert watcher.queue_stats.spilled > 0
+    assert watcher.queue_stats.max_depth <= 2
+
+
+def test_spill_file_round_trip():
+    spill = _SpillFile()
+    for i in range(3):
+        spill.push({"i": i})
+    assert [spill.pop() for _ in range(2)] == [{"i": 0}, {"i": 1}]
+    spill.push({"i": 3})
+    assert [spill.pop() for _ in range(2)] == [{"i": 2}, {"i": 3}]
+    assert spill.pending == 0
+    spill.close()
+
+
+@pytest.mark.asyncio
+async def test_batches_by_size(fake_ws):
+    fake_ws(_messages(7))
+    watcher = AsyncWatcher(DummyClient(), job_id="jid", stream=True, max_reconnects=0)
+
+    batches = [[d.markdown for d in batch] async for batch in watcher.batches(3)]
+
+    assert batches == [["# 0", "# 1", "# 2"], ["# 3", "# 4", "# 5"], ["# 6"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_flush_on_interval(fake_ws):
+    fake_ws(_messages(4, pause=0.05))
+    watcher = AsyncWatcher(DummyClient(), job_id="jid", stream=True, max_reconnects=0)
+
+    batches = [len(batch) async for batch in watcher.batches(100, interval=0.02)]
+
+    assert sum(batches) == 4
+    assert len(batches) >= 3
+
+
+@pytest.mark.asyncio
+async def test_invalid_queue_options():
+    with pytest.raises(ValueError):
+        AsyncWatcher(DummyClient(), job_id="jid", overflow="drop")
+    with pytest.raises(ValueError):
+        AsyncWatcher(DummyClient(), job_id="jid", max_queue=-1)
+    with pytest.raises(ValueError):
+        async for _ in AsyncWatcher(DummyClient(), job_id="jid").batches(10):
+            pass
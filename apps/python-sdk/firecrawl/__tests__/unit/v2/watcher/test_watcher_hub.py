@@ -0,0 +1,176 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.watcher import Watcher
+from firecrawl.v2.watcher_hub import WatcherHub
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class FakeWebSocket:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            raise asyncio.CancelledError()
+        await asyncio.sleep(0)
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws: FakeWebSocket):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _job_messages(job_id):
+    return [
+        {"type": "document", "data": {"url": f"https://example.com/{job_id}/0"}},
+        {"type": "document", "data": {"url": f"https://example.com/{job_id}/1"}},
+        {"type": "done", "data": {"status": "completed", "completed": 2, "total": 2, "data": []}},
+    ]
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    import websockets
+
+    def fake_connect(uri, *args, **kwargs):
+        job_id = uri.rsplit("/", 1)[-1]
+        if job_id.startswith("down"):
+            raise OSError("connection refused")
+        if job_id.startswith("slow"):
+            documents = [{"type": "document", "data": {"url": f"https://example.com/{job_id}/{i}"}} for i in range(8)]
+            return FakeConnect(FakeWebSocket(documents + _job_messages(job_id)[-1:]))
+        return FakeConnect(FakeWebSocket(_job_messages(job_id)))
+
+    monkeypatch.setattr(websockets, "connect", fake_connect)
+
+
+def test_hub_runs_many_jobs_on_one_thread(fake_ws):
+    threads = set()
+    documents = {}
+    done = []
+    lock = threading.Lock()
+
+    def on_document(detail):
+        with lock:
+            threads.add(threading.get_ident())
+            documents.setdefault(detail["id"], []).append(detail["data"]["url"])
+
+    with WatcherHub(DummyClient()) as hub:
+        before = threading.active_count()
+        for i in range(50):
+            hub.watch(f"job-{i}", on_document=on_document, on_done=done.append)
+        assert hub.join(timeout=5)
+        # One loop thread for all jobs, no per-job threads
+        assert threading.active_count() - before <= 1
+        stats = hub.stats
+
+    assert len(threads) == 1
+    assert len(done) == 50
+    assert documents["job-7"] == ["https://example.com/job-7/0", "https://example.com/job-7/1"]
+    assert stats.finished_jobs == 50
+    assert stats.active_jobs == 0
+    assert stats.polls == 0
+
+
+def test_hub_falls_back_to_shared_polling(fake_ws):
+    client = DummyClient()
+    client.get_crawl_status = Mock(
+        side_effect=[
+            CrawlJob(status="scraping", completed=1, total=2, data=[]),
+            CrawlJob(status="completed", completed=2, total=2, data=[]),
+        ]
+    )
+    statuses = []
+    done = []
+
+    with WatcherHub(client, max_concurrent_polls=1) as hub:
+        hub.watch("down-1", poll_interval=0.01, max_reconnects=0, on_status=lambda job: statuses.append(job.status), on_done=done.append)
+        assert hub.join(timeout=5)
+        assert hub.stats.polls == 2
+
+    assert statuses == ["scraping", "completed"]
+    assert len(done) == 1
+    assert client.get_crawl_status.call_args.kwargs == {"raw": False}
+
+
+def test_hub_rejects_duplicates_and_standalone_start(fake_ws):
+    client = DummyClient()
+    client.get_crawl_status = Mock(return_value=CrawlJob(status="scraping", data=[]))
+    hub = WatcherHub(client)
+    watcher = hub.watch("down-2", poll_interval=0.05, max_reconnects=0)
+    with pytest.raises(ValueError):
+        hub.watch("down-2")
+    with pytest.raises(RuntimeError):
+        watcher.start()
+    hub.remove("down-2")
+    assert hub.join(timeout=2)
+    hub.close()
+    with pytest.raises(RuntimeError):
+        hub.add(Watcher(client, "job-x"))
+
+
+@pytest.mark.asyncio
+async def test_hub_joins_running_loop(fake_ws):
+    hub = WatcherHub(DummyClient(), loop=asyncio.get_running_loop())
+    loop_threads = set()
+    hub.watch("job-a", on_document=lambda d: loop_threads.add(threading.get_ident()))
+    hub.watch("job-b", on_document=lambda d: loop_threads.add(threading.get_ident()))
+    await asyncio.wait_for(hub.wait(), timeout=5)
+    with pytest.raises(RuntimeError):
+        hub.join()
+    hub.close()
+    assert loop_threads == {threading.get_ident()}
+    assert hub.stats.finished_jobs == 2
+
+
+def test_slow_listener_backpressure_does_not_stall_other_jobs(fake_ws):
+    slow_seen = []
+    fast_done = threading.Event()
+
+    def slow_listener(detail):
+        time.sleep(0.15)
+        slow_seen.append(detail["data"]["url"])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with WatcherHub(DummyClient(), listener_executor=executor) as hub:
+            slow = hub.watch("slow-1", on_document=slow_listener, max_pending_events=1)
+            # Let the slow job fill its queue before the fast one starts
+            while slow.listener_stats.pending < 1:
+                time.sleep(0.005)
+            started = time.perf_counter()
+            hub.watch("job-fast", on_done=lambda detail: fast_done.set())
+            assert fast_done.wait(timeout=2)
+            fast_elapsed = time.perf_counter() - started
+            assert hub.join(timeout=5)
+            assert slow.flush_listeners(timeout=5)
+
+    # The slow job's listener work was waited out on the loop, not by blocking it
+    assert fast_elapsed < 0.3
+    assert slow.listener_stats.blocked_seconds > 0
+    assert slow_seen == [f"https://example.com/slow-1/{i}" for i in range(8)]
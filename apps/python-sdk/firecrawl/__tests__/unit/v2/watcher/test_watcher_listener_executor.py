@@ -0,0 +1,174 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from firecrawl.v2.watcher import Watcher
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class FakeWebSocket:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            raise asyncio.CancelledError()
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws: FakeWebSocket):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _messages(job_id, n):
+    out = [{"type": "document", "data": {"url": f"https://example.com/{job_id}/{i}"}} for i in range(n)]
+    out.append({"type": "done", "data": {"status": "completed", "completed": n, "total": n, "data": []}})
+    return out
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    import websockets
+
+    def fake_connect(uri, *args, **kwargs):
+        job_id = uri.rsplit("/", 1)[-1]
+        return FakeConnect(FakeWebSocket(_messages(job_id, 10)))
+
+    monkeypatch.setattr(websockets, "connect", fake_connect)
+
+
+def _wait_thread(watcher, limit=3):
+    deadline = time.time() + limit
+    while watcher._thread and watcher._thread.is_alive() and time.time() < deadline:
+        time.sleep(0.005)
+
+
+def test_slow_listeners_do_not_block_reading(fake_ws):
+    events = []
+    threads = set()
+
+    def on_document(detail):
+        time.sleep(0.03)
+        threads.add(threading.get_ident())
+        events.append(detail["data"]["url"])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        watcher = Watcher(DummyClient(), job_id="jid", listener_executor=executor)
+        watcher.add_event_listener("document", on_document)
+        watcher.add_event_listener("done", lambda d: events.append("done"))
+        started = time.perf_counter()
+        watcher.start()
+        _wait_thread(watcher)
+        read_time = time.perf_counter() - started
+        assert watcher.flush_listeners(timeout=3)
+        stats = watcher.listener_stats
+
+    # The websocket thread finished well before the ~300 ms of listener work
+    assert read_time < 0.2
+    assert events == [f"https://example.com/jid/{i}" for i in range(10)] + ["done"]
+    assert watcher._thread.ident not in threads
+    assert stats.dispatched >= 11
+    assert stats.pending == 0
+    assert stats.max_pending > 1
+    assert stats.max_lag_seconds > 0
+
+
+def test_full_queue_blocks_reader(fake_ws):
+    seen = []
+
+    def on_document(detail):
+        time.sleep(0.005)
+        seen.append(detail["data"]["url"])
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        watcher = Watcher(DummyClient(), job_id="jid", listener_executor=executor, max_pending_events=1)
+        watcher.add_event_listener("document", on_document)
+        watcher.start()
+        _wait_thread(watcher)
+        assert watcher.flush_listeners(timeout=3)
+
+    assert seen == [f"https://example.com/jid/{i}" for i in range(10)]
+    stats = watcher.listener_stats
+    # The reader waits before each frame; only the "done" frame queues two events at once
+    assert stats.max_pending <= 2
+    assert stats.blocked_seconds > 0
+
+
+def test_shared_executor_keeps_per_job_order(fake_ws):
+    seen = {"a": [], "b": []}
+
+    def listener(job):
+        def on_document(detail):
+            time.sleep(0.001)
+            seen[job].append(detail["data"]["url"])
+        return on_document
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        watchers = []
+        for job in ("a", "b"):
+            watcher = Watcher(DummyClient(), job_id=job, listener_executor=executor)
+            watcher.add_event_listener("document", listener(job))
+            watcher.start()
+            watchers.append(watcher)
+        for watcher in watchers:
+            _wait_thread(watcher)
+            assert watcher.flush_listeners(timeout=3)
+
+    for job in ("a", "b"):
+        assert seen[job] == [f"https://example.com/{job}/{i}" for i in range(10)]
+
+
+def test_inline_dispatch_is_default():
+    watcher = Watcher(DummyClient(), job_id="jid")
+    calls = []
+    watcher.add_event_listener("document", lambda d: calls.append(threading.get_ident()))
+    watcher.dispatch_event("document", {"data": {}})
+    assert calls == [threading.get_ident()]
+    assert watcher.flush_listeners()
+    assert watcher.listener_stats.dispatched == 0
+    with pytest.raises(ValueError):
+        Watcher(DummyClient(), job_id="jid", max_pending_events=0)
+
+
+def test_rejected_executor_submit_does_not_wedge_the_queue():
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    watcher = Watcher(DummyClient(), job_id="jid", listener_executor=executor, max_pending_events=1)
+    errors = []
+
+    def dispatch_twice():
+        for _ in range(2):
+            try:
+                watcher.dispatch_event("document", {"data": {}})
+            except RuntimeError as exc:
+                errors.append(exc)
+
+    thread = threading.Thread(target=dispatch_twice, daemon=True)
+    thread.start()
+    thread.join(timeout=3)
+    assert not thread.is_alive()
+    assert len(errors) == 2
+    assert watcher.flush_listeners(timeout=1)
+    assert watcher.listener_stats.pending == 0
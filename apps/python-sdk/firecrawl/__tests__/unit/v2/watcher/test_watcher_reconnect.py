@@ -0,0 +1,188 @@
+import asyncio
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.utils.normalize import ReplayFilter, document_key
+from firecrawl.v2.watcher import Watcher
+from firecrawl.v2.watcher_async import AsyncWatcher
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class DroppingWebSocket:
+    """Replays messages, then fails like a dropped connection (or ends if ``drop`` is False)."""
+
+    def __init__(self, messages, drop=True):
+        self._messages = list(messages)
+        self._drop = drop
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            if self._drop:
+                raise ConnectionClosedError(None, None)
+            raise asyncio.CancelledError()
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _doc(i):
+    return {"markdown": f"# {i}", "metadata": {"sourceURL": f"https://example.com/{i}", "scrapeId": f"s{i}"}}
+
+
+def _catchup(n, total=4):
+    return {"type": "catchup", "data": {"status": "scraping", "completed": n, "total": total, "data": [_doc(i) for i in range(n)]}}
+
+
+DONE = {"type": "done", "data": {"status": "completed", "completed": 4, "total": 4, "data": []}}
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Install a websockets.connect that hands out the given connections in order."""
+    import websockets
+
+    def install(*sockets):
+        queue = list(sockets)
+        calls = []
+
+        def fake_connect(uri, *args, **kwargs):
+            calls.append(uri)
+            ws = queue.pop(0) if queue else None
+            if ws is None:
+                raise OSError("connection refused")
+            return FakeConnect(ws)
+
+        monkeypatch.setattr(websockets, "connect", fake_connect)
+        return calls
+
+    return install
+
+
+def _run(watcher):
+    watcher.start()
+    deadline = time.time() + 3
+    while watcher._thread and watcher._thread.is_alive() and time.time() < deadline:
+        time.sleep(0.01)
+    watcher.stop()
+
+
+def test_document_key_prefers_scrape_id():
+    assert document_key(_doc(1)) == "scrape:s1"
+    assert document_key({"metadata": {"source_url": "https://a.example"}}) == "url:https://a.example"
+    assert document_key({"url": "https://b.example"}) == "url:https://b.example"
+    assert document_key({"markdown": "x"}) is None
+
+
+def test_sync_watcher_reconnects_and_deduplicates_catchup(connections):
+    calls = connections(
+        DroppingWebSocket([_catchup(2), {"type": "document", "data": _doc(2)}]),
+        # Resumed connection replays everything so far, plus one new page
+        DroppingWebSocket([_catchup(4), DONE], drop=False),
+    )
+    watcher = Watcher(DummyClient(), job_id="jid", reconnect_backoff=0.01)
+    seen = []
+    done = []
+    watcher.add_event_listener("document", lambda d: seen.append(d["data"]["metadata"]["scrapeId"]))
+    watcher.add_event_listener("done", done.append)
+    _run(watcher)
+
+    assert len(calls) == 2
+    assert seen == ["s0", "s1", "s2", "s3"]
+    assert len(watcher.data) == 4
+    assert len(done) == 1
+    assert watcher.summary.reconnects == 1
+
+
+def test_replay_filter_memory_stays_flat_over_many_documents():
+    replays = ReplayFilter(window=100)
+    for i in range(20_000):
+        assert len(replays.fresh([_doc(i)])) == 1
+    assert len(replays._keys) == 100
+    # A catchup replays the whole job: only the one new document is delivered
+    catchup = [_doc(i) for i in range(20_001)]
+    assert replays.fresh(catchup, offset=0) == [_doc(20_000)]
+    # An HTTP page from a cursor is positioned the same way
+    assert replays.fresh([_doc(i) for i in range(15_000, 20_002)], offset=15_000) == [_doc(20_001)]
+    assert len(replays._keys) == 100 and replays.delivered == 20_002
+
+
+def test_sync_watcher_deduplicates_catchup_beyond_the_key_window(connections):
+    connections(
+        DroppingWebSocket([_catchup(2, total=5), {"type": "document", "data": _doc(2)}, {"type": "document", "data": _doc(3)}]),
+        DroppingWebSocket([_catchup(5, total=5), DONE], drop=False),
+    )
+    watcher = Watcher(DummyClient(), job_id="jid", reconnect_backoff=0.01, dedupe_window=2)
+    seen = []
+    watcher.add_event_listener("document", lambda d: seen.append(d["data"]["metadata"]["scrapeId"]))
+    _run(watcher)
+    assert seen == ["s0", "s1", "s2", "s3", "s4"]
+    with pytest.raises(ValueError):
+        Watcher(DummyClient(), job_id="jid", dedupe_window=0)
+
+
+def test_sync_watcher_polls_after_reconnects_exhausted(connections):
+    calls = connections()
+    client = DummyClient()
+    client.get_crawl_status = Mock(return_value=CrawlJob(status="completed", completed=1, total=1, data=[]))
+    watcher = Watcher(client, job_id="jid", max_reconnects=2, reconnect_backoff=0.01)
+    statuses = []
+    watcher.add_listener(lambda job: statuses.append(job.status))
+    _run(watcher)
+
+    assert len(calls) == 3
+    assert statuses == ["completed"]
+    assert watcher.summary.reconnects == 2
+
+
+def test_invalid_reconnect_settings():
+    with pytest.raises(ValueError):
+        Watcher(DummyClient(), job_id="jid", max_reconnects=-1)
+    with pytest.raises(ValueError):
+        AsyncWatcher(DummyClient(), job_id="jid", reconnect_backoff=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_watcher_resumes_push_after_drop(connections):
+    calls = connections(
+        DroppingWebSocket([_catchup(2)]),
+        DroppingWebSocket([_catchup(3), {"type": "document", "data": _doc(3)}, DONE], drop=False),
+    )
+    client = DummyClient()
+    client.get_crawl_status_page = Mock(return_value={"status": "scraping", "data": []})
+    watcher = AsyncWatcher(client, job_id="jid", stream=True, reconnect_backoff=0.01)
+
+    markdown = []
+    async for snapshot in watcher:
+        markdown.extend(d.markdown for d in snapshot.data)
+
+    assert len(calls) == 2
+    assert markdown == ["# 0", "# 1", "# 2", "# 3"]
+    # The initial HTTP snapshot is fetched once, not on every reconnect
+    assert client.get_crawl_status_page.call_count == 1
+    assert watcher.summary.reconnects == 1
+    assert watcher.summary.status == "completed"
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from firecrawl.v2.types import WatcherSummary
+from firecrawl.v2.watcher import Watcher
+from firecrawl.v2.watcher_async import AsyncWatcher
+
+
+class DummyHttpClient:
+    def __init__(self, api_url: str = "http://localhost", api_key: str = "TEST"):
+        self.api_url = api_url
+        self.api_key = api_key
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class FakeWebSocket:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(0.01)
+            raise asyncio.CancelledError()
+        return json.dumps(self._messages.pop(0))
+
+
+class FakeConnect:
+    def __init__(self, ws: FakeWebSocket):
+        self._ws = ws
+
+    async def __aenter__(self):
+        return self._ws
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _doc(i):
+    return {"url": f"https://example.com/{i}", "markdown": f"# {i}"}
+
+
+MESSAGES = [
+    {"type": "catchup", "data": {"status": "scraping", "completed": 2, "total": 6, "data": [_doc(0), _doc(1)]}},
+    {"type": "document", "data": _doc(2)},
+    {"type": "document", "data": _doc(3)},
+    {"data": {"status": "scraping", "completed": 4, "total": 6, "creditsUsed": 4, "data": []}},
+    {"type": "done", "data": {"status": "completed", "completed": 6, "total": 6, "creditsUsed": 6, "data": [_doc(4), _doc(5)]}},
+]
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    import websockets
+
+    def install(messages):
+        ws = FakeWebSocket(messages)
+        monkeypatch.setattr(websockets, "connect", lambda uri, *a, **kw: FakeConnect(ws))
+
+    return install
+
+
+def _run(watcher):
+    watcher.start()
+    deadline = time.time() + 2
+    while watcher._thread and watcher._thread.is_alive() and time.time() < deadline:
+        time.sleep(0.01)
+    watcher.stop()
+
+
+def test_stream_mode_releases_documents_and_reports_summary(fake_ws):
+    fake_ws(MESSAGES)
+    watcher = Watcher(DummyClient(), job_id="jid", kind="crawl", stream=True, recent_window=3)
+
+    urls = []
+    done = []
+    snapshots = []
+    watcher.add_event_listener("document", lambda d: urls.append(d["data"]["url"]))
+    watcher.add_event_listener("done", done.append)
+    watcher.add_listener(snapshots.append)
+    _run(watcher)
+
+    assert urls == [f"https://example.com/{i}" for i in range(6)]
+    assert watcher.data == []
+    assert [d["url"] for d in watcher.recent] == [f"https://example.com/{i}" for i in (3, 4, 5)]
+    assert len(done) == 1
+    summary = done[0]["summary"]
+    assert isinstance(summary, WatcherSummary)
+    assert summary.documents == 6
+    assert (summary.completed, summary.total, summary.credits_used) == (6, 6, 6)
+    assert summary.status == "completed"
+    assert len(done[0]["data"]) == 3
+    assert len(snapshots[-1].data) == 3
+    assert watcher.summary.documents == 6
+
+
+def test_default_mode_still_accumulates(fake_ws):
+    fake_ws(MESSAGES)
+    watcher = Watcher(DummyClient(), job_id="jid", kind="crawl")
+
+    done = []
+    watcher.add_event_listener("done", done.append)
+    _run(watcher)
+
+    assert len(watcher.data) == 6
+    assert len(done[0]["data"]) == 6
+    assert "summary" not in done[0]
+    assert len(watcher.recent) == 0
+
+
+def test_negative_recent_window_rejected():
+    with pytest.raises(ValueError):
+        Watcher(DummyClient(), job_id="jid", recent_window=-1)
+    with pytest.raises(ValueError):
+        AsyncWatcher(DummyClient(), job_id="jid", recent_window=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_stream_mode_yields_each_document_once(fake_ws):
+    fake_ws(MESSAGES)
+    watcher = AsyncWatcher(DummyClient(), job_id="jid", kind="crawl", stream=True, recent_window=2)
+
+    markdown = []
+    statuses = []
+    async for snapshot in watcher:
+        statuses.append(snapshot.status)
+        markdown.extend(d.markdown for d in snapshot.data)
+
+    assert markdown == [f"# {i}" for i in range(6)]
+    assert statuses[-1] == "completed"
+    assert [d["url"] for d in watcher.recent] == ["https://example.com/4", "https://example.com/5"]
+    summary = watcher.summary
+    assert summary.documents == 6
+    assert (summary.completed, summary.total) == (6, 6)
+    assert summary.status == "completed"
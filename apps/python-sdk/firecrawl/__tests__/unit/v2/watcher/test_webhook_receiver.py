@@ -0,0 +1,190 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+
+from firecrawl.v2.types import Document
+from firecrawl.v2.webhooks import (
+    WebhookReceiver,
+    parse_webhook_payload,
+    sign_webhook_payload,
+    verify_webhook_signature,
+)
+
+SECRET = "whsec_test"
+
+
+def _payload(event, job_id="job-1", webhook_id=None, data=None, success=True, error=None):
+    return {
+        "success": success,
+        "type": event,
+        "id": job_id,
+        "webhookId": webhook_id or f"{job_id}-{event}-{len(data or [])}",
+        "data": data or [],
+        "error": error,
+        "metadata": {"tenant": "t1"},
+    }
+
+
+def _page(i):
+    return {"markdown": f"# {i}", "metadata": {"sourceURL": f"https://example.com/{i}", "scrapeId": f"s{i}"}}
+
+
+class StandInSender:
+    """Posts deliveries the way the API does: compact JSON body, HMAC header over the exact bytes."""
+
+    def __init__(self, url, secret=SECRET):
+        self._url = url
+        self._secret = secret
+        self._client = httpx.AsyncClient()
+
+    async def send(self, payload, signature=None):
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json"}
+        if self._secret is not None:
+            headers["X-Firecrawl-Signature"] = signature or sign_webhook_payload(body, self._secret)
+        return await self._client.post(self._url, content=body, headers=headers)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+def test_parse_and_verify():
+    body = json.dumps(_payload("crawl.page", data=[_page(1)])).encode()
+    signature = sign_webhook_payload(body, SECRET)
+    assert signature.startswith("sha256=")
+    assert verify_webhook_signature(body, signature, SECRET)
+    assert not verify_webhook_signature(body + b" ", signature, SECRET)
+    assert not verify_webhook_signature(body, None, SECRET)
+
+    event = parse_webhook_payload(body)
+    assert event.job_id == "job-1"
+    assert event.type == "crawl.page"
+    assert event.status == "scraping"
+    assert isinstance(event.data[0], Document)
+    assert event.data[0].markdown == "# 1"
+    assert event.metadata == {"tenant": "t1"}
+
+    extract = parse_webhook_payload(_payload("extract.completed", data=[{"answer": 42}]))
+    assert extract.status == "completed"
+    assert extract.data is None
+    assert extract.results == [{"answer": 42}]
+
+    with pytest.raises(ValueError):
+        parse_webhook_payload(b"[]")
+    with pytest.raises(ValueError):
+        parse_webhook_payload({"type": "crawl.page"})
+
+
+@pytest.mark.asyncio
+async def test_server_routes_signed_deliveries_to_job_iterator():
+    async with WebhookReceiver(secret=SECRET) as receiver:
+        sender = StandInSender(receiver.url)
+        events = receiver.events("job-1")
+        others = []
+        receiver.on(others.append, job_id="job-2")
+
+        async def deliver():
+            assert (await sender.send(_payload("crawl.started"))).status_code == 200
+            await sender.send(_payload("crawl.page", data=[_page(0)]))
+            # Redelivery of the same webhook id is acknowledged but dropped
+            await sender.send(_payload("crawl.page", data=[_page(0)]))
+            await sender.send(_payload("crawl.page", job_id="job-2", data=[_page(9)]))
+            bad = await sender.send(_payload("crawl.page", data=[_page(1)]), signature="sha256=00")
+            assert bad.status_code == 401
+            await sender.send(_payload("crawl.page", webhook_id="p1", data=[_page(1)]))
+            await sender.send(_payload("crawl.completed"))
+
+        delivery = asyncio.create_task(deliver())
+        received = [event async for event in events]
+        await delivery
+        await sender.aclose()
+
+    assert [e.type for e in received] == ["crawl.started", "crawl.page", "crawl.page", "crawl.completed"]
+    assert [d.markdown for e in received for d in e.data] == ["# 0", "# 1"]
+    assert [d.markdown for e in others for d in e.data] == ["# 9"]
+    stats = receiver.stats
+    assert stats.received == 5
+    assert stats.duplicates == 1
+    assert stats.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_early_deliveries_are_replayed_to_late_subscribers():
+    receiver = WebhookReceiver()
+    for event in ("batch_scrape.started", "batch_scrape.page"):
+        status, _ = await receiver.handle(json.dumps(_payload(event, data=[_page(0)])).encode(), {})
+        assert status == 200
+    assert receiver.stats.unrouted == 2
+
+    seen = []
+
+    async def handler(event):
+        seen.append(event.type)
+
+    receiver.on(handler, job_id="job-1")
+    await asyncio.sleep(0)
+    await receiver.handle(json.dumps(_payload("batch_scrape.completed")).encode(), {})
+    assert seen == ["batch_scrape.started", "batch_scrape.page", "batch_scrape.completed"]
+
+    status, response = await receiver.handle(b"not json", {})
+    assert status == 400
+    assert response["success"] is False
+
+
+def test_wsgi_app():
+    receiver = WebhookReceiver(secret=SECRET, path="/hooks/firecrawl")
+    seen = []
+    receiver.on(seen.append)
+    body = json.dumps(_payload("crawl.completed")).encode()
+
+    def call(path, body, signature):
+        responses = []
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": path,
+            "CONTENT_LENGTH": str(len(body)),
+            "HTTP_X_FIRECRAWL_SIGNATURE": signature,
+            "wsgi.input": io.BytesIO(body),
+        }
+        chunks = receiver.wsgi_app(environ, lambda status, headers: responses.append(status))
+        return responses[0], json.loads(b"".join(chunks))
+
+    assert call("/hooks/firecrawl", body, sign_webhook_payload(body, SECRET)) == ("200 OK", {"success": True})
+    assert call("/other", body, sign_webhook_payload(body, SECRET))[0] == "404 Not Found"
+    assert call("/hooks/firecrawl", body, "sha256=bad")[0] == "401 Unauthorized"
+    assert [e.status for e in seen] == ["completed"]
+
+
+@pytest.mark.asyncio
+async def test_asgi_app():
+    receiver = WebhookReceiver(secret=SECRET)
+    seen = []
+    receiver.on(seen.append, job_id="job-1")
+    body = json.dumps(_payload("crawl.failed", success=False, error="boom")).encode()
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:], "more_body": False},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [(b"x-firecrawl-signature", sign_webhook_payload(body, SECRET).encode())],
+    }
+    await receiver(scope, receive, send)
+
+    assert sent[0]["status"] == 200
+    assert json.loads(sent[1]["body"]) == {"success": True}
+    assert seen[0].status == "failed"
+    assert seen[0].error == "boom"
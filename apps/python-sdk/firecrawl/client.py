@@ -57,6 +57,8 @@ class V2Proxy:
 
         if client_instance:
             self.scrape = client_instance.scrape
+            self.scrape_many = client_instance.scrape_many
+            self.scrape_urls = client_instance.scrape_urls
             self.search = client_instance.search
             self.crawl = client_instance.crawl
             self.start_crawl = client_instance.start_crawl
@@ -83,6 +85,8 @@ class V2Proxy:
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
+            self.large_batch_scrape = client_instance.large_batch_scrape
+            self.batch_producer = client_instance.batch_producer
 
             self.map = client_instance.map
             self.get_concurrency = client_instance.get_concurrency
@@ -91,6 +95,7 @@ class V2Proxy:
             self.get_queue_status = client_instance.get_queue_status
 
             self.watcher = client_instance.watcher
+            self.crawl_stream = client_instance.crawl_stream
     
     def __getattr__(self, name):
         """Forward attribute access to the underlying client."""
@@ -124,6 +129,8 @@ class AsyncV2Proxy:
 
         if client_instance:
             self.scrape = client_instance.scrape
+            self.scrape_many = client_instance.scrape_many
+            self.scrape_urls = client_instance.scrape_urls
             self.search = client_instance.search
             self.crawl = client_instance.crawl
             self.start_crawl = client_instance.start_crawl
@@ -152,6 +159,8 @@ class AsyncV2Proxy:
             self.wait_batch_scrape = client_instance.wait_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
+            self.large_batch_scrape = client_instance.large_batch_scrape
+            self.batch_producer = client_instance.batch_producer
 
             self.map = client_instance.map
             self.get_concurrency = client_instance.get_concurrency
@@ -160,6 +169,7 @@ class AsyncV2Proxy:
             self.get_queue_status = client_instance.get_queue_status
 
             self.watcher = client_instance.watcher
+            self.crawl_stream = client_instance.crawl_stream
 
     def __getattr__(self, name):
         """Forward attribute access to the underlying client."""
@@ -195,6 +205,8 @@ class Firecrawl:
         self.v2 = V2Proxy(self._v2_client)
         
         self.scrape = self._v2_client.scrape
+        self.scrape_many = self._v2_client.scrape_many
+        self.scrape_urls = self._v2_client.scrape_urls
         self.search = self._v2_client.search
         self.map = self._v2_client.map
 
@@ -214,6 +226,8 @@ class Firecrawl:
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
+        self.large_batch_scrape = self._v2_client.large_batch_scrape
+        self.batch_producer = self._v2_client.batch_producer
 
         self.start_extract = self._v2_client.start_extract
         self.get_extract_status = self._v2_client.get_extract_status
@@ -230,6 +244,7 @@ class Firecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
         
         self.watcher = self._v2_client.watcher
+        self.crawl_stream = self._v2_client.crawl_stream
         
 class AsyncFirecrawl:
     """Async unified Firecrawl client (v2 by default, v1 under ``.v1``)."""
@@ -249,6 +264,8 @@ class AsyncFirecrawl:
         # Expose v2 async surface directly on the top-level client for ergonomic access
         # Keep method names aligned with the sync client
         self.scrape = self._v2_client.scrape
+        self.scrape_many = self._v2_client.scrape_many
+        self.scrape_urls = self._v2_client.scrape_urls
         self.search = self._v2_client.search
         self.map = self._v2_client.map
 
@@ -267,6 +284,8 @@ class AsyncFirecrawl:
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
+        self.large_batch_scrape = self._v2_client.large_batch_scrape
+        self.batch_producer = self._v2_client.batch_producer
 
         self.start_extract = self._v2_client.start_extract
         self.get_extract_status = self._v2_client.get_extract_status
@@ -283,6 +302,14 @@ class AsyncFirecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
 
         self.watcher = self._v2_client.watcher
+        self.crawl_stream = self._v2_client.crawl_stream
+        self.close = self._v2_client.close
+
+    async def __aenter__(self) -> "AsyncFirecrawl":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
 # Export Firecrawl as an alias for FirecrawlApp
 FirecrawlApp = Firecrawl
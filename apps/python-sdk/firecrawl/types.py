@@ -12,6 +12,7 @@ from .v2.types import (
     # Document types
     Document,
     DocumentMetadata,
+    LazyDocument,
     
     # Scrape types
     ScrapeFormats,
@@ -34,6 +35,13 @@ from .v2.types import (
     BatchScrapeRequest,
     BatchScrapeJob,
     BatchScrapeResponse,
+    LargeBatchChunkProgress,
+    BatchRetryPolicy,
+    ScrapeManyProgress,
+    ScrapePlan,
+    WatcherSummary,
+    WatcherQueueStats,
+    WatcherDispatchStats,
     
     # Map types
     MapOptions,
@@ -92,6 +100,7 @@ __all__ = [
     # Document types
     'Document',
     'DocumentMetadata',
+    'LazyDocument',
     
     # Scrape types
     'ScrapeFormats',
@@ -114,6 +123,13 @@ __all__ = [
     # Batch scrape types
     'BatchScrapeRequest',
     'BatchScrapeJob',
+    'LargeBatchChunkProgress',
+    'BatchRetryPolicy',
+    'ScrapeManyProgress',
+    'ScrapePlan',
+    'WatcherSummary',
+    'WatcherQueueStats',
+    'WatcherDispatchStats',
     'BatchScrapeResponse',
     
     # Map types
@@ -0,0 +1,447 @@
+"""
+Grow one batch scrape job from an unbounded stream of URLs.
+
+``start_batch_scrape`` needs the whole URL list up front. A producer instead
+opens the job with the first micro-batch and appends later ones to it through
+``append_to_id``, flushing whenever ``max_batch_size`` URLs are buffered or the
+oldest buffered URL has waited ``flush_interval`` seconds. Results of the one
+job are read incrementally from a cursor while URLs are still being added.
+
+Usage:
+    with client.batch_producer(flush_interval=0.05) as producer:
+        for message in consumer:
+            producer.add(message.url)
+    for doc in producer.results():
+        ...
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .methods import batch as batch_methods
+from .methods.aio import batch as async_batch_methods
+from .types import BatchScrapeJob, BatchScrapeResponse, Document, ScrapeOptions
+from .utils.url_dedupe import DedupeOption, UrlDeduplicator
+
+_TERMINAL = ("completed", "failed", "cancelled")
+
+
+class BatchProducerStats(BaseModel):
+    """Counters describing URLs handed to a producer and the appends it made."""
+
+    added: int = 0
+    submitted: int = 0
+    # URLs dropped as duplicates of ones already added (with dedupe enabled)
+    collapsed: int = 0
+    invalid: int = 0
+    flushes: int = 0
+    buffered: int = 0
+    # Longest time a URL waited in the buffer before its append was sent
+    max_buffer_seconds: float = 0.0
+
+
+class _ProducerBase:
+    def __init__(
+        self,
+        options: Optional[ScrapeOptions],
+        max_batch_size: int,
+        flush_interval: float,
+        poll_interval: float,
+        max_pending: int,
+        dedupe: DedupeOption,
+        batch_options: Dict[str, Any],
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if flush_interval < 0 or poll_interval < 0:
+            raise ValueError("flush_interval and poll_interval must be non-negative")
+        if max_pending < max_batch_size:
+            raise ValueError("max_pending must be at least max_batch_size")
+        self._options = options
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._poll_interval = poll_interval
+        self._max_pending = max_pending
+        self._batch_options = {k: v for k, v in batch_options.items() if v is not None}
+        # One deduplicator for the producer's lifetime, so repeats are caught across flushes
+        self._deduper: Optional[UrlDeduplicator] = (
+            dedupe if isinstance(dedupe, UrlDeduplicator) else UrlDeduplicator() if dedupe else None
+        )
+        self._buffer: List[str] = []
+        self._first_buffered_at: Optional[float] = None
+        self._closed = False
+        self._drained = False
+        self._error: Optional[BaseException] = None
+        self._stats = BatchProducerStats()
+        self.job_id: Optional[str] = None
+
+    @property
+    def stats(self) -> BatchProducerStats:
+        stats = self._stats.model_copy()
+        stats.buffered = len(self._buffer)
+        return stats
+
+    def _request_kwargs(self) -> Dict[str, Any]:
+        kwargs = dict(self._batch_options)
+        if self.job_id is not None:
+            kwargs["append_to_id"] = self.job_id
+            # The job-level webhook was registered by the first request
+            kwargs.pop("webhook", None)
+        return kwargs
+
+    def _take_batch(self) -> Tuple[List[str], float]:
+        batch = self._buffer[: self._max_batch_size]
+        del self._buffer[: self._max_batch_size]
+        waited = time.monotonic() - self._first_buffered_at if self._first_buffered_at is not None else 0.0
+        self._first_buffered_at = time.monotonic() if self._buffer else None
+        return batch, waited
+
+    def _flush_due(self) -> bool:
+        if not self._buffer:
+            return False
+        if self._closed or len(self._buffer) >= self._max_batch_size:
+            return True
+        return time.monotonic() - self._first_buffered_at >= self._flush_interval
+
+    def _record_submit(self, batch: List[str], response: BatchScrapeResponse, waited: float) -> None:
+        if self.job_id is None:
+            self.job_id = response.id
+        invalid = len(response.invalid_urls or [])
+        self._stats.submitted += len(batch) - invalid
+        self._stats.invalid += invalid
+        self._stats.flushes += 1
+        self._stats.max_buffer_seconds = max(self._stats.max_buffer_seconds, waited)
+
+    def _accept(self, urls: List[str]) -> List[str]:
+        self._stats.added += len(urls)
+        if self._deduper is None:
+            return urls
+        kept = self._deduper.filter(urls)
+        self._stats.collapsed += len(urls) - len(kept)
+        return kept
+
+    def _check_open(self) -> None:
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            raise RuntimeError("BatchProducer is closed")
+
+
+class BatchProducer(_ProducerBase):
+    """
+    Feed URLs into a single, growing batch scrape job.
+
+    ``add`` returns immediately; a background thread posts micro-batches.
+    ``add`` blocks once ``max_pending`` URLs are waiting to be sent. Errors
+    from a background append are raised by the next ``add``, ``flush`` or
+    ``close`` call.
+    """
+
+    def __init__(
+        self,
+        http_client: Any,
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.05,
+        poll_interval: float = 1.0,
+        max_pending: int = 10000,
+        dedupe: DedupeOption = False,
+        **batch_options: Any,
+    ) -> None:
+        """
+        Args:
+            http_client: HttpClient used for the batch scrape requests
+            options: Scrape options for every URL of the job
+            max_batch_size: URLs per append request
+            flush_interval: Seconds a URL may wait before a partial batch is sent
+            poll_interval: Seconds between result polls in ``results()``
+            max_pending: Buffered URLs at which ``add`` starts to block
+            dedupe: Drop URLs that canonicalize to one already added (True,
+                or a UrlDeduplicator); counted in ``stats.collapsed``
+            **batch_options: webhook, max_concurrency, ignore_invalid_urls,
+                zero_data_retention or integration for the job
+        """
+        super().__init__(options, max_batch_size, flush_interval, poll_interval, max_pending, dedupe, batch_options)
+        self._client = http_client
+        self._cond = threading.Condition()
+        # Serializes requests so the first one creates the job the others append to
+        self._submit_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, url: str) -> None:
+        self.add_many([url])
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        urls = list(urls)
+        if not urls:
+            return
+        urls = batch_methods.validate_batch_urls(urls)
+        with self._cond:
+            self._check_open()
+            while len(self._buffer) >= self._max_pending and self._error is None:
+                self._cond.wait()
+            self._check_open()
+            urls = self._accept(urls)
+            if not urls:
+                return
+            if self._first_buffered_at is None:
+                self._first_buffered_at = time.monotonic()
+            self._buffer.extend(urls)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_loop, name="firecrawl-batch-producer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _submit(self, batch: List[str], waited: float) -> None:
+        with self._submit_lock:
+            response = batch_methods.start_batch_scrape(
+                self._client, batch, options=self._options, **self._request_kwargs()
+            )
+            with self._cond:
+                self._record_submit(batch, response, waited)
+                self._cond.notify_all()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._flush_due():
+                    if self._closed and not self._buffer:
+                        return
+                    timeout = None
+                    if self._first_buffered_at is not None:
+                        timeout = max(self._flush_interval - (time.monotonic() - self._first_buffered_at), 0.0)
+                    self._cond.wait(timeout)
+                batch, waited = self._take_batch()
+                self._cond.notify_all()
+            try:
+                self._submit(batch, waited)
+            except Exception as exc:
+                with self._cond:
+                    self._error = exc
+                    self._cond.notify_all()
+                return
+
+    def flush(self) -> None:
+        """Send every buffered URL now."""
+        while True:
+            with self._cond:
+                if self._error is not None:
+                    raise self._error
+                if not self._buffer:
+                    break
+                batch, waited = self._take_batch()
+                self._cond.notify_all()
+            self._submit(batch, waited)
+        # Wait for an append the background thread may have in progress
+        with self._submit_lock:
+            pass
+
+    def close(self) -> None:
+        """Send the remaining URLs and stop accepting new ones."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        with self._cond:
+            self._drained = True
+            self._cond.notify_all()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "BatchProducer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def results(self) -> Iterator[Document]:
+        """
+        Yield the job's documents as they are scraped, each once.
+
+        Runs until the producer is closed and the job has finished every
+        submitted URL; may be consumed from another thread while URLs are
+        still being added.
+        """
+        cursor = 0
+        while True:
+            with self._cond:
+                while self.job_id is None and not self._drained and self._error is None:
+                    self._cond.wait(self._poll_interval or None)
+                if self._error is not None:
+                    raise self._error
+                if self.job_id is None:
+                    return
+                # Captured before polling, so a terminal status covers every append
+                submitted_all = self._drained
+                job_id = self.job_id
+            page, documents = self._read(job_id, cursor)
+            cursor += len(documents)
+            yield from documents
+            if submitted_all and page.status in _TERMINAL:
+                return
+            time.sleep(self._poll_interval)
+
+    def _read(self, job_id: str, cursor: int) -> Tuple[BatchScrapeJob, List[Document]]:
+        page = batch_methods.get_batch_scrape_status_page(self._client, f"/v2/batch/scrape/{job_id}?skip={cursor}")
+        documents = list(page.data)
+        while page.next and page.data:
+            page = batch_methods.get_batch_scrape_status_page(self._client, page.next)
+            documents.extend(page.data)
+        return page, documents
+
+
+class AsyncBatchProducer(_ProducerBase):
+    """Async counterpart of ``BatchProducer``; the flusher runs as a task on the caller's loop."""
+
+    def __init__(
+        self,
+        http_client: Any,
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.05,
+        poll_interval: float = 1.0,
+        max_pending: int = 10000,
+        dedupe: DedupeOption = False,
+        **batch_options: Any,
+    ) -> None:
+        super().__init__(options, max_batch_size, flush_interval, poll_interval, max_pending, dedupe, batch_options)
+        self._client = http_client
+        self._cond: Optional[asyncio.Condition] = None
+        self._submit_lock: Optional[asyncio.Lock] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _condition(self) -> asyncio.Condition:
+        # Created lazily so the producer can be built outside a running loop
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+            self._submit_lock = asyncio.Lock()
+        return self._cond
+
+    async def add(self, url: str) -> None:
+        await self.add_many([url])
+
+    async def add_many(self, urls: Iterable[str]) -> None:
+        urls = list(urls)
+        if not urls:
+            return
+        urls = batch_methods.validate_batch_urls(urls)
+        cond = self._condition()
+        async with cond:
+            self._check_open()
+            while len(self._buffer) >= self._max_pending and self._error is None:
+                await cond.wait()
+            self._check_open()
+            urls = self._accept(urls)
+            if not urls:
+                return
+            if self._first_buffered_at is None:
+                self._first_buffered_at = time.monotonic()
+            self._buffer.extend(urls)
+            if self._task is None:
+                self._task = asyncio.create_task(self._flush_loop())
+            cond.notify_all()
+
+    async def _submit(self, batch: List[str], waited: float) -> None:
+        cond = self._condition()
+        async with self._submit_lock:
+            response = await async_batch_methods.start_batch_scrape(
+                self._client, batch, options=self._options, **self._request_kwargs()
+            )
+            async with cond:
+                self._record_submit(batch, response, waited)
+                cond.notify_all()
+
+    async def _flush_loop(self) -> None:
+        cond = self._condition()
+        while True:
+            async with cond:
+                while not self._flush_due():
+                    if self._closed and not self._buffer:
+                        return
+                    if self._first_buffered_at is None:
+                        await cond.wait()
+                        continue
+                    remaining = self._flush_interval - (time.monotonic() - self._first_buffered_at)
+                    try:
+                        await asyncio.wait_for(cond.wait(), max(remaining, 0.0))
+                    except asyncio.TimeoutError:
+                        pass
+                batch, waited = self._take_batch()
+                cond.notify_all()
+            try:
+                await self._submit(batch, waited)
+            except Exception as exc:
+                async with cond:
+                    self._error = exc
+                    cond.notify_all()
+                return
+
+    async def flush(self) -> None:
+        """Send every buffered URL now."""
+        cond = self._condition()
+        while True:
+            async with cond:
+                if self._error is not None:
+                    raise self._error
+                if not self._buffer:
+                    break
+                batch, waited = self._take_batch()
+                cond.notify_all()
+            await self._submit(batch, waited)
+        async with self._submit_lock:
+            pass
+
+    async def close(self) -> None:
+        """Send the remaining URLs and stop accepting new ones."""
+        cond = self._condition()
+        async with cond:
+            self._closed = True
+            cond.notify_all()
+        if self._task is not None:
+            await self._task
+        async with cond:
+            self._drained = True
+            cond.notify_all()
+        if self._error is not None:
+            raise self._error
+
+    async def __aenter__(self) -> "AsyncBatchProducer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def results(self) -> AsyncIterator[Document]:
+        """Async version of ``BatchProducer.results``."""
+        cond = self._condition()
+        cursor = 0
+        while True:
+            async with cond:
+                while self.job_id is None and not self._drained and self._error is None:
+                    await cond.wait()
+                if self._error is not None:
+                    raise self._error
+                if self.job_id is None:
+                    return
+                submitted_all = self._drained
+                job_id = self.job_id
+            page = await async_batch_methods.get_batch_scrape_status_page(
+                self._client, f"/v2/batch/scrape/{job_id}?skip={cursor}"
+            )
+            documents = list(page.data)
+            while page.next and page.data:
+                page = await async_batch_methods.get_batch_scrape_status_page(self._client, page.next)
+                documents.extend(page.data)
+            cursor += len(documents)
+            for document in documents:
+                yield document
+            if submitted_all and page.status in _TERMINAL:
+                return
+            await asyncio.sleep(self._poll_interval)
@@ -5,7 +5,8 @@ This module provides the main client class that orchestrates all v2 functionalit
 """
 
 import os
-from typing import Optional, List, Dict, Any, Callable, Union, Literal
+from concurrent.futures import Executor
+from typing import Optional, List, Dict, Any, Callable, Iterator, Union, Literal
 from .types import (
     ClientConfig,
     ScrapeOptions,
@@ -39,8 +40,18 @@ from .types import (
     Location,
     PaginationConfig,
     AgentOptions,
+    RawMode,
+    LargeBatchChunkProgress,
+    BatchRetryPolicy,
+    ScrapeManyProgress,
 )
 from .utils.http_client import HttpClient
+from .utils.assets import AssetStore
+from .utils.response_cache import ResponseCache, ResponseCacheStats
+from .utils.singleflight import SingleFlight, SingleFlightStats
+from .utils.negative_cache import NegativeCache, NegativeCacheStats
+from .utils.domain_profiles import DomainProfiles
+from .utils.idempotency import IdempotencyKeys
 from .utils.error_handler import FirecrawlError
 from .methods import scrape as scrape_module
 from .methods import crawl as crawl_module  
@@ -53,6 +64,10 @@ from .methods import extract as extract_module
 from .methods import agent as agent_module
 from .methods import browser as browser_module
 from .watcher import Watcher
+from .crawl_stream import CrawlStream
+from .batch_producer import BatchProducer
+from .scrape_planner import ScrapePlanner, ScrapeUrlsStream, scrape_urls as plan_scrape_urls
+from .utils.url_dedupe import DedupeOption
 
 class FirecrawlClient:
     """
@@ -71,7 +86,15 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        raw: RawMode = False,
+        asset_store: Optional[AssetStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        idempotency_keys: Optional[bool] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        domain_profiles: Optional[DomainProfiles] = None,
+        lazy_documents: bool = False,
     ):
         """
         Initialize the Firecrawl client.
@@ -82,6 +105,29 @@ class FirecrawlClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            raw: Default result mode for scrape, crawl, batch, search and map. True returns
+                plain snake_case dicts and "api" the untouched API payload, both skipping
+                model validation. Can be overridden per call.
+            asset_store: Decode base64 screenshots and action outputs into this
+                AssetStore (in memory or a directory) and leave short references on
+                documents; read them back with Document.screenshot_bytes()
+            response_cache: Serve repeated scrape, map, search and extract calls
+                from this ResponseCache instead of the API
+            coalesce_requests: Let identical scrape, map and search calls made
+                concurrently (e.g. from several threads) share one request
+            idempotency_keys: Send a generated idempotency key on every crawl, batch,
+                extract and agent start; crawl starts, where the API enforces the
+                key, are then retried on 502/503/504 and timeouts without creating
+                a second job (default: on for the cloud API only)
+            negative_cache: Remember URLs and hosts that 404, time out or are not
+                supported, and skip them in scrape, scrape_many and batch calls
+                until their NegativeCache entry expires
+            domain_profiles: Learn per host which proxy, wait_for and mobile
+                settings work and how long scrapes take, and fill the options
+                scrape and scrape_many calls leave unset (see DomainProfiles)
+            lazy_documents: Return crawl and batch status documents as
+                LazyDocument, which parses metadata, branding and change_tracking
+                on first access; invalid values then raise on that access
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -97,10 +143,46 @@ class FirecrawlClient:
             api_url=api_url,
             timeout=timeout,
             max_retries=max_retries,
-            backoff_factor=backoff_factor
+            backoff_factor=backoff_factor,
+            raw=raw,
         )
 
-        self.http_client = HttpClient(api_key, api_url)
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            asset_store=asset_store,
+            response_cache=response_cache,
+            singleflight=SingleFlight() if coalesce_requests else None,
+            idempotency_keys=IdempotencyKeys() if idempotency_keys or (
+                idempotency_keys is None and self._is_cloud_service(api_url)
+            ) else None,
+            negative_cache=negative_cache,
+            domain_profiles=domain_profiles,
+            lazy_documents=lazy_documents,
+        )
+        # Learns scrape and batch latencies across scrape_urls calls
+        self.scrape_planner = ScrapePlanner()
+
+    def _resolve_raw(self, raw: Optional[RawMode]) -> RawMode:
+        return self.config.raw if raw is None else raw
+
+    @property
+    def response_cache_stats(self) -> Optional[ResponseCacheStats]:
+        """Hit/miss counters of the response cache (None when no cache is configured)."""
+        cache = self.http_client.response_cache
+        return cache.stats if cache is not None else None
+
+    @property
+    def coalescing_stats(self) -> Optional[SingleFlightStats]:
+        """Executed and collapsed request counts (None unless coalesce_requests is enabled)."""
+        flight = self.http_client.singleflight
+        return flight.stats if flight is not None else None
+
+    @property
+    def negative_cache_stats(self) -> Optional[NegativeCacheStats]:
+        """Skipped URLs and recorded failures (None when no negative cache is configured)."""
+        cache = self.http_client.negative_cache
+        return cache.stats if cache is not None else None
     
     def scrape(
         self,
@@ -126,6 +208,8 @@ class FirecrawlClient:
         max_age: Optional[int] = None,
         store_in_cache: Optional[bool] = None,
         integration: Optional[str] = None,
+        raw: Optional[RawMode] = None,
+        force_retry: bool = False,
     ) -> Document:
         """
         Scrape a single URL and return the document.
@@ -150,6 +234,8 @@ class FirecrawlClient:
             proxy: Proxy to use
             max_age: Maximum age of the cache
             store_in_cache: Whether to store the result in the cache
+            raw: Return a plain dict instead of a Document (overrides the client default)
+            force_retry: Scrape even if the negative cache lists the URL or its host
         Returns:
             Document
         """
@@ -177,7 +263,81 @@ class FirecrawlClient:
                 integration=integration,
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache, integration]) else None
-        return scrape_module.scrape(self.http_client, url, options)
+        return scrape_module.scrape(self.http_client, url, options, raw=self._resolve_raw(raw), force_retry=force_retry)
+
+    def scrape_many(
+        self,
+        urls: List[str],
+        options: Optional[ScrapeOptions] = None,
+        *,
+        concurrency: int = 10,
+        ordered: bool = False,
+        on_progress: Optional[Callable[[ScrapeManyProgress], None]] = None,
+        raw: Optional[RawMode] = None,
+        force_retry: bool = False,
+    ) -> Iterator[scrape_module.ScrapeManyResult]:
+        """Scrape many URLs concurrently, yielding each result as it finishes.
+
+        Args:
+            urls: URLs to scrape
+            options: Scrape options applied to every URL
+            concurrency: Maximum scrapes in flight (each on a pool thread)
+            ordered: Yield in input order instead of completion order
+            on_progress: Called with a ScrapeManyProgress after every finished URL
+            raw: Return plain dicts instead of Documents (overrides the client default)
+            force_retry: Scrape URLs the negative cache lists instead of
+                yielding KnownFailureError for them
+
+        Returns:
+            Iterator of (url, Document or exception) pairs; breaking out of the
+            loop cancels the URLs not yet started
+        """
+        return scrape_module.scrape_many(
+            self.http_client,
+            urls,
+            options,
+            concurrency=concurrency,
+            ordered=ordered,
+            raw=self._resolve_raw(raw),
+            on_progress=on_progress,
+            force_retry=force_retry,
+        )
+
+    def scrape_urls(
+        self,
+        urls: List[str],
+        options: Optional[ScrapeOptions] = None,
+        *,
+        strategy: Optional[Literal["scrape_many", "batch", "large_batch"]] = None,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+    ) -> ScrapeUrlsStream:
+        """Scrape a URL list with whichever of fan-out, one batch job or chunked
+        batch jobs is expected to finish first.
+
+        The choice uses the list size, the team's unused concurrency and the
+        scrape and batch latencies observed by earlier calls (see
+        ``scrape_planner``); ``stream.plan`` reports it.
+
+        Args:
+            urls: URLs to scrape
+            options: Scrape options applied to every URL
+            strategy: Skip planning and use "scrape_many", "batch" or "large_batch"
+            poll_interval: Seconds between status checks on the batch paths
+            timeout: Maximum seconds to wait on the batch paths
+
+        Returns:
+            Iterator of (url, Document or exception) pairs in completion order
+        """
+        return plan_scrape_urls(
+            self.http_client,
+            self.scrape_planner,
+            urls,
+            options,
+            strategy=strategy,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
 
     def search(
         self,
@@ -192,6 +352,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         scrape_options: Optional[ScrapeOptions] = None,
         integration: Optional[str] = None,
+        raw: Optional[RawMode] = None,
     ) -> SearchData:
         """
         Search for documents.
@@ -203,6 +364,7 @@ class FirecrawlClient:
             location: Location string for search
             timeout: Request timeout in milliseconds (default: 300000)
             page_options: Options for scraping individual pages
+            raw: Return plain dicts instead of SearchData (overrides the client default)
             
         Returns:
             SearchData containing the search results
@@ -220,7 +382,7 @@ class FirecrawlClient:
             integration=integration,
         )
 
-        return search_module.search(self.http_client, request)
+        return search_module.search(self.http_client, request, raw=self._resolve_raw(raw))
     
     def crawl(
         self,
@@ -247,6 +409,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         request_timeout: Optional[float] = None,
         integration: Optional[str] = None,
+        raw: Optional[RawMode] = None,
     ) -> CrawlJob:
         """
         Start a crawl job and wait for it to complete.
@@ -273,6 +436,7 @@ class FirecrawlClient:
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait for the entire crawl job to complete (None for no timeout)
             request_timeout: Timeout (in seconds) for each individual HTTP request, including pagination requests when fetching results. If there are multiple pages, each page request gets this timeout
+            raw: Return the job as a plain dict (overrides the client default)
             
         Returns:
             CrawlJob when job completes
@@ -316,6 +480,7 @@ class FirecrawlClient:
             poll_interval=poll_interval,
             timeout=timeout,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
     
     def start_crawl(
@@ -340,6 +505,7 @@ class FirecrawlClient:
         regex_on_full_url: bool = False,
         zero_data_retention: bool = False,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CrawlResponse:
         """
         Start an asynchronous crawl job.
@@ -363,6 +529,8 @@ class FirecrawlClient:
             scrape_options: Page scraping configuration
             regex_on_full_url: Apply includePaths/excludePaths regex to the full URL (including query parameters) instead of just the pathname
             zero_data_retention: Whether to delete data after 24 hours
+            idempotency_key: Key sent as-is (the API requires a UUID), so repeating
+                the call cannot start a second crawl
             
         Returns:
             CrawlResponse with job information
@@ -399,7 +567,7 @@ class FirecrawlClient:
 
         request = CrawlRequest(**request_kwargs)
 
-        return crawl_module.start_crawl(self.http_client, request)
+        return crawl_module.start_crawl(self.http_client, request, idempotency_key=idempotency_key)
     
     def get_crawl_status(
         self,
@@ -407,6 +575,7 @@ class FirecrawlClient:
         pagination_config: Optional[PaginationConfig] = None,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ) -> CrawlJob:
         """
         Get the status of a crawl job.
@@ -417,6 +586,7 @@ class FirecrawlClient:
             request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
                 is enabled (default) and there are multiple pages of results, this timeout applies to 
                 each page request separately, not to the entire operation
+            raw: Return the job as a plain dict (overrides the client default)
             
         Returns:
             CrawlJob with current status and data
@@ -429,6 +599,7 @@ class FirecrawlClient:
             job_id,
             pagination_config=pagination_config,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
 
     def get_crawl_status_page(
@@ -436,6 +607,7 @@ class FirecrawlClient:
         next_url: str,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ) -> CrawlJob:
         """
         Fetch a single page of crawl results using a next URL.
@@ -443,6 +615,7 @@ class FirecrawlClient:
         Args:
             next_url: Opaque next URL from a prior crawl status response
             request_timeout: Timeout (in seconds) for the HTTP request
+            raw: Return the page as a plain dict (overrides the client default)
 
         Returns:
             CrawlJob with the page data and next URL (if any)
@@ -451,6 +624,7 @@ class FirecrawlClient:
             self.http_client,
             next_url,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
     
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
@@ -495,6 +669,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
         location: Optional[Location] = None,
+        raw: Optional[RawMode] = None,
     ) -> MapData:
         """Map a URL and return discovered links.
 
@@ -506,6 +681,7 @@ class FirecrawlClient:
             limit: Maximum number of links to return
             sitemap: Sitemap usage mode ("only" | "include" | "skip")
             timeout: Request timeout in milliseconds
+            raw: Return a plain dict instead of MapData (overrides the client default)
 
         Returns:
             MapData containing the discovered links
@@ -521,7 +697,7 @@ class FirecrawlClient:
             location=location
         ) if any(v is not None for v in [search, include_subdomains, ignore_query_parameters, limit, sitemap, timeout, integration, location]) else None
 
-        return map_module.map(self.http_client, url, options)
+        return map_module.map(self.http_client, url, options, raw=self._resolve_raw(raw))
     
     def cancel_crawl(self, crawl_id: str) -> bool:
         """
@@ -562,6 +738,7 @@ class FirecrawlClient:
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
         agent: Optional[AgentOptions] = None,
+        idempotency_key: Optional[str] = None,
     ):
         """Start an extract job (non-blocking).
 
@@ -577,6 +754,7 @@ class FirecrawlClient:
             ignore_invalid_urls: Skip invalid URLs instead of failing
             integration: Integration tag/name
             agent: Agent configuration
+            idempotency_key: Key sent as-is in the x-idempotency-key header
         Returns:
             Response payload with job id/status (poll with get_extract_status)
         """
@@ -593,6 +771,7 @@ class FirecrawlClient:
             ignore_invalid_urls=ignore_invalid_urls,
             integration=integration,
             agent=agent,
+            idempotency_key=idempotency_key,
         )
 
     def extract(
@@ -678,6 +857,8 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        dedupe: DedupeOption = False,
+        force_retry: bool = False,
     ):
         """Start a batch scrape job over multiple URLs (non-blocking).
 
@@ -709,6 +890,11 @@ class FirecrawlClient:
             zero_data_retention: Delete data after 24 hours
             integration: Integration tag/name
             idempotency_key: Header used to deduplicate starts
+            dedupe: Drop URLs that canonicalize to one already in the list
+                (True, or a UrlDeduplicator shared across calls); the count is
+                returned as ``collapsed_urls``
+            force_retry: Submit URLs the negative cache lists as failing; otherwise
+                they are left out and returned as ``skipped_urls``
 
         Returns:
             Response payload with job id (poll with get_batch_scrape_status)
@@ -748,18 +934,23 @@ class FirecrawlClient:
             zero_data_retention=zero_data_retention,
             integration=integration,
             idempotency_key=idempotency_key,
+            dedupe=dedupe,
+            force_retry=force_retry,
         )
 
     def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        raw: Optional[RawMode] = None,
     ):
         """Get current status and any scraped data for a batch job.
 
         Args:
             job_id: Batch job ID
             pagination_config: Optional configuration for pagination behavior
+            raw: Return the job as a plain dict (overrides the client default)
 
         Returns:
             Status payload including counts and partial data
@@ -767,7 +958,8 @@ class FirecrawlClient:
         return batch_module.get_batch_scrape_status(
             self.http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            raw=self._resolve_raw(raw),
         )
 
     def get_batch_scrape_status_page(
@@ -775,12 +967,14 @@ class FirecrawlClient:
         next_url: str,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ):
         """Fetch a single page of batch scrape results using a next URL.
 
         Args:
             next_url: Opaque next URL from a prior batch scrape status response
             request_timeout: Timeout (in seconds) for the HTTP request
+            raw: Return the page as a plain dict (overrides the client default)
 
         Returns:
             BatchScrapeJob with the page data and next URL (if any)
@@ -789,6 +983,7 @@ class FirecrawlClient:
             self.http_client,
             next_url,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
 
     def cancel_batch_scrape(self, job_id: str) -> bool:
@@ -813,6 +1008,103 @@ class FirecrawlClient:
         """
         return batch_methods.get_batch_scrape_errors(self.http_client, job_id)
 
+    def batch_producer(
+        self,
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.05,
+        poll_interval: float = 1.0,
+        max_pending: int = 10000,
+        webhook: Optional[Union[str, WebhookConfig]] = None,
+        max_concurrency: Optional[int] = None,
+        ignore_invalid_urls: Optional[bool] = None,
+        zero_data_retention: Optional[bool] = None,
+        integration: Optional[str] = None,
+        dedupe: DedupeOption = False,
+    ) -> BatchProducer:
+        """Create a producer that grows one batch scrape job as URLs arrive.
+
+        Args:
+            options: Scrape options for every URL of the job
+            max_batch_size: URLs per append request
+            flush_interval: Seconds a URL may wait before a partial batch is sent
+            poll_interval: Seconds between result polls in ``results()``
+            max_pending: Buffered URLs at which ``add`` starts to block
+            webhook: Webhook configuration for the job
+            max_concurrency: Maximum concurrent scrapes for the job
+            ignore_invalid_urls: Skip invalid URLs instead of failing the request
+            zero_data_retention: Whether to delete data after 24 hours
+            integration: Integration identifier
+            dedupe: Drop URLs that canonicalize to one already added
+
+        Returns:
+            BatchProducer; call ``add``/``add_many``, then ``close``, and read
+            documents with ``results()``
+        """
+        return BatchProducer(
+            self.http_client,
+            options=options,
+            max_batch_size=max_batch_size,
+            flush_interval=flush_interval,
+            poll_interval=poll_interval,
+            max_pending=max_pending,
+            webhook=webhook,
+            max_concurrency=max_concurrency,
+            ignore_invalid_urls=ignore_invalid_urls,
+            zero_data_retention=zero_data_retention,
+            integration=integration,
+            dedupe=dedupe,
+        )
+
+    def large_batch_scrape(
+        self,
+        urls: List[str],
+        *,
+        options: Optional[ScrapeOptions] = None,
+        chunk_size: int = 100,
+        max_chunks_in_flight: Optional[int] = None,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        on_progress: Optional[Callable[[LargeBatchChunkProgress], None]] = None,
+        dedupe: DedupeOption = False,
+        retry: Optional[BatchRetryPolicy] = None,
+        force_retry: bool = False,
+    ) -> Iterator[Document]:
+        """Scrape a large list of URLs as pipelined chunk jobs, streaming documents.
+
+        Args:
+            urls: URLs to scrape
+            options: Scrape options applied to every chunk
+            chunk_size: URLs per chunk job
+            max_chunks_in_flight: Chunk jobs running at once (default: derived
+                from the team's concurrency limit)
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait per chunk
+            on_progress: Called with a LargeBatchChunkProgress as chunks start and advance
+            dedupe: Drop duplicate URLs before chunking (pass a UrlDeduplicator
+                to read the collapsed count from its ``report``)
+            retry: Append transiently failed URLs back to their chunk's job,
+                counted in the chunk's ``resubmitted`` progress
+            force_retry: Submit URLs the negative cache lists as failing
+
+        Returns:
+            Iterator over documents, in the order they are scraped
+        """
+        return batch_module.iter_large_batch(
+            self.http_client,
+            urls,
+            options,
+            chunk_size=chunk_size,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_chunks_in_flight=max_chunks_in_flight,
+            on_progress=on_progress,
+            dedupe=dedupe,
+            retry=retry,
+            force_retry=force_retry,
+        )
+
     def get_extract_status(self, job_id: str):
         """Get the current status (and data if completed) of an extract job.
 
@@ -835,6 +1127,7 @@ class FirecrawlClient:
         strict_constrain_to_urls: Optional[bool] = None,
         model: Optional[Literal["spark-1-pro", "spark-1-mini"]] = None,
         webhook: Optional[Union[str, AgentWebhookConfig]] = None,
+        idempotency_key: Optional[str] = None,
     ):
         """Start an agent job (non-blocking).
 
@@ -846,6 +1139,7 @@ class FirecrawlClient:
             max_credits: Maximum credits to use (optional)
             model: Model to use for the agent ("spark-1-pro" or "spark-1-mini")
             webhook: Webhook URL or configuration for notifications
+            idempotency_key: Key sent as-is in the x-idempotency-key header
         Returns:
             Response payload with job id/status (poll with get_agent_status)
         """
@@ -859,6 +1153,7 @@ class FirecrawlClient:
             strict_constrain_to_urls=strict_constrain_to_urls,
             model=model,
             webhook=webhook,
+            idempotency_key=idempotency_key,
         )
 
     def agent(
@@ -1035,6 +1330,13 @@ class FirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        stream: bool = False,
+        recent_window: int = 0,
+        max_reconnects: int = 5,
+        reconnect_backoff: float = 0.5,
+        listener_executor: Optional[Executor] = None,
+        max_pending_events: int = 1000,
+        dedupe_window: int = 10_000,
     ) -> Watcher:
         """Create a watcher for crawl or batch jobs.
 
@@ -1043,11 +1345,75 @@ class FirecrawlClient:
             kind: Job kind ("crawl" or "batch")
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to watch (None for no timeout)
+            stream: Dispatch documents to "document" listeners and release them
+                instead of accumulating them (bounded memory); terminal events
+                carry a WatcherSummary
+            recent_window: In streaming mode, number of recent documents kept
+            max_reconnects: Websocket reconnect attempts before falling back to
+                HTTP polling
+            reconnect_backoff: Initial delay between reconnect attempts (seconds)
+            listener_executor: Run listeners on this executor instead of the
+                websocket thread (per-job order is preserved)
+            max_pending_events: Bound on events queued for the listener executor
+            dedupe_window: Recently delivered documents remembered to drop them
+                from replays after a reconnect or HTTP fallback
 
         Returns:
             Watcher instance
         """
-        return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
+        return Watcher(
+            self,
+            job_id,
+            kind=kind,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            stream=stream,
+            recent_window=recent_window,
+            max_reconnects=max_reconnects,
+            reconnect_backoff=reconnect_backoff,
+            listener_executor=listener_executor,
+            max_pending_events=max_pending_events,
+            dedupe_window=dedupe_window,
+        )
+
+    def crawl_stream(
+        self,
+        url: str,
+        *,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        max_buffered: int = 1000,
+        **crawl_options: Any,
+    ) -> CrawlStream:
+        """
+        Start a crawl and iterate over its documents as they are scraped.
+
+        Each document is yielded exactly once, across websocket reconnects and
+        the HTTP polling fallback.
+
+        Args:
+            url: Target URL to start crawling from
+            poll_interval: Seconds between status checks when polling
+            timeout: Maximum seconds to stream (None for no timeout)
+            max_buffered: Documents buffered before reading pauses for the consumer
+            **crawl_options: Options accepted by start_crawl
+
+        Returns:
+            CrawlStream yielding Document objects; ``job_id`` and ``status``
+            describe the job
+
+        Raises:
+            TimeoutError: If the crawl does not finish within the timeout
+            RuntimeError: If watching stops before the crawl finishes
+        """
+        job = self.start_crawl(url, **crawl_options)
+        return CrawlStream(
+            self,
+            job.id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_buffered=max_buffered,
+        )
 
     def batch_scrape(
         self,
@@ -1081,9 +1447,19 @@ class FirecrawlClient:
         idempotency_key: Optional[str] = None,
         poll_interval: int = 2,
         wait_timeout: Optional[int] = None,
+        raw: Optional[RawMode] = None,
+        dedupe: DedupeOption = False,
+        retry: Optional[BatchRetryPolicy] = None,
+        force_retry: bool = False,
     ):
         """
         Start a batch scrape job and wait until completion.
+
+        Pass ``raw`` to receive the final job as a plain dict (overrides the client default),
+        ``dedupe`` to drop duplicate URLs before submitting, and ``retry`` to append
+        transiently failed URLs back to the job (optionally with escalated options)
+        while it runs. URLs the negative cache lists as failing are left out unless
+        ``force_retry`` is set.
         """
         options = ScrapeOptions(
             **{k: v for k, v in dict(
@@ -1122,5 +1498,9 @@ class FirecrawlClient:
             idempotency_key=idempotency_key,
             poll_interval=poll_interval,
             timeout=wait_timeout,
+            raw=self._resolve_raw(raw),
+            dedupe=dedupe,
+            retry=retry,
+            force_retry=force_retry,
         )
     
@@ -5,7 +5,8 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 import os
 import asyncio
 import time
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+from concurrent.futures import Executor
+from typing import Optional, List, Dict, Any, AsyncIterator, Union, Callable, Literal
 from .types import (
     ScrapeOptions,
     CrawlRequest,
@@ -34,9 +35,21 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    RawMode,
+    Document,
+    LargeBatchChunkProgress,
+    BatchRetryPolicy,
+    ScrapeManyProgress,
 )
 from .utils.http_client import HttpClient
 from .utils.http_client_async import AsyncHttpClient
+from .utils.assets import AssetStore
+from .utils.response_cache import ResponseCache, ResponseCacheStats
+from .utils.singleflight import AsyncSingleFlight, SingleFlightStats
+from .utils.negative_cache import NegativeCache, NegativeCacheStats, negative_cache_of, page_status
+from .utils.domain_profiles import DomainProfiles
+from .utils.idempotency import IdempotencyKeys
+from .utils.offload import ParseOffloader, ParseOffloadMetrics
 
 from .methods.aio import scrape as async_scrape  # type: ignore[attr-defined]
 from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
@@ -49,19 +62,137 @@ from .methods.aio import agent as async_agent  # type: ignore[attr-defined]
 from .methods.aio import browser as async_browser  # type: ignore[attr-defined]
 
 from .watcher_async import AsyncWatcher
+from .crawl_stream import AsyncCrawlStream
+from .batch_producer import AsyncBatchProducer
+from .scrape_planner import AsyncScrapeUrlsStream, ScrapePlanner, scrape_urls_async
+from .utils.url_dedupe import DedupeOption
 
 class AsyncFirecrawlClient:
     @staticmethod
     def _is_cloud_service(url: str) -> bool:
         return "api.firecrawl.dev" in url.lower()
 
-    def __init__(self, api_key: Optional[str] = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.firecrawl.dev",
+        *,
+        raw: RawMode = False,
+        parse_offload_threshold: Optional[int] = None,
+        parse_executor: Optional[Executor] = None,
+        max_pending_parses: int = 4,
+        asset_store: Optional[AssetStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        idempotency_keys: Optional[bool] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        domain_profiles: Optional[DomainProfiles] = None,
+        lazy_documents: bool = False,
+    ):
+        """
+        Args:
+            api_key: Firecrawl API key (defaults to FIRECRAWL_API_KEY)
+            api_url: Base URL of the Firecrawl API
+            raw: Default result mode for document-returning calls (see RawMode)
+            parse_offload_threshold: Response size in bytes from which JSON decoding
+                and document normalization run in an executor instead of on the
+                event loop (None keeps all parsing on the loop)
+            parse_executor: Thread or process pool for offloaded parsing; a small
+                private thread pool is used when omitted
+            max_pending_parses: Maximum responses handed to the executor at once
+            asset_store: Decode base64 screenshots and action outputs into this
+                AssetStore (in memory or a directory) and leave short references on
+                documents; read them back with Document.screenshot_bytes()
+            response_cache: Serve repeated scrape, map, search and extract calls
+                from this ResponseCache instead of the API
+            coalesce_requests: Let identical scrape, map and search calls made
+                concurrently share one request and its result or exception
+            idempotency_keys: Send a generated idempotency key on every job start
+                and retry crawl starts, where the API enforces the key, on 502/503/504
+                and transport errors (default: on for the cloud API only)
+            negative_cache: Remember URLs and hosts that 404, time out or are not
+                supported, and skip them in scrape, scrape_many and batch calls
+            domain_profiles: Learn per host which scrape options work and how long
+                scrapes take, and fill the options scrape calls leave unset
+            lazy_documents: Return crawl and batch status documents as
+                LazyDocument, parsing metadata, branding and change_tracking on
+                first access
+        """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if self._is_cloud_service(api_url) and not api_key:
             raise ValueError("API key is required for the cloud API. Set FIRECRAWL_API_KEY or pass api_key.")
-        self.http_client = HttpClient(api_key, api_url)
-        self.async_http_client = AsyncHttpClient(api_key, api_url)
+        parse_offloader = None
+        if parse_offload_threshold is not None:
+            parse_offloader = ParseOffloader(
+                parse_offload_threshold, executor=parse_executor, max_pending=max_pending_parses
+            )
+        keys = IdempotencyKeys() if idempotency_keys or (
+            idempotency_keys is None and self._is_cloud_service(api_url)
+        ) else None
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            asset_store=asset_store,
+            response_cache=response_cache,
+            idempotency_keys=keys,
+            negative_cache=negative_cache,
+            domain_profiles=domain_profiles,
+            lazy_documents=lazy_documents,
+        )
+        self.async_http_client = AsyncHttpClient(
+            api_key,
+            api_url,
+            parse_offloader=parse_offloader,
+            asset_store=asset_store,
+            response_cache=response_cache,
+            singleflight=AsyncSingleFlight() if coalesce_requests else None,
+            idempotency_keys=keys,
+            negative_cache=negative_cache,
+            domain_profiles=domain_profiles,
+            lazy_documents=lazy_documents,
+        )
+        # Default result mode (see RawMode); overridable per call with raw=...
+        self._raw: RawMode = raw
+        # Learns scrape and batch latencies across scrape_urls calls
+        self.scrape_planner = ScrapePlanner()
+
+    def _resolve_raw(self, raw: Optional[RawMode]) -> RawMode:
+        return self._raw if raw is None else raw
+
+    async def close(self) -> None:
+        """Close the HTTP connection pool and the parse offloader's worker threads."""
+        await self.async_http_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawlClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def parse_metrics(self) -> Optional[ParseOffloadMetrics]:
+        """Where response parsing ran and how much event-loop time offloading avoided (None when disabled)."""
+        offloader = self.async_http_client.parse_offloader
+        return offloader.metrics if offloader is not None else None
+
+    @property
+    def response_cache_stats(self) -> Optional[ResponseCacheStats]:
+        """Hit/miss counters of the response cache (None when no cache is configured)."""
+        cache = self.async_http_client.response_cache
+        return cache.stats if cache is not None else None
+
+    @property
+    def coalescing_stats(self) -> Optional[SingleFlightStats]:
+        """Executed and collapsed request counts (None unless coalesce_requests is enabled)."""
+        flight = self.async_http_client.singleflight
+        return flight.stats if flight is not None else None
+
+    @property
+    def negative_cache_stats(self) -> Optional[NegativeCacheStats]:
+        """Skipped URLs and recorded failures (None when no negative cache is configured)."""
+        cache = self.async_http_client.negative_cache
+        return cache.stats if cache is not None else None
 
     # Scrape
     async def scrape(
@@ -69,8 +200,53 @@ class AsyncFirecrawlClient:
         url: str,
         **kwargs,
     ):
+        raw = self._resolve_raw(kwargs.pop("raw", None))
+        force_retry = kwargs.pop("force_retry", False)
         options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None}) if kwargs else None
-        return await async_scrape.scrape(self.async_http_client, url, options)
+        return await async_scrape.scrape(self.async_http_client, url, options, raw=raw, force_retry=force_retry)
+
+    def scrape_many(
+        self,
+        urls: List[str],
+        options: Optional[ScrapeOptions] = None,
+        *,
+        concurrency: int = 10,
+        ordered: bool = False,
+        on_progress: Optional[Callable[[ScrapeManyProgress], None]] = None,
+        raw: Optional[RawMode] = None,
+        force_retry: bool = False,
+    ) -> AsyncIterator[async_scrape.ScrapeManyResult]:
+        # Used with `async for`; see FirecrawlClient.scrape_many
+        return async_scrape.scrape_many(
+            self.async_http_client,
+            urls,
+            options,
+            concurrency=concurrency,
+            ordered=ordered,
+            raw=self._resolve_raw(raw),
+            on_progress=on_progress,
+            force_retry=force_retry,
+        )
+
+    async def scrape_urls(
+        self,
+        urls: List[str],
+        options: Optional[ScrapeOptions] = None,
+        *,
+        strategy: Optional[Literal["scrape_many", "batch", "large_batch"]] = None,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+    ) -> AsyncScrapeUrlsStream:
+        # Awaiting plans the run; iterate the result with `async for`. See FirecrawlClient.scrape_urls
+        return await scrape_urls_async(
+            self.async_http_client,
+            self.scrape_planner,
+            urls,
+            options,
+            strategy=strategy,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
 
     # Search
     async def search(
@@ -78,8 +254,9 @@ class AsyncFirecrawlClient:
         query: str,
         **kwargs,
     ) -> SearchData:
+        raw = self._resolve_raw(kwargs.pop("raw", None))
         request = SearchRequest(query=query, **{k: v for k, v in kwargs.items() if v is not None})
-        return await async_search.search(self.async_http_client, request)
+        return await async_search.search(self.async_http_client, request, raw=raw)
 
     async def start_crawl(self, url: str, **kwargs) -> CrawlResponse:
         sitemap = kwargs.pop("sitemap", None)
@@ -89,8 +266,9 @@ class AsyncFirecrawlClient:
         if sitemap is not None:
             kwargs["sitemap"] = sitemap
 
+        idempotency_key = kwargs.pop("idempotency_key", None)
         request = CrawlRequest(url=url, **kwargs)
-        return await async_crawl.start_crawl(self.async_http_client, request)
+        return await async_crawl.start_crawl(self.async_http_client, request, idempotency_key=idempotency_key)
 
     async def wait_crawl(
         self,
@@ -99,6 +277,7 @@ class AsyncFirecrawlClient:
         timeout: Optional[int] = None,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ) -> CrawlJob:
         """
         Polls the status of a crawl job until it reaches a terminal state.
@@ -108,6 +287,7 @@ class AsyncFirecrawlClient:
             poll_interval (int, optional): Number of seconds to wait between polling attempts. Defaults to 2.
             timeout (Optional[int], optional): Maximum number of seconds to wait for the entire crawl job to complete before timing out. If None, waits indefinitely. Defaults to None.
             request_timeout (Optional[float], optional): Timeout (in seconds) for each individual HTTP request, including pagination requests when fetching results. If there are multiple pages, each page request gets this timeout. If None, no per-request timeout is set. Defaults to None.
+            raw (Optional[RawMode], optional): Return the job as a plain dict. Defaults to the client setting.
 
         Returns:
             CrawlJob: The final status of the crawl job when it reaches a terminal state.
@@ -120,14 +300,17 @@ class AsyncFirecrawlClient:
             - "failed": The crawl finished with an error.
             - "cancelled": The crawl was cancelled.
         """
+        raw = self._resolve_raw(raw)
         start = time.monotonic()
         while True:
             status = await async_crawl.get_crawl_status(
                 self.async_http_client,
                 job_id,
                 request_timeout=request_timeout,
+                raw=raw,
             )
-            if status.status in ["completed", "failed", "cancelled"]:
+            state = status["status"] if raw else status.status
+            if state in ["completed", "failed", "cancelled"]:
                 return status
             if timeout and (time.monotonic() - start) > timeout:
                 raise TimeoutError("Crawl wait timed out")
@@ -136,7 +319,7 @@ class AsyncFirecrawlClient:
     async def crawl(self, **kwargs) -> CrawlJob:
         # wrapper combining start and wait
         resp = await self.start_crawl(
-            **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "request_timeout")}
+            **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "request_timeout", "raw")}
         )
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
@@ -147,6 +330,7 @@ class AsyncFirecrawlClient:
             poll_interval=poll_interval,
             timeout=timeout,
             request_timeout=effective_request_timeout,
+            raw=kwargs.get("raw"),
         )
 
     async def get_crawl_status(
@@ -155,6 +339,7 @@ class AsyncFirecrawlClient:
         pagination_config: Optional[PaginationConfig] = None,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ) -> CrawlJob:
         """
         Get the status of a crawl job.
@@ -165,6 +350,7 @@ class AsyncFirecrawlClient:
             request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
                 is enabled (default) and there are multiple pages of results, this timeout applies to 
                 each page request separately, not to the entire operation
+            raw: Return the job as a plain dict (overrides the client default)
             
         Returns:
             CrawlJob with current status and data
@@ -177,6 +363,7 @@ class AsyncFirecrawlClient:
             job_id,
             pagination_config=pagination_config,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
 
     async def get_crawl_status_page(
@@ -184,6 +371,7 @@ class AsyncFirecrawlClient:
         next_url: str,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ) -> CrawlJob:
         """
         Fetch a single page of crawl results using a next URL.
@@ -191,6 +379,7 @@ class AsyncFirecrawlClient:
         Args:
             next_url: Opaque next URL from a prior crawl status response
             request_timeout: Timeout (in seconds) for the HTTP request
+            raw: Return the page as a plain dict (overrides the client default)
 
         Returns:
             CrawlJob with the page data and next URL (if any)
@@ -199,6 +388,7 @@ class AsyncFirecrawlClient:
             self.async_http_client,
             next_url,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
 
     async def cancel_crawl(self, job_id: str) -> bool:
@@ -228,6 +418,7 @@ class AsyncFirecrawlClient:
         sitemap: Optional[Literal["only", "include", "skip"]] = None,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        raw: Optional[RawMode] = None,
     ) -> MapData:
         options = MapOptions(
             search=search,
@@ -237,16 +428,38 @@ class AsyncFirecrawlClient:
             timeout=timeout,
             integration=integration,
         ) if any(v is not None for v in [search, include_subdomains, limit, sitemap, integration, timeout]) else None
-        return await async_map.map(self.async_http_client, url, options)
+        return await async_map.map(self.async_http_client, url, options, raw=self._resolve_raw(raw))
 
     async def start_batch_scrape(self, urls: List[str], **kwargs) -> Any:
         return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
-    async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
+    async def wait_batch_scrape(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        *,
+        raw: Optional[RawMode] = None,
+        retry: Optional[BatchRetryPolicy] = None,
+        options: Optional[ScrapeOptions] = None,
+    ) -> Any:
+        raw = self._resolve_raw(raw)
+        resubmitter = async_batch.AsyncBatchResubmitter(retry, options) if retry is not None else None
         start = asyncio.get_event_loop().time()
         while True:
-            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed", "cancelled"]:
+            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id, raw=raw)
+            state = status["status"] if raw else status.status
+            finished = state in ["completed", "failed", "cancelled"]
+            if resubmitter is not None:
+                resubmitter.settle(status["data"] if raw else status.data)
+                if state == "completed":
+                    await resubmitter.resubmit(self.async_http_client, job_id)
+                # Appended URLs leave the job "completed"; see batch_methods.wait_for_batch_completion
+                finished = finished and not resubmitter.waiting
+            if finished:
+                if negative_cache_of(self.async_http_client) is not None:
+                    pages = [page_status(doc) for doc in (status["data"] if raw else status.data)]
+                    await async_batch.record_job_outcome(self.async_http_client, job_id, pages)
                 return status
             if timeout and (asyncio.get_event_loop().time() - start) > timeout:
                 raise TimeoutError("Batch wait timed out")
@@ -254,21 +467,31 @@ class AsyncFirecrawlClient:
 
     async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
         # waiter wrapper
-        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
+        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "raw", "retry")})
         job_id = start.id
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
-        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
+        return await self.wait_batch_scrape(
+            job_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            raw=kwargs.get("raw"),
+            retry=kwargs.get("retry"),
+            options=kwargs.get("options"),
+        )
 
     async def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        raw: Optional[RawMode] = None,
     ):
         return await async_batch.get_batch_scrape_status(
             self.async_http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            raw=self._resolve_raw(raw),
         )
 
     async def get_batch_scrape_status_page(
@@ -276,11 +499,13 @@ class AsyncFirecrawlClient:
         next_url: str,
         *,
         request_timeout: Optional[float] = None,
+        raw: Optional[RawMode] = None,
     ):
         return await async_batch.get_batch_scrape_status_page(
             self.async_http_client,
             next_url,
             request_timeout=request_timeout,
+            raw=self._resolve_raw(raw),
         )
 
     async def cancel_batch_scrape(self, job_id: str) -> bool:
@@ -290,6 +515,58 @@ class AsyncFirecrawlClient:
         # Returns v2 errors structure; typed as CrawlErrorsResponse for parity
         return await async_batch.get_batch_scrape_errors(self.async_http_client, job_id)  # type: ignore[return-value]
 
+    def batch_producer(
+        self,
+        *,
+        options: Optional[ScrapeOptions] = None,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.05,
+        poll_interval: float = 1.0,
+        max_pending: int = 10000,
+        dedupe: DedupeOption = False,
+        **batch_options: Any,
+    ) -> AsyncBatchProducer:
+        # See FirecrawlClient.batch_producer; add/flush/close are awaited here
+        return AsyncBatchProducer(
+            self.async_http_client,
+            options=options,
+            max_batch_size=max_batch_size,
+            flush_interval=flush_interval,
+            poll_interval=poll_interval,
+            max_pending=max_pending,
+            dedupe=dedupe,
+            **batch_options,
+        )
+
+    def large_batch_scrape(
+        self,
+        urls: List[str],
+        *,
+        options: Optional[ScrapeOptions] = None,
+        chunk_size: int = 100,
+        max_chunks_in_flight: Optional[int] = None,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        on_progress: Optional[Callable[[LargeBatchChunkProgress], None]] = None,
+        dedupe: DedupeOption = False,
+        retry: Optional[BatchRetryPolicy] = None,
+        force_retry: bool = False,
+    ) -> AsyncIterator[Document]:
+        # Used with `async for`; see FirecrawlClient.large_batch_scrape
+        return async_batch.iter_large_batch(
+            self.async_http_client,
+            urls,
+            options,
+            chunk_size=chunk_size,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            max_chunks_in_flight=max_chunks_in_flight,
+            on_progress=on_progress,
+            dedupe=dedupe,
+            retry=retry,
+            force_retry=force_retry,
+        )
+
     # Extract (proxy to v1 async)
     async def extract(
         self,
@@ -339,6 +616,7 @@ class AsyncFirecrawlClient:
         scrape_options: Optional['ScrapeOptions'] = None,
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ):
         return await async_extract.start_extract(
             self.async_http_client,
@@ -352,6 +630,7 @@ class AsyncFirecrawlClient:
             scrape_options=scrape_options,
             ignore_invalid_urls=ignore_invalid_urls,
             integration=integration,
+            idempotency_key=idempotency_key,
         )
 
     # Agent
@@ -397,6 +676,7 @@ class AsyncFirecrawlClient:
         strict_constrain_to_urls: Optional[bool] = None,
         model: Optional[Literal["spark-1-pro", "spark-1-mini"]] = None,
         webhook: Optional[Union[str, AgentWebhookConfig]] = None,
+        idempotency_key: Optional[str] = None,
     ):
         return await async_agent.start_agent(
             self.async_http_client,
@@ -408,6 +688,7 @@ class AsyncFirecrawlClient:
             strict_constrain_to_urls=strict_constrain_to_urls,
             model=model,
             webhook=webhook,
+            idempotency_key=idempotency_key,
         )
 
     async def cancel_agent(self, job_id: str) -> bool:
@@ -534,5 +815,37 @@ class AsyncFirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        stream: bool = False,
+        recent_window: int = 0,
+        max_reconnects: int = 5,
+        reconnect_backoff: float = 0.5,
+        max_queue: int = 0,
+        overflow: Literal["block", "coalesce", "spill"] = "block",
+        dedupe_window: int = 10_000,
     ) -> AsyncWatcher:
-        return AsyncWatcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
+        return AsyncWatcher(
+            self,
+            job_id,
+            kind=kind,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            stream=stream,
+            recent_window=recent_window,
+            max_reconnects=max_reconnects,
+            reconnect_backoff=reconnect_backoff,
+            max_queue=max_queue,
+            overflow=overflow,
+            dedupe_window=dedupe_window,
+        )
+
+    async def crawl_stream(
+        self,
+        url: str,
+        *,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        **crawl_options: Any,
+    ) -> AsyncCrawlStream:
+        # Like the sync client, the crawl is started here: `async for doc in await client.crawl_stream(url)`
+        job = await self.start_crawl(url, **crawl_options)
+        return AsyncCrawlStream(self, job.id, poll_interval=poll_interval, timeout=timeout)
@@ -0,0 +1,182 @@
+"""
+Live, exactly-once document streams for crawl jobs.
+
+``CrawlStream`` and ``AsyncCrawlStream`` wrap a streaming watcher: documents
+arrive from the websocket (catchup and document events) and, when the socket
+cannot be kept up, from the paginated status endpoint read with a cursor.
+Each document is keyed by scrape id (or URL) so replays after a reconnect or a
+switch to HTTP polling are never yielded twice.
+
+Both streams watch a job that has already been started; the clients'
+``crawl_stream`` methods start the crawl before returning the stream.
+"""
+
+import queue
+from typing import Any, AsyncIterator, Dict, Iterator, Literal, Optional
+
+from .types import Document, WatcherSummary
+from .utils.normalize import parse_documents
+from .watcher import Watcher
+from .watcher_async import AsyncWatcher
+
+_TERMINAL = ("completed", "failed", "cancelled")
+
+
+class CrawlStream:
+    """Iterate over a job's documents as they are scraped, each exactly once.
+
+    The job's status is available as ``status`` once iteration ends; a failed
+    or cancelled job ends the stream without raising. ``TimeoutError`` is
+    raised when ``timeout`` expires before the job finishes, and
+    ``RuntimeError`` when watching stops for any other reason before it does.
+    """
+
+    def __init__(
+        self,
+        client: object,
+        job_id: str,
+        *,
+        kind: Literal["crawl", "batch"] = "crawl",
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        max_buffered: int = 1000,
+        max_reconnects: int = 5,
+        reconnect_backoff: float = 0.5,
+    ) -> None:
+        if max_buffered < 1:
+            raise ValueError("max_buffered must be at least 1")
+        self.job_id = job_id
+        self._timeout = timeout
+        self._buffer: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_buffered)
+        self._watcher = Watcher(
+            client,
+            job_id,
+            kind=kind,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            stream=True,
+            max_reconnects=max_reconnects,
+            reconnect_backoff=reconnect_backoff,
+        )
+        self._watcher.add_event_listener("document", self._on_document)
+        self._watcher.add_event_listener("error", self._on_error)
+        self.error: Optional[str] = None
+        self._finished = False
+
+    @property
+    def status(self) -> str:
+        return self._watcher.status
+
+    @property
+    def summary(self) -> WatcherSummary:
+        return self._watcher.summary
+
+    def _on_document(self, detail: Dict[str, Any]) -> None:
+        # Runs on the watcher thread; a full buffer pauses reading until the consumer catches up
+        while not self._watcher._stop.is_set():
+            try:
+                self._buffer.put(detail["data"], timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _on_error(self, detail: Dict[str, Any]) -> None:
+        self.error = detail.get("error") or detail.get("status")
+
+    def __iter__(self) -> Iterator[Document]:
+        return self
+
+    def __next__(self) -> Document:
+        if self._finished:
+            raise StopIteration
+        if self._watcher._thread is None:
+            self._watcher.start()
+        while True:
+            try:
+                raw = self._buffer.get(timeout=0.1)
+            except queue.Empty:
+                thread = self._watcher._thread
+                if thread is not None and thread.is_alive():
+                    continue
+                if not self._buffer.empty():
+                    continue
+                self._finish()
+                raise StopIteration
+            return parse_documents([raw], assets=self._watcher._assets)[0]
+
+    def _finish(self) -> None:
+        self._finished = True
+        self._watcher.stop()
+        _check_finished(self.job_id, self._watcher.status, self._timeout)
+
+    def close(self) -> None:
+        """Stop watching the job; documents not yet yielded are dropped."""
+        self._finished = True
+        self._watcher.stop()
+
+    def __enter__(self) -> "CrawlStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _check_finished(job_id: str, status: str, timeout: Optional[float]) -> None:
+    if status in _TERMINAL:
+        return
+    if timeout is not None:
+        raise TimeoutError(f"Job {job_id} did not finish within {timeout} seconds")
+    raise RuntimeError(f"Stopped watching job {job_id} before it finished (status: {status})")
+
+
+class AsyncCrawlStream:
+    """Async counterpart of ``CrawlStream``, used with ``async for``."""
+
+    def __init__(
+        self,
+        client: object,
+        job_id: str,
+        *,
+        kind: Literal["crawl", "batch"] = "crawl",
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        max_reconnects: int = 5,
+        reconnect_backoff: float = 0.5,
+    ) -> None:
+        self._client = client
+        self.job_id = job_id
+        self._kind = kind
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._max_reconnects = max_reconnects
+        self._reconnect_backoff = reconnect_backoff
+        self._watcher: Optional[AsyncWatcher] = None
+
+    @property
+    def status(self) -> Optional[str]:
+        return self._watcher.summary.status if self._watcher is not None else None
+
+    @property
+    def summary(self) -> Optional[WatcherSummary]:
+        return self._watcher.summary if self._watcher is not None else None
+
+    def __aiter__(self) -> AsyncIterator[Document]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Document]:
+        if self._watcher is not None:
+            raise RuntimeError("AsyncCrawlStream can only be iterated once")
+        self._watcher = AsyncWatcher(
+            self._client,
+            self.job_id,
+            kind=self._kind,
+            poll_interval=self._poll_interval,
+            timeout=self._timeout,
+            stream=True,
+            max_reconnects=self._max_reconnects,
+            reconnect_backoff=self._reconnect_backoff,
+        )
+        async for snapshot in self._watcher:
+            for doc in getattr(snapshot, "data", None) or []:
+                yield doc
+        _check_finished(self.job_id, self._watcher.summary.status, self._timeout)
@@ -0,0 +1,253 @@
+"""
+Columnar container for crawl and batch scrape results.
+
+DocumentFrame stores documents as Arrow record batches (one per appended page)
+instead of a list of pydantic models, and hands the Arrow data straight to
+Parquet, pandas or polars. Requires the optional ``pyarrow`` dependency
+(``pip install firecrawl-py[arrow]``).
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .types import BatchScrapeJob, CrawlJob, Document, DocumentMetadata, LazyDocument
+from .utils.normalize import _map_metadata_keys
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "DocumentFrame requires pyarrow. Install it with `pip install firecrawl-py[arrow]`."
+        ) from exc
+    return pyarrow
+
+
+# (column, arrow type name, metadata field or None for a top-level document field)
+# Markdown and HTML use 64-bit offsets so combined columns can exceed 2 GiB.
+_COLUMNS: List[Tuple[str, str, Optional[str]]] = [
+    ("url", "string", "url"),
+    ("source_url", "string", "source_url"),
+    ("status_code", "int32", "status_code"),
+    ("content_type", "string", "content_type"),
+    ("title", "string", "title"),
+    ("description", "string", "description"),
+    ("language", "string", "language"),
+    ("scrape_id", "string", "scrape_id"),
+    ("cache_state", "string", "cache_state"),
+    ("proxy_used", "string", "proxy_used"),
+    ("credits_used", "int32", "credits_used"),
+    ("error", "string", "error"),
+    ("markdown", "large_string", None),
+    ("html", "large_string", None),
+    ("summary", "large_string", None),
+    ("links", "list<string>", None),
+    ("images", "list<string>", None),
+    ("screenshot", "string", None),
+    ("warning", "string", None),
+]
+
+COLUMN_NAMES: Tuple[str, ...] = tuple(name for name, _, _ in _COLUMNS)
+
+
+def _arrow_schema(pa):
+    types: Dict[str, Callable[[], Any]] = {
+        "string": pa.string,
+        "large_string": pa.large_string,
+        "int32": pa.int32,
+        "list<string>": lambda: pa.list_(pa.string()),
+    }
+    return pa.schema([(name, types[type_name]()) for name, type_name, _ in _COLUMNS])
+
+
+def _document_row(doc: Union[Document, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Extract the DocumentFrame columns from a Document or a raw document dict
+    (snake_case from raw=True or camelCase from raw="api").
+    """
+    row: Dict[str, Any] = {}
+    if isinstance(doc, LazyDocument):
+        # Read still-deferred metadata straight from the payload instead of validating it
+        deferred, md = doc._raw_value("metadata")
+        if deferred:
+            doc = {name: getattr(doc, name) for name, _, md_field in _COLUMNS if not md_field}
+            doc["metadata"] = md
+    if isinstance(doc, dict):
+        md = doc.get("metadata")
+        metadata = _map_metadata_keys(md) if isinstance(md, dict) else {}
+        # Same list -> scalar coercions DocumentMetadata applies to typed documents
+        DocumentMetadata.coerce_lists_for_string_fields(metadata)
+        for name, _, md_field in _COLUMNS:
+            row[name] = metadata.get(md_field) if md_field else doc.get(name)
+    else:
+        md = doc.metadata
+        for name, _, md_field in _COLUMNS:
+            row[name] = getattr(md, md_field, None) if md_field else getattr(doc, name)
+    if row["url"] is None:
+        row["url"] = row["source_url"]
+    if isinstance(row["status_code"], str):
+        try:
+            row["status_code"] = int(row["status_code"])
+        except ValueError:
+            row["status_code"] = None
+    return row
+
+
+def _job_documents(job: Union[CrawlJob, BatchScrapeJob, Dict[str, Any]]) -> List[Any]:
+    if isinstance(job, dict):
+        return list(job.get("data") or [])
+    return list(job.data or [])
+
+
+class DocumentFrame:
+    """
+    Columnar, incrementally built container for crawl/batch scrape documents.
+
+    Each call to ``append`` or ``append_job`` turns one page of documents into an
+    Arrow record batch. Rows can be looked up by source URL in O(1), and the
+    collected batches are exported as a single ``pyarrow.Table`` without
+    copying.
+
+    Example:
+        frame = DocumentFrame.from_job(client.get_crawl_status(job_id))
+        frame.to_parquet("crawl.parquet")
+    """
+
+    def __init__(self, documents: Optional[Iterable[Union[Document, Dict[str, Any]]]] = None):
+        self._pa = _require_pyarrow()
+        self._schema = _arrow_schema(self._pa)
+        self._batches: List[Any] = []
+        self._num_rows = 0
+        # source_url (falling back to url) -> (batch index, row within batch)
+        self._index: Dict[str, Tuple[int, int]] = {}
+        if documents is not None:
+            self.append(documents)
+
+    @classmethod
+    def from_job(cls, job: Union[CrawlJob, BatchScrapeJob, Dict[str, Any]]) -> "DocumentFrame":
+        """
+        Build a frame from a CrawlJob/BatchScrapeJob (or a raw job dict).
+
+        Args:
+            job: Job whose ``data`` holds the documents
+
+        Returns:
+            DocumentFrame
+        """
+        frame = cls()
+        frame.append_job(job)
+        return frame
+
+    @property
+    def schema(self):
+        """Arrow schema of the frame."""
+        return self._schema
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Column names, in schema order."""
+        return COLUMN_NAMES
+
+    @property
+    def num_batches(self) -> int:
+        """Number of record batches (appended pages)."""
+        return len(self._batches)
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __contains__(self, source_url: object) -> bool:
+        return source_url in self._index
+
+    def append(self, documents: Iterable[Union[Document, Dict[str, Any]]]) -> int:
+        """
+        Append one page of documents as a new record batch.
+
+        Documents may be Document models or raw dicts (raw=True or raw="api").
+        If a source URL is already present, lookups return the newest row.
+
+        Args:
+            documents: Documents to append
+
+        Returns:
+            Number of rows appended
+        """
+        rows = [_document_row(doc) for doc in documents if doc is not None]
+        if not rows:
+            return 0
+        columns = {name: [row[name] for row in rows] for name in COLUMN_NAMES}
+        batch = self._pa.RecordBatch.from_pydict(columns, schema=self._schema)
+
+        batch_index = len(self._batches)
+        index = self._index
+        for offset, row in enumerate(rows):
+            key = row["source_url"] or row["url"]
+            if key:
+                index[key] = (batch_index, offset)
+        self._batches.append(batch)
+        self._num_rows += len(rows)
+        return len(rows)
+
+    def append_job(self, job: Union[CrawlJob, BatchScrapeJob, Dict[str, Any]]) -> int:
+        """
+        Append the documents of a job status page.
+
+        Args:
+            job: CrawlJob/BatchScrapeJob, or a raw job dict with a ``data`` list
+
+        Returns:
+            Number of rows appended
+        """
+        return self.append(_job_documents(job))
+
+    def get(self, source_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a document row by source URL.
+
+        Args:
+            source_url: Source URL (or URL when the source URL is missing)
+
+        Returns:
+            Row as a dict of column values, or None if not present
+        """
+        location = self._index.get(source_url)
+        if location is None:
+            return None
+        batch_index, offset = location
+        return self._batches[batch_index].slice(offset, 1).to_pylist()[0]
+
+    def to_arrow(self):
+        """
+        Return the frame as a ``pyarrow.Table`` made of the appended batches
+        (no data is copied).
+        """
+        return self._pa.Table.from_batches(self._batches, schema=self._schema)
+
+    def to_parquet(self, path: Any, **kwargs: Any) -> None:
+        """
+        Write the frame to a Parquet file.
+
+        Args:
+            path: File path or writable file-like object
+            **kwargs: Passed to ``pyarrow.parquet.write_table`` (e.g. compression)
+        """
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+    def to_pandas(self, **kwargs: Any):
+        """
+        Convert the frame to a pandas DataFrame (requires pandas).
+
+        Args:
+            **kwargs: Passed to ``pyarrow.Table.to_pandas``
+        """
+        return self.to_arrow().to_pandas(**kwargs)
+
+    def to_polars(self):
+        """Convert the frame to a polars DataFrame (requires polars)."""
+        try:
+            import polars
+        except ImportError as exc:
+            raise ImportError("DocumentFrame.to_polars requires polars. Install it with `pip install polars`.") from exc
+        return polars.from_arrow(self.to_arrow())
@@ -67,6 +67,7 @@ def start_agent(
     strict_constrain_to_urls: Optional[bool] = None,
     model: Optional[Literal["spark-1-pro", "spark-1-mini"]] = None,
     webhook: Optional[Union[str, AgentWebhookConfig]] = None,
+    idempotency_key: Optional[str] = None,
 ) -> AgentResponse:
     body = _prepare_agent_request(
         urls,
@@ -78,7 +79,7 @@ def start_agent(
         model=model,
         webhook=webhook,
     )
-    resp = client.post("/v2/agent", body)
+    resp = client.post("/v2/agent", body, headers=client._prepare_headers(idempotency_key))
     if not resp.ok:
         handle_response_error(resp, "agent")
     payload = _normalize_agent_response_payload(resp.json())
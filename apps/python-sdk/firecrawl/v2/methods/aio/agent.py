@@ -66,6 +66,7 @@ async def start_agent(
     strict_constrain_to_urls: Optional[bool] = None,
     model: Optional[Literal["spark-1-pro", "spark-1-mini"]] = None,
     webhook: Optional[Union[str, AgentWebhookConfig]] = None,
+    idempotency_key: Optional[str] = None,
 ) -> AgentResponse:
     body = _prepare_agent_request(
         urls,
@@ -77,7 +78,8 @@ async def start_agent(
         model=model,
         webhook=webhook,
     )
-    resp = await client.post("/v2/agent", body)
+    headers = client._headers(idempotency_key) if idempotency_key else None
+    resp = await client.post("/v2/agent", body, headers=headers)
     payload = _normalize_agent_response_payload(resp.json())
     return AgentResponse(**payload)
 
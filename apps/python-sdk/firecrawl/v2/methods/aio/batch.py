@@ -1,22 +1,50 @@
-from typing import Optional, List, Dict, Any
-from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig
-from ...utils.http_client_async import AsyncHttpClient
+import asyncio
+from functools import partial
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Tuple, Union
+from ...types import (
+    ScrapeOptions,
+    WebhookConfig,
+    Document,
+    BatchScrapeResponse,
+    BatchScrapeJob,
+    BatchRetryPolicy,
+    CrawlError,
+    LargeBatchChunkProgress,
+    PaginationConfig,
+    RawMode,
+)
+from ...utils.http_client_async import AsyncHttpClient, parse_json_response
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
-from ...methods.batch import validate_batch_urls
+from ...utils.normalize import lazy_documents_of, parse_documents, build_raw_job
+from ...utils.assets import AssetStore, asset_store_of
+from ...utils.url_dedupe import DedupeOption, dedupe_urls
+from ...utils.negative_cache import negative_cache_of, page_status, record_batch_outcome, skip_known_failures
+from ...methods.batch import (
+    validate_batch_urls,
+    chunk_urls,
+    chunks_in_flight,
+    _chunk_status_url,
+    _record_chunk_page,
+    _record_resubmission,
+    _TERMINAL_STATUSES,
+    BatchResubmitter,
+)
+from .usage import get_concurrency
 import time
 
-def _parse_batch_scrape_documents(data_list: Optional[List[Any]]) -> List[Document]:
-    documents: List[Document] = []
-    for doc in data_list or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
-    return documents
+def _parse_batch_scrape_documents(
+    data_list: Optional[List[Any]], raw: RawMode = False, assets: Optional[AssetStore] = None, lazy: bool = False
+) -> List[Any]:
+    return parse_documents(data_list, raw, lazy=lazy, assets=assets)
 
 
-def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_batch_scrape_status_response(
+    body: Dict[str, Any],
+    raw: RawMode = False,
+    assets: Optional[AssetStore] = None,
+    lazy: bool = False,
+) -> Dict[str, Any]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -27,9 +55,18 @@ def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
         "credits_used": body.get("creditsUsed"),
         "expires_at": body.get("expiresAt"),
         "next": body.get("next"),
-        "data": _parse_batch_scrape_documents(body.get("data", []) or []),
+        "data": _parse_batch_scrape_documents(body.get("data", []) or [], raw, assets, lazy),
     }
 
+
+def _parse_batch_scrape_status_body(
+    body: Dict[str, Any], raw: RawMode = False, assets: Optional[AssetStore] = None, lazy: bool = False
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    # Module-level so it can be shipped to a process pool by the parse offloader;
+    # only raw="api" results need the original body back
+    return (body if raw == "api" else {}), _parse_batch_scrape_status_response(body, raw, assets, lazy)
+
+
 def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwargs) -> Dict[str, Any]:
     if not urls:
         raise ValueError("URLs list cannot be empty")
@@ -58,21 +95,35 @@ def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwar
 
 
 async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs) -> BatchScrapeResponse:
+    dedupe: DedupeOption = kwargs.pop("dedupe", False)
+    idempotency_key: Optional[str] = kwargs.pop("idempotency_key", None)
+    force_retry: bool = kwargs.pop("force_retry", False)
+    urls, collapsed = dedupe_urls(urls, dedupe)
+    urls, skipped = skip_known_failures(client, urls, force_retry)
     payload = _prepare(urls, **kwargs)
-    response = await client.post("/v2/batch/scrape", payload)
+    headers = client._headers(idempotency_key) if idempotency_key else None
+    response = await client.post("/v2/batch/scrape", payload, headers=headers)
     if response.status_code >= 400:
         handle_response_error(response, "start batch scrape")
     body = response.json()
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    return BatchScrapeResponse(id=body.get("id"), url=body.get("url"), invalid_urls=body.get("invalidURLs"))
+    return BatchScrapeResponse(
+        id=body.get("id"),
+        url=body.get("url"),
+        invalid_urls=body.get("invalidURLs"),
+        collapsed_urls=collapsed if dedupe else None,
+        skipped_urls=skipped,
+    )
 
 
 async def get_batch_scrape_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
-) -> BatchScrapeJob:
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    raw: RawMode = False,
+) -> Union[BatchScrapeJob, Dict[str, Any]]:
     """
     Get the status of a batch scrape job.
     
@@ -80,9 +131,11 @@ async def get_batch_scrape_status(
         client: Async HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        raw: Return a plain dict job (True: snake_case, "api": camelCase) whose
+            documents are not validated into models
         
     Returns:
-        BatchScrapeJob containing job status and data
+        BatchScrapeJob containing job status and data (a dict in raw mode)
         
     Raises:
         Exception: If the status check fails
@@ -90,8 +143,11 @@ async def get_batch_scrape_status(
     response = await client.get(f"/v2/batch/scrape/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status")
-    body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    body, payload = await parse_json_response(
+        client,
+        response,
+        partial(_parse_batch_scrape_status_body, raw=raw, assets=asset_store_of(client), lazy=lazy_documents_of(client)),
+    )
     docs = payload["data"]
     
     # Handle pagination if requested
@@ -101,8 +157,14 @@ async def get_batch_scrape_status(
             client, 
             payload["next"], 
             docs, 
-            pagination_config
+            pagination_config,
+            raw=raw,
         )
+
+    if raw:
+        payload["data"] = docs
+        payload["next"] = payload["next"] if not auto_paginate else None
+        return build_raw_job(body, payload, raw)
     
     return BatchScrapeJob(
         status=payload["status"],
@@ -120,7 +182,8 @@ async def get_batch_scrape_status_page(
     next_url: str,
     *,
     request_timeout: Optional[float] = None,
-) -> BatchScrapeJob:
+    raw: RawMode = False,
+) -> Union[BatchScrapeJob, Dict[str, Any]]:
     """
     Fetch a single page of batch scrape results using the provided next URL.
 
@@ -128,6 +191,7 @@ async def get_batch_scrape_status_page(
         client: Async HTTP client instance
         next_url: Opaque next URL from a prior batch scrape status response
         request_timeout: Timeout (in seconds) for the HTTP request
+        raw: Return a plain dict page instead of a BatchScrapeJob
 
     Returns:
         BatchScrapeJob with the page data and next URL (if any)
@@ -138,8 +202,13 @@ async def get_batch_scrape_status_page(
     response = await client.get(next_url, timeout=request_timeout)
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status page")
-    body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    body, payload = await parse_json_response(
+        client,
+        response,
+        partial(_parse_batch_scrape_status_body, raw=raw, assets=asset_store_of(client), lazy=lazy_documents_of(client)),
+    )
+    if raw:
+        return build_raw_job(body, payload, raw)
     return BatchScrapeJob(
         status=payload["status"],
         completed=payload["completed"],
@@ -154,9 +223,11 @@ async def get_batch_scrape_status_page(
 async def _fetch_all_batch_pages_async(
     client: AsyncHttpClient,
     next_url: str,
-    initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
-) -> List[Document]:
+    initial_documents: List[Any],
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    raw: RawMode = False,
+) -> List[Any]:
     """
     Fetch all pages of batch scrape results asynchronously.
     
@@ -165,6 +236,7 @@ async def _fetch_all_batch_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        raw: Result mode for the parsed documents
         
     Returns:
         List of all documents from all pages
@@ -198,9 +270,12 @@ async def _fetch_all_batch_pages_async(
             logger.warning(f"Failed to fetch next page: {response.status_code}")
             break
         
-        page_data = response.json()
         try:
-            page_payload = _parse_batch_scrape_status_response(page_data)
+            page_payload = await parse_json_response(
+                client,
+                response,
+                partial(_parse_batch_scrape_status_response, raw=raw, assets=asset_store_of(client), lazy=lazy_documents_of(client)),
+            )
         except Exception:
             break
         
@@ -238,3 +313,171 @@ async def get_batch_scrape_errors(client: AsyncHttpClient, job_id: str) -> Dict[
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return body
+
+
+async def record_job_outcome(
+    client: AsyncHttpClient, job_id: str, pages: List[Tuple[Optional[str], Optional[int]]]
+) -> None:
+    """Record a finished job's pages and errors in the client's negative cache."""
+    body = await get_batch_scrape_errors(client, job_id)
+    payload = body.get("data", body)
+    record_batch_outcome(client, pages, [CrawlError(**error) for error in payload.get("errors", [])])
+
+
+class AsyncBatchResubmitter(BatchResubmitter):
+    """BatchResubmitter whose error reads and appends go through an AsyncHttpClient."""
+
+    async def resubmit(self, client: AsyncHttpClient, job_id: str) -> int:  # type: ignore[override]
+        body = await get_batch_scrape_errors(client, job_id)
+        payload = body.get("data", body)
+        urls = self.due([CrawlError(**error) for error in payload.get("errors", [])])
+        if urls:
+            await start_batch_scrape(client, urls, options=self.options, append_to_id=job_id, force_retry=True)
+            self._track(urls)
+        return len(urls)
+
+
+async def _read_chunk(client: AsyncHttpClient, progress: LargeBatchChunkProgress) -> List[Document]:
+    page = await get_batch_scrape_status_page(client, _chunk_status_url(progress.job_id, progress.documents))
+    documents = list(page.data)
+    while page.next and page.data:
+        page = await get_batch_scrape_status_page(client, page.next)
+        documents.extend(page.data)
+    _record_chunk_page(progress, page, len(documents))
+    return documents
+
+
+async def _run_large_batch(
+    client: AsyncHttpClient,
+    urls: List[str],
+    options: Optional[ScrapeOptions],
+    chunk_size: int,
+    poll_interval: float,
+    timeout: Optional[int],
+    max_chunks_in_flight: Optional[int],
+    on_progress: Optional[Callable[[LargeBatchChunkProgress], None]],
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
+) -> AsyncIterator[Tuple[int, List[Document]]]:
+    urls, _ = dedupe_urls(urls, dedupe)
+    urls, _ = skip_known_failures(client, urls, force_retry)
+    url_chunks = chunk_urls(urls, chunk_size)
+    if max_chunks_in_flight is not None:
+        if max_chunks_in_flight < 1:
+            raise ValueError("max_chunks_in_flight must be at least 1")
+        limit = min(max_chunks_in_flight, len(url_chunks))
+    else:
+        try:
+            max_concurrency = (await get_concurrency(client)).max_concurrency
+        except Exception:
+            max_concurrency = None
+        limit = chunks_in_flight(max_concurrency, chunk_size, len(url_chunks))
+    if not url_chunks:
+        return
+
+    slots = asyncio.Semaphore(limit)
+    record = negative_cache_of(client) is not None
+    # (chunk index, new documents, error); documents None marks a finished chunk
+    results: "asyncio.Queue[Tuple[int, Optional[List[Document]], Optional[BaseException]]]" = asyncio.Queue()
+
+    def notify(chunk: LargeBatchChunkProgress) -> None:
+        if on_progress is not None:
+            on_progress(chunk.model_copy())
+
+    async def run_chunk(index: int) -> None:
+        chunk = LargeBatchChunkProgress(index=index, urls=len(url_chunks[index]))
+        resubmitter = AsyncBatchResubmitter(retry, options) if retry is not None else None
+        pages: List[Tuple[Optional[str], Optional[int]]] = []
+        try:
+            async with slots:
+                job = await start_batch_scrape(client, url_chunks[index], options=options, force_retry=True)
+                chunk.job_id = job.id
+                chunk.status = "scraping"
+                chunk.started_at = time.time()
+                notify(chunk)
+                while True:
+                    documents = await _read_chunk(client, chunk)
+                    if resubmitter is not None:
+                        resubmitter.settle(documents)
+                        appended = await resubmitter.resubmit(client, chunk.job_id) if chunk.status == "completed" else 0
+                        _record_resubmission(chunk, resubmitter, appended)
+                    notify(chunk)
+                    if record:
+                        pages.extend(page_status(doc) for doc in documents)
+                    if documents:
+                        await results.put((index, documents, None))
+                    if chunk.status in _TERMINAL_STATUSES:
+                        if record:
+                            await record_job_outcome(client, chunk.job_id, pages)
+                        break
+                    if timeout and time.time() - chunk.started_at > timeout:
+                        raise TimeoutError(f"Batch scrape job {chunk.job_id} did not complete within {timeout} seconds")
+                    await asyncio.sleep(poll_interval)
+        except Exception as exc:
+            await results.put((index, None, exc))
+            return
+        await results.put((index, None, None))
+
+    tasks = [asyncio.create_task(run_chunk(index)) for index in range(len(url_chunks))]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            index, documents, error = await results.get()
+            if error is not None:
+                raise error
+            if documents is None:
+                remaining -= 1
+                continue
+            yield index, documents
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def iter_large_batch(
+    client: AsyncHttpClient,
+    urls: List[str],
+    options: Optional[ScrapeOptions] = None,
+    chunk_size: int = 100,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    *,
+    max_chunks_in_flight: Optional[int] = None,
+    on_progress: Optional[Callable[[LargeBatchChunkProgress], None]] = None,
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
+) -> AsyncIterator[Document]:
+    """Async version of ``methods.batch.iter_large_batch``: documents are yielded as chunks produce them."""
+    async for _, documents in _run_large_batch(
+        client, urls, options, chunk_size, poll_interval, timeout, max_chunks_in_flight, on_progress, dedupe, retry,
+        force_retry,
+    ):
+        for document in documents:
+            yield document
+
+
+async def process_large_batch(
+    client: AsyncHttpClient,
+    urls: List[str],
+    options: Optional[ScrapeOptions] = None,
+    chunk_size: int = 100,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    *,
+    max_chunks_in_flight: Optional[int] = None,
+    on_progress: Optional[Callable[[LargeBatchChunkProgress], None]] = None,
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
+) -> List[Document]:
+    """Async version of ``methods.batch.process_large_batch``; the result keeps chunk order."""
+    by_chunk: Dict[int, List[Document]] = {}
+    async for index, documents in _run_large_batch(
+        client, urls, options, chunk_size, poll_interval, timeout, max_chunks_in_flight, on_progress, dedupe, retry,
+        force_retry,
+    ):
+        by_chunk.setdefault(index, []).extend(documents)
+    return [doc for index in sorted(by_chunk) for doc in by_chunk[index]]
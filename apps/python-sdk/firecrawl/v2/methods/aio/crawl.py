@@ -1,4 +1,5 @@
-from typing import Optional, Dict, Any, List
+from functools import partial
+from typing import Optional, Dict, Any, List, Tuple, Union
 from ...types import (
     CrawlRequest,
     CrawlJob,
@@ -11,11 +12,13 @@ from ...types import (
     ActiveCrawlsResponse,
     ActiveCrawl,
     PaginationConfig,
+    RawMode,
 )
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
-from ...utils.http_client_async import AsyncHttpClient
-from ...utils.normalize import normalize_document_input
+from ...utils.http_client_async import AsyncHttpClient, parse_json_response
+from ...utils.normalize import lazy_documents_of, parse_documents, build_raw_job
+from ...utils.assets import AssetStore, asset_store_of
 import time
 
 
@@ -61,16 +64,18 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def _parse_crawl_documents(data_list: Optional[List[Any]]) -> List[Document]:
-    documents: List[Document] = []
-    for doc_data in data_list or []:
-        if isinstance(doc_data, dict):
-            normalized = normalize_document_input(doc_data)
-            documents.append(Document(**normalized))
-    return documents
+def _parse_crawl_documents(
+    data_list: Optional[List[Any]], raw: RawMode = False, assets: Optional[AssetStore] = None, lazy: bool = False
+) -> List[Any]:
+    return parse_documents(data_list, raw, lazy=lazy, assets=assets)
 
 
-def _parse_crawl_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_crawl_status_response(
+    body: Dict[str, Any],
+    raw: RawMode = False,
+    assets: Optional[AssetStore] = None,
+    lazy: bool = False,
+) -> Dict[str, Any]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -81,17 +86,28 @@ def _parse_crawl_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
         "credits_used": body.get("creditsUsed", 0),
         "expires_at": body.get("expiresAt"),
         "next": body.get("next"),
-        "data": _parse_crawl_documents(body.get("data", [])),
+        "data": _parse_crawl_documents(body.get("data", []), raw, assets, lazy),
     }
 
 
-async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlResponse:
+def _parse_crawl_status_body(
+    body: Dict[str, Any], raw: RawMode = False, assets: Optional[AssetStore] = None, lazy: bool = False
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    # Module-level so it can be shipped to a process pool by the parse offloader;
+    # only raw="api" results need the original body back
+    return (body if raw == "api" else {}), _parse_crawl_status_response(body, raw, assets, lazy)
+
+
+async def start_crawl(
+    client: AsyncHttpClient, request: CrawlRequest, *, idempotency_key: Optional[str] = None
+) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: Async HTTP client instance
         request: CrawlRequest containing URL and options
+        idempotency_key: Key sent as-is (see utils.idempotency)
         
     Returns:
         CrawlResponse with job information
@@ -101,7 +117,8 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
         Exception: If the crawl operation fails to start
     """
     payload = _prepare_crawl_request(request)
-    response = await client.post("/v2/crawl", payload)
+    headers = client._headers(idempotency_key) if idempotency_key else None
+    response = await client.post("/v2/crawl", payload, headers=headers)
     if response.status_code >= 400:
         handle_response_error(response, "start crawl")
     body = response.json()
@@ -116,7 +133,8 @@ async def get_crawl_status(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
-) -> CrawlJob:
+    raw: RawMode = False,
+) -> Union[CrawlJob, Dict[str, Any]]:
     """
     Get the status of a crawl job.
     
@@ -127,9 +145,11 @@ async def get_crawl_status(
         request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
             is enabled (default) and there are multiple pages of results, this timeout applies to 
             each page request separately, not to the entire operation
+        raw: Return a plain dict job (True: snake_case, "api": camelCase) whose
+            documents are not validated into models
         
     Returns:
-        CrawlJob with job information
+        CrawlJob with job information (a dict in raw mode)
         
     Raises:
         Exception: If the status check fails
@@ -137,8 +157,11 @@ async def get_crawl_status(
     response = await client.get(f"/v2/crawl/{job_id}", timeout=request_timeout)
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status")
-    body = response.json()
-    payload = _parse_crawl_status_response(body)
+    body, payload = await parse_json_response(
+        client,
+        response,
+        partial(_parse_crawl_status_body, raw=raw, assets=asset_store_of(client), lazy=lazy_documents_of(client)),
+    )
 
     documents = payload["data"]
 
@@ -151,8 +174,14 @@ async def get_crawl_status(
             documents,
             pagination_config,
             request_timeout=request_timeout,
+            raw=raw,
         )
 
+    if raw:
+        payload["data"] = documents
+        payload["next"] = payload["next"] if not auto_paginate else None
+        return build_raw_job(body, payload, raw)
+
     return CrawlJob(
         status=payload["status"],
         completed=payload["completed"],
@@ -169,7 +198,8 @@ async def get_crawl_status_page(
     next_url: str,
     *,
     request_timeout: Optional[float] = None,
-) -> CrawlJob:
+    raw: RawMode = False,
+) -> Union[CrawlJob, Dict[str, Any]]:
     """
     Fetch a single page of crawl results using the provided next URL.
 
@@ -177,6 +207,7 @@ async def get_crawl_status_page(
         client: Async HTTP client instance
         next_url: Opaque next URL from a prior crawl status response
         request_timeout: Timeout (in seconds) for the HTTP request
+        raw: Return a plain dict page instead of a CrawlJob
 
     Returns:
         CrawlJob with the page data and next URL (if any)
@@ -187,8 +218,13 @@ async def get_crawl_status_page(
     response = await client.get(next_url, timeout=request_timeout)
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status page")
-    body = response.json()
-    payload = _parse_crawl_status_response(body)
+    body, payload = await parse_json_response(
+        client,
+        response,
+        partial(_parse_crawl_status_body, raw=raw, assets=asset_store_of(client), lazy=lazy_documents_of(client)),
+    )
+    if raw:
+        return build_raw_job(body, payload, raw)
     return CrawlJob(
         status=payload["status"],
         completed=payload["completed"],
@@ -203,11 +239,12 @@ async def get_crawl_status_page(
 async def _fetch_all_pages_async(
     client: AsyncHttpClient,
     next_url: str,
-    initial_documents: List[Document],
+    initial_documents: List[Any],
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
-) -> List[Document]:
+    raw: RawMode = False,
+) -> List[Any]:
     """
     Fetch all pages of crawl results asynchronously.
     
@@ -217,6 +254,7 @@ async def _fetch_all_pages_async(
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
         request_timeout: Optional timeout (in seconds) for the underlying HTTP request
+        raw: Result mode for the parsed documents
         
     Returns:
         List of all documents from all pages
@@ -250,9 +288,12 @@ async def _fetch_all_pages_async(
             logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
             break
         
-        page_data = response.json()
         try:
-            page_payload = _parse_crawl_status_response(page_data)
+            page_payload = await parse_json_response(
+                client,
+                response,
+                partial(_parse_crawl_status_response, raw=raw, assets=asset_store_of(client), lazy=lazy_documents_of(client)),
+            )
         except Exception:
             break
         
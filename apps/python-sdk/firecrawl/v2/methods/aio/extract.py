@@ -4,6 +4,7 @@ import asyncio
 from ...types import ExtractResponse, ScrapeOptions
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
+from ...utils.response_cache import cache_entry
 
 
 def _prepare_extract_request(
@@ -58,6 +59,7 @@ async def start_extract(
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -71,7 +73,8 @@ async def start_extract(
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
     )
-    resp = await client.post("/v2/extract", body)
+    headers = client._headers(idempotency_key) if idempotency_key else None
+    resp = await client.post("/v2/extract", body, headers=headers)
     return ExtractResponse(**resp.json())
 
 
@@ -113,6 +116,21 @@ async def extract(
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
 ) -> ExtractResponse:
+    # Only completed results are cached, keyed by the start payload
+    entry = cache_entry(client, "/v2/extract", _prepare_extract_request(
+        urls,
+        prompt=prompt,
+        schema=schema,
+        system_prompt=system_prompt,
+        allow_external_links=allow_external_links,
+        enable_web_search=enable_web_search,
+        show_sources=show_sources,
+        scrape_options=scrape_options,
+        ignore_invalid_urls=ignore_invalid_urls,
+        integration=integration,
+    ))
+    if entry is not None and entry.body is not None:
+        return ExtractResponse(**entry.body)
     started = await start_extract(
         client,
         urls,
@@ -129,5 +147,8 @@ async def extract(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return await wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    result = await wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    if entry is not None and result.status == "completed":
+        entry.store(result.model_dump_json().encode("utf-8"))
+    return result
 
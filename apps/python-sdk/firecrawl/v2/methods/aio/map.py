@@ -1,7 +1,9 @@
-from typing import Optional, Dict, Any
-from ...types import MapOptions, MapData, LinkResult
+from typing import Optional, Dict, Any, Union
+from ...types import MapOptions, MapData, LinkResult, RawMode
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
+from ...utils.normalize import raw_map_links
+from ...utils.response_cache import cache_entry
 
 
 def _prepare_map_request(url: str, options: Optional[MapOptions] = None) -> Dict[str, Any]:
@@ -30,14 +32,25 @@ def _prepare_map_request(url: str, options: Optional[MapOptions] = None) -> Dict
     return payload
 
 
-async def map(client: AsyncHttpClient, url: str, options: Optional[MapOptions] = None) -> MapData:
+async def map(
+    client: AsyncHttpClient,
+    url: str,
+    options: Optional[MapOptions] = None,
+    *,
+    raw: RawMode = False,
+) -> Union[MapData, Dict[str, Any]]:
     request_data = _prepare_map_request(url, options)
-    response = await client.post("/v2/map", request_data)
-    if response.status_code >= 400:
-        handle_response_error(response, "map")
-    body = response.json()
-    if not body.get("success"):
-        raise Exception(body.get("error", "Unknown error occurred"))
+    entry = cache_entry(client, "/v2/map", request_data)
+    body = entry.body if entry is not None else None
+    if body is None:
+        response = await client.post("/v2/map", request_data)
+        if response.status_code >= 400:
+            handle_response_error(response, "map")
+        body = response.json()
+        if not body.get("success"):
+            raise Exception(body.get("error", "Unknown error occurred"))
+        if entry is not None:
+            entry.store(response.content)
     
     
     # data = body.get("data", {})
@@ -54,6 +67,11 @@ async def map(client: AsyncHttpClient, url: str, options: Optional[MapOptions] =
     #     elif isinstance(item, str):
     #         result_links.append(LinkResult(url=item))
 
+    if raw == "api":
+        return body
+    if raw:
+        return {"links": raw_map_links(body.get("links", []))}
+
     result_links: list[LinkResult] = []
     for item in body.get("links", []):
         if isinstance(item, dict):
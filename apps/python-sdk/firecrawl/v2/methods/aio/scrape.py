@@ -1,9 +1,17 @@
-from typing import Optional, Dict, Any
-from ...types import ScrapeOptions, Document
-from ...utils.normalize import normalize_document_input
+import asyncio
+import time
+from functools import partial
+from typing import Optional, Dict, Any, AsyncIterator, Callable, Iterable, List, Tuple, Union
+from ...types import ScrapeOptions, Document, RawMode, ScrapeManyProgress
+from ...utils.normalize import parse_document
+from ...utils.assets import AssetStore, asset_store_of
+from ...utils.response_cache import cache_entry
+from ...utils.negative_cache import negative_cache_of
+from ...utils.domain_profiles import domain_profiles_of
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options, validate_scrape_options
-from ...utils.http_client_async import AsyncHttpClient
+from ...utils.http_client_async import AsyncHttpClient, parse_json_response
+from ...methods.scrape import ScrapeManyResult, _record_outcome, _record_result
 
 
 async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -19,15 +27,111 @@ async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = N
     return payload
 
 
-async def scrape(client: AsyncHttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+async def scrape(
+    client: AsyncHttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    *,
+    raw: RawMode = False,
+    force_retry: bool = False,
+) -> Union[Document, Dict[str, Any]]:
+    profiles = domain_profiles_of(client)
+    if profiles is not None and profiles.apply:
+        options = profiles.apply_to(url, options)
     payload = await _prepare_scrape_request(url, options)
-    response = await client.post("/v2/scrape", payload)
-    if response.status_code >= 400:
-        handle_response_error(response, "scrape")
-    body = response.json()
+    negative = negative_cache_of(client)
+    if negative is not None and not force_retry:
+        negative.check(payload["url"])
+    parse = partial(_parse_scrape_body, raw=raw, assets=asset_store_of(client))
+    entry = cache_entry(client, "/v2/scrape", payload)
+    if entry is not None and entry.body is not None:
+        return parse(entry.body)
+    started = time.monotonic()
+    try:
+        response = await client.post("/v2/scrape", payload)
+        if response.status_code >= 400:
+            handle_response_error(response, "scrape")
+        result = await parse_json_response(client, response, parse)
+    except Exception as exc:
+        _record_outcome(client, payload["url"], options, exc, time.monotonic() - started)
+        raise
+    if entry is not None:
+        entry.store(response.content)
+    _record_outcome(client, payload["url"], options, result, time.monotonic() - started)
+    return result
+
+
+def _parse_scrape_body(
+    body: Dict[str, Any], raw: RawMode = False, assets: Optional[AssetStore] = None
+) -> Union[Document, Dict[str, Any]]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    document_data = body.get("data", {})
-    normalized = normalize_document_input(document_data)
-    return Document(**normalized)
+    return parse_document(body.get("data", {}), raw, assets=assets)
+
+
+def scrape_many(
+    client: AsyncHttpClient,
+    urls: Iterable[str],
+    options: Optional[ScrapeOptions] = None,
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+    raw: RawMode = False,
+    on_progress: Optional[Callable[[ScrapeManyProgress], None]] = None,
+    force_retry: bool = False,
+) -> AsyncIterator[ScrapeManyResult]:
+    """Async version of ``methods.scrape.scrape_many``; ``concurrency`` worker tasks share the URL list."""
+    # Validated here rather than in the generator, so errors surface at the call
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    return _scrape_many(client, list(urls), options, concurrency, ordered, raw, on_progress, force_retry)
+
+
+async def _scrape_many(
+    client: AsyncHttpClient,
+    url_list: List[str],
+    options: Optional[ScrapeOptions],
+    concurrency: int,
+    ordered: bool,
+    raw: RawMode,
+    on_progress: Optional[Callable[[ScrapeManyProgress], None]],
+    force_retry: bool,
+) -> AsyncIterator[ScrapeManyResult]:
+    progress = ScrapeManyProgress(total=len(url_list))
+    if not url_list:
+        return
+    pending = iter(enumerate(url_list))
+    results: "asyncio.Queue[Tuple[int, ScrapeManyResult]]" = asyncio.Queue()
+    in_flight = 0
+
+    async def worker() -> None:
+        nonlocal in_flight
+        for index, url in pending:
+            in_flight += 1
+            try:
+                result: Any = await scrape(client, url, options, raw=raw, force_retry=force_retry)
+            except Exception as exc:
+                result = exc
+            in_flight -= 1
+            await results.put((index, (url, result)))
 
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(url_list)))]
+    finished: Dict[int, ScrapeManyResult] = {}
+    next_index = 0
+    try:
+        for _ in range(len(url_list)):
+            index, item = await results.get()
+            _record_result(progress, item[1], in_flight)
+            if on_progress is not None:
+                on_progress(progress.model_copy())
+            if not ordered:
+                yield item
+                continue
+            finished[index] = item
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
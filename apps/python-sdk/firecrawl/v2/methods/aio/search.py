@@ -1,5 +1,6 @@
 import re
-from typing import Dict, Any, Union, List, TypeVar, Type
+from functools import partial
+from typing import Dict, Any, Optional, Union, List, TypeVar, Type
 from ...types import (
     SearchRequest,
     SearchData,
@@ -7,24 +8,31 @@ from ...types import (
     SearchResultWeb,
     SearchResultNews,
     SearchResultImages,
+    RawMode,
 )
-from ...utils.http_client_async import AsyncHttpClient
+from ...utils.http_client_async import AsyncHttpClient, parse_json_response
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
+from ...utils.normalize import _SEARCH_DOCUMENT_KEYS, parse_documents, raw_search_data
+from ...utils.assets import AssetStore, asset_store_of
+from ...utils.response_cache import cache_entry
 from ...utils.validation import validate_scrape_options, prepare_scrape_options
 
 T = TypeVar("T")
 
 async def search(
     client: AsyncHttpClient,
-    request: SearchRequest
-) -> SearchData:
+    request: SearchRequest,
+    *,
+    raw: RawMode = False,
+) -> Union[SearchData, Dict[str, Any]]:
     """
     Async search for documents.
 
     Args:
         client: Async HTTP client instance
         request: Search request
+        raw: Return plain dicts grouped by source type (True) or the untouched
+            API ``data`` payload ("api") instead of SearchData
 
     Returns:
         SearchData with search results grouped by source type
@@ -33,28 +41,49 @@ async def search(
         FirecrawlError: If the search operation fails
     """
     request_data = _prepare_search_request(request)
+    parse = partial(_parse_search_body, raw=raw, assets=asset_store_of(client))
+    entry = cache_entry(client, "/v2/search", request_data)
+    if entry is not None and entry.body is not None:
+        return parse(entry.body)
     try:
         response = await client.post("/v2/search", request_data)
         if response.status_code != 200:
             handle_response_error(response, "search")
-        response_data = response.json()
-        if not response_data.get("success"):
+        result = await parse_json_response(client, response, parse)
+        if result is None:
             handle_response_error(response, "search")
-        data = response_data.get("data", {}) or {}
-        out = SearchData()
-        if "web" in data:
-            out.web = _transform_array(data["web"], SearchResultWeb)
-        if "news" in data:
-            out.news = _transform_array(data["news"], SearchResultNews)
-        if "images" in data:
-            out.images = _transform_array(data["images"], SearchResultImages)
-        return out
+        if entry is not None:
+            entry.store(response.content)
+        return result
     except Exception as err:
         if hasattr(err, "response"):
             handle_response_error(getattr(err, "response"), "search")
         raise err
 
-def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Document]]:
+
+def _parse_search_body(
+    body: Dict[str, Any], raw: RawMode = False, assets: Optional[AssetStore] = None
+) -> Optional[Union[SearchData, Dict[str, Any]]]:
+    # Returns None for unsuccessful responses so the caller can raise from the response
+    if not body.get("success"):
+        return None
+    data = body.get("data", {}) or {}
+    if raw == "api":
+        return data
+    if raw:
+        return raw_search_data(data)
+    out = SearchData()
+    if "web" in data:
+        out.web = _transform_array(data["web"], SearchResultWeb, assets)
+    if "news" in data:
+        out.news = _transform_array(data["news"], SearchResultNews, assets)
+    if "images" in data:
+        out.images = _transform_array(data["images"], SearchResultImages, assets)
+    return out
+
+def _transform_array(
+    arr: List[Any], result_type: Type[T], assets: Optional[AssetStore] = None
+) -> List[Union[T, Document]]:
     """
     Transforms an array of items into a list of result_type or Document.
     If the item dict contains any of the special keys, it is treated as a Document.
@@ -62,23 +91,21 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Docu
     If the item is not a dict, it is wrapped as result_type with url=item.
     """
     results: List[Union[T, Document]] = []
+    # Document items are validated together as one page after the loop
+    doc_positions: List[int] = []
+    doc_items: List[Dict[str, Any]] = []
     for item in arr:
         if item and isinstance(item, dict):
-            if (
-                "markdown" in item or
-                "html" in item or
-                "rawHtml" in item or
-                "links" in item or
-                "screenshot" in item or
-                "changeTracking" in item or
-                "summary" in item or
-                "json" in item
-            ):
-                results.append(Document(**normalize_document_input(item)))
+            if _SEARCH_DOCUMENT_KEYS.intersection(item):
+                doc_positions.append(len(results))
+                doc_items.append(item)
+                results.append(None)
             else:
                 results.append(result_type(**item))
         else:
             results.append(result_type(url=item))
+    for position, doc in zip(doc_positions, parse_documents(doc_items, assets=assets)):
+        results[position] = doc
     return results
 
 def _validate_search_request(request: SearchRequest) -> SearchRequest:
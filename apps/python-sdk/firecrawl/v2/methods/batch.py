@@ -3,31 +3,41 @@ Batch scraping functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, List, Callable, Dict, Any, Union
+from collections import deque
+from typing import Optional, List, Callable, Dict, Any, Iterator, Set, Tuple, Union
 from ..types import (
+    BatchRetryPolicy,
     BatchScrapeRequest,
     BatchScrapeResponse,
     BatchScrapeJob,
+    LargeBatchChunkProgress,
     ScrapeOptions,
     Document,
     WebhookConfig,
     PaginationConfig,
+    RawMode,
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
-from ..types import CrawlErrorsResponse
-
-
-def _parse_batch_scrape_documents(data_list: Optional[List[Any]]) -> List[Document]:
-    documents: List[Document] = []
-    for doc in data_list or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
-    return documents
-
-
-def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
+from ..utils.normalize import lazy_documents_of, parse_documents, build_raw_job
+from ..utils.assets import AssetStore, asset_store_of
+from ..utils.url_dedupe import DedupeOption, dedupe_urls
+from ..utils.negative_cache import negative_cache_of, page_status, record_batch_outcome, skip_known_failures
+from ..types import CrawlError, CrawlErrorsResponse
+from .usage import get_concurrency
+
+
+def _parse_batch_scrape_documents(
+    data_list: Optional[List[Any]], raw: RawMode = False, assets: Optional[AssetStore] = None, lazy: bool = False
+) -> List[Any]:
+    return parse_documents(data_list, raw, lazy=lazy, assets=assets)
+
+
+def _parse_batch_scrape_status_response(
+    body: Dict[str, Any],
+    raw: RawMode = False,
+    assets: Optional[AssetStore] = None,
+    lazy: bool = False,
+) -> Dict[str, Any]:
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -38,7 +48,7 @@ def _parse_batch_scrape_status_response(body: Dict[str, Any]) -> Dict[str, Any]:
         "credits_used": body.get("creditsUsed"),
         "expires_at": body.get("expiresAt"),
         "next": body.get("next"),
-        "data": _parse_batch_scrape_documents(body.get("data", []) or []),
+        "data": _parse_batch_scrape_documents(body.get("data", []) or [], raw, assets, lazy),
     }
 
 
@@ -54,6 +64,8 @@ def start_batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    dedupe: DedupeOption = False,
+    force_retry: bool = False,
 ) -> BatchScrapeResponse:
     """
     Start a batch scrape job for multiple URLs.
@@ -62,13 +74,21 @@ def start_batch_scrape(
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        dedupe: Drop URLs that canonicalize to one already submitted (True,
+            or a UrlDeduplicator shared across calls)
+        force_retry: Submit URLs the client's negative cache lists as failing
+            instead of leaving them out
         
     Returns:
         BatchScrapeResponse containing job information
         
     Raises:
         FirecrawlError: If the batch scrape operation fails to start
+        KnownFailureError: If the negative cache lists every URL
     """
+    urls, collapsed = dedupe_urls(urls, dedupe)
+    urls, skipped = skip_known_failures(client, urls, force_retry)
+
     # Prepare request data
     request_data = prepare_batch_scrape_request(
         urls,
@@ -97,14 +117,18 @@ def start_batch_scrape(
         id=body.get("id"),
         url=body.get("url"),
         invalid_urls=body.get("invalidURLs") or None,
+        collapsed_urls=collapsed if dedupe else None,
+        skipped_urls=skipped,
     )
 
 
 def get_batch_scrape_status(
     client: HttpClient,
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
-) -> BatchScrapeJob:
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    raw: RawMode = False,
+) -> Union[BatchScrapeJob, Dict[str, Any]]:
     """
     Get the status of a batch scrape job.
     
@@ -112,9 +136,11 @@ def get_batch_scrape_status(
         client: HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        raw: Return a plain dict job (True: snake_case, "api": camelCase) whose
+            documents are not validated into models
         
     Returns:
-        BatchScrapeJob containing job status and data
+        BatchScrapeJob containing job status and data (a dict in raw mode)
         
     Raises:
         FirecrawlError: If the status check fails
@@ -128,7 +154,9 @@ def get_batch_scrape_status(
     
     # Parse response
     body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    payload = _parse_batch_scrape_status_response(
+        body, raw, asset_store_of(client), lazy_documents_of(client)
+    )
     documents = payload["data"]
 
     # Handle pagination if requested
@@ -138,9 +166,15 @@ def get_batch_scrape_status(
             client, 
             payload["next"], 
             documents, 
-            pagination_config
+            pagination_config,
+            raw=raw,
         )
 
+    if raw:
+        payload["data"] = documents
+        payload["next"] = payload["next"] if not auto_paginate else None
+        return build_raw_job(body, payload, raw)
+
     return BatchScrapeJob(
         status=payload["status"],
         completed=payload["completed"],
@@ -157,7 +191,8 @@ def get_batch_scrape_status_page(
     next_url: str,
     *,
     request_timeout: Optional[float] = None,
-) -> BatchScrapeJob:
+    raw: RawMode = False,
+) -> Union[BatchScrapeJob, Dict[str, Any]]:
     """
     Fetch a single page of batch scrape results using the provided next URL.
 
@@ -165,6 +200,7 @@ def get_batch_scrape_status_page(
         client: HTTP client instance
         next_url: Opaque next URL from a prior batch scrape status response
         request_timeout: Timeout (in seconds) for the HTTP request
+        raw: Return a plain dict page instead of a BatchScrapeJob
 
     Returns:
         BatchScrapeJob with the page data and next URL (if any)
@@ -178,7 +214,12 @@ def get_batch_scrape_status_page(
         handle_response_error(response, "get batch scrape status page")
 
     body = response.json()
-    payload = _parse_batch_scrape_status_response(body)
+    payload = _parse_batch_scrape_status_response(
+        body, raw, asset_store_of(client), lazy_documents_of(client)
+    )
+
+    if raw:
+        return build_raw_job(body, payload, raw)
 
     return BatchScrapeJob(
         status=payload["status"],
@@ -194,9 +235,11 @@ def get_batch_scrape_status_page(
 def _fetch_all_batch_pages(
     client: HttpClient,
     next_url: str,
-    initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
-) -> List[Document]:
+    initial_documents: List[Any],
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    raw: RawMode = False,
+) -> List[Any]:
     """
     Fetch all pages of batch scrape results.
     
@@ -205,6 +248,7 @@ def _fetch_all_batch_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        raw: Result mode for the parsed documents
         
     Returns:
         List of all documents from all pages
@@ -240,7 +284,9 @@ def _fetch_all_batch_pages(
         
         page_data = response.json()
         try:
-            page_payload = _parse_batch_scrape_status_response(page_data)
+            page_payload = _parse_batch_scrape_status_response(
+                page_data, raw, asset_store_of(client), lazy_documents_of(client)
+            )
         except Exception:
             break
         
@@ -291,12 +337,82 @@ def cancel_batch_scrape(
     return body.get("status") == "cancelled"
 
 
+class BatchResubmitter:
+    """
+    Tracks attempts per URL of one job and picks the failures to append back to it.
+
+    The API does not reopen a finished job when URLs are appended: its status
+    stays "completed". Appended URLs are therefore tracked until their document
+    or a new error shows up (or ``policy.settle_timeout`` passes), and callers
+    keep polling while ``waiting`` is true. Errors are only read once the job's
+    status is "completed", not on every poll while it scrapes.
+    """
+
+    def __init__(self, policy: BatchRetryPolicy, options: Optional[ScrapeOptions]) -> None:
+        self.policy = policy
+        self.options = policy.retry_options(options)
+        self._attempts: Dict[str, int] = {}
+        # Error ids already acted on; a job's error list keeps every past failure
+        self._handled: Set[str] = set()
+        # Appended URLs without a result yet, with the monotonic time to stop waiting for them
+        self._appended: Dict[str, float] = {}
+
+    @property
+    def waiting(self) -> bool:
+        """Whether appended URLs are still expected to produce a document or an error."""
+        now = time.monotonic()
+        for url in [url for url, deadline in self._appended.items() if deadline <= now]:
+            del self._appended[url]
+        return bool(self._appended)
+
+    def settle(self, documents: List[Any]) -> None:
+        """Stop waiting for appended URLs that have a document among ``documents``."""
+        if self._appended:
+            for document in documents:
+                self._appended.pop(page_status(document)[0], None)
+
+    def due(self, errors: List[CrawlError]) -> List[str]:
+        urls: List[str] = []
+        for error in errors:
+            if error.id in self._handled:
+                continue
+            self._handled.add(error.id)
+            self._appended.pop(error.url, None)
+            attempts = self._attempts.get(error.url, 1)
+            if attempts < self.policy.max_attempts and self.policy.is_retryable(error) and error.url not in urls:
+                self._attempts[error.url] = attempts + 1
+                urls.append(error.url)
+        return urls
+
+    def _track(self, urls: List[str]) -> None:
+        deadline = time.monotonic() + self.policy.settle_timeout
+        for url in urls:
+            self._appended[url] = deadline
+
+    def resubmit(self, client: HttpClient, job_id: str) -> int:
+        """Append the job's new retryable failures to it; returns how many were sent."""
+        urls = self.due(get_batch_scrape_errors(client, job_id).errors)
+        if urls:
+            start_batch_scrape(client, urls, options=self.options, append_to_id=job_id, force_retry=True)
+            self._track(urls)
+        return len(urls)
+
+
+def record_job_outcome(client: HttpClient, job_id: str, documents: List[Any]) -> None:
+    errors = get_batch_scrape_errors(client, job_id).errors
+    record_batch_outcome(client, [page_status(doc) for doc in documents], errors)
+
+
 def wait_for_batch_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
-) -> BatchScrapeJob:
+    timeout: Optional[int] = None,
+    *,
+    raw: RawMode = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    options: Optional[ScrapeOptions] = None,
+) -> Union[BatchScrapeJob, Dict[str, Any]]:
     """
     Wait for a batch scrape job to complete, polling for status updates.
     
@@ -305,6 +421,10 @@ def wait_for_batch_completion(
         job_id: ID of the batch scrape job
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        raw: Return the final job as a plain dict
+        retry: Append transiently failed URLs back to the job while waiting
+        options: Scrape options the job was started with (the base for
+            ``retry.escalate``)
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -314,12 +434,23 @@ def wait_for_batch_completion(
         TimeoutError: If timeout is reached
     """
     start_time = time.monotonic()
+    resubmitter = BatchResubmitter(retry, options) if retry is not None else None
     
     while True:
-        status_job = get_batch_scrape_status(client, job_id)
+        status_job = get_batch_scrape_status(client, job_id, raw=raw)
+        status = status_job["status"] if raw else status_job.status
+        finished = status in ["completed", "failed", "cancelled"]
+        if resubmitter is not None:
+            resubmitter.settle(status_job["data"] if raw else status_job.data)
+            if status == "completed":
+                resubmitter.resubmit(client, job_id)
+            # Appended URLs leave the job "completed"; keep polling until their results arrive
+            finished = finished and not resubmitter.waiting
         
         # Check if job is complete
-        if status_job.status in ["completed", "failed", "cancelled"]:
+        if finished:
+            if negative_cache_of(client) is not None:
+                record_job_outcome(client, job_id, status_job["data"] if raw else status_job.data)
             return status_job
         
         # Check timeout
@@ -343,8 +474,12 @@ def batch_scrape(
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
-) -> BatchScrapeJob:
+    timeout: Optional[int] = None,
+    raw: RawMode = False,
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
+) -> Union[BatchScrapeJob, Dict[str, Any]]:
     """
     Start a batch scrape job and wait for it to complete.
     
@@ -352,8 +487,13 @@ def batch_scrape(
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        dedupe: Drop duplicate URLs before submitting (see start_batch_scrape)
+        retry: Append transiently failed URLs back to the job, up to
+            ``retry.max_attempts`` per URL, before it is reported finished
+        force_retry: Submit URLs the negative cache lists as failing
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        raw: Return the final job as a plain dict
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -374,13 +514,15 @@ def batch_scrape(
         zero_data_retention=zero_data_retention,
         integration=integration,
         idempotency_key=idempotency_key,
+        dedupe=dedupe,
+        force_retry=force_retry,
     )
 
     job_id = start.id
 
     # Wait for completion
     return wait_for_batch_completion(
-        client, job_id, poll_interval, timeout
+        client, job_id, poll_interval, timeout, raw=raw, retry=retry, options=options
     )
 
 
@@ -481,17 +623,214 @@ def chunk_urls(urls: List[str], chunk_size: int = 100) -> List[List[str]]:
     return chunks
 
 
+# Upper bound on chunk jobs kept in flight when the limit is derived from the team's concurrency
+MAX_CHUNKS_IN_FLIGHT = 16
+
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+def chunks_in_flight(max_concurrency: Optional[int], chunk_size: int, chunk_count: int) -> int:
+    """
+    Number of chunk jobs to keep running at once.
+
+    Enough chunks to occupy the team's concurrency limit, plus one so the
+    next chunk is already queued while the slowest pages of another drain.
+    Without a known limit, two chunks are overlapped.
+    """
+    if chunk_count <= 0:
+        return 0
+    if not max_concurrency:
+        limit = 2
+    else:
+        limit = -(-max_concurrency // max(chunk_size, 1)) + 1
+    return max(1, min(limit, MAX_CHUNKS_IN_FLIGHT, chunk_count))
+
+
+def _chunk_status_url(job_id: str, cursor: int) -> str:
+    return f"/v2/batch/scrape/{job_id}?skip={cursor}"
+
+
+def _record_chunk_page(progress: LargeBatchChunkProgress, page: BatchScrapeJob, new_documents: int) -> None:
+    progress.status = page.status
+    progress.completed = page.completed
+    progress.total = page.total
+    progress.credits_used = page.credits_used
+    progress.documents += new_documents
+    if page.status in _TERMINAL_STATUSES and progress.finished_at is None:
+        progress.finished_at = time.time()
+
+
+def _read_chunk(client: HttpClient, progress: LargeBatchChunkProgress) -> List[Document]:
+    """Fetch the chunk's results past those already read and update its progress."""
+    page = get_batch_scrape_status_page(client, _chunk_status_url(progress.job_id, progress.documents))
+    documents = list(page.data)
+    while page.next and page.data:
+        page = get_batch_scrape_status_page(client, page.next)
+        documents.extend(page.data)
+    _record_chunk_page(progress, page, len(documents))
+    return documents
+
+
+def _record_resubmission(chunk: LargeBatchChunkProgress, resubmitter: "BatchResubmitter", appended: int) -> None:
+    chunk.resubmitted += appended
+    if resubmitter.waiting:
+        # The job stays "completed" while appended URLs run; report the chunk as still going
+        chunk.status = "scraping"
+        chunk.finished_at = None
+
+
+def _run_large_batch(
+    client: HttpClient,
+    urls: List[str],
+    options: Optional[ScrapeOptions],
+    chunk_size: int,
+    poll_interval: float,
+    timeout: Optional[int],
+    max_chunks_in_flight: Optional[int],
+    on_progress: Optional[Callable[[LargeBatchChunkProgress], None]],
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
+) -> Iterator[Tuple[int, List[Document]]]:
+    """Yield (chunk index, new documents) as results of the in-flight chunk jobs arrive."""
+    urls, _ = dedupe_urls(urls, dedupe)
+    urls, _ = skip_known_failures(client, urls, force_retry)
+    url_chunks = chunk_urls(urls, chunk_size)
+    if max_chunks_in_flight is not None:
+        if max_chunks_in_flight < 1:
+            raise ValueError("max_chunks_in_flight must be at least 1")
+        limit = min(max_chunks_in_flight, len(url_chunks))
+    else:
+        try:
+            max_concurrency = get_concurrency(client).max_concurrency
+        except Exception:
+            max_concurrency = None
+        limit = chunks_in_flight(max_concurrency, chunk_size, len(url_chunks))
+
+    progress = [LargeBatchChunkProgress(index=i, urls=len(chunk)) for i, chunk in enumerate(url_chunks)]
+    pending = deque(range(len(url_chunks)))
+    active: List[int] = []
+    resubmitters = {i: BatchResubmitter(retry, options) for i in range(len(url_chunks))} if retry is not None else {}
+    # (source URL, status) of each chunk's documents, recorded in the negative cache when it finishes
+    pages: Dict[int, List[Tuple[Optional[str], Optional[int]]]] = {}
+    record = negative_cache_of(client) is not None
+
+    def notify(chunk: LargeBatchChunkProgress) -> None:
+        if on_progress is not None:
+            on_progress(chunk.model_copy())
+
+    while pending or active:
+        while pending and len(active) < limit:
+            index = pending.popleft()
+            # Known failures were left out above; the chunk goes in as is
+            job = start_batch_scrape(client, url_chunks[index], options=options, force_retry=True)
+            progress[index].job_id = job.id
+            progress[index].status = "scraping"
+            progress[index].started_at = time.time()
+            active.append(index)
+            notify(progress[index])
+
+        finished = False
+        for index in list(active):
+            chunk = progress[index]
+            documents = _read_chunk(client, chunk)
+            if index in resubmitters:
+                resubmitter = resubmitters[index]
+                resubmitter.settle(documents)
+                appended = resubmitter.resubmit(client, chunk.job_id) if chunk.status == "completed" else 0
+                _record_resubmission(chunk, resubmitter, appended)
+            notify(chunk)
+            if record:
+                pages.setdefault(index, []).extend(page_status(doc) for doc in documents)
+            if documents:
+                yield index, documents
+            if chunk.status in _TERMINAL_STATUSES:
+                if record:
+                    errors = get_batch_scrape_errors(client, chunk.job_id).errors
+                    record_batch_outcome(client, pages.pop(index, []), errors)
+                active.remove(index)
+                finished = True
+            elif timeout and time.time() - chunk.started_at > timeout:
+                raise TimeoutError(f"Batch scrape job {chunk.job_id} did not complete within {timeout} seconds")
+
+        # A freed slot is refilled right away; otherwise wait for the running chunks
+        if active and not (finished and pending):
+            time.sleep(poll_interval)
+
+
+def iter_large_batch(
+    client: HttpClient,
+    urls: List[str],
+    options: Optional[ScrapeOptions] = None,
+    chunk_size: int = 100,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    *,
+    max_chunks_in_flight: Optional[int] = None,
+    on_progress: Optional[Callable[[LargeBatchChunkProgress], None]] = None,
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
+) -> Iterator[Document]:
+    """
+    Scrape a large list of URLs as chunk jobs, several in flight at once.
+
+    Documents are yielded as soon as they are scraped, in the order they
+    arrive. Each chunk's results are read incrementally, so no page is
+    downloaded twice.
+
+    Args:
+        client: HTTP client instance
+        urls: List of URLs to scrape
+        options: Scraping options
+        chunk_size: Size of each batch chunk
+        poll_interval: Seconds between status checks
+        timeout: Maximum seconds to wait per chunk
+        max_chunks_in_flight: Chunk jobs running at once (default: derived
+            from the team's concurrency limit)
+        on_progress: Called with a LargeBatchChunkProgress whenever a chunk
+            starts or is polled
+        dedupe: Drop duplicate URLs before chunking (True, or a
+            UrlDeduplicator whose report gives the collapsed count)
+        retry: Append transiently failed URLs back to their chunk's job
+            while it runs (see BatchRetryPolicy)
+        force_retry: Submit URLs the client's negative cache lists as
+            failing instead of leaving them out
+
+    Returns:
+        Iterator over scraped documents
+
+    Raises:
+        FirecrawlError: If a chunk fails to start or its status cannot be read
+        TimeoutError: If a chunk does not finish within the timeout
+    """
+    for _, documents in _run_large_batch(
+        client, urls, options, chunk_size, poll_interval, timeout, max_chunks_in_flight, on_progress, dedupe, retry,
+        force_retry,
+    ):
+        yield from documents
+
+
 def process_large_batch(
     client: HttpClient,
     urls: List[str],
     options: Optional[ScrapeOptions] = None,
     chunk_size: int = 100,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    *,
+    max_chunks_in_flight: Optional[int] = None,
+    on_progress: Optional[Callable[[LargeBatchChunkProgress], None]] = None,
+    dedupe: DedupeOption = False,
+    retry: Optional[BatchRetryPolicy] = None,
+    force_retry: bool = False,
 ) -> List[Document]:
     """
     Process a large batch of URLs by splitting into smaller chunks.
     
+    Chunks run concurrently (see ``iter_large_batch``); the result keeps
+    chunk order.
+
     Args:
         client: HTTP client instance
         urls: List of URLs to scrape
@@ -499,34 +838,26 @@ def process_large_batch(
         chunk_size: Size of each batch chunk
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait per chunk
+        max_chunks_in_flight: Chunk jobs running at once
+        on_progress: Called with per-chunk progress updates
+        dedupe: Drop duplicate URLs before chunking
+        retry: Resubmit transiently failed URLs to their chunk's job
+        force_retry: Submit URLs the negative cache lists as failing
         
     Returns:
         List of all scraped documents
         
     Raises:
-        FirecrawlError: If any chunk fails
+        FirecrawlError: If any chunk fails to start
+        TimeoutError: If a chunk does not finish within the timeout
     """
-    url_chunks = chunk_urls(urls, chunk_size)
-    all_documents = []
-    completed_chunks = 0
-    
-    for chunk in url_chunks:
-        # Process this chunk
-        result = batch_scrape(
-            client,
-            chunk,
-            options=options,
-            poll_interval=poll_interval,
-            timeout=timeout,
-        )
-
-        # Add documents from this chunk
-        if result.data:
-            all_documents.extend(result.data)
-        
-        completed_chunks += 1
-    
-    return all_documents
+    by_chunk: Dict[int, List[Document]] = {}
+    for index, documents in _run_large_batch(
+        client, urls, options, chunk_size, poll_interval, timeout, max_chunks_in_flight, on_progress, dedupe, retry,
+        force_retry,
+    ):
+        by_chunk.setdefault(index, []).extend(documents)
+    return [doc for index in sorted(by_chunk) for doc in by_chunk[index]]
 
 
 def get_batch_scrape_errors(client: HttpClient, job_id: str) -> CrawlErrorsResponse:
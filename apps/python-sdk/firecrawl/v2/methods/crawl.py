@@ -3,15 +3,17 @@ Crawling functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from ..types import (
     CrawlRequest,
     CrawlJob,
     CrawlResponse, Document, CrawlParamsRequest, CrawlParamsResponse, CrawlParamsData,
-    WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig
+    WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig,
+    RawMode,
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.normalize import lazy_documents_of, parse_documents, build_raw_job
+from ..utils.assets import AssetStore, asset_store_of
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -107,15 +109,18 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def _parse_crawl_documents(data_list: Optional[List[Any]]) -> List[Document]:
-    documents: List[Document] = []
-    for doc_data in data_list or []:
-        if isinstance(doc_data, dict):
-            documents.append(Document(**normalize_document_input(doc_data)))
-    return documents
+def _parse_crawl_documents(
+    data_list: Optional[List[Any]], raw: RawMode = False, assets: Optional[AssetStore] = None, lazy: bool = False
+) -> List[Any]:
+    return parse_documents(data_list, raw, lazy=lazy, assets=assets)
 
 
-def _parse_crawl_status_response(response_data: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_crawl_status_response(
+    response_data: Dict[str, Any],
+    raw: RawMode = False,
+    assets: Optional[AssetStore] = None,
+    lazy: bool = False,
+) -> Dict[str, Any]:
     if not response_data.get("success"):
         raise Exception(response_data.get("error", "Unknown error occurred"))
 
@@ -126,17 +131,18 @@ def _parse_crawl_status_response(response_data: Dict[str, Any]) -> Dict[str, Any
         "credits_used": response_data.get("creditsUsed", 0),
         "expires_at": response_data.get("expiresAt"),
         "next": response_data.get("next"),
-        "data": _parse_crawl_documents(response_data.get("data", [])),
+        "data": _parse_crawl_documents(response_data.get("data", []), raw, assets, lazy),
     }
 
 
-def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
+def start_crawl(client: HttpClient, request: CrawlRequest, *, idempotency_key: Optional[str] = None) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: HTTP client instance
         request: CrawlRequest containing URL and options
+        idempotency_key: Key sent as-is (see utils.idempotency)
         
     Returns:
         CrawlResponse with job information
@@ -147,7 +153,7 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
     """
     request_data = _prepare_crawl_request(request)
     
-    response = client.post("/v2/crawl", request_data)
+    response = client.post("/v2/crawl", request_data, headers=client._prepare_headers(idempotency_key))
     
     if not response.ok:
         handle_response_error(response, "start crawl")
@@ -171,7 +177,8 @@ def get_crawl_status(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
-) -> CrawlJob:
+    raw: RawMode = False,
+) -> Union[CrawlJob, Dict[str, Any]]:
     """
     Get the status of a crawl job.
 
@@ -182,9 +189,11 @@ def get_crawl_status(
         request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
             is enabled (default) and there are multiple pages of results, this timeout applies to 
             each page request separately, not to the entire operation
+        raw: Return a plain dict job (True: snake_case, "api": camelCase) whose
+            documents are not validated into models
 
     Returns:
-        CrawlJob with current status and data
+        CrawlJob with current status and data (a dict in raw mode)
 
     Raises:
         Exception: If the status check fails
@@ -199,7 +208,9 @@ def get_crawl_status(
     # Parse response
     response_data = response.json()
 
-    payload = _parse_crawl_status_response(response_data)
+    payload = _parse_crawl_status_response(
+        response_data, raw, asset_store_of(client), lazy_documents_of(client)
+    )
 
     documents = payload["data"]
 
@@ -216,8 +227,14 @@ def get_crawl_status(
             documents,
             pagination_config,
             request_timeout=request_timeout,
+            raw=raw,
         )
 
+    if raw:
+        payload["data"] = documents
+        payload["next"] = payload["next"] if not auto_paginate else None
+        return build_raw_job(response_data, payload, raw)
+
     # Create CrawlJob with current status and data
     return CrawlJob(
         status=payload["status"],
@@ -235,7 +252,8 @@ def get_crawl_status_page(
     next_url: str,
     *,
     request_timeout: Optional[float] = None,
-) -> CrawlJob:
+    raw: RawMode = False,
+) -> Union[CrawlJob, Dict[str, Any]]:
     """
     Fetch a single page of crawl results using the provided next URL.
 
@@ -243,6 +261,7 @@ def get_crawl_status_page(
         client: HTTP client instance
         next_url: Opaque next URL from a prior crawl status response
         request_timeout: Timeout (in seconds) for the HTTP request
+        raw: Return a plain dict page instead of a CrawlJob
 
     Returns:
         CrawlJob with the page data and next URL (if any)
@@ -256,7 +275,12 @@ def get_crawl_status_page(
         handle_response_error(response, "get crawl status page")
 
     response_data = response.json()
-    payload = _parse_crawl_status_response(response_data)
+    payload = _parse_crawl_status_response(
+        response_data, raw, asset_store_of(client), lazy_documents_of(client)
+    )
+
+    if raw:
+        return build_raw_job(response_data, payload, raw)
 
     return CrawlJob(
         status=payload["status"],
@@ -276,7 +300,8 @@ def _fetch_all_pages(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
-) -> List[Document]:
+    raw: RawMode = False,
+) -> List[Any]:
     """
     Fetch all pages of crawl results.
 
@@ -286,6 +311,7 @@ def _fetch_all_pages(
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
         request_timeout: Optional timeout (in seconds) for the underlying HTTP request
+        raw: Result mode for the parsed documents
 
     Returns:
         List of all documents from all pages
@@ -322,7 +348,9 @@ def _fetch_all_pages(
         page_data = response.json()
 
         try:
-            page_payload = _parse_crawl_status_response(page_data)
+            page_payload = _parse_crawl_status_response(
+                page_data, raw, asset_store_of(client), lazy_documents_of(client)
+            )
         except Exception:
             break
 
@@ -374,7 +402,8 @@ def wait_for_crawl_completion(
     timeout: Optional[int] = None,
     *,
     request_timeout: Optional[float] = None,
-) -> CrawlJob:
+    raw: RawMode = False,
+) -> Union[CrawlJob, Dict[str, Any]]:
     """
     Wait for a crawl job to complete, polling for status updates.
     
@@ -384,6 +413,7 @@ def wait_for_crawl_completion(
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
         request_timeout: Optional timeout (in seconds) for each status request
+        raw: Return the final job as a plain dict
         
     Returns:
         CrawlJob when job completes
@@ -399,10 +429,12 @@ def wait_for_crawl_completion(
             client,
             job_id,
             request_timeout=request_timeout,
+            raw=raw,
         )
+        status = crawl_job["status"] if raw else crawl_job.status
         
         # Check if job is complete
-        if crawl_job.status in ["completed", "failed", "cancelled"]:
+        if status in ["completed", "failed", "cancelled"]:
             return crawl_job
         
         # Check timeout
@@ -420,7 +452,8 @@ def crawl(
     timeout: Optional[int] = None,
     *,
     request_timeout: Optional[float] = None,
-) -> CrawlJob:
+    raw: RawMode = False,
+) -> Union[CrawlJob, Dict[str, Any]]:
     """
     Start a crawl job and wait for it to complete.
     
@@ -431,6 +464,7 @@ def crawl(
         timeout: Maximum seconds to wait for the entire crawl job to complete (None for no timeout)
         request_timeout: Timeout (in seconds) for each individual HTTP request, including pagination 
             requests when fetching results. If there are multiple pages, each page request gets this timeout
+        raw: Return the final job as a plain dict
         
     Returns:
         CrawlJob when job completes
@@ -454,6 +488,7 @@ def crawl(
         poll_interval,
         timeout,
         request_timeout=effective_request_timeout,
+        raw=raw,
     )
 
 
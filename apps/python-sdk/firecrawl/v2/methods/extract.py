@@ -6,6 +6,7 @@ from ..types import AgentOptions
 from ..utils.http_client import HttpClient
 from ..utils.validation import prepare_scrape_options
 from ..utils.error_handler import handle_response_error
+from ..utils.response_cache import cache_entry
 
 
 def _prepare_extract_request(
@@ -78,6 +79,7 @@ def start_extract(
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    idempotency_key: Optional[str] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -92,7 +94,7 @@ def start_extract(
         integration=integration,
         agent=agent,
     )
-    resp = client.post("/v2/extract", body)
+    resp = client.post("/v2/extract", body, headers=client._prepare_headers(idempotency_key))
     if not resp.ok:
         handle_response_error(resp, "extract")
     payload = _normalize_extract_response_payload(resp.json())
@@ -141,6 +143,22 @@ def extract(
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
 ) -> ExtractResponse:
+    # Only completed results are cached, keyed by the start payload
+    entry = cache_entry(client, "/v2/extract", _prepare_extract_request(
+        urls,
+        prompt=prompt,
+        schema=schema,
+        system_prompt=system_prompt,
+        allow_external_links=allow_external_links,
+        enable_web_search=enable_web_search,
+        show_sources=show_sources,
+        scrape_options=scrape_options,
+        ignore_invalid_urls=ignore_invalid_urls,
+        integration=integration,
+        agent=agent,
+    ))
+    if entry is not None and entry.body is not None:
+        return ExtractResponse(**entry.body)
     started = start_extract(
         client,
         urls,
@@ -158,4 +176,7 @@ def extract(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    result = wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    if entry is not None and result.status == "completed":
+        entry.store(result.model_dump_json().encode("utf-8"))
+    return result
@@ -2,9 +2,11 @@
 Mapping functionality for Firecrawl v2 API.
 """
 
-from typing import Optional, Dict, Any
-from ..types import MapOptions, MapData, LinkResult
+from typing import Optional, Dict, Any, Union
+from ..types import MapOptions, MapData, LinkResult, RawMode
 from ..utils import HttpClient, handle_response_error
+from ..utils.normalize import raw_map_links
+from ..utils.response_cache import cache_entry
 
 
 def _prepare_map_request(url: str, options: Optional[MapOptions] = None) -> Dict[str, Any]:
@@ -38,18 +40,32 @@ def _prepare_map_request(url: str, options: Optional[MapOptions] = None) -> Dict
     return payload
 
 
-def map(client: HttpClient, url: str, options: Optional[MapOptions] = None) -> MapData:
+def map(
+    client: HttpClient,
+    url: str,
+    options: Optional[MapOptions] = None,
+    *,
+    raw: RawMode = False,
+) -> Union[MapData, Dict[str, Any]]:
     """
     Map a URL and return MapData (links list with optional titles/descriptions).
+
+    With ``raw=True`` a ``{"links": [{"url", "title", "description"}, ...]}`` dict is
+    returned instead; ``raw="api"`` returns the untouched response body.
     """
     request_data = _prepare_map_request(url, options)
-    response = client.post("/v2/map", request_data)
-    if not response.ok:
-        handle_response_error(response, "map")
+    entry = cache_entry(client, "/v2/map", request_data)
+    body = entry.body if entry is not None else None
+    if body is None:
+        response = client.post("/v2/map", request_data)
+        if not response.ok:
+            handle_response_error(response, "map")
 
-    body = response.json()
-    if not body.get("success"):
-        raise Exception(body.get("error", "Unknown error occurred"))
+        body = response.json()
+        if not body.get("success"):
+            raise Exception(body.get("error", "Unknown error occurred"))
+        if entry is not None:
+            entry.store(response.content)
 
     # shouldnt return inside data?
     # data = body.get("data", {})
@@ -66,6 +82,11 @@ def map(client: HttpClient, url: str, options: Optional[MapOptions] = None) -> M
     #     elif isinstance(item, str):
     #         result_links.append(LinkResult(url=item))
 
+    if raw == "api":
+        return body
+    if raw:
+        return {"links": raw_map_links(body.get("links", []))}
+
     result_links: list[LinkResult] = []
     for item in body.get("links", []):
         if isinstance(item, dict):
@@ -2,9 +2,15 @@
 Scraping functionality for Firecrawl v2 API.
 """
 
-from typing import Optional, Dict, Any
-from ..types import ScrapeOptions, Document
-from ..utils.normalize import normalize_document_input
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple, Union
+from ..types import ScrapeOptions, Document, RawMode, ScrapeManyProgress
+from ..utils.normalize import parse_document
+from ..utils.assets import asset_store_of
+from ..utils.response_cache import cache_entry
+from ..utils.negative_cache import negative_cache_of, page_status
+from ..utils.domain_profiles import domain_profiles_of
 from ..utils import HttpClient, handle_response_error, prepare_scrape_options, validate_scrape_options
 
 
@@ -33,7 +39,14 @@ def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -
 
     return request_data
 
-def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+def scrape(
+    client: HttpClient,
+    url: str,
+    options: Optional[ScrapeOptions] = None,
+    *,
+    raw: RawMode = False,
+    force_retry: bool = False,
+) -> Union[Document, Dict[str, Any]]:
     """
     Scrape a single URL and return the document.
     
@@ -44,21 +57,172 @@ def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None
         client: HTTP client instance
         url: URL to scrape
         options: Scraping options (snake_case)
+        raw: Return a snake_case dict (True) or the untouched API dict ("api")
+            instead of a Document model
+        force_retry: Scrape even if the client's negative cache lists the URL
+            or its host as failing
+
+    With DomainProfiles configured on the client, options left unset are
+    filled from the profile of the URL's host.
         
     Returns:
-        Document
+        Document, or a plain dict in raw mode
+
+    Raises:
+        KnownFailureError: If the negative cache lists the URL or its host
     """
+    profiles = domain_profiles_of(client)
+    if profiles is not None and profiles.apply:
+        options = profiles.apply_to(url, options)
     payload = _prepare_scrape_request(url, options)
+    negative = negative_cache_of(client)
+    if negative is not None and not force_retry:
+        negative.check(payload["url"])
+
+    entry = cache_entry(client, "/v2/scrape", payload)
+    body = entry.body if entry is not None else None
+    if body is None:
+        started = time.monotonic()
+        try:
+            response = client.post("/v2/scrape", payload)
+
+            if not response.ok:
+                handle_response_error(response, "scrape")
+
+            body = response.json()
+            if not body.get("success"):
+                raise Exception(body.get("error", "Unknown error occurred"))
+        except Exception as exc:
+            _record_outcome(client, payload["url"], options, exc, time.monotonic() - started)
+            raise
+        if entry is not None:
+            entry.store(response.content)
+        _record_outcome(client, payload["url"], options, body.get("data") or {}, time.monotonic() - started)
+
+    return parse_document(body.get("data", {}), raw, assets=asset_store_of(client))
+
+
+def _record_outcome(
+    client: Any, url: str, options: Optional[ScrapeOptions], result: Any, latency: float
+) -> None:
+    """Feed a finished scrape (document or exception) to the client's negative cache and domain profiles."""
+    negative = negative_cache_of(client)
+    if negative is not None:
+        if isinstance(result, BaseException):
+            negative.record_exception(url, result)
+        else:
+            negative.record_status(url, page_status(result)[1])
+    profiles = domain_profiles_of(client)
+    if profiles is not None:
+        profiles.record(url, options, result, latency)
+
+
+ScrapeManyResult = Tuple[str, Union[Document, Dict[str, Any], Exception]]
+
+
+def _scrape_or_error(
+    client: HttpClient, url: str, options: Optional[ScrapeOptions], raw: RawMode, force_retry: bool = False
+) -> Union[Document, Dict[str, Any], Exception]:
+    try:
+        return scrape(client, url, options, raw=raw, force_retry=force_retry)
+    except Exception as exc:
+        return exc
+
+
+def _record_result(progress: ScrapeManyProgress, result: Any, in_flight: int) -> None:
+    progress.completed += 1
+    if isinstance(result, Exception):
+        progress.failed += 1
+    else:
+        progress.succeeded += 1
+    progress.in_flight = in_flight
+
+
+def scrape_many(
+    client: HttpClient,
+    urls: Iterable[str],
+    options: Optional[ScrapeOptions] = None,
+    *,
+    concurrency: int = 10,
+    ordered: bool = False,
+    raw: RawMode = False,
+    on_progress: Optional[Callable[[ScrapeManyProgress], None]] = None,
+    force_retry: bool = False,
+) -> Iterator[ScrapeManyResult]:
+    """
+    Scrape many URLs concurrently on a thread pool.
+
+    At most ``concurrency`` scrapes run at once; a new one starts as soon as
+    one finishes. Closing the iterator (or leaving a ``for`` loop early)
+    cancels the URLs that have not started.
+
+    Args:
+        client: HTTP client instance
+        urls: URLs to scrape
+        options: Scraping options applied to every URL
+        concurrency: Maximum scrapes in flight
+        ordered: Yield results in input order instead of completion order
+        raw: Result mode for each document (see RawMode)
+        on_progress: Called with a ScrapeManyProgress after every finished URL
+        force_retry: Scrape URLs the negative cache lists as failing instead
+            of yielding KnownFailureError for them
+
+    Returns:
+        Iterator of (url, document) pairs; a failed URL yields the exception
+        in place of the document
+    """
+    # Validated here rather than in the generator, so errors surface at the call
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    return _scrape_many(client, list(urls), options, concurrency, ordered, raw, on_progress, force_retry)
 
-    response = client.post("/v2/scrape", payload)
 
-    if not response.ok:
-        handle_response_error(response, "scrape")
+def _scrape_many(
+    client: HttpClient,
+    url_list: List[str],
+    options: Optional[ScrapeOptions],
+    concurrency: int,
+    ordered: bool,
+    raw: RawMode,
+    on_progress: Optional[Callable[[ScrapeManyProgress], None]],
+    force_retry: bool,
+) -> Iterator[ScrapeManyResult]:
+    progress = ScrapeManyProgress(total=len(url_list))
+    if not url_list:
+        return
+    pending = iter(enumerate(url_list))
+    running: Dict[Future, Tuple[int, str]] = {}
+    finished: Dict[int, ScrapeManyResult] = {}
+    next_index = 0
+    executor = ThreadPoolExecutor(
+        max_workers=min(concurrency, len(url_list)), thread_name_prefix="firecrawl-scrape-many"
+    )
 
-    body = response.json()
-    if not body.get("success"):
-        raise Exception(body.get("error", "Unknown error occurred"))
+    def submit_next() -> None:
+        for index, url in pending:
+            running[executor.submit(_scrape_or_error, client, url, options, raw, force_retry)] = (index, url)
+            return
 
-    document_data = body.get("data", {})
-    normalized = normalize_document_input(document_data)
-    return Document(**normalized)
\ No newline at end of file
+    try:
+        for _ in range(concurrency):
+            submit_next()
+        while running:
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f][0]):
+                index, url = running.pop(future)
+                submit_next()
+                result = future.result()
+                _record_result(progress, result, len(running))
+                if on_progress is not None:
+                    on_progress(progress.model_copy())
+                if not ordered:
+                    yield url, result
+                    continue
+                finished[index] = (url, result)
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -3,23 +3,29 @@ Search functionality for Firecrawl v2 API.
 """
 
 import re
-from typing import Dict, Any, Union, List, TypeVar, Type
-from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages
-from ..utils.normalize import normalize_document_input, _map_search_result_keys
+from typing import Dict, Any, Optional, Union, List, TypeVar, Type
+from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages, RawMode
+from ..utils.normalize import _SEARCH_DOCUMENT_KEYS, _map_search_result_keys, parse_documents, raw_search_data
+from ..utils.assets import AssetStore, asset_store_of
+from ..utils.response_cache import cache_entry
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
 
 T = TypeVar("T")
 
 def search(
     client: HttpClient,
-    request: SearchRequest
-) -> SearchData:
+    request: SearchRequest,
+    *,
+    raw: RawMode = False,
+) -> Union[SearchData, Dict[str, Any]]:
     """
     Search for documents.
     
     Args:
         client: HTTP client instance
         request: Search request
+        raw: Return plain dicts grouped by source type (True) or the untouched
+            API ``data`` payload ("api") instead of SearchData
         
     Returns:
         SearchData with search results grouped by source type
@@ -28,21 +34,31 @@ def search(
         FirecrawlError: If the search operation fails
     """
     request_data = _prepare_search_request(request)
+    entry = cache_entry(client, "/v2/search", request_data)
     try:
-        response = client.post("/v2/search", request_data)
-        if response.status_code != 200:
-            handle_response_error(response, "search")
-        response_data = response.json()
-        if not response_data.get("success"):
-            handle_response_error(response, "search")
+        response_data = entry.body if entry is not None else None
+        if response_data is None:
+            response = client.post("/v2/search", request_data)
+            if response.status_code != 200:
+                handle_response_error(response, "search")
+            response_data = response.json()
+            if not response_data.get("success"):
+                handle_response_error(response, "search")
+            if entry is not None:
+                entry.store(response.content)
         data = response_data.get("data", {}) or {}
+        if raw == "api":
+            return data
+        if raw:
+            return raw_search_data(data)
+        assets = asset_store_of(client)
         out = SearchData()
         if "web" in data:
-            out.web = _transform_array(data["web"], SearchResultWeb)
+            out.web = _transform_array(data["web"], SearchResultWeb, assets)
         if "news" in data:
-            out.news = _transform_array(data["news"], SearchResultNews)
+            out.news = _transform_array(data["news"], SearchResultNews, assets)
         if "images" in data:
-            out.images = _transform_array(data["images"], SearchResultImages)
+            out.images = _transform_array(data["images"], SearchResultImages, assets)
         return out
     except Exception as err:
         # If the error is an HTTP error from requests, handle it
@@ -51,7 +67,9 @@ def search(
             handle_response_error(getattr(err, "response"), "search")
         raise err
 
-def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Document']]:
+def _transform_array(
+    arr: List[Any], result_type: Type[T], assets: Optional[AssetStore] = None
+) -> List[Union[T, 'Document']]:
     """
     Transforms an array of items into a list of result_type or Document.
     If the item dict contains any of the special keys, it is treated as a Document.
@@ -59,19 +77,15 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Doc
     If the item is not a dict, it is wrapped as result_type with url=item.
     """
     results: List[Union[T, 'Document']] = []
+    # Document items are validated together as one page after the loop
+    doc_positions: List[int] = []
+    doc_items: List[Dict[str, Any]] = []
     for item in arr:
         if item and isinstance(item, dict):
-            if (
-                "markdown" in item or
-                "html" in item or
-                "rawHtml" in item or
-                "links" in item or
-                "screenshot" in item or
-                "changeTracking" in item or
-                "summary" in item or
-                "json" in item
-            ):
-                results.append(Document(**normalize_document_input(item)))
+            if _SEARCH_DOCUMENT_KEYS.intersection(item):
+                doc_positions.append(len(results))
+                doc_items.append(item)
+                results.append(None)
             else:
                 result_type_name = None
                 if result_type == SearchResultImages:
@@ -88,6 +102,8 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Doc
                     results.append(result_type(**item))
         else:
             results.append(result_type(url=item))
+    for position, doc in zip(doc_positions, parse_documents(doc_items, assets=assets)):
+        results[position] = doc
     return results
 
 def _validate_search_request(request: SearchRequest) -> SearchRequest:
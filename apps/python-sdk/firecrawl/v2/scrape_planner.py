@@ -0,0 +1,353 @@
+"""
+Choose how to scrape a URL list: direct fan-out, one batch job, or chunked jobs.
+
+A handful of URLs finishes fastest as parallel ``scrape`` calls; thousands
+are cheaper and faster as batch jobs, which pay a start-up delay but run at
+the team's full concurrency server-side. ``ScrapePlanner`` compares the two
+using latencies observed on earlier runs (one scrape, and the time until a
+batch job returns its first document) and the concurrency left unused by
+other jobs, then streams results the same way whichever path it takes:
+``(url, Document)`` pairs, with an exception in place of the document for
+URLs that failed.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple, Union
+
+from .methods import batch as batch_methods
+from .methods import scrape as scrape_methods
+from .methods import usage as usage_methods
+from .methods.aio import batch as async_batch_methods
+from .methods.aio import scrape as async_scrape_methods
+from .methods.aio import usage as async_usage_methods
+from .types import Document, LargeBatchChunkProgress, ScrapeOptions, ScrapePlan
+from .utils.error_handler import FirecrawlError
+
+logger = logging.getLogger("firecrawl")
+
+STRATEGIES = ("scrape_many", "batch", "large_batch")
+
+ScrapeUrlsResult = Tuple[str, Union[Document, Exception]]
+
+
+class ScrapePlanner:
+    """
+    Picks a strategy per URL list and learns latencies from finished runs.
+
+    Each client owns one planner (``client.scrape_planner``); its thresholds
+    can be changed there.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_fan_out: int = 100,
+        max_fan_out_concurrency: int = 20,
+        large_batch_threshold: int = 1000,
+        chunk_size: int = 100,
+        scrape_latency: float = 3.0,
+        batch_first_result: float = 6.0,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            max_fan_out: Largest list scraped with direct fan-out
+            max_fan_out_concurrency: Upper bound for parallel scrape calls
+            large_batch_threshold: Lists longer than this use chunked jobs
+            chunk_size: URLs per chunk job on the large-batch path
+            scrape_latency: Initial estimate of one scrape, in seconds
+            batch_first_result: Initial estimate of the time until a batch job
+                returns its first document, in seconds
+            smoothing: Weight of a new observation in the running estimates
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.max_fan_out = max_fan_out
+        self.max_fan_out_concurrency = max_fan_out_concurrency
+        self.large_batch_threshold = large_batch_threshold
+        self.chunk_size = chunk_size
+        self.scrape_latency = scrape_latency
+        self.batch_first_result = batch_first_result
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def observe_scrape_latency(self, seconds: float) -> None:
+        with self._lock:
+            self.scrape_latency += self.smoothing * (seconds - self.scrape_latency)
+
+    def observe_batch_first_result(self, seconds: float) -> None:
+        with self._lock:
+            self.batch_first_result += self.smoothing * (seconds - self.batch_first_result)
+
+    def plan(
+        self,
+        urls: int,
+        max_concurrency: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        strategy: Optional[str] = None,
+    ) -> ScrapePlan:
+        """
+        Choose a strategy for ``urls`` URLs.
+
+        Args:
+            urls: Number of URLs
+            max_concurrency: Team concurrency limit, if known
+            concurrency: Team concurrency currently in use, if known
+            strategy: Force "scrape_many", "batch" or "large_batch"
+        """
+        if strategy is not None and strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+        headroom = max(max_concurrency - (concurrency or 0), 1) if max_concurrency else None
+        fan_out = max(min(self.max_fan_out_concurrency, headroom or self.max_fan_out_concurrency, urls), 1)
+        server_side = max(max_concurrency or fan_out, 1)
+        with self._lock:
+            latency, first_result = self.scrape_latency, self.batch_first_result
+        fan_out_seconds = math.ceil(urls / fan_out) * latency
+        batch_seconds = first_result + max(math.ceil(urls / server_side) - 1, 0) * latency
+
+        if strategy is not None:
+            reason = "requested by caller"
+        elif urls <= self.max_fan_out and fan_out_seconds <= batch_seconds:
+            strategy = "scrape_many"
+            reason = f"fan-out estimated at {fan_out_seconds:.1f}s vs {batch_seconds:.1f}s for a batch job"
+        elif urls <= self.large_batch_threshold:
+            strategy = "batch"
+            reason = (
+                f"{urls} URLs exceed the fan-out limit of {self.max_fan_out}"
+                if urls > self.max_fan_out
+                else f"batch job estimated at {batch_seconds:.1f}s vs {fan_out_seconds:.1f}s for fan-out"
+            )
+        else:
+            strategy = "large_batch"
+            reason = f"{urls} URLs exceed the single-job limit of {self.large_batch_threshold}"
+
+        if strategy == "scrape_many":
+            plan_concurrency, chunk_size = fan_out, None
+        elif strategy == "batch":
+            plan_concurrency, chunk_size = 1, max(urls, 1)
+        else:
+            chunk_size = self.chunk_size
+            plan_concurrency = batch_methods.chunks_in_flight(
+                max_concurrency, chunk_size, math.ceil(urls / chunk_size)
+            )
+        return ScrapePlan(
+            strategy=strategy,
+            urls=urls,
+            concurrency=plan_concurrency,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+            headroom=headroom,
+            estimated_fan_out_seconds=fan_out_seconds,
+            estimated_batch_seconds=batch_seconds,
+            reason=reason,
+        )
+
+
+def _source_url(document: Document) -> str:
+    return (document.metadata.source_url if document.metadata else None) or ""
+
+
+def _job_errors(body: Any) -> List[ScrapeUrlsResult]:
+    if isinstance(body, dict):
+        payload = body.get("data", body)
+        errors = payload.get("errors", []) if isinstance(payload, dict) else []
+        return [(e.get("url", ""), FirecrawlError(e.get("error", "Unknown error"))) for e in errors]
+    return [(e.url, FirecrawlError(e.error)) for e in body.errors]
+
+
+def _job_tracker(job_ids: List[str]) -> Callable[[LargeBatchChunkProgress], None]:
+    def track(chunk: LargeBatchChunkProgress) -> None:
+        if chunk.job_id and chunk.job_id not in job_ids:
+            job_ids.append(chunk.job_id)
+
+    return track
+
+
+class ScrapeUrlsStream:
+    """
+    Iterator of (url, Document or exception) returned by ``scrape_urls``.
+
+    ``plan`` is available before iteration starts. On the batch paths,
+    documents stream as the jobs produce them and failed URLs are reported
+    from the jobs' error lists once they finish.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        planner: ScrapePlanner,
+        urls: List[str],
+        options: Optional[ScrapeOptions],
+        plan: ScrapePlan,
+        poll_interval: float,
+        timeout: Optional[int],
+    ) -> None:
+        self.plan = plan
+        self._client = client
+        self._planner = planner
+        self._urls = urls
+        self._options = options
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._iterator: Optional[Iterator[ScrapeUrlsResult]] = None
+
+    def __iter__(self) -> "ScrapeUrlsStream":
+        return self
+
+    def __next__(self) -> ScrapeUrlsResult:
+        if self._iterator is None:
+            self._iterator = self._run()
+        return next(self._iterator)
+
+    def close(self) -> None:
+        if self._iterator is not None:
+            self._iterator.close()
+
+    def _run(self) -> Iterator[ScrapeUrlsResult]:
+        plan = self.plan
+        started = time.monotonic()
+        if plan.strategy == "scrape_many":
+            finished = 0
+            for item in scrape_methods.scrape_many(
+                self._client, self._urls, self._options, concurrency=plan.concurrency
+            ):
+                finished += 1
+                yield item
+            if finished:
+                elapsed = time.monotonic() - started
+                self._planner.observe_scrape_latency(elapsed * min(plan.concurrency, finished) / finished)
+            return
+
+        job_ids: List[str] = []
+        first = True
+        for document in batch_methods.iter_large_batch(
+            self._client,
+            self._urls,
+            self._options,
+            chunk_size=plan.chunk_size,
+            poll_interval=self._poll_interval,
+            timeout=self._timeout,
+            max_chunks_in_flight=plan.concurrency,
+            on_progress=_job_tracker(job_ids),
+        ):
+            if first:
+                self._planner.observe_batch_first_result(time.monotonic() - started)
+                first = False
+            yield _source_url(document), document
+        for job_id in job_ids:
+            yield from _job_errors(batch_methods.get_batch_scrape_errors(self._client, job_id))
+
+
+class AsyncScrapeUrlsStream:
+    """Async counterpart of ``ScrapeUrlsStream``; iterate with ``async for``."""
+
+    def __init__(
+        self,
+        client: Any,
+        planner: ScrapePlanner,
+        urls: List[str],
+        options: Optional[ScrapeOptions],
+        plan: ScrapePlan,
+        poll_interval: float,
+        timeout: Optional[int],
+    ) -> None:
+        self.plan = plan
+        self._client = client
+        self._planner = planner
+        self._urls = urls
+        self._options = options
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+
+    def __aiter__(self) -> AsyncIterator[ScrapeUrlsResult]:
+        return self._run()
+
+    async def _run(self) -> AsyncIterator[ScrapeUrlsResult]:
+        plan = self.plan
+        started = time.monotonic()
+        if plan.strategy == "scrape_many":
+            finished = 0
+            async for item in async_scrape_methods.scrape_many(
+                self._client, self._urls, self._options, concurrency=plan.concurrency
+            ):
+                finished += 1
+                yield item
+            if finished:
+                elapsed = time.monotonic() - started
+                self._planner.observe_scrape_latency(elapsed * min(plan.concurrency, finished) / finished)
+            return
+
+        job_ids: List[str] = []
+        first = True
+        async for document in async_batch_methods.iter_large_batch(
+            self._client,
+            self._urls,
+            self._options,
+            chunk_size=plan.chunk_size,
+            poll_interval=self._poll_interval,
+            timeout=self._timeout,
+            max_chunks_in_flight=plan.concurrency,
+            on_progress=_job_tracker(job_ids),
+        ):
+            if first:
+                self._planner.observe_batch_first_result(time.monotonic() - started)
+                first = False
+            yield _source_url(document), document
+        for job_id in job_ids:
+            for item in _job_errors(await async_batch_methods.get_batch_scrape_errors(self._client, job_id)):
+                yield item
+
+
+def _log_plan(plan: ScrapePlan) -> None:
+    logger.debug("scrape_urls: %s for %d URLs (%s)", plan.strategy, plan.urls, plan.reason)
+
+
+def scrape_urls(
+    client: Any,
+    planner: ScrapePlanner,
+    urls: List[str],
+    options: Optional[ScrapeOptions] = None,
+    *,
+    strategy: Optional[str] = None,
+    poll_interval: float = 2,
+    timeout: Optional[int] = None,
+) -> ScrapeUrlsStream:
+    """Plan and return the result stream for ``urls`` (see ``FirecrawlClient.scrape_urls``)."""
+    urls = list(urls)
+    max_concurrency = concurrency = None
+    if strategy is None and urls:
+        try:
+            check = usage_methods.get_concurrency(client)
+            max_concurrency, concurrency = check.max_concurrency, check.concurrency
+        except Exception:
+            pass
+    plan = planner.plan(len(urls), max_concurrency, concurrency, strategy)
+    _log_plan(plan)
+    return ScrapeUrlsStream(client, planner, urls, options, plan, poll_interval, timeout)
+
+
+async def scrape_urls_async(
+    client: Any,
+    planner: ScrapePlanner,
+    urls: List[str],
+    options: Optional[ScrapeOptions] = None,
+    *,
+    strategy: Optional[str] = None,
+    poll_interval: float = 2,
+    timeout: Optional[int] = None,
+) -> AsyncScrapeUrlsStream:
+    """Async version of ``scrape_urls``."""
+    urls = list(urls)
+    max_concurrency = concurrency = None
+    if strategy is None and urls:
+        try:
+            check = await async_usage_methods.get_concurrency(client)
+            max_concurrency, concurrency = check.max_concurrency, check.concurrency
+        except Exception:
+            pass
+    plan = planner.plan(len(urls), max_concurrency, concurrency, strategy)
+    _log_plan(plan)
+    return AsyncScrapeUrlsStream(client, planner, urls, options, plan, poll_interval, timeout)
@@ -0,0 +1,357 @@
+"""
+Local, content-addressed store for crawl and batch scrape documents.
+
+DocumentStore keeps documents from many jobs in a directory:
+
+- ``segments/NNNNNN.seg``: append-only segment files of independently
+  zstd-compressed records, read back through ``mmap``
+- ``index.sqlite``: content hash -> (segment, offset, length), plus one row per
+  stored document mapping source URL and scrape_id to its content hash
+
+Records are keyed by a hash of the normalized document without per-scrape
+metadata (scrape_id, cache state, credits, ...), so a page that is unchanged
+across repeated crawls is compressed and written once; the per-scrape values
+live in the index row. Requires the optional ``zstandard`` dependency
+(``pip install firecrawl-py[store]``).
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .types import BatchScrapeJob, CrawlJob, Document, DocumentMetadata
+from .utils.normalize import normalize_document_dict
+
+
+def _require_zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "DocumentStore requires zstandard. Install it with `pip install firecrawl-py[store]`."
+        ) from exc
+    return zstandard
+
+
+# Metadata that changes on every scrape of an unchanged page; kept in the index
+# row instead of the content record so identical pages deduplicate.
+_VOLATILE_METADATA_FIELDS = frozenset({
+    "scrape_id",
+    "cache_state",
+    "cached_at",
+    "credits_used",
+    "proxy_used",
+    "concurrency_limited",
+    "concurrency_queue_duration_ms",
+})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    hash TEXT PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    raw_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT,
+    scrape_id TEXT,
+    hash TEXT NOT NULL REFERENCES records(hash),
+    job_id TEXT,
+    stored_at REAL NOT NULL,
+    volatile TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_url ON documents(url, id);
+CREATE INDEX IF NOT EXISTS documents_scrape_id ON documents(scrape_id);
+"""
+
+
+class DocumentStoreWriteResult(BaseModel):
+    """Outcome of adding documents to a DocumentStore."""
+
+    documents: int = 0
+    # Documents whose content was already stored (no new record written)
+    deduplicated: int = 0
+    compressed_bytes: int = 0
+
+
+class DocumentStoreStats(BaseModel):
+    """Size of a DocumentStore."""
+
+    documents: int
+    records: int
+    segments: int
+    raw_bytes: int
+    compressed_bytes: int
+
+
+def _document_dict(doc: Union[Document, Dict[str, Any]]) -> Dict[str, Any]:
+    """Snake_case dict for a Document or a raw (raw=True / raw="api") document dict."""
+    if isinstance(doc, Document):
+        return doc.model_dump(exclude_none=True)
+    out = {k: v for k, v in normalize_document_dict(doc).items() if v is not None}
+    md = out.get("metadata")
+    if isinstance(md, dict):
+        md = {k: v for k, v in md.items() if v is not None}
+        # Same list -> scalar coercions DocumentMetadata applies to typed documents
+        DocumentMetadata.coerce_lists_for_string_fields(md)
+        out["metadata"] = md
+    return out
+
+
+def _split_volatile(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    md = doc.get("metadata")
+    if not isinstance(md, dict):
+        return doc, {}
+    volatile = {k: md[k] for k in _VOLATILE_METADATA_FIELDS if k in md}
+    if not volatile:
+        return doc, {}
+    content = dict(doc)
+    content["metadata"] = {k: v for k, v in md.items() if k not in _VOLATILE_METADATA_FIELDS}
+    return content, volatile
+
+
+def _job_documents(job: Union[CrawlJob, BatchScrapeJob, Dict[str, Any]]) -> List[Any]:
+    if isinstance(job, dict):
+        return list(job.get("data") or [])
+    return list(job.data or [])
+
+
+class DocumentStore:
+    """
+    Deduplicating, compressed on-disk store of scraped documents with random
+    access by source URL or scrape_id.
+
+    A store directory should be written by one process at a time.
+
+    Example:
+        with DocumentStore("./crawl-archive") as store:
+            store.add_job(client.get_crawl_status(job_id), job_id=job_id)
+            doc = store.get("https://example.com/pricing")
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        level: int = 3,
+        segment_size: int = 256 * 1024 * 1024,
+    ):
+        """
+        Args:
+            path: Store directory (created if missing)
+            level: zstd compression level
+            segment_size: Size in bytes after which a new segment file is started
+        """
+        zstandard = _require_zstandard()
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        self.path = Path(path)
+        self._segments_dir = self.path / "segments"
+        self._segments_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._db = sqlite3.connect(str(self.path / "index.sqlite"))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._maps: Dict[int, Tuple[Any, mmap.mmap]] = {}
+
+        row = self._db.execute("SELECT MAX(segment) FROM records").fetchone()
+        self._segment = row[0] if row[0] is not None else 0
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._segments_dir / f"{segment:06d}.seg"
+
+    def __enter__(self) -> "DocumentStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush and close the segment files and the index."""
+        for handle, mapped in self._maps.values():
+            mapped.close()
+            handle.close()
+        self._maps.clear()
+        if not self._writer.closed:
+            self._writer.close()
+        self._db.close()
+
+    def add(
+        self, documents: Iterable[Union[Document, Dict[str, Any]]], *, job_id: Optional[str] = None
+    ) -> DocumentStoreWriteResult:
+        """
+        Store documents, writing a compressed record only for content not seen before.
+
+        Args:
+            documents: Document models or raw document dicts (raw=True or raw="api")
+            job_id: Optional job ID recorded with each document
+
+        Returns:
+            DocumentStoreWriteResult
+        """
+        result = DocumentStoreWriteResult()
+        rows = []
+        now = time.time()
+        writer = self._writer
+        try:
+            for doc in documents:
+                if doc is None:
+                    continue
+                content, volatile = _split_volatile(_document_dict(doc))
+                encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str).encode()
+                digest = hashlib.sha256(encoded).hexdigest()
+                if self._db.execute("SELECT 1 FROM records WHERE hash = ?", (digest,)).fetchone():
+                    result.deduplicated += 1
+                else:
+                    if writer.tell() >= self.segment_size:
+                        writer = self._rotate()
+                    compressed = self._compressor.compress(encoded)
+                    offset = writer.tell()
+                    writer.write(compressed)
+                    self._db.execute(
+                        "INSERT INTO records (hash, segment, offset, length, raw_size) VALUES (?, ?, ?, ?, ?)",
+                        (digest, self._segment, offset, len(compressed), len(encoded)),
+                    )
+                    result.compressed_bytes += len(compressed)
+                md = content.get("metadata") or {}
+                url = md.get("source_url") or md.get("url")
+                rows.append((url, volatile.get("scrape_id"), digest, job_id, now, json.dumps(volatile) if volatile else None))
+                result.documents += 1
+            # Records must be on disk before the index points at them
+            writer.flush()
+            self._db.executemany(
+                "INSERT INTO documents (url, scrape_id, hash, job_id, stored_at, volatile) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.commit()
+        except BaseException:
+            # Bytes already appended to the segment stay unreferenced
+            self._db.rollback()
+            raise
+        return result
+
+    def add_job(
+        self, job: Union[CrawlJob, BatchScrapeJob, Dict[str, Any]], *, job_id: Optional[str] = None
+    ) -> DocumentStoreWriteResult:
+        """
+        Store the documents of a job status page.
+
+        Args:
+            job: CrawlJob/BatchScrapeJob, or a raw job dict with a ``data`` list
+            job_id: Optional job ID recorded with each document
+
+        Returns:
+            DocumentStoreWriteResult
+        """
+        return self.add(_job_documents(job), job_id=job_id)
+
+    def _rotate(self):
+        self._writer.close()
+        self._segment += 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+        return self._writer
+
+    def _read(self, segment: int, offset: int, length: int) -> bytes:
+        entry = self._maps.get(segment)
+        if entry is None or len(entry[1]) < offset + length:
+            # Map (or re-map, if the active segment has grown) the segment file
+            if entry is not None:
+                entry[1].close()
+                entry[0].close()
+            handle = open(self._segment_path(segment), "rb")
+            entry = (handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+            self._maps[segment] = entry
+        return self._decompressor.decompress(entry[1][offset:offset + length])
+
+    def _load(self, row: Optional[Tuple[Any, ...]], raw: bool) -> Optional[Union[Document, Dict[str, Any]]]:
+        if row is None:
+            return None
+        segment, offset, length, volatile = row
+        doc = json.loads(self._read(segment, offset, length))
+        if volatile:
+            doc.setdefault("metadata", {}).update(json.loads(volatile))
+        return doc if raw else Document.model_validate(doc)
+
+    _LOOKUP = (
+        "SELECT r.segment, r.offset, r.length, d.volatile FROM documents d "
+        "JOIN records r ON r.hash = d.hash WHERE d.{column} = ? ORDER BY d.id DESC LIMIT 1"
+    )
+
+    def get(self, url: str, *, raw: bool = False) -> Optional[Union[Document, Dict[str, Any]]]:
+        """
+        Return the most recently stored version of a page.
+
+        Args:
+            url: Source URL of the page
+            raw: Return a snake_case dict instead of a Document
+
+        Returns:
+            Document (or dict), or None if the URL is not stored
+        """
+        return self._load(self._db.execute(self._LOOKUP.format(column="url"), (url,)).fetchone(), raw)
+
+    def get_by_scrape_id(self, scrape_id: str, *, raw: bool = False) -> Optional[Union[Document, Dict[str, Any]]]:
+        """
+        Return the document stored for a scrape_id.
+
+        Args:
+            scrape_id: ``metadata.scrape_id`` of the document
+            raw: Return a snake_case dict instead of a Document
+
+        Returns:
+            Document (or dict), or None if not stored
+        """
+        return self._load(self._db.execute(self._LOOKUP.format(column="scrape_id"), (scrape_id,)).fetchone(), raw)
+
+    def versions(self, url: str) -> List[Dict[str, Any]]:
+        """
+        List the stored scrapes of a page, oldest first.
+
+        Returns:
+            Dicts with scrape_id, job_id, stored_at and content_hash; consecutive
+            entries with the same content_hash are unchanged page content
+        """
+        rows = self._db.execute(
+            "SELECT scrape_id, job_id, stored_at, hash FROM documents WHERE url = ? ORDER BY id", (url,)
+        ).fetchall()
+        return [
+            {"scrape_id": scrape_id, "job_id": job_id, "stored_at": stored_at, "content_hash": digest}
+            for scrape_id, job_id, stored_at, digest in rows
+        ]
+
+    def urls(self) -> Iterator[str]:
+        """Iterate over the distinct stored source URLs."""
+        for (url,) in self._db.execute("SELECT DISTINCT url FROM documents WHERE url IS NOT NULL"):
+            yield url
+
+    def __contains__(self, url: object) -> bool:
+        return self._db.execute("SELECT 1 FROM documents WHERE url = ? LIMIT 1", (url,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    @property
+    def stats(self) -> DocumentStoreStats:
+        """Document, record and byte counts."""
+        records, raw_bytes, compressed = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(length), 0) FROM records"
+        ).fetchone()
+        return DocumentStoreStats(
+            documents=len(self),
+            records=records,
+            segments=self._segment + 1,
+            raw_bytes=raw_bytes,
+            compressed_bytes=compressed,
+        )
@@ -4,13 +4,16 @@ Type definitions for Firecrawl v2 API.
 This module contains clean, modern type definitions for the v2 API.
 """
 
+import re
 import warnings
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Literal, Optional, Tuple, TypeVar, Union
 import logging
 from pydantic import (
     BaseModel,
     Field,
+    PrivateAttr,
+    TypeAdapter,
     field_validator,
     ValidationError,
     model_serializer,
@@ -57,6 +60,49 @@ class BaseResponse(BaseModel, Generic[T]):
 
 
 # Document and content types
+
+# DocumentMetadata fields that hold a single string (lists are joined) or an int
+# (lists take the first value); built once rather than per validation
+_METADATA_SINGLE_STRING_FIELDS = frozenset({
+    "title",
+    "description",
+    "url",
+    "language",
+    "robots",
+    "og_title",
+    "og_description",
+    "og_url",
+    "og_image",
+    "og_audio",
+    "og_determiner",
+    "og_locale",
+    "og_site_name",
+    "og_video",
+    "favicon",
+    "dc_terms_created",
+    "dc_date_created",
+    "dc_date",
+    "dc_terms_type",
+    "dc_type",
+    "dc_terms_audience",
+    "dc_terms_subject",
+    "dc_subject",
+    "dc_description",
+    "dc_terms_keywords",
+    "modified_time",
+    "published_time",
+    "article_tag",
+    "article_section",
+    "source_url",
+    "scrape_id",
+    "content_type",
+    "cached_at",
+    "error",
+    "timezone",
+})
+_METADATA_INT_FIELDS = frozenset({"status_code", "num_pages", "credits_used"})
+
+
 class DocumentMetadata(BaseModel):
     """Metadata for scraped documents (snake_case only; API camelCase normalized in code)."""
 
@@ -159,69 +205,17 @@ class DocumentMetadata(BaseModel):
         """
         if not isinstance(data, dict):
             return data
-        single_str_fields = {
-            "title",
-            "description",
-            "url",
-            "language",
-            "robots",
-            "og_title",
-            "og_description",
-            "og_url",
-            "og_image",
-            "og_audio",
-            "og_determiner",
-            "og_locale",
-            "og_site_name",
-            "og_video",
-            "favicon",
-            "dc_terms_created",
-            "dc_date_created",
-            "dc_date",
-            "dc_terms_type",
-            "dc_type",
-            "dc_terms_audience",
-            "dc_terms_subject",
-            "dc_subject",
-            "dc_description",
-            "dc_terms_keywords",
-            "modified_time",
-            "published_time",
-            "article_tag",
-            "article_section",
-            "source_url",
-            "scrape_id",
-            "content_type",
-            "cached_at",
-            "error",
-            "timezone",
-        }
-        for k, v in list(data.items()):
-            if isinstance(v, list) and k in single_str_fields:
+        for k, v in data.items():
+            if not isinstance(v, list):
+                continue
+            if k in _METADATA_SINGLE_STRING_FIELDS:
                 data[k] = cls._coerce_list_to_string(v)
             # For ints that might appear as list, take first
-            if isinstance(v, list) and k in {
-                "status_code",
-                "num_pages",
-                "credits_used",
-            }:
+            elif k in _METADATA_INT_FIELDS:
                 first = v[0] if v else None
                 data[k] = cls._coerce_string_to_int(first)
         return data
 
-    @field_validator(
-        "robots",
-        "og_title",
-        "og_description",
-        "og_url",
-        "og_image",
-        "language",
-        mode="before",
-    )
-    @classmethod
-    def coerce_lists_to_string_fields(cls, v):
-        return cls._coerce_list_to_string(v)
-
     @field_validator("status_code", mode="before")
     @classmethod
     def coerce_status_code_to_int(cls, v):
@@ -279,6 +273,9 @@ class Document(BaseModel):
     change_tracking: Optional[Dict[str, Any]] = None
     branding: Optional[BrandingProfile] = None
 
+    # Decoded screenshot/action bytes keyed by reference (AssetStore in-memory mode)
+    _assets: Optional[Dict[str, bytes]] = PrivateAttr(default=None)
+
     @property
     def metadata_typed(self) -> DocumentMetadata:
         """Always returns a DocumentMetadata instance for LSP-friendly access."""
@@ -309,6 +306,141 @@ class Document(BaseModel):
             return {k: v for k, v in md.items() if v is not None}
         return {}
 
+    def asset_bytes(self, value: Optional[str]) -> Optional[bytes]:
+        """
+        Decode a screenshot or action output value (e.g. ``actions["screenshots"][0]``) to bytes.
+
+        Resolves AssetStore references, ``file://`` URIs, data URLs and bare base64
+        on demand. Returns None for missing values and hosted URLs.
+        """
+        from .utils.assets import read_asset
+
+        return read_asset(value, self._assets)
+
+    def screenshot_bytes(self) -> Optional[bytes]:
+        """Return the screenshot as bytes (None when absent or a hosted URL)."""
+        return self.asset_bytes(self.screenshot)
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler):
+        # LazyDocument keeps some fields unparsed; make sure they are present
+        # before dumping, including when nested inside CrawlJob/BatchScrapeJob.
+        self._materialize()
+        return handler(self)
+
+    def _materialize(self) -> None:
+        """Hook for subclasses that defer parsing of some fields."""
+
+
+# Fields whose parsing LazyDocument defers until first access
+_LAZY_DOCUMENT_FIELDS = frozenset({"metadata", "branding", "change_tracking"})
+
+
+class LazyDocument(Document):
+    """
+    A Document whose metadata, branding and change_tracking are kept as the raw
+    API payload and only normalized/validated on first access.
+
+    Behaves like a regular Document: attribute access, model_dump, equality,
+    copying and pickling all see the fully parsed values. Only ``__dict__``
+    reflects the not-yet-parsed state, and validation errors for the deferred
+    fields surface on first access rather than at construction.
+    """
+
+    _pending: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def from_pending(cls, data: Dict[str, Any], pending: Dict[str, Any]) -> "LazyDocument":
+        """
+        Build a document from already-normalized eager fields plus raw API values
+        for the deferred fields.
+
+        Args:
+            data: snake_case values for the non-deferred Document fields
+            pending: Raw API values keyed by deferred field name
+
+        Returns:
+            LazyDocument
+        """
+        return cls.model_validate(data)._defer(pending)
+
+    def _defer(self, pending: Dict[str, Any]) -> "LazyDocument":
+        """Attach raw API values for the deferred fields to a validated document."""
+        for name in _LAZY_DOCUMENT_FIELDS:
+            self.__dict__.pop(name, None)
+        self.__pydantic_private__["_pending"] = pending
+        self.__pydantic_fields_set__.update(pending)
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _LAZY_DOCUMENT_FIELDS:
+            return self._materialize_field(name)
+        return super().__getattr__(name)
+
+    def _materialize_field(self, name: str) -> Any:
+        pending = self.__pydantic_private__["_pending"]
+        if name in pending:
+            from .utils.normalize import normalize_deferred_field
+
+            value = normalize_deferred_field(name, pending[name])
+            # Validate against the field's own type, as Document(**data) would
+            value = _LAZY_FIELD_ADAPTERS[name].validate_python(value)
+        else:
+            value = None
+        self.__dict__[name] = value
+        return value
+
+    def _raw_value(self, name: str) -> Tuple[bool, Any]:
+        """Return (True, raw API value) if ``name`` has not been parsed yet."""
+        if name in self.__dict__:
+            return False, None
+        return True, self.__pydantic_private__["_pending"].get(name)
+
+    def _materialize(self) -> None:
+        if len(self.__dict__) == len(type(self).model_fields):
+            return
+        for name in _LAZY_DOCUMENT_FIELDS:
+            if name not in self.__dict__:
+                self._materialize_field(name)
+        self.__pydantic_private__["_pending"] = {}
+        values = self.__dict__
+        # Restore declaration order so repr/iteration match a regular Document
+        for name in type(self).model_fields:
+            values[name] = values.pop(name)
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare by field values so a LazyDocument equals the equivalent Document
+        if not isinstance(other, Document):
+            return NotImplemented
+        self._materialize()
+        other._materialize()
+        return self.__dict__ == other.__dict__
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        self._materialize()
+        return super().__getstate__()
+
+    def __copy__(self):
+        self._materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        self._materialize()
+        return super().__deepcopy__(memo)
+
+
+_LAZY_FIELD_ADAPTERS = {
+    name: TypeAdapter(Document.model_fields[name].annotation) for name in _LAZY_DOCUMENT_FIELDS
+}
+
 
 # Webhook types
 class WebhookConfig(BaseModel):
@@ -346,6 +478,13 @@ class WebhookData(BaseModel):
     total: Optional[int] = None
     data: Optional[List[Document]] = None
     error: Optional[str] = None
+    # Delivery envelope: event type (e.g. "crawl.page"), delivery id, and
+    # non-document results (extract and agent events)
+    type: Optional[str] = None
+    webhook_id: Optional[str] = None
+    success: Optional[bool] = None
+    metadata: Optional[Dict[str, Any]] = None
+    results: Optional[List[Any]] = None
 
 
 class Source(BaseModel):
@@ -706,6 +845,10 @@ class BatchScrapeResponse(BaseModel):
     id: str
     url: str
     invalid_urls: Optional[List[str]] = None
+    # Duplicate URLs dropped before submission (set when dedupe is enabled)
+    collapsed_urls: Optional[int] = None
+    # URLs left out because the negative cache lists them or their host as failing
+    skipped_urls: Optional[List[str]] = None
 
 
 class BatchScrapeJob(BaseModel):
@@ -720,6 +863,120 @@ class BatchScrapeJob(BaseModel):
     data: List[Document] = []
 
 
+class LargeBatchChunkProgress(BaseModel):
+    """Progress of one chunk job of a large batch scrape."""
+
+    index: int
+    urls: int
+    job_id: Optional[str] = None
+    status: Literal["pending", "scraping", "completed", "failed", "cancelled"] = "pending"
+    completed: int = 0
+    total: int = 0
+    documents: int = 0
+    # Failed URLs appended back to the chunk's job under a retry policy
+    resubmitted: int = 0
+    credits_used: Optional[int] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class BatchRetryPolicy(BaseModel):
+    """Resubmission of transiently failed URLs to the batch job they failed in.
+
+    Errors are matched against ``retryable`` (error code and message, case
+    insensitive); by default timeouts, proxy errors, engine exhaustion and 5xx
+    statuses are retried, while robots blocks, DNS and other 4xx failures are not.
+    """
+
+    # Total attempts per URL, the first submission included
+    max_attempts: int = Field(default=3, ge=1)
+    # Options set here override the job's options for resubmitted URLs, e.g. ScrapeOptions(proxy="stealth")
+    escalate: Optional[ScrapeOptions] = None
+    retryable: str = r"timeout|timed out|proxy|all.engines.failed|econnreset|socket hang up|\b5\d\d\b"
+    # Seconds to wait for a resubmitted URL's document or error. Appending to a
+    # finished job leaves it "completed", so waiting continues past that status
+    settle_timeout: float = Field(default=300, gt=0)
+
+    def is_retryable(self, error: "CrawlError") -> bool:
+        return re.search(self.retryable, f"{error.code or ''} {error.error}", re.IGNORECASE) is not None
+
+    def retry_options(self, options: Optional[ScrapeOptions]) -> Optional[ScrapeOptions]:
+        """Options for resubmitted URLs: ``options`` with the escalated fields applied."""
+        if self.escalate is None:
+            return options
+        if options is None:
+            return self.escalate
+        return options.model_copy(update={name: getattr(self.escalate, name) for name in self.escalate.model_fields_set})
+
+
+class ScrapeManyProgress(BaseModel):
+    """Progress of a scrape_many fan-out, reported after every finished URL."""
+
+    total: int
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    in_flight: int = 0
+
+
+class ScrapePlan(BaseModel):
+    """Strategy chosen by scrape_urls for a URL list, with the estimates behind it."""
+
+    strategy: Literal["scrape_many", "batch", "large_batch"]
+    urls: int
+    # Scrapes in flight for scrape_many; chunk jobs in flight otherwise
+    concurrency: int
+    chunk_size: Optional[int] = None
+    max_concurrency: Optional[int] = None
+    # Team concurrency not in use when the plan was made
+    headroom: Optional[int] = None
+    estimated_fan_out_seconds: float
+    estimated_batch_seconds: float
+    reason: str
+
+
+class WatcherSummary(BaseModel):
+    """Counters kept by a streaming Watcher/AsyncWatcher in place of the full document list."""
+
+    job_id: str
+    kind: Literal["crawl", "batch"]
+    status: str
+    # Documents received over the websocket (and dispatched/yielded)
+    documents: int = 0
+    completed: int = 0
+    total: int = 0
+    credits_used: Optional[int] = None
+    duration_seconds: float = 0.0
+    # Websocket reconnects performed while watching
+    reconnects: int = 0
+
+
+class WatcherDispatchStats(BaseModel):
+    """Counters of a Watcher's executor-backed listener dispatch."""
+
+    dispatched: int = 0
+    pending: int = 0
+    max_pending: int = 0
+    # Time between an event being queued and its listeners starting
+    total_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    # Time the websocket reader waited for room in the full event queue
+    blocked_seconds: float = 0.0
+
+
+class WatcherQueueStats(BaseModel):
+    """Flow-control counters of an AsyncWatcher's snapshot queue."""
+
+    # Largest number of snapshots held in memory at once
+    max_depth: int = 0
+    # Snapshots merged into a queued one because the queue was full ("coalesce")
+    coalesced: int = 0
+    # Snapshots written to the temporary spill file because the queue was full ("spill")
+    spilled: int = 0
+    # Time the receiver spent waiting for the consumer ("block")
+    blocked_seconds: float = 0.0
+
+
 class BatchScrapeStatusRequest(BaseModel):
     """Request to get batch scrape job status."""
 
@@ -1179,6 +1436,14 @@ class ActiveCrawlsRequest(BaseModel):
 
 
 # Configuration types
+
+# Result shape for document-returning calls:
+# - False: typed pydantic models (default)
+# - True: plain snake_case dicts, no model validation
+# - "api": the untouched camelCase API payload
+RawMode = Union[bool, Literal["api"]]
+
+
 class ClientConfig(BaseModel):
     """Configuration for the Firecrawl client."""
 
@@ -1187,6 +1452,7 @@ class ClientConfig(BaseModel):
     timeout: Optional[float] = None
     max_retries: int = 3
     backoff_factor: float = 0.5
+    raw: RawMode = False
 
 
 class PaginationConfig(BaseModel):
@@ -0,0 +1,237 @@
+"""
+Binary asset handling for base64 screenshots and action outputs.
+
+Screenshots and ``actions`` outputs (screenshots, PDFs) can arrive as
+multi-megabyte base64 strings. With an AssetStore configured, these payloads
+are decoded once during normalization and replaced on the Document by a short
+reference:
+
+- in-memory mode keeps the decoded bytes on the Document and leaves a
+  ``firecrawl-asset:sha256:<digest>`` reference in the field
+- directory mode streams the decoded bytes into a content-addressed directory
+  (``<dir>/<digest[:2]>/<digest>.<ext>``) and leaves a ``file://`` URI
+
+``Document.screenshot_bytes()`` and ``Document.asset_bytes()`` resolve either
+reference (as well as untouched data URLs and bare base64) on demand.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+ASSET_REF_PREFIX = "firecrawl-asset:sha256:"
+
+# Action output lists that may carry base64 payloads
+_ACTION_ASSET_KEYS = ("screenshots", "pdfs")
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]+={0,2}")
+_URL_PREFIXES = ("http://", "https://", "file:", ASSET_REF_PREFIX)
+_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "application/pdf": ".pdf",
+}
+# Base64 characters decoded per write in directory mode (multiple of 4)
+_STREAM_CHUNK = 256 * 1024
+
+
+def _split_base64(value: str, min_size: int) -> Optional[Tuple[str, Optional[str]]]:
+    """Return (base64 payload, media type) if ``value`` is a base64 asset, else None."""
+    if len(value) < min_size or value.startswith(_URL_PREFIXES):
+        return None
+    if value.startswith("data:"):
+        header, sep, payload = value.partition(",")
+        if not sep or not header.endswith(";base64"):
+            return None
+        media_type = header[5:-7].split(";", 1)[0] or None
+        return payload, media_type
+    if _BASE64_RE.fullmatch(value):
+        return value, None
+    return None
+
+
+class AssetStore:
+    """
+    Where decoded base64 screenshots and action outputs are kept.
+
+    Pass an instance as ``asset_store=`` to FirecrawlClient or
+    AsyncFirecrawlClient to enable binary-asset handling.
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None, *, min_size: int = 1024):
+        """
+        Args:
+            directory: Content-addressed directory to write decoded assets to; when
+                omitted, decoded bytes are kept in memory on each Document
+            min_size: Base64 strings shorter than this many characters are left inline
+        """
+        if min_size < 0:
+            raise ValueError("min_size must be non-negative")
+        self.directory = Path(directory).resolve() if directory is not None else None
+        self.min_size = min_size
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _store(self, value: Any, blobs: Dict[str, bytes], inline_bytes: bool) -> Any:
+        """Return the replacement for a field value, or ``value`` itself if it is not an asset."""
+        if isinstance(value, (bytes, bytearray)):
+            # Already decoded upstream (e.g. watcher raw data in in-memory mode)
+            if self.directory is not None:
+                return self._write_bytes(bytes(value), None)
+            if inline_bytes:
+                return value
+            ref = ASSET_REF_PREFIX + hashlib.sha256(value).hexdigest()
+            blobs[ref] = bytes(value)
+            return ref
+        if not isinstance(value, str):
+            return value
+        split = _split_base64(value, self.min_size)
+        if split is None:
+            return value
+        payload, media_type = split
+        try:
+            if self.directory is not None:
+                return self._write_base64(payload, media_type)
+            data = base64.b64decode(payload, validate=True)
+        except (binascii.Error, ValueError):
+            return value
+        if inline_bytes:
+            return data
+        ref = ASSET_REF_PREFIX + hashlib.sha256(data).hexdigest()
+        blobs[ref] = data
+        return ref
+
+    def _target(self, digest: str, media_type: Optional[str]) -> Path:
+        assert self.directory is not None
+        return self.directory / digest[:2] / f"{digest}{_EXTENSIONS.get(media_type or '', '.bin')}"
+
+    def _commit(self, tmp_path: str, digest: str, media_type: Optional[str]) -> str:
+        target = self._target(digest, media_type)
+        if target.exists():
+            os.unlink(tmp_path)
+        else:
+            target.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, target)
+        return target.as_uri()
+
+    def _write_base64(self, payload: str, media_type: Optional[str]) -> str:
+        # Decode chunk by chunk into a temp file so the full decoded buffer never exists
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                for start in range(0, len(payload), _STREAM_CHUNK):
+                    chunk = base64.b64decode(payload[start:start + _STREAM_CHUNK], validate=True)
+                    digest.update(chunk)
+                    fh.write(chunk)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return self._commit(tmp_path, digest.hexdigest(), media_type)
+
+    def _write_bytes(self, data: bytes, media_type: Optional[str]) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        target = self._target(digest, media_type)
+        if target.exists():
+            return target.as_uri()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        return self._commit(tmp_path, digest, media_type)
+
+
+def externalize_assets(
+    doc: Dict[str, Any], store: AssetStore, *, inline_bytes: bool = False
+) -> Tuple[Dict[str, Any], Optional[Dict[str, bytes]]]:
+    """
+    Replace base64 screenshot and action payloads in a raw document dict.
+
+    Args:
+        doc: Document dict (API or snake_case keys); not mutated
+        store: Asset store deciding where decoded bytes go
+        inline_bytes: In in-memory mode, put the decoded bytes directly in the
+            returned dict instead of a reference (for plain-dict results)
+
+    Returns:
+        (document dict, decoded bytes keyed by reference or None)
+    """
+    blobs: Dict[str, bytes] = {}
+    out = doc
+    screenshot = doc.get("screenshot")
+    if screenshot is not None:
+        replaced = store._store(screenshot, blobs, inline_bytes)
+        if replaced is not screenshot:
+            out = dict(doc)
+            out["screenshot"] = replaced
+    actions = doc.get("actions")
+    if isinstance(actions, dict):
+        new_actions = None
+        for key in _ACTION_ASSET_KEYS:
+            values = actions.get(key)
+            if not isinstance(values, list):
+                continue
+            replaced_values = [store._store(v, blobs, inline_bytes) for v in values]
+            if any(new is not old for new, old in zip(replaced_values, values)):
+                if new_actions is None:
+                    new_actions = dict(actions)
+                new_actions[key] = replaced_values
+        if new_actions is not None:
+            if out is doc:
+                out = dict(doc)
+            out["actions"] = new_actions
+    return out, blobs or None
+
+
+def externalize_raw_documents(docs: List[Any], store: Optional[AssetStore]) -> List[Any]:
+    """
+    Apply an AssetStore to raw document dicts kept by watchers, so their
+    accumulated data holds decoded bytes or file references instead of base64.
+    """
+    if store is None:
+        return docs
+    return [externalize_assets(doc, store, inline_bytes=True)[0] if isinstance(doc, dict) else doc for doc in docs]
+
+
+def read_asset(value: Any, blobs: Optional[Dict[str, bytes]] = None) -> Optional[bytes]:
+    """
+    Resolve a screenshot or action output value to bytes.
+
+    Args:
+        value: Asset reference, ``file://`` URI, data URL, bare base64 string or bytes
+        blobs: In-memory assets of the owning Document
+
+    Returns:
+        The decoded bytes, or None for missing values and hosted (http/https) URLs
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    if not isinstance(value, str) or value.startswith(("http://", "https://")):
+        return None
+    if value.startswith(ASSET_REF_PREFIX):
+        if blobs is None or value not in blobs:
+            raise KeyError(f"Asset {value} is not attached to this document")
+        return blobs[value]
+    if value.startswith("file:"):
+        return Path(unquote(urlparse(value).path)).read_bytes()
+    split = _split_base64(value, 0)
+    if split is None:
+        return None
+    try:
+        return base64.b64decode(split[0], validate=True)
+    except (binascii.Error, ValueError):
+        return None
+
+
+def asset_store_of(client: Any) -> Optional[AssetStore]:
+    """Return the AssetStore configured on an HTTP client, if any."""
+    store = getattr(client, "asset_store", None)
+    return store if isinstance(store, AssetStore) else None
@@ -0,0 +1,299 @@
+"""
+Learned per-domain scrape options.
+
+Some sites only return content with ``proxy="stealth"``, a longer
+``wait_for`` or ``mobile=True``. DomainProfiles records, per host, how each
+option set fared on earlier scrapes and how long successful scrapes took.
+``suggest`` returns the cheapest option set that works on a URL's host; with
+``apply=True`` (the default) ``scrape`` and ``scrape_many`` fill the options a
+call leaves unset with it:
+
+- option sets are considered in ``ladder`` order, cheapest first; a set is
+  passed over once it failed ``min_failures`` times and succeeds less often
+  than ``min_success_rate``. The cheapest set that has worked is suggested;
+  while none has, the cheapest one not yet passed over
+- a scrape fails when the API reports a site error (unsupported website,
+  timeout, 5xx), the page comes back with a 401/403/429/5xx status, or it
+  has no content; with ``proxy="auto"``, ``metadata.proxy_used == "stealth"``
+  also counts as a failure of the basic proxy
+- once ``min_samples`` scrapes succeeded, ``timeout`` is set to the host's
+  p95 latency times ``timeout_margin``
+
+Profiles are JSON records in a response cache backend, so a
+SQLiteCacheBackend keeps them across restarts and shares them between the
+processes of a machine.
+"""
+
+import hashlib
+import json
+import math
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, ValidationError
+
+from ..types import ScrapeOptions
+from .error_handler import FirecrawlError, RequestTimeoutError
+from .negative_cache import KnownFailureError, page_status
+from .response_cache import CacheBackend, MemoryCacheBackend
+
+# Option sets tried on a host, cheapest first
+DEFAULT_LADDER: Tuple[Dict[str, Any], ...] = (
+    {},
+    {"wait_for": 3000},
+    {"mobile": True},
+    {"proxy": "stealth"},
+    {"proxy": "stealth", "wait_for": 3000},
+)
+
+# API errors that say nothing about the site (bad request, auth, billing, conflicts, rate limits)
+_NEUTRAL_STATUSES = frozenset({400, 401, 402, 409, 429})
+
+_CONTENT_FIELDS = ("markdown", "html", "rawHtml", "raw_html", "summary", "json", "links", "screenshot", "images")
+
+
+def option_key(options: Mapping[str, Any]) -> str:
+    """The profile bucket of snake_case scrape options: proxy tier, wait_for and mobile."""
+    stealth = options.get("proxy") in ("stealth", "enhanced")
+    return json.dumps(
+        {
+            "mobile": bool(options.get("mobile")),
+            "proxy": "stealth" if stealth else "basic",
+            "wait_for": int(options.get("wait_for") or 0),
+        },
+        sort_keys=True,
+    )
+
+
+class OptionStats(BaseModel):
+    """Outcomes of one option set on one host."""
+
+    attempts: int = 0
+    successes: int = 0
+
+    @property
+    def failures(self) -> int:
+        return self.attempts - self.successes
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+
+class DomainProfile(BaseModel):
+    """What is known about scraping one host."""
+
+    host: str
+    # Outcomes keyed by option_key()
+    options: Dict[str, OptionStats] = {}
+    # Seconds taken by recent successful scrapes (and by timed out ones), newest last
+    latencies: List[float] = []
+
+    def p95_latency(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class DomainProfiles:
+    """
+    Per-host record of which scrape options work and how long scrapes take.
+
+    Pass an instance as ``domain_profiles=`` to FirecrawlClient or
+    AsyncFirecrawlClient; outcomes of ``scrape`` and ``scrape_many`` are
+    recorded automatically.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        apply: bool = True,
+        ladder: Sequence[Mapping[str, Any]] = DEFAULT_LADDER,
+        min_success_rate: float = 0.5,
+        min_failures: int = 2,
+        min_samples: int = 5,
+        timeout_margin: float = 1.5,
+        min_timeout: int = 10_000,
+        max_timeout: int = 120_000,
+        max_latencies: int = 50,
+        ttl: float = 30 * 86400.0,
+    ) -> None:
+        """
+        Args:
+            backend: Where profiles are kept (default: a 4 MB MemoryCacheBackend)
+            apply: Fill unset options of each scrape from the host's profile;
+                when False, profiles are only recorded and read via ``suggest``
+            ladder: Option sets (snake_case ScrapeOptions fields) to consider,
+                cheapest first
+            min_success_rate: Success rate at which an option set is kept
+            min_failures: Failures before an option set is passed over
+            min_samples: Latency samples needed before a timeout is suggested
+            timeout_margin: Factor applied to the p95 latency
+            min_timeout: Lower bound for a suggested timeout, in milliseconds
+            max_timeout: Upper bound for a suggested timeout, in milliseconds
+            max_latencies: Latency samples kept per host
+            ttl: Seconds a host's profile is kept after its last scrape
+        """
+        if not ladder:
+            raise ValueError("ladder must contain at least one option set")
+        if not 0 < min_success_rate <= 1:
+            raise ValueError("min_success_rate must be in (0, 1]")
+        if min_failures < 1:
+            raise ValueError("min_failures must be at least 1")
+        self.backend = backend if backend is not None else MemoryCacheBackend(4 * 1024 * 1024)
+        self.apply = apply
+        self.ladder = [dict(options) for options in ladder]
+        self.min_success_rate = min_success_rate
+        self.min_failures = min_failures
+        self.min_samples = min_samples
+        self.timeout_margin = timeout_margin
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.max_latencies = max_latencies
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(host: str) -> str:
+        canonical = json.dumps(["profile", host], separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def profile(self, url: str) -> DomainProfile:
+        """The profile of the host of ``url`` (a URL or a bare host)."""
+        host = _host_of(url)
+        content = self.backend.get(self._key(host))
+        if content is not None:
+            try:
+                return DomainProfile.model_validate_json(content)
+            except ValidationError:
+                self.backend.delete(self._key(host))
+        return DomainProfile(host=host)
+
+    def forget(self, url: str) -> None:
+        self.backend.delete(self._key(_host_of(url)))
+
+    def _suggested_fields(self, url: str) -> Dict[str, Any]:
+        profile = self.profile(url)
+        chosen = self._cheapest_working(profile)
+        fields = dict(chosen)
+        p95 = profile.p95_latency()
+        if p95 is not None and len(profile.latencies) >= self.min_samples:
+            timeout = math.ceil(p95 * self.timeout_margin * 1000)
+            fields["timeout"] = max(self.min_timeout, min(timeout, self.max_timeout))
+        return fields
+
+    def _passed_over(self, stats: OptionStats) -> bool:
+        return stats.failures >= self.min_failures and stats.success_rate < self.min_success_rate
+
+    def _cheapest_working(self, profile: DomainProfile) -> Dict[str, Any]:
+        stats = [(options, profile.options.get(option_key(options))) for options in self.ladder]
+        for options, seen in stats:
+            if seen is not None and seen.successes and not self._passed_over(seen):
+                return options
+        for options, seen in stats:
+            if seen is None or not self._passed_over(seen):
+                return options
+        # Every option set is failing; stay with the one that fails least
+        return max(stats, key=lambda item: item[1].success_rate)[0]
+
+    def suggest(self, url: str) -> Optional[ScrapeOptions]:
+        """Cheapest working options (and timeout) for the host of ``url``; None when nothing is known."""
+        fields = self._suggested_fields(url)
+        return ScrapeOptions(**fields) if fields else None
+
+    def apply_to(self, url: str, options: Optional[ScrapeOptions]) -> Optional[ScrapeOptions]:
+        """``options`` with the fields it leaves unset taken from the host's profile."""
+        fields = self._suggested_fields(url)
+        if options is not None:
+            fields = {k: v for k, v in fields.items() if k not in options.model_fields_set}
+        if not fields:
+            return options
+        if options is None:
+            return ScrapeOptions(**fields)
+        return options.model_copy(update=fields)
+
+    def record(self, url: str, options: Optional[ScrapeOptions], result: Any, latency: float) -> None:
+        """
+        Record one scrape of ``url`` with ``options``.
+
+        Args:
+            result: The scraped document (Document, or an API or snake_case
+                dict) or the exception the scrape raised
+            latency: Seconds the request took
+        """
+        success = _succeeded(result)
+        if success is None:
+            return
+        requested = options.model_dump(exclude_none=True) if options is not None else {}
+        with self._lock:
+            profile = self.profile(url)
+            if requested.get("proxy") == "auto" and _proxy_used(result) == "stealth":
+                # The API had to escalate: basic failed where stealth was tried
+                _count(profile, option_key({**requested, "proxy": "basic"}), False)
+                _count(profile, option_key({**requested, "proxy": "stealth"}), success)
+            else:
+                _count(profile, option_key(requested), success)
+            if success:
+                profile.latencies.append(round(latency, 3))
+            elif isinstance(result, RequestTimeoutError):
+                # A timed out scrape took at least as long as it was allowed
+                allowed = requested.get("timeout")
+                profile.latencies.append(round(max(latency, (allowed or 0) / 1000), 3))
+            del profile.latencies[: -self.max_latencies]
+            self.backend.set(self._key(profile.host), profile.model_dump_json().encode("utf-8"), self.ttl)
+
+
+def _host_of(url: str) -> str:
+    url = url.strip()
+    return ((urlparse(url).hostname if "//" in url else url) or "").lower()
+
+
+def _count(profile: DomainProfile, key: str, success: bool) -> None:
+    stats = profile.options.setdefault(key, OptionStats())
+    stats.attempts += 1
+    stats.successes += int(success)
+
+
+def _metadata(document: Any) -> Any:
+    if isinstance(document, dict):
+        return document.get("metadata") or {}
+    return getattr(document, "metadata", None) or {}
+
+
+def _proxy_used(result: Any) -> Optional[str]:
+    if isinstance(result, BaseException):
+        return None
+    metadata = _metadata(result)
+    if isinstance(metadata, dict):
+        return metadata.get("proxyUsed") or metadata.get("proxy_used")
+    return getattr(metadata, "proxy_used", None)
+
+
+def _succeeded(result: Any) -> Optional[bool]:
+    """Whether a scrape worked; None when its outcome says nothing about the options."""
+    if isinstance(result, BaseException):
+        if isinstance(result, KnownFailureError) or not isinstance(result, FirecrawlError):
+            return None
+        return None if result.status_code in _NEUTRAL_STATUSES else False
+    _, status = page_status(result)
+    if status is not None and (status in (401, 403, 429) or status >= 500):
+        return False
+    if status in (404, 410):
+        # A missing page is no sign that the options are wrong
+        return None
+    return any(_field(result, name) for name in _CONTENT_FIELDS)
+
+
+def _field(document: Any, name: str) -> Any:
+    if isinstance(document, dict):
+        return document.get(name)
+    return getattr(document, name, None)
+
+
+def domain_profiles_of(client: Any) -> Optional[DomainProfiles]:
+    """Return the DomainProfiles configured on an HTTP client, if any."""
+    profiles = getattr(client, "domain_profiles", None)
+    return profiles if isinstance(profiles, DomainProfiles) else None
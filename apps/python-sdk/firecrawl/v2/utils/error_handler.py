@@ -41,6 +41,11 @@ class RequestTimeoutError(FirecrawlError):
     pass
 
 
+class ConflictError(FirecrawlError):
+    """Raised when the request conflicts with an earlier one, e.g. a reused idempotency key (409)."""
+    pass
+
+
 class RateLimitError(FirecrawlError):
     """Raised when the rate limit is exceeded (429)."""
     pass
@@ -96,6 +101,9 @@ def handle_response_error(response: requests.Response, action: str) -> None:
     elif response.status_code == 408:
         message = f"Request Timeout: Failed to {action} as the request timed out. {error_message} - {error_details}"
         raise RequestTimeoutError(message, response.status_code, response)
+    elif response.status_code == 409:
+        message = f"Conflict: Failed to {action}. {error_message} - {error_details}"
+        raise ConflictError(message, response.status_code, response)
     elif response.status_code == 429:
         message = f"Rate Limit Exceeded: Failed to {action}. {error_message} - {error_details}"
         raise RateLimitError(message, response.status_code, response)
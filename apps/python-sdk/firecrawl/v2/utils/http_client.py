@@ -6,16 +6,54 @@ import time
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from .assets import AssetStore
 from .get_version import get_version
+from .idempotency import (
+    IDEMPOTENT_RETRY_STATUSES,
+    IdempotencyKeys,
+    retries_safely,
+    unknown_outcome,
+    with_idempotency_key,
+)
+from .domain_profiles import DomainProfiles
+from .negative_cache import NegativeCache
+from .response_cache import ResponseCache
+from .singleflight import SingleFlight, request_key
 
 version = get_version()
 
 class HttpClient:
     """HTTP client with retry logic and error handling."""
 
-    def __init__(self, api_key: Optional[str], api_url: str):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        api_url: str,
+        *,
+        asset_store: Optional[AssetStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        singleflight: Optional[SingleFlight] = None,
+        idempotency_keys: Optional[IdempotencyKeys] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        domain_profiles: Optional[DomainProfiles] = None,
+        lazy_documents: bool = False,
+    ):
         self.api_key = api_key
         self.api_url = api_url
+        # Optional destination for decoded base64 screenshots/action outputs
+        self.asset_store = asset_store
+        # Optional cache consulted by scrape/map/search/extract before any request
+        self.response_cache = response_cache
+        # Optional sharing of one response among identical concurrent requests
+        self.singleflight = singleflight
+        # Optional generation of idempotency keys for job-creating POSTs
+        self.idempotency_keys = idempotency_keys
+        # Optional record of URLs and hosts that keep failing, checked before scraping them
+        self.negative_cache = negative_cache
+        # Optional per-host record of working scrape options and latencies
+        self.domain_profiles = domain_profiles
+        # Return crawl and batch status documents as LazyDocument
+        self.lazy_documents = lazy_documents
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -65,12 +103,36 @@ class HttpClient:
         """Make a POST request with retry logic."""
         if headers is None:
             headers = self._prepare_headers()
+        headers = with_idempotency_key(self.idempotency_keys, endpoint, data, headers)
 
         data['origin'] = f'python-sdk@{version}'
             
         url = self._build_url(endpoint)
-        
+
+        flight = self.singleflight
+        if flight is not None and flight.applies_to(endpoint):
+            return flight.do(
+                request_key(endpoint, data, headers),
+                lambda: self._post(endpoint, url, data, headers, timeout, retries, backoff_factor),
+            )
+        return self._post(endpoint, url, data, headers, timeout, retries, backoff_factor)
+
+    def _post(
+        self,
+        endpoint: str,
+        url: str,
+        data: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        retries: int,
+        backoff_factor: float,
+    ) -> requests.Response:
         last_exception = None
+        # A keyed crawl start cannot create a second job, so gateway errors and timeouts are safe to retry
+        keyed = retries_safely(endpoint, headers)
+        # Why the request was last resent, for a 409 that leaves its first outcome unknown
+        resent_after = None
+        retry_statuses = IDEMPOTENT_RETRY_STATUSES if keyed else (502,)
         
         for attempt in range(retries):
             try:
@@ -81,22 +143,27 @@ class HttpClient:
                     timeout=timeout
                 )
 
-                if response.status_code == 502:
+                if response.status_code in retry_statuses:
                     if attempt < retries - 1:
+                        resent_after = f"a {response.status_code} response"
                         time.sleep(backoff_factor * (2 ** attempt))
                         continue
-                
+
+                if keyed and resent_after is not None and response.status_code == 409:
+                    raise unknown_outcome(response, resent_after)
+
                 return response
                 
             except requests.RequestException as e:
                 last_exception = e
+                resent_after = type(e).__name__
                 if attempt == retries - 1:
                     raise e
                 time.sleep(backoff_factor * (2 ** attempt))
         
         # This should never be reached due to the exception handling above
         raise last_exception or Exception("Unexpected error in POST request")
-    
+
     def get(
         self,
         endpoint: str,
@@ -1,14 +1,57 @@
+import asyncio
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Tuple
 from .get_version import get_version
+from .assets import AssetStore
+from .idempotency import (
+    IDEMPOTENT_RETRY_STATUSES,
+    IdempotencyKeys,
+    retries_safely,
+    unknown_outcome,
+    with_idempotency_key,
+)
+from .offload import ParseOffloader
+from .domain_profiles import DomainProfiles
+from .negative_cache import NegativeCache
+from .response_cache import ResponseCache
+from .singleflight import AsyncSingleFlight, request_key
 
 version = get_version()
 
 
 class AsyncHttpClient:
-    def __init__(self, api_key: Optional[str], api_url: str):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        api_url: str,
+        *,
+        parse_offloader: Optional[ParseOffloader] = None,
+        asset_store: Optional[AssetStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        singleflight: Optional[AsyncSingleFlight] = None,
+        idempotency_keys: Optional[IdempotencyKeys] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        domain_profiles: Optional[DomainProfiles] = None,
+        lazy_documents: bool = False,
+    ):
         self.api_key = api_key
         self.api_url = api_url
+        # Optional executor offload for decoding/normalizing large response bodies
+        self.parse_offloader = parse_offloader
+        # Optional destination for decoded base64 screenshots/action outputs
+        self.asset_store = asset_store
+        # Optional cache consulted by scrape/map/search/extract before any request
+        self.response_cache = response_cache
+        # Optional sharing of one response among identical concurrent requests
+        self.singleflight = singleflight
+        # Optional generation of idempotency keys for job-creating POSTs
+        self.idempotency_keys = idempotency_keys
+        # Optional record of URLs and hosts that keep failing, checked before scraping them
+        self.negative_cache = negative_cache
+        # Optional per-host record of working scrape options and latencies
+        self.domain_profiles = domain_profiles
+        # Return crawl and batch status documents as LazyDocument
+        self.lazy_documents = lazy_documents
         headers = {
             "Content-Type": "application/json",
         }
@@ -24,6 +67,9 @@ class AsyncHttpClient:
 
     async def close(self) -> None:
         await self._client.aclose()
+        if self.parse_offloader is not None:
+            # Stops the offloader's private thread pool; a caller-supplied executor is left running
+            self.parse_offloader.shutdown(wait=False)
 
     def _headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         headers: Dict[str, str] = {}
@@ -38,14 +84,24 @@ class AsyncHttpClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
+        merged_headers = with_idempotency_key(
+            self.idempotency_keys, endpoint, data, {**self._headers(), **(headers or {})}
+        )
         payload = dict(data)
         payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
-            endpoint,
-            json=payload,
-            headers={**self._headers(), **(headers or {})},
-            timeout=timeout,
-        )
+
+        def send() -> Awaitable[httpx.Response]:
+            return self._client.post(endpoint, json=payload, headers=merged_headers, timeout=timeout)
+
+        flight = self.singleflight
+        if flight is not None and flight.applies_to(endpoint):
+            return await flight.do(request_key(endpoint, payload, merged_headers), send)
+        if retries_safely(endpoint, merged_headers):
+            response, resent_after = await _send_with_retries(send)
+            if resent_after is not None and response.status_code == 409:
+                raise unknown_outcome(response, resent_after)
+            return response
+        return await send()
 
     async def get(
         self,
@@ -67,3 +123,42 @@ class AsyncHttpClient:
             endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
         )
 
+
+async def _send_with_retries(
+    send: Callable[[], Awaitable[httpx.Response]], retries: int = 3, backoff_factor: float = 0.5
+) -> Tuple[httpx.Response, Optional[str]]:
+    """
+    Retry a keyed crawl start on transport errors and 502/503/504; the key prevents a duplicate job.
+
+    Returns:
+        (the response, why the request was last resent or None if it was sent once)
+    """
+    resent_after: Optional[str] = None
+    for attempt in range(retries - 1):
+        try:
+            response = await send()
+        except httpx.TransportError as exc:
+            resent_after = type(exc).__name__
+        else:
+            if response.status_code not in IDEMPOTENT_RETRY_STATUSES:
+                return response, resent_after
+            resent_after = f"a {response.status_code} response"
+        await asyncio.sleep(backoff_factor * (2 ** attempt))
+    return await send(), resent_after
+
+
+async def parse_json_response(
+    client: Any, response: httpx.Response, parse: Optional[Callable[[Any], Any]] = None
+) -> Any:
+    """
+    Decode a JSON response and optionally apply ``parse`` to the body.
+
+    When the client has a ParseOffloader configured, large bodies are decoded
+    and parsed in its executor instead of on the event loop. Exceptions raised
+    by ``parse`` propagate either way.
+    """
+    offloader = getattr(client, "parse_offloader", None)
+    if isinstance(offloader, ParseOffloader):
+        return await offloader.parse(response, parse)
+    body = response.json()
+    return parse(body) if parse is not None else body
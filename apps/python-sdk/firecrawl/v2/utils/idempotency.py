@@ -0,0 +1,106 @@
+"""
+Idempotency keys for job-creating POSTs (crawl, batch scrape, extract, agent).
+
+Only ``POST /v2/crawl`` enforces the ``x-idempotency-key`` header: the API
+records the key as soon as the request arrives and answers a later request
+carrying it with 409. A keyed crawl start whose outcome is unknown (a
+timeout, a connection error, or a 502/503/504 from the gateway) is therefore
+resent with the same key and cannot start a second crawl. A 500 is not
+retried: the key was recorded before the crawl failed, so a retry would be
+refused although no crawl exists. A 409 on a resent start raises
+UnknownOutcomeError, as the first attempt may or may not have started the
+crawl. The other job endpoints ignore the key, so their POSTs keep the plain
+retry on 502 only.
+
+Generated keys are UUIDs, as the API requires, derived from a hash of the
+canonical request payload (sorted keys, SDK ``origin`` excluded) and a random
+nonce per call, so a key stays the same across the retries of one call. A
+caller-supplied ``idempotency_key`` is sent unchanged; ``derive_key`` builds
+a stable UUID from a caller nonce, e.g. to repeat a request after a restart.
+"""
+
+import json
+import uuid
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from .error_handler import ConflictError
+
+IDEMPOTENCY_HEADER = "x-idempotency-key"
+
+# Endpoints whose POST starts a billed job
+JOB_ENDPOINTS = ("/v2/crawl", "/v2/batch/scrape", "/v2/extract", "/v2/agent")
+
+# Endpoints where the API rejects a reused key
+ENFORCED_ENDPOINTS = ("/v2/crawl",)
+
+# Status codes retried for keyed POSTs to ENFORCED_ENDPOINTS; a 500 is not,
+# as the API has recorded the key by then whether or not a job was started
+IDEMPOTENT_RETRY_STATUSES = (502, 503, 504)
+
+_NAMESPACE = uuid.UUID("5b0f3a4e-8d1c-4c39-9f0e-6a1f2e7d9c41")
+
+
+def is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def retries_safely(endpoint: str, headers: Mapping[str, str]) -> bool:
+    """Whether a POST can be resent without risking a second job: keyed and to an enforcing endpoint."""
+    return endpoint in ENFORCED_ENDPOINTS and is_uuid(headers.get(IDEMPOTENCY_HEADER, ""))
+
+
+class UnknownOutcomeError(ConflictError):
+    """
+    Raised when a resent crawl start is refused because its idempotency key
+    was already used: the first attempt may or may not have started a crawl.
+    """
+
+
+def unknown_outcome(response: Any, cause: str) -> UnknownOutcomeError:
+    """The error for a 409 answering a crawl start resent after ``cause``."""
+    return UnknownOutcomeError(
+        f"Crawl start was resent after {cause} and the API reports its idempotency key as already used; "
+        "the first attempt may or may not have started a crawl. Check get_active_crawls before starting it again.",
+        409,
+        response,
+    )
+
+
+def derive_key(endpoint: str, payload: Dict[str, Any], nonce: str) -> str:
+    """Return the idempotency key for ``payload`` posted to ``endpoint`` under ``nonce``."""
+    body = {k: v for k, v in payload.items() if k != "origin"}
+    canonical = json.dumps([nonce, endpoint, body], sort_keys=True, separators=(",", ":"), default=str)
+    return str(uuid.uuid5(_NAMESPACE, canonical))
+
+
+class IdempotencyKeys:
+    """Generates a key for every job-creating POST that does not carry one."""
+
+    def __init__(self, endpoints: Iterable[str] = JOB_ENDPOINTS) -> None:
+        self.endpoints = frozenset(endpoints)
+
+    def applies_to(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+    def key_for(self, endpoint: str, payload: Dict[str, Any], nonce: Optional[str] = None) -> str:
+        return derive_key(endpoint, payload, nonce if nonce is not None else uuid.uuid4().hex)
+
+
+def with_idempotency_key(
+    keys: Optional[IdempotencyKeys], endpoint: str, payload: Dict[str, Any], headers: Dict[str, str]
+) -> Dict[str, str]:
+    """
+    Return ``headers`` with the idempotency key the request should carry.
+
+    A key already in ``headers`` is kept as given; without one, ``keys`` adds
+    a fresh key for job endpoints.
+    """
+    if headers.get(IDEMPOTENCY_HEADER):
+        return headers
+    if keys is None or not keys.applies_to(endpoint):
+        return headers
+    return {**headers, IDEMPOTENCY_HEADER: keys.key_for(endpoint, payload)}
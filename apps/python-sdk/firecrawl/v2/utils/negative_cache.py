@@ -0,0 +1,338 @@
+"""
+Negative cache for URLs and hosts that keep failing.
+
+A scrape that returns a 404/410 page, times out, or hits an unsupported or
+unreachable website is recorded under its URL. Failures that concern the
+whole site are also recorded under its host: an unsupported website or a
+DNS/TLS failure at once, timeouts after ``host_threshold`` of them. Until
+the record expires, ``scrape`` and ``scrape_many`` fail fast with
+KnownFailureError and batch starts leave the URL out; ``force_retry=True``
+on those calls sends the request anyway.
+
+Every repeated failure of the same class multiplies the record's TTL by
+``backoff`` (up to ``max_ttl``); a successful scrape removes it. Records are
+small JSON values kept in a response cache backend (MemoryCacheBackend or
+SQLiteCacheBackend), so one backend can serve both caches and a SQLite file
+shares known failures between the processes of a machine.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, ValidationError
+
+from .error_handler import FirecrawlError, RequestTimeoutError, WebsiteNotSupportedError
+from .response_cache import CacheBackend, MemoryCacheBackend
+
+FailureClass = Literal["not_found", "timeout", "unsupported", "unreachable"]
+
+# Seconds a URL or host is skipped after its first failure of each class
+DEFAULT_TTLS: Dict[str, float] = {
+    "not_found": 3600.0,
+    "timeout": 300.0,
+    "unsupported": 6 * 3600.0,
+    "unreachable": 900.0,
+}
+
+# Page status codes recorded as not_found
+NOT_FOUND_STATUSES = (404, 410)
+
+_TIMEOUT = re.compile(r"SCRAPE_TIMEOUT|timed out", re.IGNORECASE)
+_UNREACHABLE = re.compile(r"SCRAPE_DNS_RESOLUTION_ERROR|SCRAPE_SSL_ERROR|DNS resolution failed|SSL/TLS")
+
+
+class NegativeEntry(BaseModel):
+    """A recorded failure of one URL or host."""
+
+    target: str
+    scope: Literal["url", "host"]
+    failure: FailureClass
+    # Consecutive failures of this class
+    count: int = 1
+    error: Optional[str] = None
+    # Epoch seconds until which the target is skipped
+    until: float = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self.until > time.time()
+
+
+class NegativeCacheStats(BaseModel):
+    """Counters for a NegativeCache."""
+
+    # Requests answered with KnownFailureError or URLs left out of batches
+    skipped: int = 0
+    failures: int = 0
+    # Records removed after a successful scrape
+    cleared: int = 0
+
+
+class KnownFailureError(FirecrawlError):
+    """Raised instead of scraping URLs the negative cache says will fail again."""
+
+    def __init__(self, message: str, entries: Mapping[str, NegativeEntry]):
+        super().__init__(message)
+        # URL -> the URL or host record that blocked it
+        self.entries = dict(entries)
+
+
+def classify_failure(code: Optional[str], message: Optional[str]) -> Optional[FailureClass]:
+    """Failure class of an API error code/message, or None when it is not worth remembering."""
+    text = f"{code or ''} {message or ''}"
+    if _UNREACHABLE.search(text):
+        return "unreachable"
+    if _TIMEOUT.search(text):
+        return "timeout"
+    return None
+
+
+def classify_exception(error: BaseException) -> Optional[FailureClass]:
+    if isinstance(error, WebsiteNotSupportedError):
+        return "unsupported"
+    if isinstance(error, RequestTimeoutError):
+        return "timeout"
+    if isinstance(error, FirecrawlError):
+        return classify_failure(None, str(error))
+    return None
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url.strip()).hostname or "").lower()
+
+
+class NegativeCache:
+    """
+    Known failures of URLs and hosts, consulted before scraping them.
+
+    Pass an instance as ``negative_cache=`` to FirecrawlClient or
+    AsyncFirecrawlClient.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        backoff: float = 2.0,
+        max_ttl: float = 7 * 86400.0,
+        host_threshold: int = 3,
+    ) -> None:
+        """
+        Args:
+            backend: Where records are kept (default: a 4 MB MemoryCacheBackend);
+                may be the backend of a ResponseCache
+            ttls: Seconds to skip a target after its first failure, per failure
+                class (merged over DEFAULT_TTLS)
+            backoff: Factor applied to the TTL for each further failure
+            max_ttl: Upper bound for a single TTL; a record is also remembered
+                this long after it expires so that the next failure continues
+                the series
+            host_threshold: Timeouts on one host before the whole host is skipped
+        """
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if host_threshold < 1:
+            raise ValueError("host_threshold must be at least 1")
+        self.backend = backend if backend is not None else MemoryCacheBackend(4 * 1024 * 1024)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.backoff = backoff
+        self.max_ttl = max_ttl
+        self.host_threshold = host_threshold
+        self._lock = threading.Lock()
+        self._stats = NegativeCacheStats()
+
+    @property
+    def stats(self) -> NegativeCacheStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    @staticmethod
+    def _key(scope: str, target: str) -> str:
+        canonical = json.dumps(["negative", scope, target], separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _read(self, scope: str, target: str) -> Optional[NegativeEntry]:
+        content = self.backend.get(self._key(scope, target))
+        if content is None:
+            return None
+        try:
+            return NegativeEntry.model_validate_json(content)
+        except ValidationError:
+            self.backend.delete(self._key(scope, target))
+            return None
+
+    def _write(self, entry: NegativeEntry) -> None:
+        remember = max(entry.until - time.time(), 0.0) + self.max_ttl
+        self.backend.set(self._key(entry.scope, entry.target), entry.model_dump_json().encode("utf-8"), remember)
+
+    def ttl(self, failure: str, count: int) -> float:
+        """Seconds a target is skipped after its ``count``-th consecutive ``failure``."""
+        return min(self.ttls[failure] * self.backoff ** max(count - 1, 0), self.max_ttl)
+
+    def lookup(self, url: str) -> Optional[NegativeEntry]:
+        """The active URL or host record blocking ``url``, if any."""
+        url = url.strip()
+        for scope, target in (("url", url), ("host", host_of(url))):
+            if not target:
+                continue
+            entry = self._read(scope, target)
+            if entry is not None and entry.active:
+                return entry
+        return None
+
+    def check(self, url: str) -> None:
+        """Raise KnownFailureError when ``url`` is blocked."""
+        entry = self.lookup(url)
+        if entry is None:
+            return
+        with self._lock:
+            self._stats.skipped += 1
+        raise KnownFailureError(_describe(url, entry), {url: entry})
+
+    def partition(self, urls: Iterable[str]) -> Tuple[List[str], Dict[str, NegativeEntry]]:
+        """Split ``urls`` into those to scrape and the blocked ones with their records."""
+        keep: List[str] = []
+        blocked: Dict[str, NegativeEntry] = {}
+        for url in urls:
+            entry = self.lookup(url)
+            if entry is None:
+                keep.append(url)
+            else:
+                blocked[url] = entry
+        with self._lock:
+            self._stats.skipped += len(blocked)
+        return keep, blocked
+
+    def record_failure(self, url: str, failure: FailureClass, error: Optional[str] = None) -> NegativeEntry:
+        url = url.strip()
+        entry = self._bump("url", url, failure, error)
+        host = host_of(url)
+        if host and failure in ("timeout", "unsupported", "unreachable"):
+            self._bump("host", host, failure, error)
+        with self._lock:
+            self._stats.failures += 1
+        return entry
+
+    def _bump(self, scope: str, target: str, failure: FailureClass, error: Optional[str]) -> NegativeEntry:
+        previous = self._read(scope, target)
+        count = previous.count + 1 if previous is not None and previous.failure == failure else 1
+        # A host is only skipped for timeouts once several of its URLs timed out
+        blocking = count - (self.host_threshold - 1) if scope == "host" and failure == "timeout" else count
+        until = time.time() + self.ttl(failure, blocking) if blocking >= 1 else 0.0
+        entry = NegativeEntry(target=target, scope=scope, failure=failure, count=count, error=error, until=until)
+        self._write(entry)
+        return entry
+
+    def record_exception(self, url: str, error: BaseException) -> Optional[NegativeEntry]:
+        """Record ``error`` raised while scraping ``url`` when it is a cacheable failure."""
+        failure = classify_exception(error)
+        return self.record_failure(url, failure, str(error)[:200]) if failure is not None else None
+
+    def record_status(self, url: str, status: Optional[int]) -> None:
+        """Record a scraped page: a 404/410 status is a failure, anything else a success."""
+        if status in NOT_FOUND_STATUSES:
+            self.record_failure(url, "not_found", f"Page returned status {status}")
+        else:
+            self.record_success(url)
+
+    def record_success(self, url: str) -> None:
+        """Drop the URL's record and its host's, as the host answered."""
+        url = url.strip()
+        cleared = 0
+        for scope, target in (("url", url), ("host", host_of(url))):
+            if target and self._read(scope, target) is not None:
+                self.backend.delete(self._key(scope, target))
+                cleared += 1
+        if cleared:
+            with self._lock:
+                self._stats.cleared += cleared
+
+    def forget(self, url: str) -> None:
+        """Remove what is known about ``url`` and its host."""
+        url = url.strip()
+        self.backend.delete(self._key("url", url))
+        host = host_of(url)
+        if host:
+            self.backend.delete(self._key("host", host))
+
+
+def _describe(url: str, entry: NegativeEntry) -> str:
+    subject = url if entry.scope == "url" else f"host {entry.target} of {url}"
+    remaining = max(int(entry.until - time.time()), 0)
+    return (
+        f"Skipped {subject}: failed {entry.count} time(s) with {entry.failure}"
+        f" ({entry.error or 'no details'}); retried in {remaining}s or with force_retry=True"
+    )
+
+
+def negative_cache_of(client: Any) -> Optional[NegativeCache]:
+    """Return the NegativeCache configured on an HTTP client, if any."""
+    cache = getattr(client, "negative_cache", None)
+    return cache if isinstance(cache, NegativeCache) else None
+
+
+def skip_known_failures(
+    client: Any, urls: List[str], force_retry: bool = False
+) -> Tuple[List[str], Optional[List[str]]]:
+    """
+    Leave blocked URLs out of a batch.
+
+    Returns:
+        (URLs to submit, skipped URLs or None when no negative cache applies)
+
+    Raises:
+        KnownFailureError: If every URL is blocked
+    """
+    cache = negative_cache_of(client)
+    if cache is None or force_retry:
+        return urls, None
+    keep, blocked = cache.partition(urls)
+    if urls and not keep:
+        raise KnownFailureError(f"All {len(urls)} URLs are known failures", blocked)
+    return keep, list(blocked)
+
+
+def record_batch_outcome(
+    client: Any, pages: Iterable[Tuple[Optional[str], Optional[int]]], errors: Iterable[Any]
+) -> None:
+    """
+    Record a finished batch job in the client's negative cache.
+
+    Args:
+        pages: (source URL, status code) of each scraped document (see page_status)
+        errors: The job's CrawlErrors; a URL that was scraped after failing
+            counts as a success
+    """
+    cache = negative_cache_of(client)
+    if cache is None:
+        return
+    scraped = {url: status for url, status in pages if url}
+    for error in errors:
+        failure = classify_failure(error.code, error.error)
+        if failure is not None and error.url and error.url not in scraped:
+            cache.record_failure(error.url, failure, error.error)
+    for url, status in scraped.items():
+        cache.record_status(url, status)
+
+
+def page_status(document: Any) -> Tuple[Optional[str], Optional[int]]:
+    """(source URL, page status code) of a Document or of an API or snake_case document dict."""
+    metadata = document.get("metadata") if isinstance(document, dict) else getattr(document, "metadata", None)
+    if metadata is None:
+        return None, None
+    if isinstance(metadata, dict):
+        url = metadata.get("sourceURL") or metadata.get("source_url") or metadata.get("url")
+        status = metadata.get("statusCode", metadata.get("status_code"))
+    else:
+        url = getattr(metadata, "source_url", None) or getattr(metadata, "url", None)
+        status = getattr(metadata, "status_code", None)
+    try:
+        return url, int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return url, None
@@ -2,8 +2,56 @@
 Normalization helpers for v2 API payloads to avoid relying on Pydantic aliases.
 """
 
-from typing import Any, Dict, List
-from ..types import DocumentMetadata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from ..types import Document, DocumentMetadata, LazyDocument, RawMode
+from .assets import AssetStore, externalize_assets
+
+
+# API v2 camelCase metadata keys -> DocumentMetadata snake_case fields
+_METADATA_KEY_MAP: Dict[str, str] = {
+    # OpenGraph
+    "ogTitle": "og_title",
+    "ogDescription": "og_description",
+    "ogUrl": "og_url",
+    "ogImage": "og_image",
+    "ogAudio": "og_audio",
+    "ogDeterminer": "og_determiner",
+    "ogLocale": "og_locale",
+    "ogLocaleAlternate": "og_locale_alternate",
+    "ogSiteName": "og_site_name",
+    "ogVideo": "og_video",
+    # Dublin Core and misc
+    "dcTermsCreated": "dc_terms_created",
+    "dcDateCreated": "dc_date_created",
+    "dcDate": "dc_date",
+    "dcTermsType": "dc_terms_type",
+    "dcType": "dc_type",
+    "dcTermsAudience": "dc_terms_audience",
+    "dcTermsSubject": "dc_terms_subject",
+    "dcSubject": "dc_subject",
+    "dcDescription": "dc_description",
+    "dcTermsKeywords": "dc_terms_keywords",
+    "modifiedTime": "modified_time",
+    "publishedTime": "published_time",
+    "articleTag": "article_tag",
+    "articleSection": "article_section",
+    # Response-level
+    "sourceURL": "source_url",
+    "statusCode": "status_code",
+    "scrapeId": "scrape_id",
+    "numPages": "num_pages",
+    "contentType": "content_type",
+    "proxyUsed": "proxy_used",
+    "cacheState": "cache_state",
+    "cachedAt": "cached_at",
+    "creditsUsed": "credits_used",
+    "concurrencyLimited": "concurrency_limited",
+    "concurrencyQueueDurationMs": "concurrency_queue_duration_ms",
+}
 
 
 def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,51 +59,8 @@ def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
     Convert API v2 camelCase metadata keys to snake_case expected by DocumentMetadata.
     Leaves unknown keys as-is.
     """
-    mapping = {
-        # OpenGraph
-        "ogTitle": "og_title",
-        "ogDescription": "og_description",
-        "ogUrl": "og_url",
-        "ogImage": "og_image",
-        "ogAudio": "og_audio",
-        "ogDeterminer": "og_determiner",
-        "ogLocale": "og_locale",
-        "ogLocaleAlternate": "og_locale_alternate",
-        "ogSiteName": "og_site_name",
-        "ogVideo": "og_video",
-        # Dublin Core and misc
-        "dcTermsCreated": "dc_terms_created",
-        "dcDateCreated": "dc_date_created",
-        "dcDate": "dc_date",
-        "dcTermsType": "dc_terms_type",
-        "dcType": "dc_type",
-        "dcTermsAudience": "dc_terms_audience",
-        "dcTermsSubject": "dc_terms_subject",
-        "dcSubject": "dc_subject",
-        "dcDescription": "dc_description",
-        "dcTermsKeywords": "dc_terms_keywords",
-        "modifiedTime": "modified_time",
-        "publishedTime": "published_time",
-        "articleTag": "article_tag",
-        "articleSection": "article_section",
-        # Response-level
-        "sourceURL": "source_url",
-        "statusCode": "status_code",
-        "scrapeId": "scrape_id",
-        "numPages": "num_pages",
-        "contentType": "content_type",
-        "proxyUsed": "proxy_used",
-        "cacheState": "cache_state",
-        "cachedAt": "cached_at",
-        "creditsUsed": "credits_used",
-        "concurrencyLimited": "concurrency_limited",
-        "concurrencyQueueDurationMs": "concurrency_queue_duration_ms",
-    }
-
-    out: Dict[str, Any] = {}
-    for k, v in md.items():
-        snake = mapping.get(k, k)
-        out[snake] = v
+    mapping = _METADATA_KEY_MAP
+    out = {mapping.get(k, k): v for k, v in md.items()}
 
     # Light coercions where server may send strings/lists
     if isinstance(out.get("status_code"), str):
@@ -68,12 +73,10 @@ def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
-def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
+def normalize_document_dict(doc: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Normalize a raw Document dict from the API into the Python SDK's expected shape:
-    - Convert top-level keys rawHtml->raw_html, changeTracking->change_tracking
-    - Convert metadata keys from camelCase to snake_case
-    - Convert branding.colorScheme to branding.color_scheme
+    Convert a raw Document dict from the API into plain snake_case keys without
+    constructing any pydantic models. The input dict is not mutated.
     """
     normalized = dict(doc)
 
@@ -85,41 +88,314 @@ def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
 
     md = normalized.get("metadata")
     if isinstance(md, dict):
-        mapped = _map_metadata_keys(md)
-        # Construct a typed DocumentMetadata; extras allowed/preserved
-        try:
-            normalized["metadata"] = DocumentMetadata.model_validate(mapped)
-        except Exception:
-            normalized["metadata"] = mapped
+        normalized["metadata"] = _map_metadata_keys(md)
 
     # Normalize branding top-level camelCase keys
     branding = normalized.get("branding")
-    if isinstance(branding, dict):
-        if "colorScheme" in branding and "color_scheme" not in branding:
-            branding["color_scheme"] = branding.pop("colorScheme")
+    if isinstance(branding, dict) and "colorScheme" in branding and "color_scheme" not in branding:
+        branding = dict(branding)
+        branding["color_scheme"] = branding.pop("colorScheme")
+        normalized["branding"] = branding
+
+    return normalized
+
+
+def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a raw Document dict from the API into the Python SDK's expected shape:
+    - Convert top-level keys rawHtml->raw_html, changeTracking->change_tracking
+    - Convert metadata keys from camelCase to snake_case
+    - Convert branding.colorScheme to branding.color_scheme
+    """
+    normalized = normalize_document_dict(doc)
+
+    md = normalized.get("metadata")
+    if isinstance(md, dict):
+        # Construct a typed DocumentMetadata; extras allowed/preserved
+        try:
+            normalized["metadata"] = DocumentMetadata.model_validate(md)
+        except Exception:
+            pass
 
     return normalized
 
 
+def normalize_deferred_field(name: str, value: Any) -> Any:
+    """
+    Normalize the raw API value of a field deferred by LazyDocument
+    (metadata, branding or change_tracking) to its snake_case shape.
+    """
+    if name == "metadata" and isinstance(value, dict):
+        return _map_metadata_keys(value)
+    if name == "branding" and isinstance(value, dict) and "colorScheme" in value and "color_scheme" not in value:
+        value = dict(value)
+        value["color_scheme"] = value.pop("colorScheme")
+    return value
+
+
+def _split_lazy_document(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split a raw API document dict into snake_case eager fields and the raw values
+    of the fields LazyDocument defers. The input dict is not mutated.
+    """
+    data: Dict[str, Any] = {}
+    pending: Dict[str, Any] = {}
+    for key, value in doc.items():
+        if key in ("metadata", "branding", "change_tracking"):
+            pending[key] = value
+        elif key == "changeTracking":
+            pending.setdefault("change_tracking", value)
+        elif key == "rawHtml":
+            data.setdefault("raw_html", value)
+        else:
+            data[key] = value
+    return data, pending
+
+
+def build_lazy_document(doc: Dict[str, Any]) -> LazyDocument:
+    """
+    Build a LazyDocument from a raw API document dict. Cheap top-level fields are
+    validated right away; metadata, branding and change_tracking are kept as-is
+    and normalized on first access. The input dict is not mutated.
+    """
+    data, pending = _split_lazy_document(doc)
+    return LazyDocument.from_pending(data, pending)
+
+
+# Compiled validators for whole pages of documents (one pydantic-core call per page)
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[Document])
+_LAZY_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[LazyDocument])
+_VALIDATION_SLICE = 256
+
+
+def parse_documents(
+    data_list: Optional[List[Any]],
+    raw: RawMode = False,
+    *,
+    lazy: bool = False,
+    assets: Optional[AssetStore] = None,
+) -> List[Any]:
+    """
+    Parse a list of API document dicts according to the requested result mode.
+
+    Typed documents are normalized with plain dict operations and then validated
+    a slice of the page at a time, rather than constructing each Document separately.
+
+    Args:
+        data_list: Documents as returned by the API (camelCase dicts)
+        raw: False for typed Document models, True for snake_case dicts,
+            "api" for the untouched API dicts
+        lazy: In typed mode, return LazyDocument instances that defer parsing
+            metadata, branding and change_tracking until first access (their
+            validation errors are then raised on that access)
+        assets: Decode base64 screenshots and action outputs into this store,
+            leaving references on the documents (not applied to raw="api")
+
+    Returns:
+        List of Document models or plain dicts
+    """
+    docs = [doc for doc in data_list or [] if isinstance(doc, dict)]
+    if raw == "api":
+        return docs
+    blobs: List[Optional[Dict[str, bytes]]] = []
+    if assets is not None:
+        externalized = [externalize_assets(doc, assets, inline_bytes=bool(raw)) for doc in docs]
+        docs = [doc for doc, _ in externalized]
+        blobs = [doc_blobs for _, doc_blobs in externalized]
+    if raw:
+        return [normalize_document_dict(doc) for doc in docs]
+    if not docs:
+        return []
+    # Validate in fixed-size slices: each validate_python call holds the GIL, so
+    # bounding it keeps other threads (e.g. an event loop) responsive.
+    parsed: List[Any] = []
+    for start in range(0, len(docs), _VALIDATION_SLICE):
+        chunk = docs[start:start + _VALIDATION_SLICE]
+        if lazy:
+            split = [_split_lazy_document(doc) for doc in chunk]
+            validated = _LAZY_DOCUMENT_LIST_ADAPTER.validate_python([data for data, _ in split])
+            parsed.extend(doc._defer(pending) for doc, (_, pending) in zip(validated, split))
+        else:
+            parsed.extend(_DOCUMENT_LIST_ADAPTER.validate_python([normalize_document_dict(doc) for doc in chunk]))
+    for doc, doc_blobs in zip(parsed, blobs):
+        if doc_blobs:
+            doc._assets = doc_blobs
+    return parsed
+
+
+def parse_document(doc: Dict[str, Any], raw: RawMode = False, *, assets: Optional[AssetStore] = None) -> Any:
+    """
+    Parse a single API document dict (e.g. a scrape result) according to the
+    requested result mode. See parse_documents for the arguments.
+    """
+    if raw == "api":
+        return doc
+    doc_blobs = None
+    if assets is not None:
+        doc, doc_blobs = externalize_assets(doc, assets, inline_bytes=bool(raw))
+    if raw:
+        return normalize_document_dict(doc)
+    document = Document(**normalize_document_input(doc))
+    if doc_blobs:
+        document._assets = doc_blobs
+    return document
+
+
+def lazy_documents_of(client: Any) -> bool:
+    """Whether an HTTP client was configured to parse crawl and batch documents lazily."""
+    return getattr(client, "lazy_documents", False) is True
+
+
+def document_key(doc: Any) -> Optional[str]:
+    """
+    Identity of a raw document for de-duplication across replays (e.g. the
+    catchup sent after a websocket reconnect): its scrape id, else its URL.
+    Accepts API (camelCase) and snake_case dicts; returns None if neither is set.
+    """
+    if not isinstance(doc, dict):
+        return None
+    url = doc.get("url")
+    metadata = doc.get("metadata")
+    if isinstance(metadata, dict):
+        scrape_id = metadata.get("scrapeId") or metadata.get("scrape_id")
+        if scrape_id:
+            return f"scrape:{scrape_id}"
+        url = metadata.get("sourceURL") or metadata.get("source_url") or metadata.get("url") or url
+    return f"url:{url}" if url else None
+
+
+class ReplayFilter:
+    """
+    Drops documents a watcher already delivered when a job's results are
+    replayed: the catchup sent after a websocket reconnect, or HTTP result
+    pages read from a ``?skip=`` cursor.
+
+    Both list the job's documents in completion order from a known position,
+    so only the keys of the ``window`` most recently delivered documents are
+    kept: a replayed document at a position before ``delivered - window``
+    completed before all of them and is dropped by position alone. Memory
+    stays bounded however many documents the job has.
+    """
+
+    def __init__(self, window: int = 10_000) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        # Documents delivered so far
+        self.delivered = 0
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+
+    def fresh(self, docs: Iterable[Any], offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the documents of ``docs`` not delivered yet and count them as delivered.
+
+        Args:
+            docs: Raw documents
+            offset: For replays, the position of the first document in the
+                job's completion order; None for newly streamed documents
+        """
+        horizon = self.delivered - self.window
+        fresh: List[Dict[str, Any]] = []
+        for position, doc in enumerate(docs, start=offset or 0):
+            if not isinstance(doc, dict):
+                continue
+            if offset is not None and position < horizon:
+                continue
+            key = document_key(doc)
+            if key is not None:
+                if key in self._keys:
+                    continue
+                self._keys[key] = None
+                if len(self._keys) > self.window:
+                    self._keys.popitem(last=False)
+            fresh.append(doc)
+        self.delivered += len(fresh)
+        return fresh
+
+
+def build_raw_job(body: Dict[str, Any], payload: Dict[str, Any], raw: RawMode) -> Dict[str, Any]:
+    """
+    Build the dict returned for crawl/batch status calls in raw mode.
+
+    Args:
+        body: Original (first page) API response body
+        payload: Parsed snake_case status payload with the final data and next values
+        raw: True for snake_case keys, "api" for the API's camelCase keys
+
+    Returns:
+        Job status dict
+    """
+    if raw == "api":
+        out = dict(body)
+        out["data"] = payload["data"]
+        out["next"] = payload["next"]
+        return out
+    return {
+        "status": payload["status"],
+        "completed": payload["completed"],
+        "total": payload["total"],
+        "credits_used": payload["credits_used"],
+        "expires_at": payload["expires_at"],
+        "next": payload["next"],
+        "data": payload["data"],
+    }
+
+
+# Keys whose presence marks a search result as a scraped Document
+_SEARCH_DOCUMENT_KEYS = frozenset(
+    {"markdown", "html", "rawHtml", "links", "screenshot", "changeTracking", "summary", "json"}
+)
+
+
+# API camelCase keys -> snake_case fields per search result type
+_SEARCH_RESULT_KEY_MAPS: Dict[str, Dict[str, str]] = {
+    "images": {
+        "imageUrl": "image_url",
+        "imageWidth": "image_width",
+        "imageHeight": "image_height",
+    },
+    "news": {
+        "imageUrl": "image_url",
+    },
+}
+
+
 def _map_search_result_keys(result: Dict[str, Any], result_type: str) -> Dict[str, Any]:
-    if result_type == "images":
-        mapping = {
-            "imageUrl": "image_url",
-            "imageWidth": "image_width",
-            "imageHeight": "image_height",
-        }
-    elif result_type == "news":
-        mapping = {
-            "imageUrl": "image_url",
-        }
-    elif result_type == "web":
-        mapping = {}
-    else:
-        mapping = {}
+    mapping = _SEARCH_RESULT_KEY_MAPS.get(result_type)
+    if not mapping:
+        return dict(result)
+    return {mapping.get(k, k): v for k, v in result.items()}
 
-    out: Dict[str, Any] = {}
-    for k, v in result.items():
-        snake = mapping.get(k, k)
-        out[snake] = v
 
+def raw_map_links(items: Optional[List[Any]]) -> List[Dict[str, Any]]:
+    """Convert map API links (strings or dicts) into plain link dicts."""
+    links: List[Dict[str, Any]] = []
+    for item in items or []:
+        if isinstance(item, dict):
+            links.append({
+                "url": item.get("url", ""),
+                "title": item.get("title"),
+                "description": item.get("description"),
+            })
+        elif isinstance(item, str):
+            links.append({"url": item, "title": None, "description": None})
+    return links
+
+
+def raw_search_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert search API data into snake_case dicts grouped by source type."""
+    out: Dict[str, Any] = {}
+    for result_type in ("web", "news", "images"):
+        if result_type not in data:
+            continue
+        items: List[Any] = []
+        for item in data[result_type] or []:
+            if isinstance(item, dict):
+                if _SEARCH_DOCUMENT_KEYS.intersection(item):
+                    items.append(normalize_document_dict(item))
+                else:
+                    items.append(_map_search_result_keys(item, result_type))
+            else:
+                items.append({"url": item})
+        out[result_type] = items
     return out
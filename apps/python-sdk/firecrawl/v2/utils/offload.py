@@ -0,0 +1,195 @@
+"""
+Off-event-loop JSON decoding and normalization for the async client.
+
+Decoding a multi-megabyte crawl page and building its documents is CPU-bound
+and blocks the event loop for its whole duration. ParseOffloader runs that
+work in an executor once a response body crosses a size threshold, limits how
+many bodies are queued for the executor at once, and records how much loop
+time was avoided.
+"""
+
+import asyncio
+import json
+import re
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class ParseOffloadMetrics(BaseModel):
+    """Counters describing where response parsing ran."""
+
+    inline_count: int = 0
+    inline_seconds: float = 0.0
+    offloaded_count: int = 0
+    offloaded_bytes: int = 0
+    # Decode + normalize time spent in the executor, i.e. loop block time avoided
+    avoided_block_seconds: float = 0.0
+    max_avoided_block_seconds: float = 0.0
+    # Time spent waiting for a free executor slot (the loop stays free meanwhile)
+    queue_wait_seconds: float = 0.0
+    max_pending: int = 0
+
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _decode_array(text: str, idx: int):
+    # text[idx] == "["; each element is decoded by its own raw_decode call
+    items = []
+    idx = _WHITESPACE.match(text, idx + 1).end()
+    if text[idx] == "]":
+        return items, idx + 1
+    while True:
+        value, idx = _DECODER.raw_decode(text, idx)
+        items.append(value)
+        idx = _WHITESPACE.match(text, idx).end()
+        if text[idx] == "]":
+            return items, idx + 1
+        if text[idx] != ",":
+            raise ValueError("Expecting ',' delimiter")
+        idx = _WHITESPACE.match(text, idx + 1).end()
+
+
+def _loads_incremental(content: bytes) -> Any:
+    """
+    Decode JSON like ``json.loads``, but decode top-level arrays (e.g. a status
+    page's ``data``) one element per call. A single ``json.loads`` of a large
+    body holds the GIL throughout; splitting it lets the event loop thread run
+    between elements while a worker thread decodes.
+    """
+    text = content.decode("utf-8") if isinstance(content, (bytes, bytearray)) else content
+    try:
+        idx = _WHITESPACE.match(text, 0).end()
+        if text[idx] != "{":
+            return json.loads(text)
+        out = {}
+        idx = _WHITESPACE.match(text, idx + 1).end()
+        if text[idx] == "}":
+            idx += 1
+        else:
+            while True:
+                key, idx = _DECODER.raw_decode(text, idx)
+                if not isinstance(key, str):
+                    raise ValueError("Expecting property name")
+                idx = _WHITESPACE.match(text, idx).end()
+                if text[idx] != ":":
+                    raise ValueError("Expecting ':' delimiter")
+                idx = _WHITESPACE.match(text, idx + 1).end()
+                if text[idx] == "[":
+                    out[key], idx = _decode_array(text, idx)
+                else:
+                    out[key], idx = _DECODER.raw_decode(text, idx)
+                idx = _WHITESPACE.match(text, idx).end()
+                if text[idx] == "}":
+                    idx += 1
+                    break
+                if text[idx] != ",":
+                    raise ValueError("Expecting ',' delimiter")
+                idx = _WHITESPACE.match(text, idx + 1).end()
+        if _WHITESPACE.match(text, idx).end() != len(text):
+            raise ValueError("Extra data")
+        return out
+    except (ValueError, IndexError):
+        # Malformed or unusual input: let json.loads produce the result or the canonical error
+        return json.loads(text)
+
+
+def _decode_and_parse(content: bytes, parse: Optional[Callable[[Any], Any]], incremental: bool = False):
+    start = time.perf_counter()
+    body = _loads_incremental(content) if incremental else json.loads(content)
+    result = parse(body) if parse is not None else body
+    return result, time.perf_counter() - start
+
+
+class ParseOffloader:
+    """
+    Decode and parse HTTP response bodies off the event loop above a size threshold.
+
+    Works with thread pools (the default) and process pools. With a process
+    pool, ``parse`` callables must be picklable (module-level functions or
+    ``functools.partial`` of them).
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int = 1_000_000,
+        *,
+        executor: Optional[Executor] = None,
+        max_workers: int = 2,
+        max_pending: int = 4,
+    ):
+        """
+        Args:
+            threshold_bytes: Bodies at least this large are parsed in the executor
+            executor: Thread or process pool to use; a private thread pool with
+                ``max_workers`` threads is created when omitted
+            max_workers: Size of the private thread pool
+            max_pending: Maximum bodies submitted to the executor at once; further
+                large responses wait (without blocking the loop) for a free slot
+        """
+        if threshold_bytes < 0:
+            raise ValueError("threshold_bytes must be non-negative")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.threshold_bytes = threshold_bytes
+        self.max_pending = max_pending
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="firecrawl-parse"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self.metrics = ParseOffloadMetrics()
+
+    async def parse(self, response: httpx.Response, parse: Optional[Callable[[Any], T]] = None) -> Any:
+        """
+        Decode a response body as JSON and apply ``parse`` to it.
+
+        Args:
+            response: HTTP response whose body is already read
+            parse: Optional function applied to the decoded body
+
+        Returns:
+            ``parse(body)``, or the decoded body when ``parse`` is None
+        """
+        content = response.content
+        if len(content) < self.threshold_bytes:
+            result, elapsed = _decode_and_parse(content, parse)
+            self.metrics.inline_count += 1
+            self.metrics.inline_seconds += elapsed
+            return result
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        queued_at = time.perf_counter()
+        async with self._semaphore:
+            waited = time.perf_counter() - queued_at
+            self._pending += 1
+            self.metrics.max_pending = max(self.metrics.max_pending, self._pending)
+            try:
+                loop = asyncio.get_running_loop()
+                result, elapsed = await loop.run_in_executor(
+                    self._executor, _decode_and_parse, content, parse, True
+                )
+            finally:
+                self._pending -= 1
+
+        metrics = self.metrics
+        metrics.offloaded_count += 1
+        metrics.offloaded_bytes += len(content)
+        metrics.avoided_block_seconds += elapsed
+        metrics.max_avoided_block_seconds = max(metrics.max_avoided_block_seconds, elapsed)
+        metrics.queue_wait_seconds += waited
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor if it was created by this offloader."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
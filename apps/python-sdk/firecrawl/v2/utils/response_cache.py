@@ -0,0 +1,328 @@
+"""
+Client-side cache for scrape, map, search and extract responses.
+
+Responses are keyed by a SHA-256 hash of the API URL, endpoint and the
+prepared request payload (canonical JSON, sorted keys), so two calls with the
+same URL and options share an entry regardless of how the options were
+spelled. A hit returns the stored API body without a network request; results
+are parsed from it exactly as from a fresh response.
+
+Entries expire after the payload's ``maxAge`` (top level or under
+``scrapeOptions``) when set, otherwise after the cache's default TTL; a
+``maxAge`` of 0 bypasses the cache. Two backends are provided:
+
+- ``MemoryCacheBackend``: per-process LRU bounded by a byte budget
+- ``SQLiteCacheBackend``: a SQLite file in WAL mode, shared by the processes
+  of one machine
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+
+class ResponseCacheStats(BaseModel):
+    """Counters for a ResponseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    # Entries dropped by the backend to stay within its byte budget
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class CacheBackend(ABC):
+    """Storage for cached response bodies; subclasses must be thread-safe."""
+
+    evictions: int = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the unexpired value stored under ``key``, if any."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def usage(self) -> Tuple[int, int]:
+        """Return (entries, bytes) currently stored."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache holding at most ``max_bytes`` of response bodies."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.time() + ttl, value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def usage(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._size
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Response cache in a SQLite file, usable by several local processes at once.
+
+    With ``max_bytes`` set, least recently read entries are deleted after a
+    write pushes the file's content over the budget.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, max_bytes: Optional[int] = None) -> None:
+        """
+        Args:
+            path: Database file; created with its parent directory if missing
+            max_bytes: Upper bound for stored response bytes (None for no bound)
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            if self.max_bytes is not None:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), now + ttl, now),
+            )
+            if self.max_bytes is not None:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total - freed <= self.max_bytes:
+                break
+            victims.append((key,))
+            freed += size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def usage(self) -> Tuple[int, int]:
+        with self._lock:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE expires_at > ?", (time.time(),)
+            ).fetchone()
+        return count, size
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class CacheEntry:
+    """A cache lookup for one request: the stored body on a hit, and where to store a fresh one."""
+
+    def __init__(self, cache: "ResponseCache", key: str, ttl: float, body: Optional[Any]) -> None:
+        self._cache = cache
+        self.key = key
+        self.ttl = ttl
+        self.body = body
+
+    def store(self, content: bytes) -> None:
+        """Store the raw JSON body of a successful response."""
+        self._cache._store(self.key, content, self.ttl)
+
+
+class ResponseCache:
+    """
+    Cache in front of scrape, map, search and extract.
+
+    Pass an instance as ``response_cache=`` to FirecrawlClient or
+    AsyncFirecrawlClient.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, *, ttl: float = 3600.0) -> None:
+        """
+        Args:
+            backend: Where responses are kept (default: a 64 MB MemoryCacheBackend)
+            ttl: Seconds an entry lives when the request sets no ``max_age``
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        entries, size = self.backend.usage()
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self.backend.evictions,
+                entries=entries,
+                size_bytes=size,
+            )
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def ttl_for(self, payload: Dict[str, Any]) -> float:
+        """Seconds to keep a response to ``payload``; 0 when it must not be cached."""
+        max_age = payload.get("maxAge")
+        if max_age is None and isinstance(payload.get("scrapeOptions"), dict):
+            max_age = payload["scrapeOptions"].get("maxAge")
+        if max_age is None:
+            return self.ttl
+        return max(float(max_age) / 1000.0, 0.0)
+
+    @staticmethod
+    def key_for(api_url: str, endpoint: str, payload: Dict[str, Any]) -> str:
+        canonical = json.dumps([api_url, endpoint, payload], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def entry(self, api_url: str, endpoint: str, payload: Dict[str, Any]) -> Optional[CacheEntry]:
+        """Look up a request; None when the request bypasses the cache."""
+        ttl = self.ttl_for(payload)
+        if ttl <= 0:
+            return None
+        key = self.key_for(api_url, endpoint, payload)
+        content = self.backend.get(key)
+        body = None
+        if content is not None:
+            try:
+                body = json.loads(content)
+            except ValueError:
+                self.backend.delete(key)
+        with self._lock:
+            if body is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return CacheEntry(self, key, ttl, body)
+
+    def _store(self, key: str, content: bytes, ttl: float) -> None:
+        self.backend.set(key, content, ttl)
+        with self._lock:
+            self._stores += 1
+
+
+def response_cache_of(client: Any) -> Optional[ResponseCache]:
+    """Return the ResponseCache configured on an HTTP client, if any."""
+    cache = getattr(client, "response_cache", None)
+    return cache if isinstance(cache, ResponseCache) else None
+
+
+def cache_entry(client: Any, endpoint: str, payload: Dict[str, Any]) -> Optional[CacheEntry]:
+    """Look up ``payload`` in the client's cache; None when no cache applies."""
+    cache = response_cache_of(client)
+    if cache is None:
+        return None
+    return cache.entry(getattr(client, "api_url", ""), endpoint, payload)
@@ -0,0 +1,134 @@
+"""
+In-flight deduplication ("singleflight") of identical requests.
+
+When several callers issue the same request while one is already on the wire,
+only the first is sent; the others wait for it and receive the same response,
+or the same exception. Requests are identical when endpoint, payload and
+headers hash the same (canonical JSON, sorted keys). Nothing is kept once the
+request completes; use a ResponseCache for reuse over time.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Read-only endpoints whose concurrent duplicates can share one response
+COALESCED_ENDPOINTS = ("/v2/scrape", "/v2/map", "/v2/search")
+
+
+class SingleFlightStats(BaseModel):
+    """Counters for request coalescing."""
+
+    # Requests that reached the network
+    executed: int = 0
+    # Calls that shared the response of an identical in-flight request
+    collapsed: int = 0
+    in_flight: int = 0
+
+
+def request_key(endpoint: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> str:
+    canonical = json.dumps([endpoint, payload, headers or {}], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _FlightBase:
+    def __init__(self, endpoints: Iterable[str]) -> None:
+        self.endpoints = frozenset(endpoints)
+        self._stats = SingleFlightStats()
+
+    def applies_to(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+
+class SingleFlight(_FlightBase):
+    """Thread-safe coalescing of identical concurrent calls."""
+
+    def __init__(self, endpoints: Iterable[str] = COALESCED_ENDPOINTS) -> None:
+        super().__init__(endpoints)
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.in_flight = len(self._calls)
+        return stats
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with ``key`` is in flight; then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats.executed += 1
+            else:
+                self._stats.collapsed += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight(_FlightBase):
+    """
+    Coalescing of identical concurrent calls on one event loop.
+
+    The shared call runs as its own task, so cancelling the caller that
+    started it does not cancel the request for the others.
+    """
+
+    def __init__(self, endpoints: Iterable[str] = COALESCED_ENDPOINTS) -> None:
+        super().__init__(endpoints)
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        stats = self._stats.model_copy()
+        stats.in_flight = len(self._calls)
+        return stats
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is not None:
+            self._stats.collapsed += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._stats.executed += 1
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the outcome as retrieved when every caller went away
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,262 @@
+"""
+URL canonicalization and duplicate removal before URLs are submitted.
+
+Equivalent spellings of a URL (fragment, default port, trailing slash,
+tracking parameters, host case) are reduced to one canonical key; only the
+first URL seen for each key is submitted, unchanged. Keys are kept in an
+exact set until ``exact_limit`` distinct URLs have been seen, then in a Bloom
+filter whose memory is fixed by its capacity and false-positive rate. A false
+positive drops a URL that was not a duplicate, with at most the configured
+probability.
+"""
+
+import hashlib
+import logging
+import math
+from typing import Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from pydantic import BaseModel
+
+logger = logging.getLogger("firecrawl")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters that only carry campaign or click attribution
+TRACKING_PARAMS = frozenset({
+    "fbclid",
+    "gclid",
+    "gclsrc",
+    "dclid",
+    "gbraid",
+    "wbraid",
+    "msclkid",
+    "yclid",
+    "twclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "_hsenc",
+    "_hsmi",
+    "mkt_tok",
+    "oly_anon_id",
+    "oly_enc_id",
+    "vero_id",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+
+def canonicalize_url(url: str, *, strip_tracking: bool = True) -> str:
+    """
+    Reduce a URL to the form used to detect duplicates.
+
+    Lower-cases the scheme and host, drops the default port, the fragment,
+    tracking query parameters and a trailing slash (except for the root
+    path). Query parameter order is kept, since some sites depend on it.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{host}"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc += f":{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+
+    query = parts.query
+    if query and strip_tracking:
+        pairs = parse_qsl(query, keep_blank_values=True)
+        kept = [(k, v) for k, v in pairs if not _is_tracking_param(k)]
+        if len(kept) != len(pairs):
+            query = urlencode(kept)
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def _is_tracking_param(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing of one blake2b digest)."""
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """Add ``item``; returns False if it was (probably) already present."""
+        new = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            mask = 1 << bit
+            if not self._bits[byte] & mask:
+                self._bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos // 8] & (1 << (pos % 8)) for pos in self._positions(item))
+
+
+class DedupeReport(BaseModel):
+    """Outcome of URL deduplication."""
+
+    seen: int = 0
+    unique: int = 0
+    collapsed: int = 0
+    # True once keys moved from the exact set to the Bloom filter
+    probabilistic: bool = False
+    # Size of the Bloom filter (0 while the exact set is in use)
+    memory_bytes: int = 0
+
+
+class UrlDeduplicator:
+    """
+    Remembers canonical URL keys across calls and drops repeats.
+
+    One instance can span many requests (a large batch's chunks, a
+    producer's micro-batches), so duplicates are collapsed across all of
+    them.
+    """
+
+    def __init__(
+        self,
+        *,
+        exact_limit: int = 100_000,
+        capacity: int = 10_000_000,
+        false_positive_rate: float = 0.001,
+        strip_tracking: bool = True,
+    ) -> None:
+        """
+        Args:
+            exact_limit: Distinct URLs kept in an exact set before switching
+                to the Bloom filter
+            capacity: URLs the Bloom filter is sized for; beyond it the
+                false-positive rate rises
+            false_positive_rate: Target probability that a new URL is wrongly
+                treated as a duplicate once the Bloom filter is in use
+            strip_tracking: Remove utm_* and click-id query parameters when
+                comparing URLs
+        """
+        if exact_limit < 0:
+            raise ValueError("exact_limit must be non-negative")
+        if capacity < exact_limit:
+            raise ValueError("capacity must be at least exact_limit")
+        self._exact_limit = exact_limit
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._strip_tracking = strip_tracking
+        self._exact: Optional[Set[str]] = set()
+        self._bloom: Optional[BloomFilter] = None
+        self._report = DedupeReport()
+        if exact_limit == 0:
+            self._switch_to_bloom()
+
+    @property
+    def report(self) -> DedupeReport:
+        report = self._report.model_copy()
+        report.probabilistic = self._bloom is not None
+        report.memory_bytes = self._bloom.size_bytes if self._bloom is not None else 0
+        return report
+
+    def _switch_to_bloom(self) -> None:
+        self._bloom = BloomFilter(self._capacity, self._false_positive_rate)
+        for key in self._exact or ():
+            self._bloom.add(key)
+        self._exact = None
+
+    def add(self, url: str) -> bool:
+        """Record ``url``; returns True if it was not seen before."""
+        key = canonicalize_url(url, strip_tracking=self._strip_tracking)
+        self._report.seen += 1
+        if self._exact is not None:
+            if key in self._exact:
+                new = False
+            else:
+                self._exact.add(key)
+                new = True
+                if len(self._exact) > self._exact_limit:
+                    self._switch_to_bloom()
+        else:
+            new = self._bloom.add(key)
+        if new:
+            self._report.unique += 1
+        else:
+            self._report.collapsed += 1
+        return new
+
+    def filter(self, urls: Iterable[str]) -> List[str]:
+        """Return the URLs not seen before, in order, keeping their original spelling."""
+        return [url for url in urls if self.add(url)]
+
+
+DedupeOption = Union[bool, UrlDeduplicator, None]
+
+
+def dedupe_urls(urls: List[str], dedupe: DedupeOption = True) -> Tuple[List[str], int]:
+    """
+    Apply a ``dedupe`` option to a URL list.
+
+    Args:
+        urls: URLs to submit
+        dedupe: True for a deduplicator sized to ``urls`` (exact for small
+            inputs), a UrlDeduplicator to share state across calls, or
+            False/None to keep every URL
+
+    Returns:
+        (URLs to submit, number of URLs collapsed)
+    """
+    if not dedupe:
+        return urls, 0
+    deduper = dedupe if isinstance(dedupe, UrlDeduplicator) else deduplicator_for(len(urls))
+    before = deduper.report.collapsed
+    kept = deduper.filter(urls)
+    collapsed = deduper.report.collapsed - before
+    if collapsed:
+        logger.debug("Collapsed %d duplicate URLs out of %d", collapsed, len(urls))
+    return kept, collapsed
+
+
+def deduplicator_for(expected_urls: int, false_positive_rate: float = 0.001) -> UrlDeduplicator:
+    """A deduplicator sized for ``expected_urls`` inputs."""
+    capacity = max(expected_urls, 1)
+    return UrlDeduplicator(
+        exact_limit=min(100_000, capacity), capacity=capacity, false_positive_rate=false_positive_rate
+    )
@@ -9,18 +9,135 @@ Usage:
 
 import asyncio
 import json
+import random
 import threading
-from typing import Callable, List, Optional, Literal, Union, Dict, Any
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Deque, List, Optional, Literal, Tuple, Union, Dict, Any
 
 import websockets
 
-from .types import CrawlJob, BatchScrapeJob, Document
-from .utils.normalize import normalize_document_input
+from .types import CrawlJob, BatchScrapeJob, Document, WatcherDispatchStats, WatcherSummary
+from .utils.normalize import ReplayFilter, parse_documents
+from .utils.assets import asset_store_of, externalize_raw_documents
 
 
 JobKind = Literal["crawl", "batch"]
 JobType = Union[CrawlJob, BatchScrapeJob]
 
+# Upper bound for the delay between websocket reconnect attempts, in seconds
+_MAX_RECONNECT_BACKOFF = 30.0
+
+
+class _SerialDispatcher:
+    """
+    Runs one watcher's listener calls on a (possibly shared) executor, one at a
+    time and in the order they were queued.
+
+    ``submit`` never blocks the caller's event loop: the websocket reader
+    awaits ``wait_for_room`` before reading the next frame instead, so under a
+    WatcherHub a slow listener holds up only its own job.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int) -> None:
+        self._executor = executor
+        self._max_pending = max_pending
+        self._items: Deque[Tuple[float, Callable[..., None], Tuple[Any, ...]]] = deque()
+        self._cond = threading.Condition()
+        self._running = False
+        # Readers waiting in wait_for_room(), woken from the draining thread
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self.stats = WatcherDispatchStats()
+
+    def submit(self, fn: Callable[..., None], *args: Any) -> None:
+        with self._cond:
+            if len(self._items) >= self._max_pending and not _on_event_loop():
+                # Off-loop callers (e.g. dispatch_event from an application thread) may block
+                started = time.perf_counter()
+                self._cond.wait_for(lambda: len(self._items) < self._max_pending)
+                self.stats.blocked_seconds += time.perf_counter() - started
+            self._items.append((time.perf_counter(), fn, args))
+            self.stats.pending = len(self._items)
+            self.stats.max_pending = max(self.stats.max_pending, self.stats.pending)
+            if self._running:
+                return
+            self._running = True
+        try:
+            self._executor.submit(self._drain)
+        except BaseException:
+            # Rejected (e.g. the executor was shut down): nothing will drain the
+            # queue, so withdraw the event and wake submitters and flush()
+            with self._cond:
+                self._items.pop()
+                self.stats.pending = len(self._items)
+                self._running = False
+                self._cond.notify_all()
+                self._wake_waiters()
+            raise
+
+    async def wait_for_room(self) -> None:
+        """Wait, without blocking the event loop, until fewer than max_pending events are queued."""
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if len(self._items) < self._max_pending:
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        started = time.perf_counter()
+        try:
+            await waiter
+        finally:
+            with self._cond:
+                self.stats.blocked_seconds += time.perf_counter() - started
+
+    def _wake_waiters(self) -> None:
+        # Called with self._cond held
+        waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                # The reader's loop has been closed
+                pass
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                if not self._items:
+                    self._running = False
+                    self._cond.notify_all()
+                    self._wake_waiters()
+                    return
+                queued_at, fn, args = self._items.popleft()
+                lag = time.perf_counter() - queued_at
+                stats = self.stats
+                stats.pending = len(self._items)
+                stats.dispatched += 1
+                stats.total_lag_seconds += lag
+                stats.max_lag_seconds = max(stats.max_lag_seconds, lag)
+                self._cond.notify_all()
+                if self._waiters and len(self._items) < self._max_pending:
+                    self._wake_waiters()
+            fn(*args)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._items and not self._running, timeout)
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
 
 class Watcher:
     def __init__(
@@ -30,7 +147,52 @@ class Watcher:
         kind: JobKind = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        *,
+        stream: bool = False,
+        recent_window: int = 0,
+        max_reconnects: int = 5,
+        reconnect_backoff: float = 0.5,
+        listener_executor: Optional[Executor] = None,
+        max_pending_events: int = 1000,
+        dedupe_window: int = 10_000,
     ) -> None:
+        """
+        Args:
+            client: FirecrawlClient used for HTTP status fallback
+            job_id: Job ID to watch
+            kind: Job kind ("crawl" or "batch")
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to watch (None for no timeout)
+            stream: Dispatch each document to "document" listeners exactly once
+                and release it instead of accumulating ``data``; HTTP fallback
+                reads results incrementally from a cursor. Snapshots carry no
+                documents and terminal events carry ``summary``
+            recent_window: In streaming mode, number of most recent documents
+                kept in ``recent``
+            max_reconnects: Consecutive websocket reconnect attempts before
+                falling back to HTTP polling
+            reconnect_backoff: Initial delay in seconds between reconnect
+                attempts; doubled (with jitter) after each failed attempt
+            listener_executor: Run listeners and event handlers on this executor
+                instead of the websocket thread, so slow listeners do not delay
+                frame reading; events of this job still run one at a time, in
+                order. The executor may be shared between watchers.
+            max_pending_events: With a listener executor, events queued before
+                the websocket reader waits for listeners to catch up (events
+                from a frame already read are still queued; the reader then
+                waits, without blocking its event loop, before the next frame)
+            dedupe_window: Keys of the most recently delivered documents kept to
+                drop them from replays; older replayed documents are dropped by
+                their position (see ReplayFilter)
+        """
+        if recent_window < 0:
+            raise ValueError("recent_window must be non-negative")
+        if dedupe_window < 1:
+            raise ValueError("dedupe_window must be at least 1")
+        if max_reconnects < 0 or reconnect_backoff < 0:
+            raise ValueError("max_reconnects and reconnect_backoff must be non-negative")
+        if max_pending_events < 1:
+            raise ValueError("max_pending_events must be at least 1")
         self._client = client
         self._job_id = job_id
         self._kind = kind
@@ -43,10 +205,17 @@ class Watcher:
         http_client = getattr(client, "http_client", None)
         self._api_url: Optional[str] = getattr(http_client, "api_url", None)
         self._api_key: Optional[str] = getattr(http_client, "api_key", None)
+        self._assets = asset_store_of(http_client)
 
         # v1-parity state and event handlers
         self.status: str = "scraping"
         self.data: List[Dict[str, Any]] = []
+        self._stream = stream
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=recent_window)
+        self._documents_seen = 0
+        self._progress: Dict[str, Any] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
         self._event_handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {
             "done": [],
             "error": [],
@@ -54,11 +223,35 @@ class Watcher:
         }
         self._sent_done: bool = False
         self._sent_error: bool = False
+        self._max_reconnects = max_reconnects
+        self._reconnect_backoff = reconnect_backoff
+        self._reconnects = 0
+        self._messages_received = 0
+        # Documents already delivered, so a catchup replayed after reconnecting adds only new ones
+        self._replays = ReplayFilter(dedupe_window)
+        # Number of results already read through HTTP pagination (streaming mode)
+        self._cursor = 0
+        self._dispatcher = (
+            _SerialDispatcher(listener_executor, max_pending_events) if listener_executor is not None else None
+        )
+        # Set by WatcherHub: shared scheduler that runs HTTP status polls
+        self._poller: Optional[Any] = None
 
     def add_listener(self, callback: Callable[[JobType], None]) -> None:
         self._listeners.append(callback)
 
     def _emit(self, status: JobType) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.submit(self._call_listeners, status)
+        else:
+            self._call_listeners(status)
+
+    async def _wait_for_listeners(self) -> None:
+        # Backpressure from the listener executor, awaited so a shared loop keeps serving other jobs
+        if self._dispatcher is not None:
+            await self._dispatcher.wait_for_room()
+
+    def _call_listeners(self, status: JobType) -> None:
         for cb in list(self._listeners):
             try:
                 cb(status)
@@ -71,13 +264,80 @@ class Watcher:
             self._event_handlers[event_type].append(handler)
 
     def dispatch_event(self, event_type: str, detail: Dict[str, Any]) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.submit(self._call_handlers, event_type, detail)
+        else:
+            self._call_handlers(event_type, detail)
+
+    def _call_handlers(self, event_type: str, detail: Dict[str, Any]) -> None:
         if event_type in self._event_handlers:
-            for handler in self._event_handlers[event_type]:
+            for handler in list(self._event_handlers[event_type]):
                 try:
                     handler(detail)
                 except Exception:
                     pass
 
+    @property
+    def listener_stats(self) -> WatcherDispatchStats:
+        """Queue depth and lag of executor-backed listener dispatch (zeros when inline)."""
+        if self._dispatcher is None:
+            return WatcherDispatchStats()
+        with self._dispatcher._cond:
+            return self._dispatcher.stats.model_copy()
+
+    def flush_listeners(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been handled by the listener executor.
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.flush(timeout)
+
+    @property
+    def summary(self) -> WatcherSummary:
+        """Document count and latest job progress seen so far."""
+        started = self._started_at
+        end = self._finished_at or time.monotonic()
+        return WatcherSummary(
+            job_id=self._job_id,
+            kind=self._kind,
+            status=self.status,
+            documents=self._documents_seen,
+            completed=self._progress.get("completed") or 0,
+            total=self._progress.get("total") or 0,
+            credits_used=self._progress.get("creditsUsed"),
+            duration_seconds=(end - started) if started is not None else 0.0,
+            reconnects=self._reconnects,
+        )
+
+    def _accept_documents(self, docs: List[Any], dispatch: bool = True, offset: Optional[int] = None) -> None:
+        fresh = self._replays.fresh(docs, offset)
+        docs = externalize_raw_documents(fresh, self._assets)
+        self._documents_seen += len(docs)
+        if self._stream:
+            # Dispatched and released; only the bounded recent window is kept
+            self.recent.extend(docs)
+        else:
+            self.data.extend(docs)
+        if dispatch:
+            for doc in docs:
+                self.dispatch_event("document", {"data": doc, "id": self._job_id})
+
+    def _record_progress(self, payload: Dict[str, Any]) -> None:
+        for key in ("completed", "total", "creditsUsed"):
+            if payload.get(key) is not None:
+                self._progress[key] = payload[key]
+
+    def _terminal_detail(self, status: str, data: Optional[List[Any]] = None) -> Dict[str, Any]:
+        if self._finished_at is None:
+            self._finished_at = time.monotonic()
+        if self._stream:
+            return {"status": status, "data": list(self.recent), "summary": self.summary, "id": self._job_id}
+        return {"status": status, "data": self.data if data is None else data, "id": self._job_id}
+
     def _build_ws_url(self) -> str:
         if not self._api_url:
             raise ValueError("API URL is required for WebSocket watcher")
@@ -87,199 +347,270 @@ class Watcher:
         return f"{ws_base}/v2/batch/scrape/{self._job_id}"
 
     async def _run_ws(self) -> None:
+        if self._started_at is None:
+            self._started_at = time.monotonic()
         uri = self._build_ws_url()
         headers_list = []
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self._timeout if self._timeout else None
+        attempt = 0
         try:
-            async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
-                while not self._stop.is_set():
-                    # Use short recv timeouts to allow HTTP polling fallback
-                    if deadline is not None:
-                        remaining = max(0.0, deadline - asyncio.get_event_loop().time())
-                        timeout = min(self._poll_interval or remaining, remaining)
-                    else:
-                        timeout = self._poll_interval or 5
-                    try:
-                        msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
-                    except asyncio.TimeoutError:
-                        # Quiet period: poll HTTP once to progress statuses
-                        if await self._poll_status_once():
-                            break
-                        else:
-                            continue
-                    except asyncio.CancelledError:
-                        break
-                    except Exception:
-                        # Connection error: switch to HTTP polling until terminal or timeout
-                        while not self._stop.is_set():
-                            if await self._poll_status_once():
-                                return
-                            if deadline is not None and asyncio.get_event_loop().time() >= deadline:
-                                return
-                            await asyncio.sleep(self._poll_interval or 2)
-                        return
-
-                    try:
-                        body = json.loads(msg)
-                    except Exception:
-                        continue
-
-                    # v1-style typed event handling
-                    msg_type = body.get("type")
-                    if msg_type == "error":
-                        self.status = "failed"
-                        self.dispatch_event("error", {
-                            "status": self.status,
-                            "data": self.data,
-                            "error": body.get("error"),
-                            "id": self._job_id,
-                        })
-                        self._sent_error = True
-                        # Emit a final failed snapshot for listeners
-                        if self._kind == "crawl":
-                            job = CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        else:
-                            job = BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        self._emit(job)
-                        break
-                    elif msg_type == "catchup":
-                        d = body.get("data", {})
-                        self.status = d.get("status", self.status)
-                        docs_in = d.get("data", [])
-                        self.data.extend(docs_in)
-                        for doc in docs_in:
-                            self.dispatch_event("document", {"data": doc, "id": self._job_id})
-                    elif msg_type == "document":
-                        doc = body.get("data")
-                        if isinstance(doc, dict):
-                            self.data.append(doc)
-                            self.dispatch_event("document", {"data": doc, "id": self._job_id})
-                    elif msg_type == "done":
-                        self.status = "completed"
-                        # Gather any documents in the done payload
-                        raw_payload = body.get("data", {}) or {}
-                        docs_in = raw_payload.get("data", []) or []
-                        if isinstance(docs_in, list) and docs_in:
-                            for doc in docs_in:
-                                if isinstance(doc, dict):
-                                    self.data.append(doc)
-                        # Dispatch done event first
-                        self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
-                        self._sent_done = True
-                        # Emit a final completed snapshot for listeners and break immediately
-                        docs: List[Document] = []
-                        for doc in self.data:
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
-                        if self._kind == "crawl":
-                            job = CrawlJob(
-                                status="completed",
-                                completed=raw_payload.get("completed", 0),
-                                total=raw_payload.get("total", 0),
-                                credits_used=raw_payload.get("creditsUsed", 0),
-                                expires_at=raw_payload.get("expiresAt"),
-                                next=raw_payload.get("next"),
-                                data=docs,
-                            )
-                        else:
-                            job = BatchScrapeJob(
-                                status="completed",
-                                completed=raw_payload.get("completed", 0),
-                                total=raw_payload.get("total", 0),
-                                credits_used=raw_payload.get("creditsUsed", 0),
-                                expires_at=raw_payload.get("expiresAt"),
-                                next=raw_payload.get("next"),
-                                data=docs,
-                            )
-                        self._emit(job)
-                        break
-
-                    payload = body.get("data", body)
-                    # Only treat messages with an explicit status as job snapshots
-                    has_status_field = (isinstance(payload, dict) and "status" in payload) or ("status" in body)
-                    if not has_status_field:
-                        continue
-                    status_str = payload.get("status", body.get("status", self.status))
-
-                    if self._kind == "crawl":
-                        docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
-                        job = CrawlJob(
-                            status=status_str,
-                            completed=payload.get("completed", 0),
-                            total=payload.get("total", 0),
-                            credits_used=payload.get("creditsUsed", 0),
-                            expires_at=payload.get("expiresAt"),
-                            next=payload.get("next"),
-                            data=docs,
-                        )
-                        self._emit(job)
-                        if status_str in ("completed", "failed", "cancelled"):
-                            # Ensure done/error dispatched even if server didn't send explicit event type
-                            if status_str == "completed" and not self._sent_done:
-                                self.dispatch_event("done", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_done = True
-                            if status_str == "failed" and not self._sent_error:
-                                self.dispatch_event("error", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_error = True
-                            break
-                    else:
-                        docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
-                        job = BatchScrapeJob(
-                            status=status_str,
-                            completed=payload.get("completed", 0),
-                            total=payload.get("total", 0),
-                            credits_used=payload.get("creditsUsed"),
-                            expires_at=payload.get("expiresAt"),
-                            next=payload.get("next"),
-                            data=docs,
-                        )
-                        self._emit(job)
-                        if status_str in ("completed", "failed", "cancelled"):
-                            if status_str == "completed" and not self._sent_done:
-                                self.dispatch_event("done", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_done = True
-                            if status_str == "failed" and not self._sent_error:
-                                self.dispatch_event("error", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_error = True
-                            break
-        except Exception:
-            pass
+            while not self._stop.is_set():
+                received = self._messages_received
+                try:
+                    async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
+                        if await self._consume_ws(websocket, deadline):
+                            return
+                except Exception:
+                    pass
+                if self._messages_received > received:
+                    # The connection was healthy for a while; start backing off from scratch
+                    attempt = 0
+                if self._stop.is_set() or (deadline is not None and loop.time() >= deadline):
+                    return
+                if attempt >= self._max_reconnects:
+                    # Out of reconnect attempts: HTTP polling until terminal or timeout
+                    await self._poll_until_terminal(deadline)
+                    return
+                delay = min(self._reconnect_backoff * (2 ** attempt), _MAX_RECONNECT_BACKOFF)
+                delay *= 0.5 + random.random() / 2
+                if deadline is not None:
+                    delay = min(delay, max(0.0, deadline - loop.time()))
+                await asyncio.sleep(delay)
+                attempt += 1
+                self._reconnects += 1
         finally:
             # Ensure terminal event parity with v1 even on abrupt disconnects
             if self.status == "completed" and not self._sent_done:
-                self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
+                self.dispatch_event("done", self._terminal_detail(self.status))
+                self._sent_done = True
+
+    async def _consume_ws(self, websocket: Any, deadline: Optional[float]) -> bool:
+        """Handle messages from one connection. Returns True once watching is over, False if it dropped."""
+        loop = asyncio.get_event_loop()
+        while not self._stop.is_set():
+            await self._wait_for_listeners()
+            # Use short recv timeouts to allow HTTP polling fallback
+            if deadline is not None:
+                remaining = max(0.0, deadline - loop.time())
+                timeout = min(self._poll_interval or remaining, remaining)
+            else:
+                timeout = self._poll_interval or 5
+            try:
+                msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Quiet period: poll HTTP once to progress statuses
+                if await self._poll_status_once():
+                    return True
+                if deadline is not None and loop.time() >= deadline:
+                    return True
+                continue
+            except asyncio.CancelledError:
+                return True
+            except Exception:
+                # Connection dropped: reconnect (the server replays progress as a catchup)
+                return False
+            self._messages_received += 1
+
+            try:
+                body = json.loads(msg)
+            except Exception:
+                continue
+
+            # v1-style typed event handling
+            msg_type = body.get("type")
+            if msg_type == "error":
+                self.status = "failed"
+                detail = self._terminal_detail(self.status)
+                detail["error"] = body.get("error")
+                self.dispatch_event("error", detail)
+                self._sent_error = True
+                # Emit a final failed snapshot for listeners
+                if self._kind == "crawl":
+                    job = CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                else:
+                    job = BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                self._emit(job)
+                return True
+            elif msg_type == "catchup":
+                d = body.get("data", {})
+                self.status = d.get("status", self.status)
+                self._record_progress(d)
+                self._accept_documents(d.get("data", []) or [], offset=0)
+            elif msg_type == "document":
+                self._accept_documents([body.get("data")])
+            elif msg_type == "done":
+                self.status = "completed"
+                # Gather any documents in the done payload
+                raw_payload = body.get("data", {}) or {}
+                self._record_progress(raw_payload)
+                docs_in = raw_payload.get("data", []) or []
+                if isinstance(docs_in, list) and docs_in:
+                    # Streaming mode has no accumulated list to hand over later
+                    self._accept_documents(docs_in, dispatch=self._stream)
+                # Dispatch done event first
+                self.dispatch_event("done", self._terminal_detail(self.status))
                 self._sent_done = True
+                # Emit a final completed snapshot for listeners and stop
+                final_docs = list(self.recent) if self._stream else self.data
+                docs: List[Document] = parse_documents(final_docs, assets=self._assets)
+                if self._kind == "crawl":
+                    job = CrawlJob(
+                        status="completed",
+                        completed=raw_payload.get("completed", 0),
+                        total=raw_payload.get("total", 0),
+                        credits_used=raw_payload.get("creditsUsed", 0),
+                        expires_at=raw_payload.get("expiresAt"),
+                        next=raw_payload.get("next"),
+                        data=docs,
+                    )
+                else:
+                    job = BatchScrapeJob(
+                        status="completed",
+                        completed=raw_payload.get("completed", 0),
+                        total=raw_payload.get("total", 0),
+                        credits_used=raw_payload.get("creditsUsed", 0),
+                        expires_at=raw_payload.get("expiresAt"),
+                        next=raw_payload.get("next"),
+                        data=docs,
+                    )
+                self._emit(job)
+                return True
+
+            payload = body.get("data", body)
+            # Only treat messages with an explicit status as job snapshots
+            has_status_field = (isinstance(payload, dict) and "status" in payload) or ("status" in body)
+            if not has_status_field:
+                continue
+            status_str = payload.get("status", body.get("status", self.status))
+            self.status = status_str
+            self._record_progress(payload)
+
+            if self._kind == "crawl":
+                docs = [] if self._stream else parse_documents(payload.get("data", []), assets=self._assets)
+                job = CrawlJob(
+                    status=status_str,
+                    completed=payload.get("completed", 0),
+                    total=payload.get("total", 0),
+                    credits_used=payload.get("creditsUsed", 0),
+                    expires_at=payload.get("expiresAt"),
+                    next=payload.get("next"),
+                    data=docs,
+                )
+                self._emit(job)
+                if status_str in ("completed", "failed", "cancelled"):
+                    # Ensure done/error dispatched even if server didn't send explicit event type
+                    if status_str == "completed" and not self._sent_done:
+                        self.dispatch_event("done", self._terminal_detail(status_str))
+                        self._sent_done = True
+                    if status_str == "failed" and not self._sent_error:
+                        self.dispatch_event("error", self._terminal_detail(status_str))
+                        self._sent_error = True
+                    return True
+            else:
+                docs = [] if self._stream else parse_documents(payload.get("data", []), assets=self._assets)
+                job = BatchScrapeJob(
+                    status=status_str,
+                    completed=payload.get("completed", 0),
+                    total=payload.get("total", 0),
+                    credits_used=payload.get("creditsUsed"),
+                    expires_at=payload.get("expiresAt"),
+                    next=payload.get("next"),
+                    data=docs,
+                )
+                self._emit(job)
+                if status_str in ("completed", "failed", "cancelled"):
+                    if status_str == "completed" and not self._sent_done:
+                        self.dispatch_event("done", self._terminal_detail(status_str))
+                        self._sent_done = True
+                    if status_str == "failed" and not self._sent_error:
+                        self.dispatch_event("error", self._terminal_detail(status_str))
+                        self._sent_error = True
+                    return True
+        return True
+
+    async def _poll_until_terminal(self, deadline: Optional[float]) -> None:
+        while not self._stop.is_set():
+            await self._wait_for_listeners()
+            if await self._poll_status_once():
+                return
+            if deadline is not None and asyncio.get_event_loop().time() >= deadline:
+                return
+            await asyncio.sleep(self._poll_interval or 2)
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._poller is not None:
+            return await self._poller.run(fn, *args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def _fetch_from_cursor(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]], int]:
+        """
+        Fetch result pages from the HTTP cursor onwards (blocking).
+
+        Returns:
+            (last page body, documents on those pages, new cursor)
+        """
+        if self._kind == "crawl":
+            fetch_page = self._client.get_crawl_status_page
+            url = f"/v2/crawl/{self._job_id}?skip={self._cursor}"
+        else:
+            fetch_page = self._client.get_batch_scrape_status_page
+            url = f"/v2/batch/scrape/{self._job_id}?skip={self._cursor}"
+        cursor = self._cursor
+        docs: List[Dict[str, Any]] = []
+        page = fetch_page(url, raw="api")
+        while True:
+            page_docs = page.get("data") or []
+            docs.extend(page_docs)
+            cursor += len(page_docs)
+            if not page.get("next") or not page_docs:
+                return page, docs, cursor
+            page = fetch_page(page["next"], raw="api")
 
     async def _poll_status_once(self) -> bool:
         """Poll job status over HTTP once. Returns True if terminal."""
         try:
-            if self._kind == "crawl":
-                job: CrawlJob = await asyncio.to_thread(self._client.get_crawl_status, self._job_id)
+            if self._stream:
+                # Only results past the cursor are fetched; documents already
+                # delivered over the websocket are dropped by _accept_documents
+                page, docs, cursor = await self._run_blocking(self._fetch_from_cursor)
+            elif self._kind == "crawl":
+                # Watchers always work with typed snapshots, regardless of the client's raw default
+                job: JobType = await self._run_blocking(self._client.get_crawl_status, self._job_id, raw=False)
             else:
-                job: BatchScrapeJob = await asyncio.to_thread(self._client.get_batch_scrape_status, self._job_id)
+                job = await self._run_blocking(self._client.get_batch_scrape_status, self._job_id, raw=False)
         except Exception:
             return False
 
+        if self._stream:
+            offset, self._cursor = self._cursor, cursor
+            self._accept_documents(docs, offset=offset)
+            job_cls = CrawlJob if self._kind == "crawl" else BatchScrapeJob
+            credits_used = page.get("creditsUsed")
+            if credits_used is None and self._kind == "crawl":
+                credits_used = 0
+            job = job_cls(
+                status=page.get("status", self.status),
+                completed=page.get("completed") or 0,
+                total=page.get("total") or 0,
+                credits_used=credits_used,
+                expires_at=page.get("expiresAt"),
+                next=None,
+                data=[],
+            )
+
         self.status = job.status
+        self._record_progress({"completed": job.completed, "total": job.total, "creditsUsed": job.credits_used})
         self._emit(job)
         if job.status in ("completed", "failed", "cancelled"):
             if job.status == "completed" and not self._sent_done:
-                self.dispatch_event("done", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                self.dispatch_event("done", self._terminal_detail(job.status, [d.model_dump() for d in job.data]))
                 self._sent_done = True
             if job.status == "failed" and not self._sent_error:
-                self.dispatch_event("error", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                self.dispatch_event("error", self._terminal_detail(job.status, [d.model_dump() for d in job.data]))
                 self._sent_error = True
             return True
         return False
@@ -288,9 +619,13 @@ class Watcher:
         asyncio.run(self._run_ws())
 
     def start(self) -> None:
+        if self._poller is not None:
+            raise RuntimeError("Watcher is managed by a WatcherHub")
         if self._thread and self._thread.is_alive():
             return
         self._stop.clear()
+        self._started_at = time.monotonic()
+        self._finished_at = None
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
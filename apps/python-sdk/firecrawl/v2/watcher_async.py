@@ -4,21 +4,140 @@ Async WebSocket watcher with async iterator interface for v2 jobs.
 Usage:
     async for snapshot in AsyncWatcher(client, job_id, kind="crawl"):
         print(snapshot.status)
+
+    # Bulk inserts: lists of up to 500 new documents, at least once a second
+    async for docs in AsyncWatcher(client, job_id, stream=True).batches(500, interval=1.0):
+        await db.insert_many(docs)
 """
 
 import asyncio
 import inspect
 import json
+import pickle
+import random
+import struct
+import tempfile
 import time
-from typing import AsyncIterator, Dict, List, Literal, Optional
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Literal, Optional, Tuple
 
 import websockets
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
 
-from .types import BatchScrapeJob, CrawlJob, Document
-from .utils.normalize import normalize_document_input
+from .types import BatchScrapeJob, CrawlJob, Document, WatcherQueueStats, WatcherSummary
+from .utils.normalize import ReplayFilter, parse_documents
+from .utils.assets import asset_store_of, externalize_raw_documents
 
 JobKind = Literal["crawl", "batch"]
+OverflowPolicy = Literal["block", "coalesce", "spill"]
+
+# Upper bound for the delay between websocket reconnect attempts, in seconds
+_MAX_RECONNECT_BACKOFF = 30.0
+# Queue size used by batches() when no max_queue is configured
+_DEFAULT_BATCH_QUEUE = 64
+_END = object()
+_LENGTH = struct.Struct("<Q")
+
+
+class _SpillFile:
+    """FIFO of pickled snapshots in an anonymous temporary file."""
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._read_offset = 0
+        self._write_offset = 0
+        self.pending = 0
+
+    def push(self, item: Any) -> None:
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.seek(self._write_offset)
+        self._file.write(_LENGTH.pack(len(data)))
+        self._file.write(data)
+        self._write_offset = self._file.tell()
+        self.pending += 1
+
+    def pop(self) -> Any:
+        self._file.seek(self._read_offset)
+        (size,) = _LENGTH.unpack(self._file.read(_LENGTH.size))
+        item = pickle.loads(self._file.read(size))
+        self._read_offset = self._file.tell()
+        self.pending -= 1
+        if not self.pending:
+            # Drained: reuse the file from the start
+            self._file.truncate(0)
+            self._read_offset = self._write_offset = 0
+        return item
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _SnapshotQueue:
+    """Bounded queue between the websocket receiver and the consumer."""
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy, merge) -> None:
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._merge = merge
+        self._items: Deque[Any] = deque()
+        self._spill: Optional[_SpillFile] = None
+        self._cond = asyncio.Condition()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.stats = WatcherQueueStats()
+
+    async def put(self, item: Any) -> None:
+        async with self._cond:
+            if len(self._items) >= self._maxsize or (self._spill is not None and self._spill.pending):
+                if self._overflow == "block":
+                    started = time.perf_counter()
+                    await self._cond.wait_for(lambda: len(self._items) < self._maxsize)
+                    self.stats.blocked_seconds += time.perf_counter() - started
+                    self._items.append(item)
+                elif self._overflow == "coalesce":
+                    self._items[-1] = self._merge(self._items[-1], item)
+                    self.stats.coalesced += 1
+                else:
+                    if self._spill is None:
+                        self._spill = _SpillFile()
+                    # Everything after the first spilled item is spilled too, to keep order
+                    self._spill.push(item)
+                    self.stats.spilled += 1
+            else:
+                self._items.append(item)
+            self.stats.max_depth = max(self.stats.max_depth, len(self._items))
+            self._cond.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None) -> None:
+        async with self._cond:
+            self._closed = True
+            self._error = error
+            self._cond.notify_all()
+
+    def _has_items(self) -> bool:
+        return bool(self._items) or (self._spill is not None and self._spill.pending > 0)
+
+    async def get(self) -> Any:
+        """Next snapshot, or ``_END`` once the receiver has finished."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._has_items() or self._closed)
+            if self._items:
+                item = self._items.popleft()
+                spill = self._spill
+                while spill is not None and spill.pending and len(self._items) < self._maxsize:
+                    self._items.append(spill.pop())
+            elif self._has_items():
+                item = self._spill.pop()
+            else:
+                if self._error is not None:
+                    raise self._error
+                return _END
+            self._cond.notify_all()
+            return item
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
 
 
 class AsyncWatcher:
@@ -30,7 +149,53 @@ class AsyncWatcher:
         kind: JobKind = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        stream: bool = False,
+        recent_window: int = 0,
+        max_reconnects: int = 5,
+        reconnect_backoff: float = 0.5,
+        max_queue: int = 0,
+        overflow: OverflowPolicy = "block",
+        dedupe_window: int = 10_000,
     ) -> None:
+        """
+        Args:
+            client: Client used for HTTP status fallback
+            job_id: Job ID to watch
+            kind: Job kind ("crawl" or "batch")
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to watch (None for no timeout)
+            stream: Yield each document exactly once, in the snapshot for the
+                message (or HTTP fallback poll) that delivered it, instead of
+                accumulating them for the final snapshot; HTTP fallback reads
+                results incrementally from a cursor and ``summary`` holds the
+                running counters
+            recent_window: In streaming mode, number of most recent documents
+                kept in ``recent``
+            max_reconnects: Consecutive websocket reconnect attempts before
+                falling back to HTTP polling
+            reconnect_backoff: Initial delay in seconds between reconnect
+                attempts; doubled (with jitter) after each failed attempt
+            max_queue: Receive snapshots in a background task into a queue of
+                at most this many snapshots, so a slow consumer does not stall
+                the websocket reader (0 receives inline, on demand)
+            overflow: What to do when the queue is full: "block" stops reading
+                the websocket until the consumer catches up, "coalesce" merges
+                the snapshot into the last queued one (documents are kept in
+                streaming mode), "spill" writes it to a temporary file
+            dedupe_window: Keys of the most recently delivered documents kept to
+                drop them from replays; older replayed documents are dropped by
+                their position (see ReplayFilter)
+        """
+        if recent_window < 0:
+            raise ValueError("recent_window must be non-negative")
+        if dedupe_window < 1:
+            raise ValueError("dedupe_window must be at least 1")
+        if max_reconnects < 0 or reconnect_backoff < 0:
+            raise ValueError("max_reconnects and reconnect_backoff must be non-negative")
+        if max_queue < 0:
+            raise ValueError("max_queue must be non-negative")
+        if overflow not in ("block", "coalesce", "spill"):
+            raise ValueError("overflow must be 'block', 'coalesce' or 'spill'")
         self._client = client
         self._job_id = job_id
         self._kind = kind
@@ -41,17 +206,174 @@ class AsyncWatcher:
         if http_client is not None:
             self._api_url = getattr(http_client, "api_url", None)
             self._api_key = getattr(http_client, "api_key", None)
+            self._assets = asset_store_of(http_client)
         else:
             # Allow passing the top-level Firecrawl client directly
             self._api_url = getattr(client, "api_url", None)
             self._api_key = getattr(client, "api_key", None)
+            self._assets = None
 
         self._status: str = "scraping"
         self._data: List[Dict] = []
+        self._stream = stream
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=recent_window)
+        self._documents_seen = 0
+        self._progress: Dict[str, Any] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._max_reconnects = max_reconnects
+        self._reconnect_backoff = reconnect_backoff
+        self._reconnects = 0
+        self._messages_received = 0
+        self._ws_dropped = False
+        # Documents already delivered, so a catchup replayed after reconnecting adds only new ones
+        self._replays = ReplayFilter(dedupe_window)
+        # Number of results already read through HTTP pagination (streaming mode)
+        self._cursor = 0
+        self._max_queue = max_queue
+        self._overflow = overflow
+        self._queue_stats = WatcherQueueStats()
 
     def __aiter__(self) -> AsyncIterator[object]:
+        if self._max_queue:
+            return self._iterate_queued(self._max_queue)
         return self._iterate()
 
+    @property
+    def queue_stats(self) -> WatcherQueueStats:
+        """Flow-control counters of the most recent queued iteration."""
+        return self._queue_stats.model_copy()
+
+    async def batches(self, size: int = 100, interval: Optional[float] = None) -> AsyncIterator[List[Document]]:
+        """
+        Iterate over newly received documents in lists, for bulk inserts.
+
+        Requires ``stream=True`` so each document is delivered exactly once.
+
+        Args:
+            size: Maximum documents per batch; a batch is yielded as soon as it is full
+            interval: Also yield a non-empty partial batch this many seconds after
+                its first document arrived
+
+        Returns:
+            Async iterator of document lists; the last batch may be smaller
+        """
+        if not self._stream:
+            raise ValueError("batches() requires stream=True")
+        if size < 1 or (interval is not None and interval <= 0):
+            raise ValueError("size and interval must be positive")
+        loop = asyncio.get_event_loop()
+        queue, receiver = self._start_receiver(self._max_queue or _DEFAULT_BATCH_QUEUE)
+        pending: List[Document] = []
+        flush_at: Optional[float] = None
+        try:
+            while True:
+                if flush_at is None:
+                    item = await queue.get()
+                else:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), max(0.0, flush_at - loop.time()))
+                    except asyncio.TimeoutError:
+                        yield pending
+                        pending, flush_at = [], None
+                        continue
+                if item is _END:
+                    break
+                if not item.data:
+                    continue
+                if not pending and interval is not None:
+                    flush_at = loop.time() + interval
+                pending.extend(item.data)
+                while len(pending) >= size:
+                    yield pending[:size]
+                    pending = pending[size:]
+                if not pending:
+                    flush_at = None
+            if pending:
+                yield pending
+        finally:
+            await self._stop_receiver(queue, receiver)
+
+    def _merge_snapshots(self, older, newer):
+        if self._stream and older.data:
+            # Streaming snapshots carry only their own documents; keep all of them
+            newer.data = list(older.data) + list(newer.data or [])
+        return newer
+
+    def _start_receiver(self, maxsize: int) -> Tuple[_SnapshotQueue, "asyncio.Task[None]"]:
+        queue = _SnapshotQueue(maxsize, self._overflow, self._merge_snapshots)
+        self._queue_stats = queue.stats
+
+        async def receive() -> None:
+            error: Optional[BaseException] = None
+            try:
+                async for snapshot in self._iterate():
+                    await queue.put(snapshot)
+            except Exception as exc:
+                error = exc
+            finally:
+                await queue.finish(error)
+
+        return queue, asyncio.ensure_future(receive())
+
+    async def _stop_receiver(self, queue: _SnapshotQueue, receiver: "asyncio.Task[None]") -> None:
+        receiver.cancel()
+        try:
+            await receiver
+        except (asyncio.CancelledError, Exception):
+            pass
+        queue.close()
+
+    async def _iterate_queued(self, maxsize: int) -> AsyncIterator[object]:
+        queue, receiver = self._start_receiver(maxsize)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    return
+                yield item
+        finally:
+            await self._stop_receiver(queue, receiver)
+
+    @property
+    def summary(self) -> WatcherSummary:
+        """Document count and latest job progress seen so far."""
+        started = self._started_at
+        end = self._finished_at or time.monotonic()
+        return WatcherSummary(
+            job_id=self._job_id,
+            kind=self._kind,
+            status=self._status,
+            documents=self._documents_seen,
+            completed=self._progress.get("completed") or 0,
+            total=self._progress.get("total") or 0,
+            credits_used=self._progress.get("creditsUsed"),
+            duration_seconds=(end - started) if started is not None else 0.0,
+            reconnects=self._reconnects,
+        )
+
+    def _accept_documents(self, docs: List[Any], offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        fresh = self._replays.fresh(docs, offset)
+        docs = externalize_raw_documents(fresh, self._assets)
+        self._documents_seen += len(docs)
+        if self._stream:
+            self.recent.extend(docs)
+        else:
+            self._data.extend(docs)
+        return docs
+
+    def _record_progress(self, payload: Dict[str, Any]) -> None:
+        for key in ("completed", "total", "creditsUsed"):
+            if payload.get(key) is not None:
+                self._progress[key] = payload[key]
+
+    def _track(self, job):
+        # Record the status of a snapshot before it is yielded
+        self._status = job.status
+        if job.status in ("completed", "failed", "cancelled") and self._finished_at is None:
+            self._finished_at = time.monotonic()
+        return job
+
     def _build_ws_url(self) -> str:
         if not self._api_url:
             raise ValueError("API URL is required for WebSocket watcher")
@@ -61,126 +383,197 @@ class AsyncWatcher:
         return f"{ws_base}/v2/batch/scrape/{self._job_id}"
 
     async def _iterate(self) -> AsyncIterator[object]:
+        self._started_at = time.monotonic()
+        self._finished_at = None
         uri = self._build_ws_url()
         headers_list = []
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
-        # Attempt to establish WS; on failure, fall back to HTTP polling immediately
-        try:
-            async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
-                # Pre-yield a snapshot if available to ensure progress is visible
-                try:
-                    pre = await self._fetch_job_status()
-                    yield pre
-                    if pre.status in ("completed", "failed", "cancelled"):
-                        return
-                except Exception:
-                    pass
-
-                while True:
-                    try:
-                        if deadline is not None:
-                            remaining = max(0.0, deadline - asyncio.get_event_loop().time())
-                            timeout = min(self._poll_interval, remaining) if remaining > 0 else 0.0
-                        else:
-                            timeout = self._poll_interval
-                        msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
-                    except asyncio.TimeoutError:
-                        # Quiet period: poll HTTP once
-                        job = await self._safe_fetch()
-                        if job is not None:
-                            yield job
-                            if job.status in ("completed", "failed", "cancelled"):
-                                return
-                        if deadline is not None and asyncio.get_event_loop().time() >= deadline:
-                            return
-                        continue
-                    except (ConnectionClosedOK, ConnectionClosed, ConnectionClosedError):
-                        # Graceful/abrupt close: poll HTTP until terminal (bounded by timeout)
-                        deadline = time.time() + (self._timeout or 30)
-                        while True:
-                            try:
-                                job = await self._fetch_job_status()
-                                yield job
-                                if job.status in ("completed", "failed", "cancelled"):
-                                    return
-                            except Exception:
-                                return
-                            if time.time() >= deadline:
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self._timeout if self._timeout else None
+        attempt = 0
+        first_connection = True
+        while True:
+            received = self._messages_received
+            self._ws_dropped = False
+            try:
+                async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
+                    if first_connection:
+                        first_connection = False
+                        # Pre-yield a snapshot if available to ensure progress is visible
+                        try:
+                            pre = await self._fetch_job_status()
+                            yield pre
+                            if pre.status in ("completed", "failed", "cancelled"):
                                 return
-                            await asyncio.sleep(1)
-                    try:
-                        body = json.loads(msg)
-                    except Exception:
-                        continue
-
-                    msg_type = body.get("type")
-                    if msg_type == "error":
-                        self._status = "failed"
-                        # Yield a terminal snapshot
-                        if self._kind == "crawl":
-                            yield CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        else:
-                            yield BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        return
-                    elif msg_type == "catchup":
-                        d = body.get("data", {})
-                        self._status = d.get("status", self._status)
-                        docs_in = d.get("data", []) or []
-                        self._data.extend(docs_in)
-                        # Fall through to emit a snapshot below
-                    elif msg_type == "document":
-                        doc = body.get("data")
-                        if isinstance(doc, dict):
-                            self._data.append(doc)
-                        # Fall through to emit a snapshot below
-                    elif msg_type == "done":
-                        self._status = "completed"
-                        raw_payload = body.get("data", {}) or {}
-                        docs_in = raw_payload.get("data", []) or []
-                        if isinstance(docs_in, list) and docs_in:
-                            for doc in docs_in:
-                                if isinstance(doc, dict):
-                                    self._data.append(doc)
-                        # Emit final snapshot then end
-                        yield self._make_snapshot(status="completed", payload=raw_payload, docs_override=self._data)
+                        except Exception:
+                            pass
+                    async for snapshot in self._consume_ws(websocket, deadline):
+                        yield snapshot
+                    if not self._ws_dropped:
                         return
+            except Exception:
+                # Connect failure or abrupt disconnect
+                pass
+            if self._messages_received > received:
+                # The connection was healthy for a while; start backing off from scratch
+                attempt = 0
+            if deadline is not None and loop.time() >= deadline:
+                return
+            if attempt >= self._max_reconnects:
+                break
+            delay = min(self._reconnect_backoff * (2 ** attempt), _MAX_RECONNECT_BACKOFF)
+            delay *= 0.5 + random.random() / 2
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - loop.time()))
+            await asyncio.sleep(delay)
+            attempt += 1
+            self._reconnects += 1
 
-                    # Generic snapshot emit for status messages and periodic progress
-                    payload = body.get("data", body)
-                    status_str = payload.get("status", body.get("status", self._status))
-                    snapshot = self._make_snapshot(status=status_str, payload=payload)
-                    yield snapshot
-                    if status_str in ("completed", "failed", "cancelled"):
-                        return
-        except Exception:
-            # WS connect failure: fallback to HTTP polling loop until terminal/timeout
-            deadline = time.time() + (self._timeout or 30)
-            while True:
-                try:
-                    job = await self._fetch_job_status()
+        # Out of reconnect attempts: fall back to HTTP polling until the job is
+        # terminal or the timeout expires; fetch errors end iteration with the error
+        while True:
+            job = await self._fetch_job_status()
+            yield job
+            if job.status in ("completed", "failed", "cancelled"):
+                return
+            if deadline is not None and loop.time() >= deadline:
+                return
+            delay = self._poll_interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - loop.time()))
+            await asyncio.sleep(delay)
+
+    async def _consume_ws(self, websocket: Any, deadline: Optional[float]) -> AsyncIterator[object]:
+        """Yield snapshots from one connection; sets ``_ws_dropped`` if it closes before the job ends."""
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                if deadline is not None:
+                    remaining = max(0.0, deadline - loop.time())
+                    timeout = min(self._poll_interval, remaining) if remaining > 0 else 0.0
+                else:
+                    timeout = self._poll_interval
+                msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Quiet period: poll HTTP once
+                job = await self._safe_fetch()
+                if job is not None:
                     yield job
                     if job.status in ("completed", "failed", "cancelled"):
                         return
-                except Exception:
+                if deadline is not None and loop.time() >= deadline:
                     return
-                if time.time() >= deadline:
-                    return
-                await asyncio.sleep(1)
+                continue
+            except (ConnectionClosedOK, ConnectionClosed, ConnectionClosedError):
+                # Graceful/abrupt close before the job finished: reconnect and catch up
+                self._ws_dropped = True
+                return
+            self._messages_received += 1
+            try:
+                body = json.loads(msg)
+            except Exception:
+                continue
+
+            new_docs: List[Dict[str, Any]] = []
+            msg_type = body.get("type")
+            if msg_type == "error":
+                self._status = "failed"
+                self._finished_at = time.monotonic()
+                # Yield a terminal snapshot
+                if self._kind == "crawl":
+                    yield CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                else:
+                    yield BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                return
+            elif msg_type == "catchup":
+                d = body.get("data", {})
+                self._status = d.get("status", self._status)
+                docs_in = d.get("data", []) or []
+                new_docs = self._accept_documents(docs_in, offset=0)
+                # Fall through to emit a snapshot below
+            elif msg_type == "document":
+                new_docs = self._accept_documents([body.get("data")])
+                # Fall through to emit a snapshot below
+            elif msg_type == "done":
+                self._status = "completed"
+                raw_payload = body.get("data", {}) or {}
+                self._record_progress(raw_payload)
+                docs_in = raw_payload.get("data", []) or []
+                new_docs = self._accept_documents(docs_in if isinstance(docs_in, list) else [])
+                # Emit final snapshot then end; streaming mode only carries documents not yielded yet
+                final_docs = new_docs if self._stream else self._data
+                yield self._track(self._make_snapshot(status="completed", payload=raw_payload, docs_override=final_docs))
+                return
+
+            # Generic snapshot emit for status messages and periodic progress
+            payload = body.get("data", body)
+            status_str = payload.get("status", body.get("status", self._status))
+            if msg_type != "document":
+                self._record_progress(payload)
+            if self._stream:
+                # Each document is yielded once, with the message that delivered it
+                snapshot = self._make_snapshot(status=status_str, payload=payload, docs_override=new_docs)
+            else:
+                snapshot = self._make_snapshot(status=status_str, payload=payload)
+            yield self._track(snapshot)
+            if status_str in ("completed", "failed", "cancelled"):
+                return
 
     async def _fetch_job_status(self):
+        if self._stream:
+            return await self._fetch_from_cursor()
+        if self._kind == "crawl":
+            job = await self._call_status_method("get_crawl_status")
+        else:
+            job = await self._call_status_method("get_batch_scrape_status")
+        self._record_progress({"completed": job.completed, "total": job.total, "creditsUsed": job.credits_used})
+        return self._track(job)
+
+    async def _fetch_from_cursor(self):
+        # Streaming mode: read only results past the cursor; documents already
+        # delivered over the websocket are dropped by _accept_documents
         if self._kind == "crawl":
-            return await self._call_status_method("get_crawl_status")
-        return await self._call_status_method("get_batch_scrape_status")
+            method_name = "get_crawl_status_page"
+            url = f"/v2/crawl/{self._job_id}?skip={self._cursor}"
+        else:
+            method_name = "get_batch_scrape_status_page"
+            url = f"/v2/batch/scrape/{self._job_id}?skip={self._cursor}"
+        meth = getattr(self._client, method_name, None)
+        if meth is None:
+            meth = getattr(getattr(self._client, "v2", None), method_name, None)
+        if meth is None:
+            raise RuntimeError(f"Client does not expose {method_name}")
+
+        async def fetch(page_url: str) -> Dict[str, Any]:
+            result = meth(page_url, raw="api")
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        cursor = self._cursor
+        docs: List[Dict[str, Any]] = []
+        page = await fetch(url)
+        while True:
+            page_docs = page.get("data") or []
+            docs.extend(page_docs)
+            cursor += len(page_docs)
+            if not page.get("next") or not page_docs:
+                break
+            page = await fetch(page["next"])
+        offset, self._cursor = self._cursor, cursor
+        new_docs = self._accept_documents(docs, offset=offset)
+        self._record_progress(page)
+        status = page.get("status", self._status)
+        return self._track(self._make_snapshot(status=status, payload={**page, "next": None}, docs_override=new_docs))
 
     async def _call_status_method(self, method_name: str):
-        # Try on client directly
+        # Try on client directly; snapshots are always typed, regardless of the client's raw default
         meth = getattr(self._client, method_name, None)
         if meth is not None:
             try:
-                result = meth(self._job_id)
+                result = meth(self._job_id, raw=False)
             except TypeError:
                 result = None
             if result is not None:
@@ -196,7 +589,7 @@ class AsyncWatcher:
             meth = getattr(v2, method_name, None)
             if meth is not None:
                 try:
-                    result = meth(self._job_id)
+                    result = meth(self._job_id, raw=False)
                 except TypeError:
                     result = None
                 if result is not None:
@@ -214,12 +607,8 @@ class AsyncWatcher:
             return None
 
     def _make_snapshot(self, *, status: str, payload: Dict, docs_override: Optional[List[Dict]] = None):
-        docs = []
         source_docs = docs_override if docs_override is not None else payload.get("data", []) or []
-        for doc in source_docs:
-            if isinstance(doc, dict):
-                d = normalize_document_input(doc)
-                docs.append(Document(**d))
+        docs = parse_documents(source_docs, assets=self._assets)
 
         if self._kind == "crawl":
             return CrawlJob(
@@ -0,0 +1,277 @@
+"""
+Multiplexed watcher hub: many crawl and batch jobs on one event loop.
+
+Each ``Watcher.start()`` runs its own thread and event loop. A WatcherHub runs
+the same per-job websocket logic as tasks on a single background loop (or on
+a loop the application already runs) and sends every HTTP status poll through
+one bounded scheduler, so watching hundreds of jobs costs one loop thread plus
+a small, fixed pool of poll workers.
+
+Usage:
+    with WatcherHub(client) as hub:
+        for job_id in job_ids:
+            hub.watch(job_id, kind="crawl", on_document=store_document)
+        hub.join()
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel
+
+from .watcher import JobKind, JobType, Watcher
+
+
+class WatcherHubStats(BaseModel):
+    """Counters describing a hub's jobs and HTTP status polls."""
+
+    active_jobs: int = 0
+    finished_jobs: int = 0
+    polls: int = 0
+    # Time polls spent waiting for a free poll worker
+    poll_queue_seconds: float = 0.0
+    max_poll_queue_seconds: float = 0.0
+
+
+class _PollScheduler:
+    """Runs blocking status calls for all hub jobs on a bounded worker pool."""
+
+    def __init__(self, max_concurrent_polls: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_polls, thread_name_prefix="firecrawl-watcher-poll"
+        )
+        self._lock = threading.Lock()
+        self.polls = 0
+        self.queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+
+    def _call(self, enqueued: float, fn: Callable[..., Any], args: Any, kwargs: Dict[str, Any]) -> Any:
+        waited = time.perf_counter() - enqueued
+        with self._lock:
+            self.polls += 1
+            self.queue_seconds += waited
+            self.max_queue_seconds = max(self.max_queue_seconds, waited)
+        return fn(*args, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, time.perf_counter(), fn, args, kwargs)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class WatcherHub:
+    """
+    Watch many crawl and batch jobs from a single event loop.
+
+    Jobs are Watcher instances driven by the hub instead of their own thread;
+    listeners registered on them are called from the hub's loop thread and
+    should return quickly, unless a listener executor is configured. A job whose websocket cannot be (re)opened falls
+    back to HTTP polling, as with a standalone Watcher.
+    """
+
+    def __init__(
+        self,
+        client: Optional[object] = None,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_concurrent_polls: int = 4,
+        listener_executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Args:
+            client: FirecrawlClient used by ``watch()`` for websocket URLs and
+                HTTP status fallback
+            loop: Running event loop to schedule jobs on (e.g. the application's
+                own); when omitted the hub starts its own loop in a background
+                thread on first use
+            max_concurrent_polls: Worker threads shared by all jobs for HTTP
+                status polls
+            listener_executor: Default listener executor for jobs started with
+                ``watch()``, so slow listeners do not hold up the shared loop
+        """
+        if max_concurrent_polls < 1:
+            raise ValueError("max_concurrent_polls must be at least 1")
+        self._client = client
+        self._listener_executor = listener_executor
+        self._loop = loop
+        self._owns_loop = loop is None
+        self._thread: Optional[threading.Thread] = None
+        self._scheduler = _PollScheduler(max_concurrent_polls)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, "concurrent.futures.Future[None]"] = {}
+        self._watchers: Dict[str, Watcher] = {}
+        self._finished = 0
+        self._closed = False
+
+    def __enter__(self) -> "WatcherHub":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def stats(self) -> WatcherHubStats:
+        with self._lock:
+            active = sum(1 for future in self._jobs.values() if not future.done())
+            finished = self._finished
+        scheduler = self._scheduler
+        return WatcherHubStats(
+            active_jobs=active,
+            finished_jobs=finished,
+            polls=scheduler.polls,
+            poll_queue_seconds=scheduler.queue_seconds,
+            max_poll_queue_seconds=scheduler.max_queue_seconds,
+        )
+
+    def watch(
+        self,
+        job_id: str,
+        kind: JobKind = "crawl",
+        *,
+        on_status: Optional[Callable[[JobType], None]] = None,
+        on_document: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_done: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_error: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **watcher_options: Any,
+    ) -> Watcher:
+        """
+        Start watching a job.
+
+        Listeners passed here are registered before the job is scheduled, so no
+        early events are missed.
+
+        Args:
+            job_id: Job ID to watch
+            kind: Job kind ("crawl" or "batch")
+            on_status: Called with each job snapshot
+            on_document: Called with each "document" event
+            on_done: Called with the "done" event
+            on_error: Called with the "error" event
+            **watcher_options: Other Watcher arguments (poll_interval, timeout,
+                stream, recent_window, max_reconnects, ...)
+
+        Returns:
+            The Watcher driven by the hub
+        """
+        if self._client is None:
+            raise ValueError("WatcherHub.watch() requires a client; use add() for prebuilt watchers")
+        if self._listener_executor is not None:
+            watcher_options.setdefault("listener_executor", self._listener_executor)
+        watcher = Watcher(self._client, job_id, kind=kind, **watcher_options)
+        if on_status is not None:
+            watcher.add_listener(on_status)
+        for event_type, handler in (("document", on_document), ("done", on_done), ("error", on_error)):
+            if handler is not None:
+                watcher.add_event_listener(event_type, handler)
+        return self.add(watcher)
+
+    def add(self, watcher: Watcher) -> Watcher:
+        """
+        Drive an existing, not yet started Watcher from the hub.
+
+        Register its listeners before calling this.
+        """
+        if self._closed:
+            raise RuntimeError("WatcherHub is closed")
+        if watcher._thread is not None and watcher._thread.is_alive():
+            raise ValueError("Watcher is already running in its own thread")
+        job_id = watcher._job_id
+        with self._lock:
+            current = self._jobs.get(job_id)
+            if current is not None and not current.done():
+                raise ValueError(f"Job {job_id} is already being watched")
+            watcher._poller = self._scheduler
+            watcher._stop.clear()
+            self._watchers[job_id] = watcher
+            future = asyncio.run_coroutine_threadsafe(self._run(watcher), self._ensure_loop())
+            self._jobs[job_id] = future
+        future.add_done_callback(self._on_job_done)
+        return watcher
+
+    def get(self, job_id: str) -> Optional[Watcher]:
+        return self._watchers.get(job_id)
+
+    def remove(self, job_id: str) -> None:
+        """Stop watching a job. Its listeners receive no further events."""
+        with self._lock:
+            future = self._jobs.get(job_id)
+            watcher = self._watchers.get(job_id)
+        if watcher is not None:
+            watcher._stop.set()
+        if future is not None:
+            future.cancel()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every watched job to finish.
+
+        Returns:
+            True if all jobs finished, False if the timeout expired first
+        """
+        if self._in_loop_thread():
+            raise RuntimeError("join() would block the hub's loop; use 'await hub.wait()' instead")
+        with self._lock:
+            futures = list(self._jobs.values())
+        if not futures:
+            return True
+        _, pending = concurrent.futures.wait(futures, timeout=timeout)
+        return not pending
+
+    async def wait(self) -> None:
+        """Wait for every watched job to finish, from a coroutine on any loop."""
+        with self._lock:
+            futures = list(self._jobs.values())
+        if futures:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in futures), return_exceptions=True)
+
+    def close(self) -> None:
+        """Stop all jobs, then the hub's own loop thread and poll workers."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            job_ids = list(self._jobs)
+        for job_id in job_ids:
+            self.remove(job_id)
+        with self._lock:
+            futures = list(self._jobs.values())
+        if futures and not self._in_loop_thread():
+            concurrent.futures.wait(futures, timeout=1)
+        if self._owns_loop and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=1)
+            if not self._loop.is_running():
+                self._loop.close()
+        self._scheduler.shutdown()
+
+    def _in_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="firecrawl-watcher-hub", daemon=True
+            )
+            self._thread.start()
+        return self._loop
+
+    def _on_job_done(self, future: "concurrent.futures.Future[None]") -> None:
+        with self._lock:
+            self._finished += 1
+
+    async def _run(self, watcher: Watcher) -> None:
+        watcher._started_at = time.monotonic()
+        watcher._finished_at = None
+        # Reconnects and HTTP polling fallback are handled by the watcher itself
+        await watcher._run_ws()
@@ -0,0 +1,562 @@
+"""
+Embeddable receiver for Firecrawl webhooks.
+
+Jobs started with ``webhook=WebhookConfig(url=..., events=["page", "completed"])``
+push their progress to the caller, so nothing has to poll. ``WebhookReceiver``
+verifies the ``X-Firecrawl-Signature`` header, parses each delivery into
+``WebhookData`` (pages as ``Document`` objects), drops redelivered payloads and
+routes the rest to per-job handlers or async iterators. It is an ASGI app, has
+a WSGI entry point (``wsgi_app``), and can run its own small asyncio server.
+
+Usage:
+    receiver = WebhookReceiver(secret=WEBHOOK_SECRET)
+    await receiver.start(host="0.0.0.0", port=8080)
+    job = await client.start_crawl(url, webhook=WebhookConfig(url=PUBLIC_URL, events=["page", "completed", "failed"]))
+    async for event in receiver.events(job.id):
+        for doc in event.data or []:
+            ...
+"""
+
+import asyncio
+import hashlib
+import hmac
+import inspect
+import json
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel
+
+from .types import WebhookData
+from .utils.normalize import parse_documents
+
+logger = logging.getLogger("firecrawl")
+
+SIGNATURE_HEADER = "X-Firecrawl-Signature"
+
+_EVENT_STATUS = {
+    "started": "scraping",
+    "page": "scraping",
+    "action": "processing",
+    "completed": "completed",
+    "failed": "failed",
+    "cancelled": "cancelled",
+}
+_TERMINAL = ("completed", "failed", "cancelled")
+_DOCUMENT_KINDS = ("crawl", "batch_scrape")
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+}
+
+WebhookHandler = Callable[[WebhookData], Union[None, Awaitable[None]]]
+
+
+class WebhookSignatureError(ValueError):
+    """Raised when a webhook delivery is unsigned or its signature does not match."""
+
+
+class WebhookReceiverStats(BaseModel):
+    """Counters describing webhook deliveries seen by a receiver."""
+
+    received: int = 0
+    # Bad signature or malformed payload
+    rejected: int = 0
+    # Redelivered payloads (same webhook id) that were dropped
+    duplicates: int = 0
+    # Deliveries with no handler or iterator for their job (kept in the backlog)
+    unrouted: int = 0
+
+
+def sign_webhook_payload(body: Union[bytes, str], secret: str) -> str:
+    """Compute the ``X-Firecrawl-Signature`` header value for a raw payload."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_webhook_signature(body: Union[bytes, str], signature: Optional[str], secret: str) -> bool:
+    """Check a signature header against the raw payload (constant-time)."""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign_webhook_payload(body, secret), signature.strip())
+
+
+def parse_webhook_payload(payload: Union[bytes, str, Dict[str, Any]]) -> WebhookData:
+    """
+    Parse a webhook delivery.
+
+    Args:
+        payload: Raw request body or decoded JSON object
+
+    Returns:
+        WebhookData; crawl and batch pages carry ``Document`` objects in
+        ``data``, other events carry their raw ``results``
+
+    Raises:
+        ValueError: If the payload is not a webhook delivery
+    """
+    if isinstance(payload, (bytes, bytearray)):
+        payload = payload.decode("utf-8")
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    if not isinstance(payload, dict):
+        raise ValueError("Webhook payload must be a JSON object")
+
+    event_type = payload.get("type") or ""
+    kind, _, event = event_type.partition(".")
+    job_id = payload.get("id") or payload.get("jobId")
+    if not job_id:
+        raise ValueError("Webhook payload has no job id")
+
+    raw = payload.get("data")
+    if raw is None:
+        raw = []
+    elif not isinstance(raw, list):
+        raw = [raw]
+    documents = None
+    results = None
+    if kind in _DOCUMENT_KINDS:
+        documents = parse_documents([d for d in raw if isinstance(d, dict)])
+    else:
+        results = raw
+
+    status = _EVENT_STATUS.get(event, event or "unknown")
+    if event == "completed" and payload.get("success") is False:
+        status = "failed"
+    return WebhookData(
+        job_id=job_id,
+        status=status,
+        data=documents,
+        error=payload.get("error"),
+        type=event_type or None,
+        webhook_id=payload.get("webhookId"),
+        success=payload.get("success"),
+        metadata=payload.get("metadata"),
+        results=results,
+    )
+
+
+class _EventStream:
+    """Async iterator fed by a receiver from any thread."""
+
+    def __init__(self, receiver: "WebhookReceiver", job_id: Optional[str], loop: asyncio.AbstractEventLoop) -> None:
+        self._receiver = receiver
+        self._job_id = job_id
+        self._loop = loop
+        self._queue: "asyncio.Queue[Optional[WebhookData]]" = asyncio.Queue()
+        self._done = False
+
+    def _deliver(self, event: Optional[WebhookData]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        except RuntimeError:
+            # The consumer's loop has been closed
+            pass
+
+    def __aiter__(self) -> "_EventStream":
+        return self
+
+    async def __anext__(self) -> WebhookData:
+        if self._done:
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            self.close()
+            raise StopAsyncIteration
+        if self._job_id is not None and event.status in _TERMINAL:
+            # A job's stream ends after its terminal event
+            self.close()
+        return event
+
+    def close(self) -> None:
+        self._done = True
+        self._receiver._unsubscribe(self._job_id, self)
+
+
+class WebhookReceiver:
+    """
+    Receive webhook deliveries and route them by job id.
+
+    Handlers may be plain functions or coroutine functions. Deliveries for a
+    job nobody has subscribed to yet are kept in a bounded backlog and
+    replayed to its first handler or iterator, so subscribing right after
+    ``start_crawl`` returns does not miss early events.
+    """
+
+    def __init__(
+        self,
+        secret: Optional[str] = None,
+        *,
+        path: str = "/",
+        max_body_bytes: int = 50 * 1024 * 1024,
+        dedupe_window: int = 10000,
+        max_backlog: int = 1000,
+    ) -> None:
+        """
+        Args:
+            secret: Webhook signing secret; when set, unsigned or mis-signed
+                deliveries are rejected with 401
+            path: Request path deliveries are posted to
+            max_body_bytes: Largest accepted request body
+            dedupe_window: Number of recent webhook ids remembered to drop redeliveries
+            max_backlog: Unrouted deliveries kept for jobs without subscribers
+        """
+        if dedupe_window < 0 or max_backlog < 0:
+            raise ValueError("dedupe_window and max_backlog must be non-negative")
+        self._secret = secret
+        self._path = path
+        self._max_body_bytes = max_body_bytes
+        self._lock = threading.Lock()
+        self._handlers: Dict[Optional[str], List[WebhookHandler]] = {}
+        self._streams: Dict[Optional[str], List[_EventStream]] = {}
+        self._seen_ids: Set[str] = set()
+        self._seen_order: Deque[str] = deque()
+        self._dedupe_window = dedupe_window
+        self._backlog: "OrderedDict[str, List[WebhookData]]" = OrderedDict()
+        self._backlog_size = 0
+        self._max_backlog = max_backlog
+        self._stats = WebhookReceiverStats()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._address: Optional[Tuple[str, int]] = None
+
+    @property
+    def stats(self) -> WebhookReceiverStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    # Subscriptions
+    def on(self, handler: WebhookHandler, job_id: Optional[str] = None) -> WebhookHandler:
+        """Call ``handler`` for every delivery of ``job_id`` (or of every job when None)."""
+        with self._lock:
+            self._handlers.setdefault(job_id, []).append(handler)
+            backlog = self._take_backlog(job_id)
+        for event in backlog:
+            _call_handler(handler, event)
+        return handler
+
+    def remove(self, handler: WebhookHandler, job_id: Optional[str] = None) -> None:
+        with self._lock:
+            handlers = self._handlers.get(job_id, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            if not handlers:
+                self._handlers.pop(job_id, None)
+
+    def events(self, job_id: Optional[str] = None) -> _EventStream:
+        """
+        Iterate over deliveries with ``async for``.
+
+        Must be called from a running event loop. A per-job iterator ends
+        after the job's completed, failed or cancelled event; an iterator for
+        all jobs (``job_id=None``) runs until ``close()``.
+        """
+        stream = _EventStream(self, job_id, asyncio.get_running_loop())
+        with self._lock:
+            self._streams.setdefault(job_id, []).append(stream)
+            backlog = self._take_backlog(job_id)
+        for event in backlog:
+            stream._deliver(event)
+        return stream
+
+    def _unsubscribe(self, job_id: Optional[str], stream: _EventStream) -> None:
+        with self._lock:
+            streams = self._streams.get(job_id, [])
+            if stream in streams:
+                streams.remove(stream)
+            if not streams:
+                self._streams.pop(job_id, None)
+
+    def _take_backlog(self, job_id: Optional[str]) -> List[WebhookData]:
+        if job_id is None:
+            return []
+        events = self._backlog.pop(job_id, [])
+        self._backlog_size -= len(events)
+        return events
+
+    def _keep_unrouted(self, event: WebhookData) -> None:
+        if self._max_backlog == 0:
+            return
+        self._backlog.setdefault(event.job_id, []).append(event)
+        self._backlog_size += 1
+        while self._backlog_size > self._max_backlog:
+            # Evict the oldest event of the least recently started job
+            oldest_job = next(iter(self._backlog))
+            events = self._backlog[oldest_job]
+            events.pop(0)
+            self._backlog_size -= 1
+            if not events:
+                del self._backlog[oldest_job]
+
+    # Delivery
+    def _accept(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, Dict[str, Any], Optional[WebhookData], List[WebhookHandler]]:
+        """Verify, parse, dedupe and route one delivery; handlers are returned for the caller to run."""
+        try:
+            if self._secret is not None:
+                signature = headers.get(SIGNATURE_HEADER.lower())
+                if not verify_webhook_signature(body, signature, self._secret):
+                    raise WebhookSignatureError("Invalid webhook signature")
+            event = parse_webhook_payload(body)
+        except WebhookSignatureError as exc:
+            with self._lock:
+                self._stats.rejected += 1
+            return 401, {"success": False, "error": str(exc)}, None, []
+        except (ValueError, UnicodeDecodeError) as exc:
+            with self._lock:
+                self._stats.rejected += 1
+            return 400, {"success": False, "error": f"Invalid webhook payload: {exc}"}, None, []
+
+        with self._lock:
+            if event.webhook_id is not None:
+                if event.webhook_id in self._seen_ids:
+                    self._stats.duplicates += 1
+                    return 200, {"success": True, "duplicate": True}, None, []
+                if self._dedupe_window:
+                    self._seen_ids.add(event.webhook_id)
+                    self._seen_order.append(event.webhook_id)
+                    if len(self._seen_order) > self._dedupe_window:
+                        self._seen_ids.discard(self._seen_order.popleft())
+            self._stats.received += 1
+
+            job_handlers = list(self._handlers.get(event.job_id, []))
+            job_streams = list(self._streams.get(event.job_id, []))
+            handlers = job_handlers + list(self._handlers.get(None, []))
+            streams = job_streams + list(self._streams.get(None, []))
+            if not job_handlers and not job_streams:
+                self._keep_unrouted(event)
+                if not handlers and not streams:
+                    self._stats.unrouted += 1
+        for stream in streams:
+            stream._deliver(event)
+        return 200, {"success": True}, event, handlers
+
+    async def handle(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Process one delivery and await its handlers.
+
+        Args:
+            body: Raw request body (the signature covers these exact bytes)
+            headers: Request headers with lower-case names
+
+        Returns:
+            (HTTP status, JSON response body)
+        """
+        status, response, event, handlers = self._accept(body, headers)
+        for handler in handlers:
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Webhook handler failed for job %s", event.job_id)
+        return status, response
+
+    def handle_sync(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """Blocking variant of ``handle`` for WSGI servers and other threads."""
+        status, response, event, handlers = self._accept(body, headers)
+        for handler in handlers:
+            _call_handler(handler, event)
+        return status, response
+
+    def _precheck(self, method: str, path: str, length: Optional[int]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        if path.split("?", 1)[0] != self._path:
+            return 404, {"success": False, "error": "Not found"}
+        if method.upper() != "POST":
+            return 405, {"success": False, "error": "Method not allowed"}
+        if length is not None and length > self._max_body_bytes:
+            return 413, {"success": False, "error": "Payload too large"}
+        return None
+
+    # ASGI
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[[], Awaitable[Dict[str, Any]]], send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        length = _content_length(headers)
+        result = self._precheck(scope.get("method", "GET"), scope.get("path", "/"), length)
+        if result is None:
+            chunks: List[bytes] = []
+            size = 0
+            more = True
+            while more:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > self._max_body_bytes:
+                    result = (413, {"success": False, "error": "Payload too large"})
+                    break
+                chunks.append(chunk)
+                more = message.get("more_body", False)
+            if result is None:
+                result = await self.handle(b"".join(chunks), headers)
+
+        status, response = result
+        payload = json.dumps(response).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    # WSGI
+    def wsgi_app(self, environ: Dict[str, Any], start_response: Callable[..., Any]) -> List[bytes]:
+        headers = {
+            key[5:].replace("_", "-").lower(): value for key, value in environ.items() if key.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_LENGTH"):
+            headers["content-length"] = environ["CONTENT_LENGTH"]
+        length = _content_length(headers)
+        result = self._precheck(environ.get("REQUEST_METHOD", "GET"), environ.get("PATH_INFO") or "/", length)
+        if result is None:
+            if length is None:
+                result = (411, {"success": False, "error": "Content-Length required"})
+            else:
+                body = environ["wsgi.input"].read(length) if length else b""
+                result = self.handle_sync(body, headers)
+
+        status, response = result
+        payload = json.dumps(response).encode("utf-8")
+        start_response(
+            f"{status} {_REASONS.get(status, '')}".strip(),
+            [("Content-Type", "application/json"), ("Content-Length", str(len(payload)))],
+        )
+        return [payload]
+
+    # Standalone asyncio server
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Listen for deliveries on ``host:port`` (an ephemeral port when 0).
+
+        Returns:
+            The URL deliveries should be posted to (use the public address of
+            this host in ``WebhookConfig.url``)
+        """
+        if self._server is not None:
+            raise RuntimeError("WebhookReceiver is already running")
+        self._server = await asyncio.start_server(self._serve_connection, host, port)
+        self._address = self._server.sockets[0].getsockname()[:2]
+        return self.url
+
+    @property
+    def url(self) -> str:
+        if self._address is None:
+            raise RuntimeError("WebhookReceiver is not running")
+        host, port = self._address
+        return f"http://{host}:{port}{self._path}"
+
+    async def stop(self) -> None:
+        """Stop the server and end iterators that follow all jobs."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+        with self._lock:
+            streams = list(self._streams.get(None, []))
+        for stream in streams:
+            stream._deliver(None)
+
+    async def __aenter__(self) -> "WebhookReceiver":
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await _write_response(writer, 400, {"success": False, "error": "Bad request"}, False)
+                    break
+                method, target, version = parts
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                length = _content_length(headers)
+                result = self._precheck(method, target, length)
+                if result is None and length is None:
+                    result = (411, {"success": False, "error": "Content-Length required"})
+                if result is not None:
+                    # The unread body leaves the stream out of sync; close after replying
+                    await _write_response(writer, result[0], result[1], False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, response = await self.handle(body, headers)
+                await _write_response(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _content_length(headers: Mapping[str, str]) -> Optional[int]:
+    value = headers.get("content-length")
+    if value is None:
+        return None
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return None
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, response: Dict[str, Any], keep_alive: bool) -> None:
+    payload = json.dumps(response).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + payload)
+    await writer.drain()
+
+
+def _call_handler(handler: WebhookHandler, event: WebhookData) -> None:
+    try:
+        result = handler(event)
+        if inspect.isawaitable(result):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(_await(result))
+            else:
+                asyncio.ensure_future(result)
+    except Exception:
+        logger.exception("Webhook handler failed for job %s", event.job_id)
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
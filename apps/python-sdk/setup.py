@@ -36,6 +36,10 @@ setup(
         'pydantic>=2.0',
         'aiohttp'
     ],
+    extras_require={
+        'arrow': ['pyarrow>=14.0'],
+        'store': ['zstandard>=0.22'],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",